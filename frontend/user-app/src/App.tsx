@@ -1,27 +1,21 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Card } from './components/ui/Card';
 import { TransactionForm } from './components/TransactionForm';
 import { ResultDisplay } from './components/ResultDisplay';
 import { TransactionsPage } from './pages/TransactionsPage';
 import { HomePage } from './pages/HomePage';
-<<<<<<< HEAD
 import { LoginPage } from './pages/LoginPage';
 import { RegisterPage } from './pages/RegisterPage';
 import { VerifyEmailPage } from './pages/VerifyEmailPage';
-=======
 import { NavBar } from './components/NavBar';
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
-import { validateTransaction, getUserTransactions } from './services/api';
+import { validateTransaction, getUserTransactions, openUserEvents } from './services/api';
 import { useUser } from './context/UserContext';
 import type { TransactionRequest, TransactionResponse, TransactionStatus } from './types/transaction';
 
 type Page = 'home' | 'new-transaction' | 'my-transactions';
-<<<<<<< HEAD
 type AuthView = 'login' | 'register' | 'verify-email';
-=======
 type NotificationType = 'success' | 'warning' | 'info';
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
 
 interface Notification {
   id: string;
@@ -36,7 +30,33 @@ interface Notification {
   };
 }
 
+// Revisión del analista, desde el historial o desde un evento transaction_status
+interface ReviewedTransaction {
+  txId: string;
+  status: string;
+  amount?: number | null;
+  reviewedBy?: string | null;
+}
+
+const REVIEW_NOTIFICATIONS: Record<string, { title: string; message: string; type: NotificationType }> = {
+  APPROVED: { title: 'Transacción aprobada por el banco', message: 'fue aprobada por el analista', type: 'success' },
+  REJECTED: { title: 'Transacción rechazada', message: 'fue rechazada por el banco', type: 'warning' },
+};
+
 // Helper functions para reducir complejidad
+const saveNotifications = (notifications: Notification[]) => {
+  try { localStorage.setItem('notifications', JSON.stringify(notifications)); } catch (e) {}
+};
+
+const loadNotifiedTransactions = (): Set<string> => {
+  try {
+    const raw = localStorage.getItem('lastCheckedTransactions');
+    return new Set(raw ? JSON.parse(raw) : []);
+  } catch (e) {
+    return new Set();
+  }
+};
+
 const getTransactionTypeLabel = (type: string | undefined): string => {
   if (type === 'transfer') return 'transferencia';
   if (type === 'deposit') return 'depósito';
@@ -44,7 +64,7 @@ const getTransactionTypeLabel = (type: string | undefined): string => {
 };
 
 function App() {
-  const { userId, isAuthenticated, login, logout } = useUser();
+  const { userId, token, isAuthenticated, login, logout } = useUser();
   const [authView, setAuthView] = useState<AuthView>('login');
   const [pendingVerificationEmail, setPendingVerificationEmail] = useState<string | null>(null);
   const [currentPage, setCurrentPage] = useState<Page>('home');
@@ -62,154 +82,101 @@ function App() {
       return [];
     }
   });
-  const [lastCheckedTransactions, setLastCheckedTransactions] = useState<Set<string>>(() => {
-    try {
-      const raw = localStorage.getItem('lastCheckedTransactions');
-      const arr = raw ? JSON.parse(raw) : [];
-      return new Set(arr);
-    } catch (e) {
-      return new Set();
-    }
-  });
+  // Revisiones ya notificadas; en un ref para que marcar una no reabra el stream
+  const notifiedTransactions = useRef<Set<string>>(loadNotifiedTransactions());
 
-<<<<<<< HEAD
-  // ✅ TODOS LOS HOOKS SIEMPRE AL INICIO - Polling para verificar actualizaciones de transacciones del admin
-=======
-  const addNotification = (title: string, message: string, type: NotificationType) => {
-    const newNotification: Notification = {
-      id: Date.now().toString(),
-      title,
-      message,
-      time: 'Justo ahora',
-      type,
-      read: false
-    };
-    setNotifications(prev => [newNotification, ...prev]);
-  };
-
-  const handleTransactionReview = (transaction: any, txId: string) => {
-    if (!transaction.reviewedBy || lastCheckedTransactions.has(txId)) {
+  const handleTransactionReview = ({ txId, status, amount, reviewedBy }: ReviewedTransaction) => {
+    if (!reviewedBy || notifiedTransactions.current.has(txId)) {
       return;
     }
 
-    const amount = Math.abs(transaction.amount).toLocaleString();
-    
-    if (transaction.status === 'APPROVED') {
-      addNotification(
-        'Transacción aprobada por el banco',
-        `Tu transacción de $${amount} fue aprobada por el analista.`,
-        'success'
-      );
-    } else if (transaction.status === 'REJECTED') {
-      addNotification(
-        'Transacción rechazada',
-        `Tu transacción de $${amount} fue rechazada por el banco.`,
-        'warning'
-      );
-    }
-    
+    const absAmount = Math.abs(amount ?? 0);
+    const amountStr = `$${absAmount.toLocaleString()}`;
+    const review = REVIEW_NOTIFICATIONS[status];
+    setNotifications(prev => {
+      // Quitar la notificación "requiere autenticación" de la misma transacción
+      const next = prev.filter(n => {
+        const isPendingTitle = n.title && n.title.includes('Transacción requiere autenticación');
+        if (!isPendingTitle) return true;
+        // Si la notificación tiene meta.amount, usarla para comparar
+        if (n.meta && typeof n.meta.amount === 'number') {
+          return n.meta.amount !== absAmount;
+        }
+        // Fallback a comparar texto (por compatibilidad con notificaciones antiguas)
+        return !(n.message && n.message.includes(amountStr));
+      });
+      if (review) {
+        // id ligado a la transacción para evitar duplicados
+        next.unshift({
+          id: `tx-${txId}`,
+          title: review.title,
+          message: `Tu transacción de ${amountStr} ${review.message}.`,
+          time: new Date().toLocaleString(),
+          type: review.type,
+          read: false
+        });
+      }
+      saveNotifications(next);
+      return next;
+    });
+
     // Marcar como ya notificada
-    setLastCheckedTransactions(prev => new Set([...prev, txId]));
+    notifiedTransactions.current.add(txId);
+    try {
+      localStorage.setItem('lastCheckedTransactions', JSON.stringify(Array.from(notifiedTransactions.current)));
+    } catch (e) {}
     // Refrescar la página de inicio para actualizar el balance
     setHomeRefreshKey(prev => prev + 1);
   };
 
-  // Polling para verificar actualizaciones de transacciones del admin
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
+  // ✅ TODOS LOS HOOKS SIEMPRE AL INICIO - Revisiones del admin por SSE.
+  // Cada (re)conexión pide el historial una sola vez para recuperar lo que
+  // pasó sin conexión; después solo llegan eventos transaction_status
   useEffect(() => {
     // Guard: Solo ejecutar si está autenticado y tenemos userId
-    if (!userId || !isAuthenticated) return;
+    if (!userId || !isAuthenticated || !token) return;
 
-    const checkForUpdates = async () => {
+    const resync = async () => {
       try {
         const transactions = await getUserTransactions(userId);
-        
-        // Verificar transacciones que fueron revisadas por el admin
         transactions.forEach((transaction: any) => {
-          const txId = transaction.transactionId || transaction.id;
-<<<<<<< HEAD
-
-          // Si la transacción fue revisada y no la hemos notificado antes
-          if (transaction.reviewedBy && !lastCheckedTransactions.has(txId)) {
-            // Construir representación del monto para buscar notificaciones previas
-            const amountStr = `$${Math.abs(transaction.amount).toLocaleString()}`;
-
-            // Eliminar notificaciones previas que indiquen "requiere autenticación" para la misma cantidad
-            setNotifications(prev => {
-              const filtered = prev.filter(n => {
-                const isPendingTitle = n.title && n.title.includes('Transacción requiere autenticación');
-                if (!isPendingTitle) return true;
-                // Si la notificación tiene meta.amount, usarla para comparar
-                if (n.meta && typeof n.meta.amount === 'number') {
-                  return n.meta.amount !== Math.abs(transaction.amount);
-                }
-                // Fallback a comparar texto (por compatibilidad con notificaciones antiguas)
-                return !(n.message && n.message.includes(amountStr));
-              });
-              try { localStorage.setItem('notifications', JSON.stringify(filtered)); } catch (e) {}
-              return filtered;
-            });
-
-            if (transaction.status === 'APPROVED') {
-              // usar id ligado a la transacción para evitar duplicados
-              setNotifications(prev => {
-                const newNotif: Notification = {
-                  id: `tx-${txId}`,
-                  title: 'Transacción aprobada por el banco',
-                  message: `Tu transacción de ${amountStr} fue aprobada por el analista.`,
-                  time: new Date().toLocaleString(),
-                  type: 'success',
-                  read: false
-                };
-                const next = [newNotif, ...prev];
-                try { localStorage.setItem('notifications', JSON.stringify(next)); } catch (e) {}
-                return next;
-              });
-            } else if (transaction.status === 'REJECTED') {
-              setNotifications(prev => {
-                const newNotif: Notification = {
-                  id: `tx-${txId}`,
-                  title: 'Transacción rechazada',
-                  message: `Tu transacción de ${amountStr} fue rechazada por el banco.`,
-                  time: new Date().toLocaleString(),
-                  type: 'warning',
-                  read: false
-                };
-                const next = [newNotif, ...prev];
-                try { localStorage.setItem('notifications', JSON.stringify(next)); } catch (e) {}
-                return next;
-              });
-            }
-
-            // Marcar como ya notificada
-            setLastCheckedTransactions(prev => {
-              const next = new Set([...prev, txId]);
-              try { localStorage.setItem('lastCheckedTransactions', JSON.stringify(Array.from(next))); } catch (e) {}
-              return next;
-            });
-            // Refrescar la página de inicio para actualizar el balance
-            setHomeRefreshKey(prev => prev + 1);
-          }
-=======
-          handleTransactionReview(transaction, txId);
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
+          handleTransactionReview({
+            txId: transaction.transactionId || transaction.id,
+            status: transaction.status,
+            amount: transaction.amount,
+            reviewedBy: transaction.reviewedBy,
+          });
         });
       } catch (error) {
         console.error('Error checking for transaction updates:', error);
       }
     };
 
-    // Verificar inmediatamente
-    checkForUpdates();
-    
-    // Verificar cada 10 segundos
-    const interval = setInterval(checkForUpdates, 10000);
+    // Sin EventSource (entornos de test) solo se sincroniza una vez
+    if (typeof EventSource === 'undefined') {
+      resync();
+      return;
+    }
+
+    // El navegador reconecta solo (retry del servidor) y vuelve a disparar onopen
+    const events = openUserEvents(userId, token);
+    events.onopen = () => {
+      resync();
+    };
+    events.addEventListener('transaction_status', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      handleTransactionReview({
+        txId: data.transaction_id,
+        status: data.status,
+        amount: data.amount,
+        reviewedBy: data.reviewed_by,
+      });
+    });
 
-    return () => clearInterval(interval);
-  }, [userId, lastCheckedTransactions, isAuthenticated]);
+    return () => events.close();
+  }, [userId, token, isAuthenticated]);
 
-<<<<<<< HEAD
-  const addNotification = (title: string, message: string, type: 'success' | 'warning' | 'info', meta?: { amount?: number; txId?: string }) => {
+  const addNotification = (title: string, message: string, type: NotificationType, meta?: { amount?: number; txId?: string }) => {
     const newNotification: Notification = {
       id: Date.now().toString(),
       title,
@@ -221,7 +188,7 @@ function App() {
     };
     setNotifications(prev => {
       const next = [newNotification, ...prev];
-      try { localStorage.setItem('notifications', JSON.stringify(next)); } catch (e) {}
+      saveNotifications(next);
       return next;
     });
   };
@@ -229,7 +196,7 @@ function App() {
   const removeNotification = (id: string) => {
     setNotifications(prev => {
       const next = prev.filter(n => n.id !== id);
-      try { localStorage.setItem('notifications', JSON.stringify(next)); } catch (e) {}
+      saveNotifications(next);
       return next;
     });
   };
@@ -237,13 +204,11 @@ function App() {
   const markAllRead = () => {
     setNotifications(prev => {
       const next = prev.map(n => ({ ...n, read: true }));
-      try { localStorage.setItem('notifications', JSON.stringify(next)); } catch (e) {}
+      saveNotifications(next);
       return next;
     });
   };
 
-=======
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
   const handleSubmit = async (transaction: TransactionRequest) => {
     setStatus('loading');
     setError(null);
@@ -268,18 +233,14 @@ function App() {
       } else if (response.status === 'SUSPICIOUS') {
         addNotification(
           'Transacción requiere autenticación',
-<<<<<<< HEAD
-          `Tu transacción de $${Math.abs(transaction.amount).toLocaleString()} fue marcada como sospechosa. Por favor, confirma tu identidad.`,
+          `Tu transacción de $${amount} fue marcada como sospechosa. Por favor, confirma tu identidad.`,
           'warning',
           { amount: Math.abs(transaction.amount) }
         );
       } else if (response.status === 'REJECTED') {
         addNotification(
           'Transacción rechazada',
-          `Tu transacción de $${Math.abs(transaction.amount).toLocaleString()} fue rechazada por el banco.`,
-=======
-          `Tu transacción de $${amount} fue marcada como sospechosa. Por favor, confirma tu identidad.`,
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
+          `Tu transacción de $${amount} fue rechazada por el banco.`,
           'warning'
         );
       }
@@ -300,37 +261,27 @@ function App() {
     setHomeRefreshKey(prev => prev + 1);
   };
 
-<<<<<<< HEAD
+  const handleLogin = async (loginUserId: string, password: string) => {
+    const response = await fetch('http://localhost:8000/api/v1/auth/login', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ user_id: loginUserId, password }),
+    });
+
+    const data = await response.json();
+
+    if (!response.ok) {
+      throw new Error(data.detail || 'Error al iniciar sesión');
+    }
+
+    login(loginUserId, data.access_token, data.email, data.full_name);
+  };
+
   // ✅ DESPUÉS DE TODOS LOS HOOKS - Lógica condicional de autenticación
   if (!isAuthenticated) {
-    if (authView === 'login') {
-      return (
-        <LoginPage
-          onLogin={async (userId, password) => {
-            try {
-              const response = await fetch('http://localhost:8000/api/v1/auth/login', {
-                method: 'POST',
-                headers: {
-                  'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ user_id: userId, password }),
-              });
-
-              const data = await response.json();
-
-              if (!response.ok) {
-                throw new Error(data.detail || 'Error al iniciar sesión');
-              }
-
-              login(userId, data.access_token, data.email, data.full_name);
-            } catch (err: any) {
-              throw err;
-            }
-          }}
-          onSwitchToRegister={() => setAuthView('register')}
-        />
-      );
-    } else if (authView === 'register') {
+    if (authView === 'register') {
       return (
         <RegisterPage
           onRegisterSuccess={(email: string) => {
@@ -340,7 +291,8 @@ function App() {
           onSwitchToLogin={() => setAuthView('login')}
         />
       );
-    } else if (authView === 'verify-email' && pendingVerificationEmail) {
+    }
+    if (authView === 'verify-email' && pendingVerificationEmail) {
       return (
         <VerifyEmailPage
           email={pendingVerificationEmail}
@@ -355,163 +307,29 @@ function App() {
         />
       );
     }
-    
-    // Fallback si algo sale mal
-    return (
-      <LoginPage
-        onLogin={async (userId, password) => {
-          try {
-            const response = await fetch('http://localhost:8000/api/v1/auth/login', {
-              method: 'POST',
-              headers: {
-                'Content-Type': 'application/json',
-              },
-              body: JSON.stringify({ user_id: userId, password }),
-            });
-
-            const data = await response.json();
-
-            if (!response.ok) {
-              throw new Error(data.detail || 'Error al iniciar sesión');
-            }
-
-            login(userId, data.access_token, data.email, data.full_name);
-          } catch (err: any) {
-            throw err;
-          }
-        }}
-        onSwitchToRegister={() => setAuthView('register')}
-      />
-    );
+    return <LoginPage onLogin={handleLogin} onSwitchToRegister={() => setAuthView('register')} />;
   }
 
-  // Componente reutilizable de navegación
-  const NavBar = () => (
-    <nav className="bg-white shadow-sm border-b sticky top-0 z-10">
-      <div className="max-w-6xl mx-auto px-4 py-4 flex justify-between items-center">
-        <div className="flex items-center gap-4">
-          <img src="assets/logo-full.svg" alt="FinTech Bank" className="h-24" />
-          <button className="ml-2 px-4 py-2 bg-gray-100 border border-gray-200 rounded-full text-sm font-medium text-gray-800 shadow-sm hover:bg-gray-200">
-            {userId}
-          </button>
-        </div>
-        <div className="flex gap-4 items-center">
-          {/* Campanita de notificaciones */}
-          <div className="relative">
-            <button 
-              onClick={() => setShowNotifications(!showNotifications)}
-              className="relative p-2 text-gray-600 hover:text-user-primary transition-colors" 
-              title="Notificaciones"
-            >
-              <Bell className="w-6 h-6" />
-              {/* Badge de notificaciones */}
-              {notifications.length > 0 && (
-                <span className="absolute top-1 right-1 w-2 h-2 bg-red-500 rounded-full"></span>
-              )}
-            </button>
-            
-            {/* Dropdown de notificaciones */}
-            {showNotifications && (
-              <div className="absolute right-0 mt-2 w-80 bg-white rounded-lg shadow-xl border border-gray-200 z-50">
-                <div className="p-4 border-b border-gray-200">
-                  <h3 className="font-semibold text-gray-900">Notificaciones</h3>
-                </div>
-                <div className="max-h-96 overflow-y-auto">
-                  {notifications.length === 0 ? (
-                    <div className="p-8 text-center text-gray-500">
-                      <Bell className="w-12 h-12 mx-auto mb-2 opacity-30" />
-                      <p className="text-sm">No tienes notificaciones</p>
-                    </div>
-                  ) : (
-                    notifications.map((notification) => (
-                      <div key={notification.id} className={`p-4 border-b border-gray-100 last:border-b-0 ${notification.read ? 'bg-gray-50' : ''}`}>
-                        <div className="flex items-start gap-3">
-                          <div className={`w-2 h-2 rounded-full mt-2 ${
-                            notification.type === 'success' ? 'bg-green-500' :
-                            notification.type === 'warning' ? 'bg-yellow-500' :
-                            'bg-blue-500'
-                          }`}></div>
-                          <div className="flex-1">
-                            <div className="flex justify-between items-start">
-                              <div>
-                                <p className="text-sm font-medium text-gray-900">{notification.title}</p>
-                                <p className="text-xs text-gray-600 mt-1">{notification.message}</p>
-                                <p className="text-xs text-gray-400 mt-1">{notification.time}</p>
-                              </div>
-                              <div className="ml-4 flex-shrink-0">
-                                <button onClick={() => removeNotification(notification.id)} className="text-xs text-gray-400 hover:text-red-500">Eliminar</button>
-                              </div>
-                            </div>
-                          </div>
-                        </div>
-                      </div>
-                    ))
-                  )}
-                </div>
-                <div className="p-3 border-t border-gray-200 text-center">
-                  <div className="flex items-center justify-between">
-                    <button onClick={markAllRead} className="text-sm text-gray-600 hover:text-gray-800 font-medium">Marcar todas leídas</button>
-                    <button 
-                      onClick={() => setShowNotifications(false)}
-                      className="text-sm text-user-primary hover:text-indigo-700 font-medium"
-                    >
-                      Cerrar
-                    </button>
-                  </div>
-                </div>
-              </div>
-            )}
-          </div>
-          <div className="flex gap-2">
-            <button
-              onClick={() => setCurrentPage('home')}
-              className={`px-4 py-2 rounded-lg font-medium transition-colors ${
-                currentPage === 'home'
-                  ? 'bg-user-primary text-white'
-                  : 'text-gray-600 hover:text-user-primary hover:bg-gray-50'
-              }`}
-            >
-              Inicio
-            </button>
-            <button
-              onClick={() => setCurrentPage('new-transaction')}
-              className={`px-4 py-2 rounded-lg font-medium transition-colors ${
-                currentPage === 'new-transaction'
-                  ? 'bg-user-primary text-white'
-                  : 'text-gray-600 hover:text-user-primary hover:bg-gray-50'
-              }`}
-            >
-              Transferir
-            </button>
-            <button
-              onClick={() => setCurrentPage('my-transactions')}
-              className={`px-4 py-2 rounded-lg font-medium transition-colors ${
-                currentPage === 'my-transactions'
-                  ? 'bg-user-primary text-white'
-                  : 'text-gray-600 hover:text-user-primary hover:bg-gray-50'
-              }`}
-            >
-              Movimientos
-            </button>
-            <button
-              onClick={() => logout()}
-              className="px-4 py-2 rounded-lg font-medium text-red-600 hover:text-red-700 hover:bg-red-50 transition-colors"
-            >
-              Cerrar Sesión
-            </button>
-=======
+  const renderNavBar = (): JSX.Element => (
+    <NavBar 
+      userId={userId}
+      currentPage={currentPage} 
+      notifications={notifications} 
+      showNotifications={showNotifications}
+      onPageChange={setCurrentPage}
+      onToggleNotifications={() => setShowNotifications(!showNotifications)}
+      onCloseNotifications={() => setShowNotifications(false)}
+      onRemoveNotification={removeNotification}
+      onMarkAllRead={markAllRead}
+      onLogout={logout}
+    />
+  );
+
   const renderPage = (): JSX.Element => {
     if (currentPage === 'home') {
       return (
         <div className="min-h-screen bg-gradient-to-br from-gray-50 to-gray-100">
-          <NavBar 
-            currentPage={currentPage} 
-            notifications={notifications} 
-            showNotifications={showNotifications}
-            onPageChange={setCurrentPage}
-            onToggleNotifications={() => setShowNotifications(!showNotifications)}
-            onCloseNotifications={() => setShowNotifications(false)}
-          />
+          {renderNavBar()}
           <HomePage key={homeRefreshKey} onNavigate={setCurrentPage} />
         </div>
       );
@@ -520,14 +338,7 @@ function App() {
     if (currentPage === 'my-transactions') {
       return (
         <div className="min-h-screen bg-gradient-to-br from-gray-50 to-gray-100">
-          <NavBar 
-            currentPage={currentPage} 
-            notifications={notifications} 
-            showNotifications={showNotifications}
-            onPageChange={setCurrentPage}
-            onToggleNotifications={() => setShowNotifications(!showNotifications)}
-            onCloseNotifications={() => setShowNotifications(false)}
-          />
+          {renderNavBar()}
           <TransactionsPage />
         </div>
       );
@@ -539,14 +350,7 @@ function App() {
   const renderTransactionPage = (): JSX.Element => {
     return (
       <div className="min-h-screen bg-gradient-to-br from-gray-50 to-gray-100">
-        <NavBar 
-          currentPage={currentPage} 
-          notifications={notifications} 
-          showNotifications={showNotifications}
-          onPageChange={setCurrentPage}
-          onToggleNotifications={() => setShowNotifications(!showNotifications)}
-          onCloseNotifications={() => setShowNotifications(false)}
-        />
+        {renderNavBar()}
         
         <div className="py-12 px-4 sm:px-6 lg:px-8">
           <div className="max-w-md mx-auto">
@@ -578,7 +382,6 @@ function App() {
             >
               Powered by FinTech Bank v1.0
             </motion.div>
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
           </div>
         </div>
       </div>
@@ -595,16 +398,12 @@ function App() {
           exit={{ opacity: 0, scale: 0.95 }}
           transition={{ duration: 0.2 }}
         >
-<<<<<<< HEAD
-          <span>FinTech Bank v1.0</span>
-=======
           <Card>
             <h2 className="text-xl font-semibold text-gray-900 mb-6">
               Realizar una Transferencia
             </h2>
             <TransactionForm onSubmit={handleSubmit} isLoading={status === 'loading'} />
           </Card>
->>>>>>> bf056f362333762157a19e9dee09cd17298e7ff7
         </motion.div>
       );
     }
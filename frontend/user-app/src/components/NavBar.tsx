@@ -1,4 +1,3 @@
-import { UserSelector } from './UserSelector';
 import { NotificationDropdown } from './NotificationDropdown';
 
 type NotificationType = 'success' | 'warning' | 'info';
@@ -13,21 +12,29 @@ interface Notification {
 }
 
 interface NavBarProps {
+  readonly userId: string;
   readonly currentPage: string;
   readonly notifications: Notification[];
   readonly showNotifications: boolean;
   readonly onPageChange: (page: 'home' | 'new-transaction' | 'my-transactions') => void;
   readonly onToggleNotifications: () => void;
   readonly onCloseNotifications: () => void;
+  readonly onRemoveNotification: (id: string) => void;
+  readonly onMarkAllRead: () => void;
+  readonly onLogout: () => void;
 }
 
 export const NavBar = ({
+  userId,
   currentPage,
   notifications,
   showNotifications,
   onPageChange,
   onToggleNotifications,
-  onCloseNotifications
+  onCloseNotifications,
+  onRemoveNotification,
+  onMarkAllRead,
+  onLogout
 }: NavBarProps) => (
   <nav className="bg-white shadow-sm border-b sticky top-0 z-10">
     <div className="max-w-6xl mx-auto px-4 py-4 flex justify-between items-center">
@@ -35,7 +42,9 @@ export const NavBar = ({
         FinTech Bank
       </h1>
       <div className="flex gap-4 items-center">
-        <UserSelector />
+        <span className="px-4 py-2 bg-gray-100 border border-gray-200 rounded-full text-sm font-medium text-gray-800">
+          {userId}
+        </span>
         {/* Campanita de notificaciones */}
         <div className="relative">
           <button 
@@ -57,6 +66,8 @@ export const NavBar = ({
             <NotificationDropdown 
               notifications={notifications} 
               onClose={onCloseNotifications} 
+              onRemove={onRemoveNotification}
+              onMarkAllRead={onMarkAllRead}
             />
           )}
         </div>
@@ -91,6 +102,12 @@ export const NavBar = ({
           >
             Mis Transacciones
           </button>
+          <button
+            onClick={onLogout}
+            className="px-4 py-2 rounded-lg font-medium text-red-600 hover:text-red-700 hover:bg-red-50 transition-colors"
+          >
+            Cerrar Sesión
+          </button>
         </div>
       </div>
     </div>
@@ -12,6 +12,8 @@ interface Notification {
 interface NotificationDropdownProps {
   notifications: Notification[];
   onClose: () => void;
+  onRemove: (id: string) => void;
+  onMarkAllRead: () => void;
 }
 
 const getNotificationColor = (type: NotificationType): string => {
@@ -20,8 +22,8 @@ const getNotificationColor = (type: NotificationType): string => {
   return 'bg-blue-500';
 };
 
-const NotificationItem = ({ notification }: { notification: Notification }) => (
-  <div className="p-4 hover:bg-gray-50 border-b border-gray-100 last:border-b-0">
+const NotificationItem = ({ notification, onRemove }: { notification: Notification; onRemove: (id: string) => void }) => (
+  <div className={`p-4 hover:bg-gray-50 border-b border-gray-100 last:border-b-0 ${notification.read ? 'bg-gray-50' : ''}`}>
     <div className="flex items-start gap-3">
       <div className={`w-2 h-2 rounded-full mt-2 ${getNotificationColor(notification.type)}`}></div>
       <div className="flex-1">
@@ -29,6 +31,9 @@ const NotificationItem = ({ notification }: { notification: Notification }) => (
         <p className="text-xs text-gray-600 mt-1">{notification.message}</p>
         <p className="text-xs text-gray-400 mt-1">{notification.time}</p>
       </div>
+      <button onClick={() => onRemove(notification.id)} className="ml-4 flex-shrink-0 text-xs text-gray-400 hover:text-red-500">
+        Eliminar
+      </button>
     </div>
   </div>
 );
@@ -44,7 +49,7 @@ const EmptyNotifications = () => (
   </div>
 );
 
-export const NotificationDropdown = ({ notifications, onClose }: NotificationDropdownProps) => {
+export const NotificationDropdown = ({ notifications, onClose, onRemove, onMarkAllRead }: NotificationDropdownProps) => {
   return (
     <div className="absolute right-0 mt-2 w-80 bg-white rounded-lg shadow-xl border border-gray-200 z-50">
       <div className="p-4 border-b border-gray-200">
@@ -55,11 +60,14 @@ export const NotificationDropdown = ({ notifications, onClose }: NotificationDro
           <EmptyNotifications />
         ) : (
           notifications.map((notification) => (
-            <NotificationItem key={notification.id} notification={notification} />
+            <NotificationItem key={notification.id} notification={notification} onRemove={onRemove} />
           ))
         )}
       </div>
-      <div className="p-3 border-t border-gray-200 text-center">
+      <div className="p-3 border-t border-gray-200 flex items-center justify-between">
+        <button onClick={onMarkAllRead} className="text-sm text-gray-600 hover:text-gray-800 font-medium">
+          Marcar todas leídas
+        </button>
         <button 
           onClick={onClose}
           className="text-sm text-user-primary hover:text-indigo-700 font-medium"
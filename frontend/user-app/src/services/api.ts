@@ -1,8 +1,10 @@
 import axios from 'axios';
 import type { TransactionRequest, TransactionResponse } from '@/types/transaction';
 
+const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || '';
+
 const api = axios.create({
-  baseURL: import.meta.env.VITE_API_BASE_URL || '',
+  baseURL: API_BASE_URL,
   timeout: 10000,
   headers: {
     'Content-Type': 'application/json',
@@ -57,6 +59,14 @@ export const getUserTransactions = async (userId: string) => {
   return response.data;
 };
 
+// Cambios de estado de las transacciones del usuario (Server-Sent Events).
+// EventSource no puede enviar headers: el JWT va en ?token= (el gateway
+// oculta su valor en el access log)
+export const openUserEvents = (userId: string, token: string): EventSource => {
+  const query = new URLSearchParams({ token });
+  return new EventSource(`${API_BASE_URL}/api/v1/user/events/${encodeURIComponent(userId)}?${query}`);
+};
+
 export const authenticateTransaction = async (transactionId: string, confirmed: boolean) => {
   const response = await api.post(`/api/v1/user/transaction/${transactionId}/authenticate`, {
     confirmed
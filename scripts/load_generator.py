@@ -0,0 +1,393 @@
+"""
+Generador de carga local para el API Gateway
+
+Reproduce tráfico realista contra:
+- POST /api/v1/transaction/validate  (simulador del frontend usuario)
+- POST /transaction                  (ingesta 202 Accepted)
+
+Sintetiza usuarios con ubicación habitual, dispositivos conocidos, horarios
+preferidos y ráfagas, de modo que cada estrategia recorra sus ramas:
+monto > umbral, viajes fuera del radio, dispositivos nuevos, ráfagas que
+superan max_transactions y transacciones fuera de horario (solo /transaction
+acepta timestamp; /validate usa la hora del servidor). /transaction no tiene
+campo de dispositivo: esas peticiones siempre caen en missing_device.
+
+La carga es de lazo abierto: las llegadas siguen un proceso de Poisson a la
+tasa configurada y no esperan a que termine la petición anterior, así la
+latencia medida incluye el encolamiento real del gateway.
+
+Uso:
+    python scripts/load_generator.py --base-url http://localhost:8000 \\
+        --rate 50 --duration 60 --users 200 --endpoint mixed
+
+No usar contra producción: cada petición persiste evaluaciones en MongoDB.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+
+VALIDATE_PATH = "/api/v1/transaction/validate"
+SUBMIT_PATH = "/transaction"
+
+# Ciudades base (mismas coordenadas que el gazetteer del gateway)
+HOME_CITIES: List[Tuple[str, float, float]] = [
+    ("Bogota", 4.6097, -74.0817),
+    ("Medellin", 6.2442, -75.5812),
+    ("Cali", 3.4516, -76.5320),
+    ("Miami", 25.7617, -80.1918),
+    ("New York", 40.7128, -74.0060),
+    ("Chicago", 41.8781, -87.6298),
+    ("Los Angeles", 34.0522, -118.2437),
+    ("San Francisco", 37.7749, -122.4194),
+]
+
+TRANSACTION_TYPES = ["transfer", "payment", "recharge", "deposit"]
+
+
+@dataclass
+class UserProfile:
+    """Comportamiento sintético de un usuario"""
+
+    user_id: str
+    home: Tuple[float, float]
+    devices: List[str]
+    active_hours: List[int]
+    typical_amount: float
+    burst_probability: float
+
+
+@dataclass
+class TrafficMix:
+    """Probabilidades de cada escenario (deben ejercitar todas las ramas)"""
+
+    travel: float = 0.05
+    new_device: float = 0.05
+    missing_device: float = 0.01
+    high_amount: float = 0.05
+    off_hours: float = 0.05
+    burst_size: Tuple[int, int] = (4, 7)
+
+
+class TrafficModel:
+    """Genera payloads a partir de perfiles de usuario sintéticos"""
+
+    def __init__(self, users: int, mix: TrafficMix, rng: random.Random) -> None:
+        self.mix = mix
+        self.rng = rng
+        self.profiles = [self._make_profile(i) for i in range(users)]
+        # Pocos usuarios concentran la mayor parte del tráfico (Zipf aproximado)
+        self.weights = [1.0 / (rank + 1) ** 0.8 for rank in range(users)]
+        self.pending_bursts: List[UserProfile] = []
+
+    def _make_profile(self, index: int) -> UserProfile:
+        _, lat, lon = self.rng.choice(HOME_CITIES)
+        start_hour = self.rng.randint(6, 12)
+        span = self.rng.randint(6, 12)
+        return UserProfile(
+            user_id=f"load_user_{index:05d}",
+            home=(lat, lon),
+            devices=[f"load_dev_{index:05d}_{d}" for d in range(self.rng.randint(1, 3))],
+            active_hours=[(start_hour + h) % 24 for h in range(span)],
+            typical_amount=self.rng.lognormvariate(4.5, 0.8),
+            burst_probability=self.rng.uniform(0.0, 0.03),
+        )
+
+    def _pick_user(self) -> UserProfile:
+        if self.pending_bursts:
+            return self.pending_bursts.pop()
+        user = self.rng.choices(self.profiles, weights=self.weights, k=1)[0]
+        if self.rng.random() < user.burst_probability:
+            size = self.rng.randint(*self.mix.burst_size)
+            self.pending_bursts.extend([user] * (size - 1))
+        return user
+
+    def _location(self, user: UserProfile) -> Tuple[str, Tuple[float, float]]:
+        """Devuelve (escenario, coordenadas): casa con jitter de ~5 km o viaje"""
+        if self.rng.random() < self.mix.travel:
+            _, lat, lon = self.rng.choice(HOME_CITIES)
+            return "travel", (lat, lon)
+        lat, lon = user.home
+        return "home", (lat + self.rng.gauss(0, 0.03), lon + self.rng.gauss(0, 0.03))
+
+    def _device(self, user: UserProfile) -> Tuple[str, Optional[str]]:
+        roll = self.rng.random()
+        if roll < self.mix.missing_device:
+            return "missing_device", None
+        if roll < self.mix.missing_device + self.mix.new_device:
+            return "new_device", f"load_new_{uuid.uuid4().hex[:10]}"
+        return "known_device", self.rng.choice(user.devices)
+
+    def _amount(self, user: UserProfile) -> Tuple[str, float]:
+        if self.rng.random() < self.mix.high_amount:
+            return "high_amount", round(self.rng.uniform(1500.01, 20000), 2)
+        return "normal_amount", round(max(1.0, self.rng.gauss(user.typical_amount, 20)), 2)
+
+    def _timestamp(self, user: UserProfile) -> Tuple[str, datetime]:
+        now = datetime.now(timezone.utc)
+        if self.rng.random() < self.mix.off_hours:
+            quiet = [h for h in range(24) if h not in user.active_hours] or [3]
+            return "off_hours", now.replace(hour=self.rng.choice(quiet))
+        return "usual_hours", now.replace(hour=self.rng.choice(user.active_hours))
+
+    def next_request(self, endpoint: str) -> Tuple[str, dict, List[str]]:
+        """Retorna (path, json, etiquetas de escenario)"""
+        user = self._pick_user()
+        location_tag, (lat, lon) = self._location(user)
+        device_tag, device_id = self._device(user)
+        amount_tag, amount = self._amount(user)
+        tags = [location_tag, device_tag, amount_tag]
+        transaction_type = self.rng.choice(TRANSACTION_TYPES)
+
+        if endpoint == "mixed":
+            endpoint = "validate" if self.rng.random() < 0.7 else "transaction"
+
+        if endpoint == "validate":
+            body = {
+                "amount": amount,
+                "userId": user.user_id,
+                "location": f"{lat:.5f},{lon:.5f}",
+                "deviceId": device_id,
+                "transactionType": transaction_type,
+            }
+            return VALIDATE_PATH, body, tags
+
+        # TransactionRequest no acepta device_id: el worker evalúa sin dispositivo
+        tags[1] = "missing_device"
+        time_tag, timestamp = self._timestamp(user)
+        body = {
+            "id": f"load_{uuid.uuid4().hex}",
+            "amount": amount,
+            "user_id": user.user_id,
+            "location": {"latitude": lat, "longitude": lon},
+            "timestamp": timestamp.isoformat(),
+            "transaction_type": transaction_type,
+        }
+        return SUBMIT_PATH, body, tags + [time_tag]
+
+
+class LatencyHistogram:
+    """Histograma logarítmico (5 buckets por década) de 100 us a 60 s"""
+
+    BUCKETS_PER_DECADE = 5
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        micros = max(seconds * 1e6, 100.0)
+        return int(math.log10(micros) * self.BUCKETS_PER_DECADE)
+
+    def record(self, seconds: float) -> None:
+        self.counts[self._bucket(seconds)] += 1
+        self.samples += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def upper_bound(self, bucket: int) -> float:
+        return 10 ** ((bucket + 1) / self.BUCKETS_PER_DECADE) / 1e6
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        target = p * self.samples
+        running = 0
+        for bucket in sorted(self.counts):
+            running += self.counts[bucket]
+            if running >= target:
+                return min(self.upper_bound(bucket), self.max)
+        return self.max
+
+    def rows(self) -> List[Tuple[float, int]]:
+        return [(self.upper_bound(b), self.counts[b]) for b in sorted(self.counts)]
+
+
+@dataclass
+class LoadReport:
+    """Resultados agregados por endpoint"""
+
+    histograms: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    statuses: Dict[str, Counter] = field(default_factory=dict)
+    scenarios: Counter = field(default_factory=Counter)
+    outcomes: Counter = field(default_factory=Counter)
+    scheduled: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+
+    def record(self, path: str, status: str, seconds: float) -> None:
+        self.histograms.setdefault(path, LatencyHistogram()).record(seconds)
+        self.statuses.setdefault(path, Counter())[status] += 1
+
+    def completed(self) -> int:
+        return sum(sum(c.values()) for c in self.statuses.values())
+
+    def errors(self) -> int:
+        return sum(
+            n
+            for counter in self.statuses.values()
+            for status, n in counter.items()
+            if not status.startswith("2")
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "elapsed_s": round(self.elapsed, 3),
+            "scheduled": self.scheduled,
+            "completed": self.completed(),
+            "dropped": self.dropped,
+            "errors": self.errors(),
+            "throughput_rps": round(self.completed() / self.elapsed, 2) if self.elapsed else 0,
+            "scenarios": dict(self.scenarios),
+            "outcomes": dict(self.outcomes),
+            "endpoints": {
+                path: {
+                    "statuses": dict(self.statuses[path]),
+                    "p50_ms": round(h.percentile(0.50) * 1000, 2),
+                    "p90_ms": round(h.percentile(0.90) * 1000, 2),
+                    "p99_ms": round(h.percentile(0.99) * 1000, 2),
+                    "max_ms": round(h.max * 1000, 2),
+                    "mean_ms": round(h.total / h.samples * 1000, 2) if h.samples else 0,
+                }
+                for path, h in self.histograms.items()
+            },
+        }
+
+    def print_summary(self) -> None:
+        data = self.to_dict()
+        print("=" * 60)
+        print(f"Duración: {data['elapsed_s']} s")
+        print(
+            f"Programadas: {data['scheduled']}  Completadas: {data['completed']}  "
+            f"Descartadas (cliente saturado): {data['dropped']}"
+        )
+        completed = data["completed"] or 1
+        print(f"Throughput: {data['throughput_rps']} req/s  "
+              f"Errores: {data['errors']} ({data['errors'] / completed:.1%})")
+        for path, stats in data["endpoints"].items():
+            print("-" * 60)
+            print(f"{path}")
+            print(f"  status: {stats['statuses']}")
+            print(f"  p50={stats['p50_ms']} ms  p90={stats['p90_ms']} ms  "
+                  f"p99={stats['p99_ms']} ms  max={stats['max_ms']} ms")
+            histogram = self.histograms[path]
+            peak = max(count for _, count in histogram.rows())
+            for upper, count in histogram.rows():
+                bar = "#" * max(1, int(40 * count / peak))
+                print(f"  <= {upper * 1000:>10.2f} ms {count:>7} {bar}")
+        print("-" * 60)
+        print(f"Escenarios: {data['scenarios']}")
+        print(f"Resultados: {data['outcomes']}")
+        print("=" * 60)
+
+
+async def _send(
+    client: httpx.AsyncClient, path: str, body: dict, report: LoadReport
+) -> None:
+    start = time.perf_counter()
+    try:
+        response = await client.post(path, json=body)
+        status = str(response.status_code)
+        if response.status_code < 300:
+            payload = response.json()
+            report.outcomes[payload.get("riskLevel") or payload.get("risk_level") or "accepted"] += 1
+    except httpx.TimeoutException:
+        status = "timeout"
+    except httpx.HTTPError as exc:
+        status = type(exc).__name__
+    report.record(path, status, time.perf_counter() - start)
+
+
+async def run_load(args: argparse.Namespace) -> LoadReport:
+    """Programa llegadas de Poisson durante `duration` segundos (lazo abierto)"""
+    rng = random.Random(args.seed)
+    model = TrafficModel(args.users, TrafficMix(), rng)
+    report = LoadReport()
+    in_flight: set = set()
+
+    limits = httpx.Limits(max_connections=args.max_connections)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as client:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        next_arrival = start
+        deadline = start + args.duration
+
+        while next_arrival < deadline:
+            delay = next_arrival - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            report.scheduled += 1
+            path, body, tags = model.next_request(args.endpoint)
+            report.scenarios.update(tags)
+            if len(in_flight) >= args.max_in_flight:
+                report.dropped += 1
+            else:
+                task = asyncio.create_task(_send(client, path, body, report))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            next_arrival += rng.expovariate(args.rate)
+
+        if in_flight:
+            await asyncio.wait(in_flight)
+        report.elapsed = loop.time() - start
+
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generador de carga para el API Gateway")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--rate", type=float, default=20.0, help="Llegadas por segundo")
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos de carga")
+    parser.add_argument("--users", type=int, default=100, help="Usuarios sintéticos")
+    parser.add_argument(
+        "--endpoint", choices=["validate", "transaction", "mixed"], default="validate"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Semilla para reproducibilidad")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Timeout por petición (s)")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="Tope de peticiones simultáneas; las llegadas por encima se cuentan como descartadas",
+    )
+    parser.add_argument("--json-out", default=None, help="Guardar el reporte en JSON")
+    args = parser.parse_args(argv)
+    if args.rate <= 0 or args.duration <= 0 or args.users <= 0:
+        parser.error("--rate, --duration y --users deben ser positivos")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print(
+        f"🚀 {args.rate} req/s durante {args.duration} s contra {args.base_url} "
+        f"({args.endpoint}, {args.users} usuarios)"
+    )
+    report = asyncio.run(run_load(args))
+    report.print_summary()
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return 1 if report.completed() == 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
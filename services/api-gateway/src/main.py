@@ -8,16 +8,24 @@ Eso funciona, pero hace imposible probar el código y cambiar configuraciones en
 Por eso las puse en funciones separadas que se pueden inyectar - así los tests usan mocks
 y el código real usa las conexiones reales. Es más trabajo inicial pero vale la pena.
 """
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from decimal import Decimal
+import threading
+import redis
+import redis.asyncio as redis_async
 from api_gateway.routes import router
 from src.adapters import (
     MongoDBAdapter,
     RedisAdapter,
     RabbitMQAdapter,
+    RedisDashboardCounters,
+    RedisEvaluationEventPublisher,
+    build_fallback_policies,
+    build_location_profile,
 )
 from src.config import settings
+from src.domain.models import RiskLevel
 from src.domain.strategies.amount_threshold import AmountThresholdStrategy
 from src.domain.strategies.location_check import LocationStrategy
 from src.application.use_cases import (
@@ -25,6 +33,16 @@ from src.application.use_cases import (
     ReviewTransactionUseCase,
 )
 from src.infrastructure.user_repository import UserRepository
+from src.infrastructure.metrics import REGISTRY, CONTENT_TYPE, PrometheusMetricsRecorder, instrument_client
+from src.infrastructure.circuit_breaker import breaker_for, guard_client
+from src.infrastructure.admission import AdmissionMiddleware, build_admission_controller
+from src.infrastructure.rate_limit import LocalTokenBucket, RateLimiter, RateLimitMiddleware, parse_rate_limits
+from src.infrastructure.logging_config import configure_from_settings
+from src.infrastructure.gazetteer import default_gazetteer
+from src.infrastructure.event_stream import EventHub
+from src.infrastructure.tracing import TRACER, TracingMiddleware, configure_tracing
+from src.infrastructure import serialization
+from src.infrastructure.serialization import FastJSONResponse
 from src.infrastructure.auth_service import (
     PasswordService,
     JWTService,
@@ -42,7 +60,51 @@ app = FastAPI(
     title="Fraud Detection Engine",
     description="Motor de detección de fraude con Clean Architecture",
     version="0.1.0",
+    default_response_class=FastJSONResponse,
 )
+serialization.use_backend(settings.json_backend)
+
+# Logging estructurado no bloqueante (QueueHandler + listener en otro hilo)
+configure_from_settings(settings)
+
+# Gazetteer de ubicaciones cargado al arrancar, no en el primer request
+default_gazetteer()
+
+# Tracing opcional: el middleware solo se agrega si TRACING_ENABLED=true
+if configure_tracing(settings, service_name="api-gateway").enabled:
+    app.add_middleware(TracingMiddleware)
+
+# Control de admisión por clase de endpoint (scoring, auth, admin). Se
+# registra antes que CORS para que los 429/503 también lleven sus headers
+_admission = build_admission_controller(settings)
+if _admission is not None:
+    app.add_middleware(AdmissionMiddleware, controller=_admission)
+
+
+def _token_user(token: str):
+    """user id de un token Bearer válido (None si no lo es)"""
+    payload = get_jwt_service().verify_token(token)
+    return payload.get("sub") if payload else None
+
+
+# Rate limiting por usuario, analista o IP. Va por fuera de la admisión:
+# quien excede su límite no ocupa lugares en las colas
+_rate_limit_redis = None
+if settings.rate_limit_enabled:
+    _rate_limit_redis = guard_client(instrument_client(
+        redis_async.from_url(
+            settings.redis_url, decode_responses=True,
+            socket_timeout=settings.redis_timeout_seconds,
+            socket_connect_timeout=settings.redis_timeout_seconds,
+        ), "redis"
+    ), breaker_for("redis"))
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=RateLimiter(_rate_limit_redis, LocalTokenBucket(settings.rate_limit_local_max_keys)),
+        rules=parse_rate_limits(settings.rate_limits),
+        user_resolver=_token_user,
+        trust_forwarded_for=settings.rate_limit_trust_forwarded_for,
+    )
 
 # CORS middleware
 app.add_middleware(
@@ -55,19 +117,62 @@ app.add_middleware(
 
 
 # Dependency Injection
+#
+# Un adaptador por proceso (un pool de conexiones) para todos los requests:
+# crear MongoClient/Redis por request abría conexiones nuevas justo cuando
+# hay ráfagas y agravaba la sobrecarga. Se crean en el primer uso para no
+# exigir MongoDB/Redis/RabbitMQ al importar.
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def _shared_instance(name: str, build):
+    instance = _shared.get(name)
+    if instance is None:
+        with _shared_lock:
+            instance = _shared.get(name)
+            if instance is None:
+                instance = _shared[name] = build()
+    return instance
+
+
 def get_repository():
     """Factory para TransactionRepository"""
-    return MongoDBAdapter(settings.mongodb_url, settings.mongodb_database)
+    return _shared_instance(
+        "repository", lambda: MongoDBAdapter(settings.mongodb_url, settings.mongodb_database)
+    )
 
 
 def get_cache():
     """Factory para CacheService"""
-    return RedisAdapter(settings.redis_url, settings.redis_ttl)
+    return _shared_instance("cache", lambda: RedisAdapter(settings.redis_url, settings.redis_ttl))
 
 
 def get_publisher():
     """Factory para MessagePublisher"""
-    return RabbitMQAdapter(settings.rabbitmq_url)
+    return _shared_instance("publisher", lambda: RabbitMQAdapter(settings.rabbitmq_url))
+
+
+# Canal push (SSE): clientes de larga vida compartidos por todos los requests.
+# El hub mantiene una sola suscripción a Redis por réplica del gateway (sin
+# socket_timeout: su lectura bloquea a propósito hasta que llega un evento).
+_redis_timeouts = {
+    "socket_timeout": settings.redis_timeout_seconds,
+    "socket_connect_timeout": settings.redis_timeout_seconds,
+}
+_event_redis = guard_client(instrument_client(
+    redis.from_url(settings.redis_url, decode_responses=True, **_redis_timeouts), "redis"
+), breaker_for("redis"))
+_event_redis_async = guard_client(instrument_client(
+    redis_async.from_url(settings.redis_url, decode_responses=True, **_redis_timeouts), "redis"
+), breaker_for("redis"))
+event_hub = EventHub(redis_async.from_url(settings.redis_url, decode_responses=True))
+dashboard_counters = RedisDashboardCounters(_event_redis_async)
+
+
+def get_event_publisher():
+    """Factory para EvaluationEventPublisher"""
+    return RedisEvaluationEventPublisher(_event_redis, _event_redis_async)
 
 
 def get_strategies():
@@ -96,18 +201,28 @@ def get_evaluate_use_case(
 ):
     """Factory para EvaluateTransactionUseCase"""
     strategies = get_strategies()
-    return EvaluateTransactionUseCase(repository, publisher, cache, strategies)
+    return EvaluateTransactionUseCase(
+        repository, publisher, cache, strategies,
+        metrics=PrometheusMetricsRecorder(), tracer=TRACER,
+        location_profile=build_location_profile(cache),
+        cost_aware=settings.rule_cost_aware,
+        risk_ceiling=RiskLevel[settings.rule_risk_ceiling],
+        events=get_event_publisher(),
+        fallback_policies=build_fallback_policies(),
+    )
 
 
 def get_review_use_case(repository=Depends(get_repository)):
     """Factory para ReviewTransactionUseCase"""
-    return ReviewTransactionUseCase(repository)
+    return ReviewTransactionUseCase(repository, events=get_event_publisher())
 
 
 # Authentication Factories
 def get_user_repository():
     """Factory para UserRepository"""
-    return UserRepository(settings.mongodb_url, settings.mongodb_database)
+    return _shared_instance(
+        "user_repository", lambda: UserRepository(settings.mongodb_url, settings.mongodb_database)
+    )
 
 
 def get_password_service():
@@ -170,7 +285,7 @@ def get_current_user_use_case():
 
 
 # Registrar rutas con dependency injection
-from api_gateway.routes import router, api_v1_router, configure_dependencies
+from api_gateway.routes import router, api_v1_router, configure_dependencies, configure_event_stream
 from api_gateway.auth_routes import auth_router, configure_auth_dependencies
 
 configure_dependencies(
@@ -180,6 +295,7 @@ configure_dependencies(
     review_use_case_factory=get_review_use_case,
     publisher_factory=get_publisher
 )
+configure_event_stream(get_event_publisher, event_hub, dashboard_counters, get_jwt_service)
 
 configure_auth_dependencies(
     user_repository_factory=get_user_repository,
@@ -197,12 +313,36 @@ app.include_router(api_v1_router)  # Añadir router v1
 app.include_router(auth_router)  # Añadir router de autenticación
 
 
+@app.on_event("shutdown")
+async def close_connections():
+    """
+    Cierra la suscripción pub/sub del canal push, el cliente Redis del rate
+    limiting y los adaptadores compartidos
+    """
+    await event_hub.close()
+    if _rate_limit_redis is not None:
+        await _rate_limit_redis.aclose()
+    if "publisher" in _shared:
+        _shared["publisher"].close()
+    if "cache" in _shared:
+        await _shared["cache"].close()
+    for name in ("repository", "user_repository"):
+        if name in _shared:
+            _shared[name].client.close()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "version": "0.1.0"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Métricas del hot path en formato Prometheus (estrategias, Redis, MongoDB)"""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
 
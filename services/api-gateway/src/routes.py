@@ -8,11 +8,31 @@ Nota (María Gutiérrez):
 La IA sugirió poner toda la lógica en las rutas. La moví a los casos de uso
 para cumplir con Separation of Concerns - las rutas solo manejan HTTP.
 """
-from fastapi import APIRouter, HTTPException, Header, Query, status
+import logging
+import time
+from fastapi import APIRouter, HTTPException, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Callable, Any, Dict
 from pydantic import BaseModel, Field
 from decimal import Decimal
 from datetime import datetime, timezone
+from src.domain.models import RiskLevel
+from src.domain.rules import RuleCompiler, compile_rule
+from src.application.interfaces import NullEvaluationEventPublisher
+from src.infrastructure.event_stream import ADMIN_CHANNEL, HEARTBEAT_SECONDS, format_sse, user_channel
+from src.infrastructure import serialization
+from src.infrastructure.tracing import TRACER
+from src.infrastructure.gazetteer import resolve_location
+from src.infrastructure.rule_cache import (
+    DEFAULT_RULE_ORDER,
+    RULE_ORDER_KEY,
+    RuleSetCache,
+    bump_rules_version,
+    read_rule_order,
+)
+from src.infrastructure.serialization import FastJSONResponse
+
+logger = logging.getLogger(__name__)
 
 
 def _iso_utc(dt: Optional[datetime]) -> Optional[str]:
@@ -31,6 +51,52 @@ def _iso_utc(dt: Optional[datetime]) -> Optional[str]:
 # Constantes
 RULE_NOT_FOUND_MESSAGE = "Rule not found"
 
+# Campos proyectados por cada listado (ver MongoDBAdapter.list_evaluations)
+AUDIT_ROW_FIELDS = (
+    "transaction_id", "user_id", "risk_level", "reasons", "timestamp",
+    "status", "reviewed_by", "reviewed_at",
+)
+LOG_ROW_FIELDS = AUDIT_ROW_FIELDS + ("amount", "location", "user_authenticated")
+USER_ROW_FIELDS = LOG_ROW_FIELDS + ("transaction_type", "description")
+
+# Tope de decisiones por request de revisión masiva (un bulk_write por lote)
+BULK_REVIEW_MAX_ITEMS = 1000
+
+# risk_level se guarda por nombre; el historial de usuario expone el valor numérico
+_RISK_SCORES = {level.name: level.value for level in RiskLevel}
+
+
+def _row_location(row: dict) -> Optional[str]:
+    location = row.get("location")
+    if not location:
+        return None
+    return f"{location['latitude']}, {location['longitude']}"
+
+
+def _frontend_status(status: str) -> str:
+    """El dashboard muestra PENDING_REVIEW como SUSPICIOUS"""
+    if status == "APPROVED":
+        return "APPROVED"
+    return "SUSPICIOUS" if status == "PENDING_REVIEW" else "REJECTED"
+
+
+def _log_row(row: dict) -> dict:
+    """Fila del log de transacciones del dashboard (LOG_ROW_FIELDS)"""
+    amount = row.get("amount")
+    return {
+        "id": row["transaction_id"],
+        "amount": float(amount) if amount else 0.0,
+        "userId": row.get("user_id", "unknown"),
+        "date": row["timestamp"],
+        "status": _frontend_status(row.get("status", "PENDING_REVIEW")),
+        "violations": row["reasons"],
+        "riskLevel": row["risk_level"],
+        "location": _row_location(row) or "N/A",
+        "userAuthenticated": row.get("user_authenticated"),
+        "reviewedBy": row.get("reviewed_by"),
+        "reviewedAt": row.get("reviewed_at"),
+    }
+
 # DTOs para request/response
 class TransactionRequest(BaseModel):
     """DTO para solicitud de evaluación de transacción"""
@@ -51,6 +117,26 @@ class ReviewRequest(BaseModel):
     analyst_comment: Optional[str] = None
 
 
+class BulkReviewItem(BaseModel):
+    """Una decisión del lote (la validación de decision es por ítem)"""
+
+    transactionId: str = Field(..., min_length=1)
+    decision: str
+
+
+class BulkReviewRequest(BaseModel):
+    """DTO para revisión masiva"""
+
+    decisions: List[BulkReviewItem] = Field(..., min_length=1, max_length=BULK_REVIEW_MAX_ITEMS)
+
+
+class ReviewClaimRequest(BaseModel):
+    """DTO para pedir un lote de la cola de revisión manual"""
+
+    batchSize: Optional[int] = Field(None, ge=1, le=100, description="Tareas a asignar (default: settings)")
+    leaseSeconds: Optional[int] = Field(None, ge=30, le=3600, description="Duración del lease (default: settings)")
+
+
 class ThresholdConfigRequest(BaseModel):
     """DTO para actualización de configuración"""
 
@@ -115,6 +201,24 @@ def configure_dependencies(
     _publisher_factory = publisher_factory
 
 
+# Canal push (SSE): sin configurar, los cambios de estado no se notifican
+_event_publisher_factory = NullEvaluationEventPublisher
+_event_hub = None
+_dashboard_counters = None
+_jwt_service_factory = None
+
+def configure_event_stream(event_publisher_factory, event_hub, dashboard_counters=None, jwt_service_factory=None) -> None:
+    """
+    Configura el canal push desde main.py (publicador por request, hub y
+    contadores únicos; JWTService para autenticar los streams de usuario)
+    """
+    global _event_publisher_factory, _event_hub, _dashboard_counters, _jwt_service_factory
+    _event_publisher_factory = event_publisher_factory
+    _event_hub = event_hub
+    _dashboard_counters = dashboard_counters
+    _jwt_service_factory = jwt_service_factory
+
+
 # ============================================================================
 # Helper Functions para reducir complejidad cognitiva
 # ============================================================================
@@ -125,7 +229,7 @@ async def _get_disabled_rules(cache) -> set:
         disabled_set = await cache.redis.smembers("disabled_default_rules")
         return {r.decode('utf-8') if isinstance(r, bytes) else r for r in disabled_set}
     except Exception as e:
-        print(f"Error loading disabled rules: {e}")
+        logger.warning("Error loading disabled rules: %s", e)
         return set()
 
 
@@ -137,67 +241,83 @@ async def _build_strategies(disabled_rules: set, cache, repository):
     from src.domain.strategies.device_validation import DeviceValidationStrategy
     from src.domain.strategies.rapid_transaction import RapidTransactionStrategy
     from src.domain.strategies.unusual_time import UnusualTimeStrategy
+    from src.adapters import guard_repository
     
-    strategies = []
-    config = await cache.get_threshold_config()
+    # Con Redis caído (o su circuito abierto) se evalúa con la configuración por defecto
+    try:
+        config = await cache.get_threshold_config()
+    except Exception as e:
+        logger.warning("Error loading threshold config: %s", e)
+        config = None
+    # Reglas personalizadas y orden persistido desde /admin/rules/reorder
+    # (snapshot por proceso, ver infrastructure/rule_cache.py)
+    rules = await _RULE_SET_CACHE.get(cache, repository)
+    defaults = []  # (rule_id, estrategia)
+
+    def add(rule_id: str, strategy) -> None:
+        defaults.append((rule_id, strategy))
     
     # 1. AmountThresholdStrategy
     if "rule_amount_threshold" not in disabled_rules:
         threshold = config.get("amount_threshold", settings.amount_threshold) if config else settings.amount_threshold
-        strategies.append(AmountThresholdStrategy(Decimal(str(threshold))))
+        add("rule_amount_threshold", AmountThresholdStrategy(Decimal(str(threshold))))
     
     # 2. LocationStrategy
     if "rule_location_check" not in disabled_rules:
         radius_km = config.get("location_radius_km", settings.location_radius_km) if config else settings.location_radius_km
-        strategies.append(LocationStrategy(radius_km))
+        add("rule_location_check", LocationStrategy(radius_km))
     
     # 3. DeviceValidationStrategy
     if "rule_device_validation" not in disabled_rules:
-        strategies.append(DeviceValidationStrategy(redis_client=cache.redis_sync))
+        add("rule_device_validation", DeviceValidationStrategy(redis_client=cache.redis_sync))
     
     # 4. RapidTransactionStrategy
     if "rule_rapid_transaction" not in disabled_rules:
-        max_transactions_str = await cache.redis.get("rule_config:rule_rapid_transaction:max_transactions")
-        time_window_minutes_str = await cache.redis.get("rule_config:rule_rapid_transaction:time_window_minutes")
+        try:
+            max_transactions_str = await cache.redis.get("rule_config:rule_rapid_transaction:max_transactions")
+            time_window_minutes_str = await cache.redis.get("rule_config:rule_rapid_transaction:time_window_minutes")
+        except Exception as e:
+            logger.warning("Error loading rapid transaction config: %s", e)
+            max_transactions_str = time_window_minutes_str = None
         max_transactions = int(max_transactions_str) if max_transactions_str else 3
         time_window_minutes = int(time_window_minutes_str) if time_window_minutes_str else 5
-        strategies.append(RapidTransactionStrategy(redis_client=cache.redis_sync, max_transactions=max_transactions, window_minutes=time_window_minutes))
+        add("rule_rapid_transaction", RapidTransactionStrategy(redis_client=cache.redis_sync, max_transactions=max_transactions, window_minutes=time_window_minutes))
     
     # 5. UnusualTimeStrategy
     if "rule_unusual_time" not in disabled_rules:
-        strategies.append(UnusualTimeStrategy(audit_repository=repository))
+        add("rule_unusual_time", UnusualTimeStrategy(audit_repository=guard_repository(repository)))
     
-    return strategies
+    # 6. Reglas personalizadas habilitadas (compiladas una vez por versión)
+    from src.domain.strategies.custom_rule import build_custom_strategies
+    return rules.sort_strategies(defaults, build_custom_strategies(rules.custom_rules, _RULE_COMPILER))
+
+
+# Reglas compiladas compartidas entre requests; se recompilan cuando cambia updated_at
+_RULE_COMPILER = RuleCompiler()
+
+# Reglas personalizadas habilitadas y orden; se recargan cuando cambia rules:version
+_RULE_SET_CACHE = RuleSetCache()
+
+
+async def _rules_changed(cache) -> None:
+    """Invalida el snapshot de reglas de este proceso y avisa a los demás"""
+    _RULE_SET_CACHE.invalidate()
+    await bump_rules_version(cache)
 
 
 def _parse_location(location_str: str) -> dict:
-    """Parsea la ubicación desde string a coordenadas lat/lon"""
-    location_str = location_str.strip()
-    
-    # Verificar si ya son coordenadas (formato: "lat,lon")
-    if ',' in location_str and len(location_str.split(',')) == 2:
-        try:
-            parts = location_str.split(',')
-            lat = float(parts[0].strip())
-            lon = float(parts[1].strip())
-            return {"latitude": lat, "longitude": lon}
-        except ValueError:
-            pass
-    
-    # Mapeo de ciudades a coordenadas (fallback)
-    location_coords = {
-        "New York": {"latitude": 40.7128, "longitude": -74.0060},
-        "Los Angeles": {"latitude": 34.0522, "longitude": -118.2437},
-        "Chicago": {"latitude": 41.8781, "longitude": -87.6298},
-        "Miami": {"latitude": 25.7617, "longitude": -80.1918},
-        "San Francisco": {"latitude": 37.7749, "longitude": -122.4194},
-        "Bogota": {"latitude": 4.6097, "longitude": -74.0817},
-        "Medellin": {"latitude": 6.2442, "longitude": -75.5812},
-        "Cali": {"latitude": 3.4516, "longitude": -76.5320}
-    }
-    
-    city = location_str.split(",")[0].strip()
-    return location_coords.get(city, {"latitude": 40.7128, "longitude": -74.0060})
+    """
+    Parsea la ubicación ("lat,lon", ciudad o "ciudad, país") a coordenadas lat/lon
+
+    Raises:
+        ValueError: Si la ubicación no se reconoce (el endpoint responde 422)
+    """
+    resolved = resolve_location(location_str)
+    if resolved is None:
+        raise ValueError(
+            f"Unknown location: {location_str!r}. Use 'lat,lon' or a city name"
+        )
+    return resolved.as_dict()
 
 
 def _adjust_amount_by_type(amount: float, transaction_type: str) -> float:
@@ -217,6 +337,14 @@ def _map_risk_to_response(risk_level: str) -> tuple:
     return risk_mapping.get(risk_level, ("REJECTED", 95))
 
 
+async def _get_rule_order(cache) -> Dict[str, int]:
+    """
+    Orden persistido de las reglas predeterminadas, leído de Redis (vacío si
+    Redis falla). Para evaluar se usa el snapshot de _RULE_SET_CACHE.
+    """
+    return await read_rule_order(cache) or {}
+
+
 def _get_default_rule_ids() -> set:
     """Retorna el conjunto de IDs de reglas predeterminadas"""
     return {
@@ -240,6 +368,7 @@ def _delete_custom_rule(rule_id: str, repository) -> None:
         result = repository.db.custom_rules.delete_one({"id": rule_id})
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail=RULE_NOT_FOUND_MESSAGE)
+        _RULE_COMPILER.forget(rule_id)
 
 
 async def _handle_rule_enabled_state(rule_id: str, enabled: bool, cache, analyst_id: str) -> dict:
@@ -345,6 +474,13 @@ def _update_custom_rule(rule_id: str, rule_params: RuleParametersRequest, reposi
     if "enabled" in rule_params.parameters:
         update_data["enabled"] = rule_params.parameters["enabled"]
     
+    # Validar que los nuevos parámetros compilan para el tipo de la regla
+    # (RuleDefinitionError es ValueError -> 422)
+    current = repository.db.custom_rules.find_one({"id": rule_id}, {"_id": 0, "type": 1})
+    if current is None:
+        raise HTTPException(status_code=404, detail=RULE_NOT_FOUND_MESSAGE)
+    compile_rule({"id": rule_id, "type": current["type"], "parameters": rule_params.parameters})
+    
     result = repository.db.custom_rules.update_one(
         {"id": rule_id},
         {"$set": update_data}
@@ -358,62 +494,90 @@ def _update_custom_rule(rule_id: str, rule_params: RuleParametersRequest, reposi
 # ============================================================================
 
 @router.post("/transaction", status_code=status.HTTP_202_ACCEPTED)
-async def submit_transaction(transaction: TransactionRequest):
+async def submit_transaction(transaction: TransactionRequest, response: Response):
     """
     HU-001: Recibe transacción y responde 202 Accepted
     El procesamiento es asíncrono vía RabbitMQ
-    
+
+    El gateway valida y publica en la cola transactions; el worker corre
+    las estrategias. El resultado se consulta en Location
+    (GET /transaction/{id}/status) o llega por /api/v1/user/events.
+    Reenviar el mismo ID mientras está en proceso no lo publica de nuevo.
+
     Nota del desarrollador:
     La IA sugirió 200 OK. Lo cambié a 202 Accepted porque el procesamiento
     es asíncrono - esto comunica mejor la semántica al cliente.
     """
+    from src.adapters import build_submission_registry
+    from src.application.use_cases import SubmitTransactionUseCase
+
+    # Ajustar el monto según el tipo de transacción
+    transaction_data = transaction.model_dump()
+    transaction_type = transaction_data.get('transaction_type', 'transfer')
+
+    # Transferencias, pagos y recargas son salidas de dinero (negativo)
+    # Depósitos son entradas de dinero (positivo)
+    if transaction_type in ['transfer', 'payment', 'recharge']:
+        # Hacer el monto negativo si no lo es
+        if transaction_data['amount'] > 0:
+            transaction_data['amount'] = -transaction_data['amount']
+    # Para 'deposit' el monto ya es positivo, no se modifica
+
     try:
-        # Instanciar directamente con las factories
-        repository = _repository_factory()
-        cache = _cache_factory()
-        publisher = _publisher_factory()
-        
-        # Ajustar el monto según el tipo de transacción
-        transaction_data = transaction.model_dump()
-        transaction_type = transaction_data.get('transaction_type', 'transfer')
-        
-        # Transferencias, pagos y recargas son salidas de dinero (negativo)
-        # Depósitos son entradas de dinero (positivo)
-        if transaction_type in ['transfer', 'payment', 'recharge']:
-            # Hacer el monto negativo si no lo es
-            if transaction_data['amount'] > 0:
-                transaction_data['amount'] = -transaction_data['amount']
-        # Para 'deposit' el monto ya es positivo, no se modifica
-        
-        # Crear estrategias
-        from decimal import Decimal
-        from src.config import settings
-        from src.domain.strategies.amount_threshold import AmountThresholdStrategy
-        from src.domain.strategies.location_check import LocationStrategy
-        from src.domain.strategies.device_validation import DeviceValidationStrategy
-        from src.domain.strategies.rapid_transaction import RapidTransactionStrategy
-        from src.domain.strategies.unusual_time import UnusualTimeStrategy
-        
-        strategies = [
-            AmountThresholdStrategy(Decimal(str(settings.amount_threshold))),
-            LocationStrategy(settings.location_radius_km),
-            DeviceValidationStrategy(redis_client=cache.redis_sync),
-            RapidTransactionStrategy(redis_client=cache.redis_sync),
-            UnusualTimeStrategy(audit_repository=repository),
-        ]
-        
-        # Crear e invocar use case
-        from src.application.use_cases import EvaluateTransactionUseCase
-        evaluate_use_case = EvaluateTransactionUseCase(repository, publisher, cache, strategies)
-        
-        result = await evaluate_use_case.execute(transaction_data)
-        return {
-            "status": "accepted",
-            "transaction_id": transaction.id,
-            "risk_level": result["risk_level"],
-        }
+        use_case = SubmitTransactionUseCase(
+            _publisher_factory(), build_submission_registry(_cache_factory()), tracer=TRACER
+        )
+        queued = await use_case.execute(transaction_data)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error("Could not queue transaction %s: %s", transaction.id, e)
+        raise HTTPException(
+            status_code=503, detail="Transaction queue unavailable", headers={"Retry-After": "5"}
+        )
+
+    status_url = f"/transaction/{transaction.id}/status"
+    response.headers["Location"] = status_url
+    return {
+        "status": "accepted",
+        "transaction_id": transaction.id,
+        "duplicate": not queued,
+        "status_url": status_url,
+    }
+
+
+@router.get("/transaction/{transaction_id}/status")
+async def get_transaction_status(transaction_id: str, response: Response):
+    """
+    Estado de una transacción enviada por POST /transaction
+
+    - PROCESSING: aceptada, el worker aún no la evalúa (Retry-After: 1)
+    - EVALUATED: con risk_level, reasons y el estado de revisión
+    - FAILED: el worker la descartó (DLQ); reason dice por qué
+    - 404 si no existe ni está en proceso
+    """
+    from starlette.concurrency import run_in_threadpool
+    from src.adapters import build_submission_registry
+
+    evaluation = await run_in_threadpool(_repository_factory().get_evaluation_by_id, transaction_id)
+    if evaluation is not None:
+        return FastJSONResponse({
+            "transaction_id": transaction_id,
+            "state": "EVALUATED",
+            "risk_level": evaluation.risk_level.name,
+            "reasons": evaluation.reasons,
+            "status": evaluation.status,
+            "evaluated_at": evaluation.timestamp,
+        })
+
+    registry = build_submission_registry(_cache_factory())
+    reason = await registry.failure(transaction_id)
+    if reason is not None:
+        return {"transaction_id": transaction_id, "state": "FAILED", "reason": reason}
+    if await registry.is_pending(transaction_id):
+        response.headers["Retry-After"] = "1"
+        return {"transaction_id": transaction_id, "state": "PROCESSING"}
+    raise HTTPException(status_code=404, detail=f"Transaction {transaction_id} not found")
 
 
 @router.get("/audit/all")
@@ -421,20 +585,23 @@ async def get_all_evaluations():
     """
     HU-002: Consulta todas las evaluaciones para auditoría
     """
+    from starlette.concurrency import run_in_threadpool
+
     repository = _repository_factory()
-    evaluations = await repository.get_all_evaluations()
-    return [
+    rows = await run_in_threadpool(repository.list_evaluations, AUDIT_ROW_FIELDS)
+    # Datetimes crudos: FastJSONResponse los serializa en ISO UTC ('Z')
+    return FastJSONResponse([
         {
-            "transaction_id": e.transaction_id,
-            "risk_level": e.risk_level.name,
-            "reasons": e.reasons,
-            "timestamp": _iso_utc(e.timestamp),
-            "status": e.status,
-            "reviewed_by": e.reviewed_by,
-            "reviewed_at": _iso_utc(e.reviewed_at) if e.reviewed_at else None,
+            "transaction_id": row["transaction_id"],
+            "risk_level": row["risk_level"],
+            "reasons": row["reasons"],
+            "timestamp": row["timestamp"],
+            "status": row.get("status", "PENDING_REVIEW"),
+            "reviewed_by": row.get("reviewed_by"),
+            "reviewed_at": row.get("reviewed_at"),
         }
-        for e in evaluations
-    ]
+        for row in rows
+    ])
 
 
 @router.get("/audit/transaction/{transaction_id}")
@@ -468,25 +635,29 @@ async def get_user_transactions(user_id: str):
     Returns:
         Lista de evaluaciones de transacciones del usuario
     """
+    from starlette.concurrency import run_in_threadpool
+
     repository = _repository_factory()
-    evaluations = repository.get_evaluations_by_user(user_id)
+    rows = await run_in_threadpool(
+        repository.list_evaluations, AUDIT_ROW_FIELDS, user_id=user_id
+    )
     
-    if not evaluations:
+    if not rows:
         return []
     
-    return [
+    return FastJSONResponse([
         {
-            "transaction_id": e.transaction_id,
+            "transaction_id": row["transaction_id"],
             "user_id": user_id,
-            "risk_level": e.risk_level.name,
-            "reasons": e.reasons,
-            "status": e.status,
-            "evaluated_at": _iso_utc(e.evaluated_at) if hasattr(e, 'evaluated_at') and e.evaluated_at else _iso_utc(e.timestamp),
-            "reviewed_by": e.reviewed_by,
-            "reviewed_at": e.reviewed_at.isoformat() if e.reviewed_at else None,
+            "risk_level": row["risk_level"],
+            "reasons": row["reasons"],
+            "status": row.get("status", "PENDING_REVIEW"),
+            "evaluated_at": row["timestamp"],
+            "reviewed_by": row.get("reviewed_by"),
+            "reviewed_at": row.get("reviewed_at"),
         }
-        for e in evaluations
-    ]
+        for row in rows
+    ])
 
 
 @api_v1_router.put("/transaction/review/{transaction_id}")
@@ -508,12 +679,13 @@ async def review_transaction(
     try:
         # Instanciar el use case correctamente
         repository = _repository_factory()
-        review_use_case = ReviewTransactionUseCase(repository)
+        review_use_case = ReviewTransactionUseCase(repository, events=_event_publisher_factory())
         
         # Ejecutar en thread pool para no bloquear el event loop
         await run_in_threadpool(
             review_use_case.execute, transaction_id, review.decision, analyst_id
         )
+        await _complete_review_task(transaction_id)
         return {"status": "reviewed", "decision": review.decision}
     except ValueError as e:
         if "not found" in str(e).lower():
@@ -521,6 +693,127 @@ async def review_transaction(
         raise HTTPException(status_code=422, detail=str(e))
 
 
+@api_v1_router.post("/transaction/review/bulk")
+async def review_transactions_bulk(
+    review: BulkReviewRequest,
+    analyst_id: str = Header(..., alias="X-Analyst-ID"),
+):
+    """
+    HU-010: El analista decide un lote de transacciones en una request
+
+    Responde 200 con un resultado por ítem (applied, invalid, duplicate,
+    not_found, not_pending); un ítem inválido no invalida el lote.
+    """
+    from starlette.concurrency import run_in_threadpool
+    from src.application.use_cases import BulkReviewTransactionsUseCase
+
+    use_case = BulkReviewTransactionsUseCase(_repository_factory(), events=_event_publisher_factory())
+    decisions = [
+        {"transaction_id": item.transactionId, "decision": item.decision}
+        for item in review.decisions
+    ]
+    try:
+        results = await run_in_threadpool(use_case.execute, decisions, analyst_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    applied = [result["transaction_id"] for result in results if result["outcome"] == "applied"]
+    if applied:
+        try:
+            await _review_queue().complete_many(applied)
+        except Exception as e:
+            logger.warning("Could not remove %d reviewed tasks from the queue: %s", len(applied), e)
+    return {
+        "analystId": analyst_id,
+        "reviewed": len(applied),
+        "results": [
+            {"transactionId": result["transaction_id"], "outcome": result["outcome"], "status": result["status"]}
+            for result in results
+        ],
+    }
+
+
+def _review_queue():
+    from src.adapters import build_review_queue
+
+    return build_review_queue(_cache_factory())
+
+
+async def _complete_review_task(transaction_id: str) -> None:
+    """
+    Saca de la cola de revisión una transacción ya decidida, sin importar
+    quién tenía el lease (best-effort: la decisión ya quedó guardada)
+    """
+    try:
+        await _review_queue().complete(transaction_id)
+    except Exception as e:
+        logger.warning("Could not remove %s from the review queue: %s", transaction_id, e)
+
+
+@api_v1_router.get("/admin/review-queue")
+async def get_review_queue():
+    """Tareas de revisión manual esperando analista"""
+    return {"pending": await _review_queue().pending()}
+
+
+@api_v1_router.post("/admin/review-queue/claim")
+async def claim_review_tasks(
+    claim: ReviewClaimRequest,
+    analyst_id: str = Header(..., alias="X-Analyst-ID"),
+):
+    """
+    HU-010: Entrega al analista un lote de transacciones por revisar
+
+    Las tareas salen por prioridad (riesgo, monto y antigüedad) y quedan
+    asignadas al analista hasta leaseExpiresAt; si no las decide antes,
+    vuelven a la cola para otro analista.
+    """
+    from src.config import settings
+
+    lease_seconds = claim.leaseSeconds or settings.review_lease_seconds
+    tasks = await _review_queue().claim(
+        analyst_id, claim.batchSize or settings.review_batch_size, lease_seconds
+    )
+    return {
+        "analystId": analyst_id,
+        "tasks": [
+            {
+                "transactionId": task["transaction_id"],
+                "userId": task.get("user_id"),
+                "riskLevel": task["risk_level"],
+                "amount": task.get("amount"),
+                "violations": task.get("reasons", []),
+                "enqueuedAt": _iso_utc(datetime.fromtimestamp(task["enqueued_at"])),
+                "priority": round(task["priority"], 2),
+            }
+            for task in tasks
+        ],
+        "leaseExpiresAt": _iso_utc(datetime.fromtimestamp(tasks[0]["lease_expires_at"])) if tasks else None,
+    }
+
+
+@api_v1_router.post("/admin/review-queue/{transaction_id}/complete")
+async def complete_review_task(
+    transaction_id: str,
+    analyst_id: str = Header(..., alias="X-Analyst-ID"),
+):
+    """
+    Libera una tarea asignada al analista (p.ej. decidida por otro canal)
+
+    409 si la tarea está asignada a otro analista: su lease venció y se
+    reasignó.
+    """
+    from src.application.interfaces import LeaseConflictError
+
+    try:
+        completed = await _review_queue().complete(transaction_id, analyst_id)
+    except LeaseConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not completed:
+        raise HTTPException(status_code=404, detail=f"Review task {transaction_id} not found")
+    return {"status": "completed", "transactionId": transaction_id}
+
+
 @router.get("/config/thresholds")
 async def get_thresholds():
     """
@@ -581,8 +874,11 @@ async def validate_transaction_sync(transaction: TransactionValidateRequest):
     Retorna resultado inmediato con status, riskScore y violations.
     """
     try:
-        # DEBUG: Ver qué llega
-        print(f"[ROUTE] Received - userId: {transaction.userId}, deviceId: {transaction.deviceId}")
+        started = time.perf_counter()
+        
+        # Resolver la ubicación antes de tocar Redis/MongoDB: si no se
+        # reconoce el request falla con 422
+        location_dict = _parse_location(transaction.location)
         
         # Instanciar dependencias
         repository = _repository_factory()
@@ -590,16 +886,28 @@ async def validate_transaction_sync(transaction: TransactionValidateRequest):
         publisher = _publisher_factory()
         
         # Obtener reglas deshabilitadas y crear estrategias
-        disabled_rules = await _get_disabled_rules(cache)
-        strategies = await _build_strategies(disabled_rules, cache, repository)
+        with TRACER.start_span("gateway.get_disabled_rules"):
+            disabled_rules = await _get_disabled_rules(cache)
+        with TRACER.start_span("gateway.build_strategies"):
+            strategies = await _build_strategies(disabled_rules, cache, repository)
         
         # Crear use case
+        from src.config import settings
         from src.application.use_cases import EvaluateTransactionUseCase
+        from src.adapters import build_fallback_policies, build_location_profile
+        from src.infrastructure.metrics import PrometheusMetricsRecorder
         import uuid
-        evaluate_use_case = EvaluateTransactionUseCase(repository, publisher, cache, strategies)
+        evaluate_use_case = EvaluateTransactionUseCase(
+            repository, publisher, cache, strategies,
+            metrics=PrometheusMetricsRecorder(), tracer=TRACER,
+            location_profile=build_location_profile(cache),
+            cost_aware=settings.rule_cost_aware,
+            risk_ceiling=RiskLevel[settings.rule_risk_ceiling],
+            events=_event_publisher_factory(),
+            fallback_policies=build_fallback_policies(),
+        )
         
-        # Parsear ubicación y ajustar monto
-        location_dict = _parse_location(transaction.location)
+        # Ajustar monto
         transaction_type = getattr(transaction, 'transactionType', 'transfer')
         adjusted_amount = _adjust_amount_by_type(transaction.amount, transaction_type)
         
@@ -615,11 +923,18 @@ async def validate_transaction_sync(transaction: TransactionValidateRequest):
             "description": getattr(transaction, 'description', None)
         }
         
-        # DEBUG: Ver payload completo
-        print(f"[ROUTE] transaction_data: device_id={transaction_data.get('device_id')}")
-        
         # Evaluar transacción
         result = await evaluate_use_case.execute(transaction_data)
+        logger.info(
+            "transaction validated",
+            extra={
+                "transaction_id": transaction_data["id"],
+                "user_id": transaction.userId,
+                "device_id": transaction.deviceId,
+                "risk_level": result["risk_level"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
         
         # Mapear resultado
         risk_level = result["risk_level"]
@@ -729,7 +1044,7 @@ async def _load_custom_rule_parameters(cache, default_rules):
         await _load_rapid_transaction_params(cache, default_rules)
         await _load_unusual_time_params(cache, default_rules)
     except Exception as e:
-        print(f"Error loading custom rule parameters from Redis: {e}")
+        logger.warning("Error loading custom rule parameters from Redis: %s", e)
 
 async def _get_deleted_rules(cache):
     """Obtiene las reglas eliminadas de Redis."""
@@ -738,7 +1053,7 @@ async def _get_deleted_rules(cache):
         deleted_set = await cache.redis.smembers("deleted_default_rules")
         deleted_rules = {r.decode('utf-8') if isinstance(r, bytes) else r for r in deleted_set}
     except Exception as e:
-        print(f"Error loading deleted rules: {e}")
+        logger.warning("Error loading deleted rules: %s", e)
     return deleted_rules
 
 async def _get_disabled_rules(cache):
@@ -748,7 +1063,7 @@ async def _get_disabled_rules(cache):
         disabled_set = await cache.redis.smembers("disabled_default_rules")
         disabled_rules = {r.decode('utf-8') if isinstance(r, bytes) else r for r in disabled_set}
     except Exception as e:
-        print(f"Error loading disabled rules: {e}")
+        logger.warning("Error loading disabled rules: %s", e)
     return disabled_rules
 
 def _get_custom_rules(repository):
@@ -767,7 +1082,7 @@ def _get_custom_rules(repository):
                     "order": rule_doc["order"]
                 })
     except Exception as e:
-        print(f"Error loading custom rules: {e}")
+        logger.warning("Error loading custom rules: %s", e)
     return custom_rules
 
 @api_v1_router.get("/admin/rules")
@@ -802,10 +1117,13 @@ async def get_rules():
         # Obtener reglas DESHABILITADAS de Redis (estas sí deben aparecer pero con enabled=false)
         disabled_rules = await _get_disabled_rules(cache)
         
-        # Marcar reglas predeterminadas deshabilitadas (NO filtrarlas)
+        # Marcar reglas predeterminadas deshabilitadas (NO filtrarlas) y
+        # aplicar el orden persistido
+        rule_order = await _get_rule_order(cache)
         for rule in default_rules:
             if rule["id"] in disabled_rules:
                 rule["enabled"] = False
+            rule["order"] = rule_order.get(rule["id"], rule["order"])
         
         # Obtener reglas personalizadas de MongoDB (TODAS, no solo enabled)
         repository = _repository_factory()
@@ -857,6 +1175,7 @@ async def update_rule(
         else:
             # Intentar actualizar regla personalizada en MongoDB
             _update_custom_rule(rule_id, rule_params, repository, analyst_id)
+            await _rules_changed(cache)
         
         # Construir respuesta
         if rule_data is None:
@@ -886,60 +1205,31 @@ async def get_transactions_log(
     Permite filtrar por estado, usuario y limitar cantidad de resultados.
     Utilizado por el Dashboard Admin para monitoreo.
     """
+    from starlette.concurrency import run_in_threadpool
+
     try:
         repository = _repository_factory()
         
-        # Obtener todas las evaluaciones
-        evaluations = await repository.get_all_evaluations()
-        
-        # Filtrar por user_id si se especifica
-        if user_id:
-            evaluations = [e for e in evaluations if e.user_id == user_id]
-        
-        # Filtrar por status si se especifica
+        # Mapear status del frontend a status del backend
+        backend_status = None
         if status:
-            # Mapear status del frontend a status del backend
             status_map = {
                 "APPROVED": "APPROVED",
                 "SUSPICIOUS": "PENDING_REVIEW",
                 "REJECTED": "REJECTED"
             }
             backend_status = status_map.get(status.upper(), status.upper())
-            evaluations = [e for e in evaluations if e.status == backend_status]
-        
-        # Limitar resultados si se especificó un límite
-        if limit is not None:
-            evaluations = evaluations[:limit]
         
-        # Helper para mapear status
-        def map_status_to_frontend(status: str) -> str:
-            if status == "APPROVED":
-                return "APPROVED"
-            elif status == "PENDING_REVIEW":
-                return "SUSPICIOUS"
-            else:
-                return "REJECTED"
-        
-        # Formatear respuesta con datos de la evaluación
-        result = []
-        for e in evaluations:
-            frontend_status = map_status_to_frontend(e.status)
-            
-            result.append({
-                "id": e.transaction_id,
-                "amount": float(e.amount) if e.amount else 0.0,
-                "userId": e.user_id,
-                "date": _iso_utc(e.timestamp),
-                "status": frontend_status,
-                "violations": e.reasons,
-                "riskLevel": e.risk_level.name,
-                "location": f"{e.location.latitude}, {e.location.longitude}" if e.location else "N/A",
-                "userAuthenticated": e.user_authenticated,
-                "reviewedBy": e.reviewed_by,
-                "reviewedAt": _iso_utc(e.reviewed_at) if e.reviewed_at else None
-            })
+        # Filtros y límite se resuelven en MongoDB; solo viajan los campos del log
+        rows = await run_in_threadpool(
+            repository.list_evaluations,
+            LOG_ROW_FIELDS,
+            user_id=user_id,
+            status=backend_status,
+            limit=limit,
+        )
         
-        return result
+        return FastJSONResponse([_log_row(row) for row in rows])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching transaction log: {str(e)}")
 
@@ -1050,6 +1340,100 @@ async def get_trends():
         raise HTTPException(status_code=500, detail=f"Error fetching trends: {str(e)}")
 
 
+# Filas recientes del log incluidas en el snapshot del feed admin
+DASHBOARD_RECENT_ROWS = 50
+
+
+async def _dashboard_snapshot(repository) -> dict:
+    """
+    Estado inicial del feed admin: contadores de Redis (sembrados desde
+    MongoDB solo la primera vez) y las últimas filas del log
+    """
+    from datetime import timedelta
+    from starlette.concurrency import run_in_threadpool
+
+    snapshot = await _dashboard_counters.read()
+    if not snapshot["seeded"]:
+        totals = await run_in_threadpool(repository.count_evaluations)
+        since = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=23)
+        hourly = await run_in_threadpool(repository.count_evaluations, since, True)
+        await _dashboard_counters.seed(totals, hourly)
+        snapshot = await _dashboard_counters.read()
+
+    rows = await run_in_threadpool(
+        repository.list_evaluations, LOG_ROW_FIELDS, limit=DASHBOARD_RECENT_ROWS
+    )
+    return {
+        "type": "snapshot",
+        "seq": snapshot["seq"],
+        "counters": snapshot["counters"],
+        "hourly": snapshot["hourly"],
+        "recent": [_log_row(row) for row in rows],
+    }
+
+
+async def _admin_event_stream(request: Request, subscription, snapshot: dict, heartbeat: float = HEARTBEAT_SECONDS):
+    """
+    Cuerpo SSE del feed admin: el snapshot y después solo los deltas
+    posteriores a él (seq mayor), con la fila ya en el formato del log
+    """
+    try:
+        yield "retry: 5000\n\n"
+        yield format_sse(serialization.dumps_str(snapshot), event="snapshot")
+        while not await request.is_disconnected():
+            data = await subscription.get(timeout=heartbeat)
+            if data is None:
+                yield ": keepalive\n\n"
+                continue
+            event = serialization.loads(data)
+            if event["seq"] <= snapshot["seq"]:
+                continue  # Ya contado en el snapshot
+            if "rows" in event:
+                event["rows"] = [_log_row(row) for row in event["rows"]]
+            else:
+                event["row"] = _log_row(event["row"])
+            yield format_sse(serialization.dumps_str(event), event=event["type"])
+    finally:
+        subscription.close()
+
+
+@api_v1_router.get("/admin/stream")
+async def stream_dashboard(request: Request):
+    """
+    Feed en vivo del Dashboard Admin (Server-Sent Events)
+
+    Protocolo:
+    - snapshot: {seq, counters, hourly, recent} al conectar. counters usa
+      campos total, status:<estado> y risk:<nivel>; hourly agrupa por hora
+      ("YYYYmmddHH") los estados de las últimas 24 horas
+    - evaluation / status_change: {seq, counters, hour, hourly, row} con
+      los deltas a sumar y la fila del log a insertar o reemplazar
+    - status_changes: {seq, counters, hours, rows} para una revisión
+      masiva; hours trae los deltas por hora ({hora: {estado: n}})
+
+    Cada analista conectado cuesta una lectura de Redis y una consulta
+    acotada a MongoDB al conectar; después solo recibe eventos, sin
+    recorrer la colección como /admin/metrics, /admin/trends y
+    /admin/transactions/log.
+    """
+    if _event_hub is None or _dashboard_counters is None:
+        raise HTTPException(status_code=503, detail="Event stream is not available")
+
+    # Suscribirse antes de leer el snapshot: ningún evento queda entre ambos
+    subscription = _event_hub.subscribe(ADMIN_CHANNEL)
+    try:
+        snapshot = await _dashboard_snapshot(_repository_factory())
+    except Exception as e:
+        subscription.close()
+        raise HTTPException(status_code=500, detail=f"Error building dashboard snapshot: {str(e)}")
+
+    return StreamingResponse(
+        _admin_event_stream(request, subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @api_v1_router.post("/admin/rules")
 async def create_rule(
     rule: dict,
@@ -1066,6 +1450,9 @@ async def create_rule(
         if "name" not in rule or "type" not in rule or "parameters" not in rule:
             raise ValueError("Missing required fields: name, type, parameters")
         
+        # Una regla que no compila nunca se ejecutaría: se rechaza con 422
+        compile_rule(rule)
+        
         # Generar ID único para la regla
         import uuid
         from datetime import datetime
@@ -1088,6 +1475,7 @@ async def create_rule(
         repository = _repository_factory()
         if hasattr(repository, 'db'):
             repository.db.custom_rules.insert_one(rule_doc)
+            await _rules_changed(_cache_factory())
         
         return {
             "success": True,
@@ -1129,6 +1517,7 @@ async def delete_rule(
             message = "Default rule deleted permanently"
         else:
             _delete_custom_rule(rule_id, repository)
+            await _rules_changed(cache)
             message = "Custom rule deleted successfully"
         
         return {
@@ -1149,26 +1538,51 @@ async def reorder_rules(
 ):
     """
     Reordena el Chain of Responsibility
-    
-    Permite cambiar el orden de ejecución de las reglas de fraude.
-    Implementación simplificada - en producción guardar en BD.
+
+    Las reglas listadas pasan a las posiciones 1, 2, ... y las no listadas
+    quedan detrás conservando su orden relativo. Se persiste la posición de
+    todas: las predeterminadas en el hash rule_order de Redis y las
+    personalizadas en el campo `order` de custom_rules. La evaluación
+    (gateway y worker) ejecuta las estrategias en este orden (en modo
+    cost_aware, dentro de cada nivel de costo).
     """
     try:
+        cache = _cache_factory()
+        repository = _repository_factory()
+
+        from starlette.concurrency import run_in_threadpool
+        deleted_rules = await _get_deleted_rules(cache)
+        rule_order = await _get_rule_order(cache)
+        default_ids = _get_default_rule_ids() - deleted_rules
+        custom_rules = await run_in_threadpool(_get_custom_rules, repository)
+        custom_ids = {rule["id"] for rule in custom_rules}
+
         # Validar que los IDs sean válidos
-        valid_rule_ids = {"rule_amount_threshold", "rule_location_check"}
-        invalid_ids = [rid for rid in reorder.ruleIds if rid not in valid_rule_ids]
-        
+        invalid_ids = [rid for rid in reorder.ruleIds if rid not in default_ids and rid not in custom_ids]
         if invalid_ids:
             raise ValueError(f"Invalid rule IDs: {invalid_ids}")
-        
-        # En producción, actualizar el orden en la base de datos
-        # Por ahora, solo retornar éxito
+        if len(set(reorder.ruleIds)) != len(reorder.ruleIds):
+            raise ValueError("Duplicated rule IDs")
+
+        # Orden actual (el mismo que muestra GET /admin/rules) para ubicar las no listadas
+        current = [(rule_order.get(rid, DEFAULT_RULE_ORDER[rid]), rid) for rid in DEFAULT_RULE_ORDER if rid in default_ids]
+        current += [(rule["order"], rule["id"]) for rule in custom_rules]
+        current.sort(key=lambda pair: pair[0])
+        listed = set(reorder.ruleIds)
+        ordered_ids = list(reorder.ruleIds) + [rid for _, rid in current if rid not in listed]
+
+        new_order = {rid: idx + 1 for idx, rid in enumerate(ordered_ids)}
+        default_order = {rid: order for rid, order in new_order.items() if rid in default_ids}
+        if default_order:
+            await cache.redis.hset(RULE_ORDER_KEY, mapping=default_order)
+        custom_order = {rid: order for rid, order in new_order.items() if rid in custom_ids}
+        if custom_order:
+            await run_in_threadpool(_persist_custom_rule_order, repository, custom_order)
+        await _rules_changed(cache)
+
         return {
             "success": True,
-            "newOrder": [
-                {"id": rid, "order": idx + 1}
-                for idx, rid in enumerate(reorder.ruleIds)
-            ],
+            "newOrder": [{"id": rid, "order": order} for rid, order in new_order.items()],
             "updated_by": analyst_id
         }
     except ValueError as e:
@@ -1176,6 +1590,12 @@ async def reorder_rules(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reordering rules: {str(e)}")
 
+
+def _persist_custom_rule_order(repository, custom_order: Dict[str, int]) -> None:
+    """Guarda la prioridad de reglas personalizadas (no cambia su versión compilada)"""
+    for rule_id, order in custom_order.items():
+        repository.db.custom_rules.update_one({"id": rule_id}, {"$set": {"order": order}})
+
 # ============================================================================
 # ENDPOINTS PARA USUARIO
 # ============================================================================
@@ -1197,33 +1617,33 @@ async def get_user_transactions(
     
     try:
         repository = _repository_factory()
-        # Ejecutar en thread pool ya que es síncrono
-        evaluations = await run_in_threadpool(
-            repository.get_evaluations_by_user, user_id
+        # Ejecutar en thread pool ya que es síncrono; el límite lo aplica MongoDB
+        rows = await run_in_threadpool(
+            repository.list_evaluations, USER_ROW_FIELDS, user_id=user_id, limit=limit
         )
         
-        # Limitar resultados
-        evaluations = evaluations[:limit]
-        
-        return [
-            {
-                "id": e.transaction_id,
-                "userId": e.user_id,
-                "amount": float(e.amount) if e.amount else None,
-                "location": f"{e.location.latitude}, {e.location.longitude}" if e.location else None,
-                "timestamp": _iso_utc(e.timestamp),
-                "status": e.status,
-                "riskScore": e.risk_level.value,
-                "violations": e.reasons,
-                "needsAuthentication": e.status == "PENDING_REVIEW" and e.user_authenticated is None,
-                "userAuthenticated": e.user_authenticated,
-                "reviewedBy": e.reviewed_by,
-                "reviewedAt": _iso_utc(e.reviewed_at) if e.reviewed_at else None,
-                "transactionType": e.transaction_type,
-                "description": e.description
-            }
-            for e in evaluations
-        ]
+        result = []
+        for row in rows:
+            amount = row.get("amount")
+            row_status = row.get("status", "PENDING_REVIEW")
+            authenticated = row.get("user_authenticated")
+            result.append({
+                "id": row["transaction_id"],
+                "userId": row.get("user_id", user_id),
+                "amount": float(amount) if amount else None,
+                "location": _row_location(row),
+                "timestamp": row["timestamp"],
+                "status": row_status,
+                "riskScore": _RISK_SCORES[row["risk_level"]],
+                "violations": row["reasons"],
+                "needsAuthentication": row_status == "PENDING_REVIEW" and authenticated is None,
+                "userAuthenticated": authenticated,
+                "reviewedBy": row.get("reviewed_by"),
+                "reviewedAt": row.get("reviewed_at"),
+                "transactionType": row.get("transaction_type"),
+                "description": row.get("description")
+            })
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving transactions: {str(e)}")
 
@@ -1265,6 +1685,7 @@ async def authenticate_transaction(
         
         # Guardar en BD
         await run_in_threadpool(repository.update_evaluation, evaluation)
+        await run_in_threadpool(_event_publisher_factory().publish_status_change, evaluation)
         
         return {
             "status": "authenticated",
@@ -1277,3 +1698,75 @@ async def authenticate_transaction(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error authenticating transaction: {str(e)}")
+
+
+async def _event_stream(request: Request, subscription, heartbeat: float = HEARTBEAT_SECONDS):
+    """
+    Cuerpo SSE: eventos de la suscripción y un comentario cada `heartbeat`
+    segundos sin eventos (mantiene la conexión viva y detecta desconexiones)
+    """
+    try:
+        # Si la conexión se corta, EventSource reintenta a los 5 s
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            data = await subscription.get(timeout=heartbeat)
+            yield ": keepalive\n\n" if data is None else format_sse(data, event="transaction_status")
+    finally:
+        subscription.close()
+
+
+# Cookie con el JWT para los streams SSE (alternativa a ?token=)
+ACCESS_TOKEN_COOKIE = "access_token"
+
+
+@api_v1_router.get("/user/events/{user_id}")
+async def stream_user_events(
+    user_id: str,
+    request: Request,
+    token: Optional[str] = Query(None, description="JWT de /auth/login (EventSource no puede enviar headers)"),
+):
+    """
+    Cambios de estado de las transacciones del usuario (Server-Sent Events)
+
+    Reemplaza el polling del historial: cada decisión del analista o
+    autenticación del usuario llega como un evento `transaction_status`.
+    Al (re)conectar, el cliente debe pedir /user/transactions/{user_id} una
+    vez para resincronizar lo que pasó mientras estuvo desconectado.
+
+    Requiere el JWT del mismo usuario en ?token=, en la cookie access_token
+    o en el header Authorization: 401 sin token válido, 403 si es de otro
+    usuario. El access log de uvicorn oculta el valor de ?token=
+    (logging_config.QueryRedactionFilter).
+    """
+    if _event_hub is None or _jwt_service_factory is None:
+        raise HTTPException(status_code=503, detail="Event stream is not available")
+    if _stream_user(request, token) != user_id:
+        raise HTTPException(status_code=403, detail="Not allowed to read another user's events")
+
+    subscription = _event_hub.subscribe(user_channel(user_id))
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        # Sin buffering en proxies (nginx) ni caché: cada evento sale al instante
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _stream_user(request: Request, token: Optional[str]) -> str:
+    """
+    user id (sub) del JWT de un stream
+
+    Raises:
+        HTTPException: 401 si no hay token o no es válido
+    """
+    if not token:
+        token = request.cookies.get(ACCESS_TOKEN_COOKIE)
+    if not token:
+        scheme, _, value = request.headers.get("authorization", "").partition(" ")
+        token = value if scheme.lower() == "bearer" else None
+    payload = _jwt_service_factory().verify_token(token) if token else None
+    if not payload or not payload.get("sub"):
+        raise HTTPException(
+            status_code=401, detail="Invalid or expired token", headers={"WWW-Authenticate": "Bearer"}
+        )
+    return payload["sub"]
@@ -12,20 +12,38 @@ La IA sugirió un solo adaptador genérico "DataAdapter". Lo refactoricé en
 tres adaptadores específicos para cumplir con Interface Segregation y
 Single Responsibility.
 """
-from typing import List, Optional
-from datetime import datetime
-from pymongo import MongoClient
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from datetime import datetime, timedelta
+from pymongo import MongoClient, UpdateOne
 import redis.asyncio as redis_async
 import redis
 import pika
-import json
 from src.application.interfaces import (
     TransactionRepository,
     MessagePublisher,
     CacheService,
+    EvaluationRow,
+    EvaluationEventPublisher,
+    LeaseConflictError,
+    LocationProfileStore,
+    ReviewQueue,
+    ReviewTask,
+    SubmissionRegistry,
 )
-from src.domain.models import FraudEvaluation, RiskLevel
+from src.domain.models import FraudEvaluation, Location, RiskLevel
+from src.domain.money import Money
+from src.domain.review_priority import ReviewPriorityPolicy
 from src.config import settings
+from src.infrastructure.circuit_breaker import breaker_for, guard_client, parse_fallback_policies
+from src.infrastructure.metrics import instrument_client
+from src.infrastructure.tracing import TRACER, inject
+from src.infrastructure import serialization
+from src.infrastructure.event_stream import ADMIN_CHANNEL, user_channel
+from src.infrastructure.partitioning import partition_for, partition_queue, partition_queues, queue_arguments
+
+logger = logging.getLogger(__name__)
 
 
 class MongoDBAdapter(TransactionRepository):
@@ -41,22 +59,38 @@ class MongoDBAdapter(TransactionRepository):
     a Motor después si es necesario (YAGNI principle).
     """
 
-    def __init__(self, connection_string: str, database_name: str) -> None:
+    def __init__(self, connection_string: str, database_name: str, create_indexes: bool = True) -> None:
         """
         Inicializa el adaptador de MongoDB
         
         Args:
             connection_string: URL de conexión a MongoDB
             database_name: Nombre de la base de datos
+            create_indexes: Crear los índices al construir. El worker los
+                crea al arrancar con ensure_indexes() detrás del breaker
         """
-        self.client = MongoClient(connection_string)
+        timeout_ms = settings.mongodb_timeout_ms
+        self.client = MongoClient(
+            connection_string,
+            serverSelectionTimeoutMS=timeout_ms,
+            connectTimeoutMS=timeout_ms,
+            socketTimeoutMS=timeout_ms,
+        )
         self.db = self.client[database_name]
-        self.evaluations = self.db.evaluations
+        # Proxy que cuenta/cronometra cada operación sobre la colección (/metrics)
+        self.evaluations = instrument_client(self.db.evaluations, "mongodb")
+        if create_indexes:
+            self.ensure_indexes()
 
+    def ensure_indexes(self) -> None:
+        """Crea los índices de evaluations (idempotente)"""
         # Crear índices para mejorar performance
         self.evaluations.create_index("transaction_id", unique=True)
         self.evaluations.create_index([("timestamp", -1)])
         self.evaluations.create_index("user_id")
+        # Listados: historial por usuario y log filtrado por estado, ambos por fecha
+        self.evaluations.create_index([("user_id", 1), ("timestamp", -1)])
+        self.evaluations.create_index([("status", 1), ("timestamp", -1)])
 
     async def save_evaluation(self, evaluation: FraudEvaluation) -> None:
         """
@@ -76,6 +110,9 @@ class MongoDBAdapter(TransactionRepository):
             "status": evaluation.status,
             "reviewed_by": evaluation.reviewed_by,
             "reviewed_at": evaluation.reviewed_at,
+            # amount_cents es la fuente de verdad; amount (float) se mantiene
+            # para consultas y dashboards existentes
+            "amount_cents": Money.parse(evaluation.amount).cents if evaluation.amount else None,
             "amount": float(evaluation.amount) if evaluation.amount else None,
             "location": {
                 "latitude": evaluation.location.latitude,
@@ -121,8 +158,80 @@ class MongoDBAdapter(TransactionRepository):
         Returns:
             Lista de evaluaciones ordenadas por timestamp descendente
         """
-        documents = self.evaluations.find({"user_id": user_id}).sort("timestamp", -1)
-        return [self._document_to_evaluation(doc) for doc in documents]
+        with TRACER.start_span("mongodb.evaluations_by_user") as span:
+            documents = self.evaluations.find({"user_id": user_id}).sort("timestamp", -1)
+            evaluations = [self._document_to_evaluation(doc) for doc in documents]
+            span.set_attribute("db.rows", len(evaluations))
+        return evaluations
+
+    def list_evaluations(
+        self,
+        fields: Iterable[str],
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[EvaluationRow]:
+        """
+        Listado liviano de evaluaciones, más recientes primero
+
+        Solo trae de MongoDB los campos pedidos (proyección) y retorna los
+        documentos como dicts, sin construir entidades. Los filtros y el
+        límite se resuelven en la base de datos.
+
+        Args:
+            fields: Campos de EvaluationRow a incluir
+            user_id: Filtrar por usuario
+            status: Filtrar por estado (APPROVED, PENDING_REVIEW, REJECTED)
+            limit: Máximo de filas (None = todas)
+        """
+        query = {}
+        if user_id:
+            query["user_id"] = user_id
+        if status:
+            query["status"] = status
+
+        projection = dict.fromkeys(fields, 1)
+        projection["_id"] = 0
+
+        with TRACER.start_span("mongodb.list_evaluations") as span:
+            cursor = self.evaluations.find(query, projection).sort("timestamp", -1)
+            if limit:
+                cursor = cursor.limit(limit)
+            rows = list(cursor)
+            span.set_attribute("db.rows", len(rows))
+        return rows
+
+    def list_enabled_custom_rules(self) -> List[Dict[str, Any]]:
+        """
+        Reglas personalizadas habilitadas, solo con los campos que necesita
+        el compilador de reglas (domain/rules.py)
+        """
+        projection = {"_id": 0, "id": 1, "name": 1, "type": 1, "parameters": 1, "order": 1, "updated_at": 1}
+        with TRACER.start_span("mongodb.list_custom_rules"):
+            return list(self.db.custom_rules.find({"enabled": True}, projection))
+
+    def count_evaluations(
+        self, since: Optional[datetime] = None, by_hour: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Conteos por estado y nivel de riesgo, agrupados en MongoDB
+
+        Args:
+            since: Solo evaluaciones con timestamp >= since
+            by_hour: Agrupar también por hora ("YYYYmmddHH" en `hour`)
+
+        Returns:
+            Filas {"status", "risk_level", ["hour"], "count"}
+        """
+        group = {"status": "$status", "risk_level": "$risk_level"}
+        if by_hour:
+            group["hour"] = {"$dateToString": {"format": "%Y%m%d%H", "date": "$timestamp"}}
+        pipeline = [{"$group": {"_id": group, "count": {"$sum": 1}}}]
+        if since is not None:
+            pipeline.insert(0, {"$match": {"timestamp": {"$gte": since}}})
+
+        with TRACER.start_span("mongodb.count_evaluations"):
+            return [{**row["_id"], "count": row["count"]} for row in self.evaluations.aggregate(pipeline)]
 
     def update_evaluation(self, evaluation: FraudEvaluation) -> None:
         """
@@ -147,6 +256,70 @@ class MongoDBAdapter(TransactionRepository):
         if result.matched_count == 0:
             raise ValueError(f"Transaction {evaluation.transaction_id} not found")
 
+    def get_evaluations_by_ids(self, transaction_ids: Iterable[str]) -> List[FraudEvaluation]:
+        """Evaluaciones de varias transacciones en una sola consulta (las inexistentes se omiten)"""
+        with TRACER.start_span("mongodb.evaluations_by_ids") as span:
+            documents = self.evaluations.find({"transaction_id": {"$in": list(transaction_ids)}})
+            evaluations = [self._document_to_evaluation(doc) for doc in documents]
+            span.set_attribute("db.rows", len(evaluations))
+        return evaluations
+
+    def apply_manual_decisions(
+        self, evaluations: Sequence[FraudEvaluation], expected_status: str = "PENDING_REVIEW"
+    ) -> Set[str]:
+        """
+        Guarda decisiones manuales con un solo bulk_write de updates
+        condicionales: solo se actualizan filas que siguen en expected_status
+
+        Returns:
+            transaction_id de las evaluaciones que quedaron con la decisión
+
+        Nota del desarrollador:
+        bulk_write solo informa totales. Si alguna fila no coincidió (otro
+        analista la decidió entre la lectura y la escritura) se consulta el
+        estado final de esas filas, una consulta más solo en ese caso.
+        """
+        if not evaluations:
+            return set()
+        operations = [
+            UpdateOne(
+                {"transaction_id": evaluation.transaction_id, "status": expected_status},
+                {"$set": {
+                    "status": evaluation.status,
+                    "reviewed_by": evaluation.reviewed_by,
+                    "reviewed_at": evaluation.reviewed_at,
+                }},
+            )
+            for evaluation in evaluations
+        ]
+        with TRACER.start_span("mongodb.bulk_review") as span:
+            result = self.evaluations.bulk_write(operations, ordered=False)
+            span.set_attribute("db.rows", result.matched_count)
+
+        transaction_ids = [evaluation.transaction_id for evaluation in evaluations]
+        if result.matched_count == len(operations):
+            return set(transaction_ids)
+
+        wanted = {evaluation.transaction_id: (evaluation.status, evaluation.reviewed_by) for evaluation in evaluations}
+        rows = self.evaluations.find(
+            {"transaction_id": {"$in": transaction_ids}},
+            {"_id": 0, "transaction_id": 1, "status": 1, "reviewed_by": 1},
+        )
+        return {
+            row["transaction_id"] for row in rows
+            if (row.get("status"), row.get("reviewed_by")) == wanted[row["transaction_id"]]
+        }
+
+    @staticmethod
+    def _document_amount(document: dict) -> Optional[Money]:
+        """Monto desde amount_cents; documentos anteriores solo traen amount (float)"""
+        cents = document.get("amount_cents")
+        if cents is not None:
+            return Money(cents)
+        if document.get("amount"):
+            return Money.parse(document["amount"])
+        return None
+
     def _document_to_evaluation(self, document: dict) -> FraudEvaluation:
         """
         Convierte un documento de MongoDB a entidad FraudEvaluation
@@ -154,24 +327,24 @@ class MongoDBAdapter(TransactionRepository):
         Nota del desarrollador:
         La IA olvidó manejar el enum RiskLevel. Agregué conversión explícita
         para evitar errores de tipos.
+
+        Usa from_trusted: los documentos los escribió save_evaluation a partir
+        de entidades ya validadas, así que no repetimos __post_init__ por fila.
         """
-        from decimal import Decimal
-        
         location = None
         if document.get("location"):
-            from src.domain.models import Location
-            location = Location(
+            location = Location.from_trusted(
                 latitude=document["location"]["latitude"],
                 longitude=document["location"]["longitude"]
             )
         
-        return FraudEvaluation(
+        return FraudEvaluation.from_trusted(
             transaction_id=document["transaction_id"],
             user_id=document.get("user_id", "unknown"),
             risk_level=RiskLevel[document["risk_level"]],  # Usar RiskLevel[name] en lugar de RiskLevel(value)
             reasons=document["reasons"],
             timestamp=document["timestamp"],
-            amount=Decimal(str(document["amount"])) if document.get("amount") else None,
+            amount=self._document_amount(document),
             location=location,
             status=document.get("status", "PENDING_REVIEW"),
             reviewed_by=document.get("reviewed_by"),
@@ -198,11 +371,27 @@ class RedisAdapter(CacheService):
             connection_string: URL de conexión a Redis
             ttl: Tiempo de vida por defecto en segundos
         """
-        self.redis = redis_async.from_url(connection_string, decode_responses=True)
+        timeouts = {
+            "socket_timeout": settings.redis_timeout_seconds,
+            "socket_connect_timeout": settings.redis_timeout_seconds,
+        }
+        # Ambos clientes comparten el breaker "redis": si uno detecta la
+        # caída, el otro deja de esperar timeouts
+        breaker = breaker_for("redis")
+        self.redis = guard_client(instrument_client(
+            redis_async.from_url(connection_string, decode_responses=True, **timeouts), "redis"
+        ), breaker)
         # Cliente síncrono para estrategias que no pueden usar async/await
-        self.redis_sync = redis.from_url(connection_string, decode_responses=True)
+        self.redis_sync = guard_client(instrument_client(
+            redis.from_url(connection_string, decode_responses=True, **timeouts), "redis"
+        ), breaker)
         self.ttl = ttl
 
+    async def close(self) -> None:
+        """Cierra los pools de ambos clientes (adaptador compartido del gateway)"""
+        await self.redis.aclose()
+        self.redis_sync.close()
+
     async def get_user_location(self, user_id: str) -> Optional[dict]:
         """
         Obtiene la ubicación histórica del usuario
@@ -216,8 +405,8 @@ class RedisAdapter(CacheService):
             return None
 
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return serialization.loads(data)
+        except ValueError:  # JSONDecodeError de json y de orjson
             return None
 
     async def set_user_location(
@@ -229,7 +418,7 @@ class RedisAdapter(CacheService):
         if ttl is None:
             ttl = self.ttl
 
-        location_data = json.dumps({"latitude": latitude, "longitude": longitude})
+        location_data = serialization.dumps({"latitude": latitude, "longitude": longitude})
         await self.redis.setex(f"user:{user_id}:location", ttl, location_data)
 
     async def get_threshold_config(self) -> Optional[dict]:
@@ -241,8 +430,8 @@ class RedisAdapter(CacheService):
             return None
 
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return serialization.loads(data)
+        except ValueError:
             return None
 
     async def set_threshold_config(
@@ -256,7 +445,7 @@ class RedisAdapter(CacheService):
         de 1 año para evitar que Redis lo elimine por falta de uso,
         pero permitir limpieza eventual si el sistema se reconfigura.
         """
-        config_data = json.dumps(
+        config_data = serialization.dumps(
             {
                 "amount_threshold": amount_threshold,
                 "location_radius_km": location_radius_km,
@@ -266,6 +455,655 @@ class RedisAdapter(CacheService):
         await self.redis.setex("config:thresholds", 31536000, config_data)
 
 
+class RedisLocationProfile(LocationProfileStore):
+    """
+    Perfil de ubicaciones frecuentes sobre Redis GEO
+
+    Por usuario:
+    - user:{id}:geo          sorted set GEO con el centro de cada cluster
+    - user:{id}:geo:weights  hash cluster -> transacciones agrupadas
+
+    Buscar el cluster más cercano es un GEOSEARCH (en pipeline con el hash de
+    pesos, un solo round trip). Registrar una ubicación es una lectura y una
+    escritura en pipeline; no se lee el historial de transacciones.
+
+    Nota del desarrollador:
+    El clustering es incremental: el punto se une al cluster más cercano
+    dentro de `cluster_radius_km` y mueve su centro como media móvil (el peso
+    se topa en `max_weight` para que el centro siga adaptándose); si no hay
+    ninguno se abre un cluster nuevo y, con el perfil lleno, se descarta el
+    de menor peso. Dos registros simultáneos del mismo usuario pueden abrir
+    clusters duplicados, lo cual no afecta la búsqueda del más cercano.
+    """
+
+    # GEOSEARCH exige un radio: media circunferencia terrestre cubre el globo
+    _SEARCH_ALL_KM = 20038
+    # Redis GEO solo acepta latitudes dentro de la proyección Web Mercator
+    _MAX_LATITUDE = 85.05112878
+
+    def __init__(
+        self,
+        redis_client,
+        cluster_radius_km: float = 25.0,
+        max_clusters: int = 8,
+        ttl: int = 7776000,
+        max_weight: int = 50,
+    ) -> None:
+        """
+        Args:
+            redis_client: Cliente redis.asyncio (p.ej. RedisAdapter.redis)
+            cluster_radius_km: Distancia máxima para sumar un punto a un cluster
+            max_clusters: Clusters por usuario antes de descartar el menos usado
+            ttl: Vida del perfil sin actividad, en segundos (90 días por defecto)
+            max_weight: Peso máximo usado al mover el centro de un cluster
+        """
+        if cluster_radius_km <= 0 or max_clusters < 1:
+            raise ValueError("cluster_radius_km and max_clusters must be positive")
+        self.redis = redis_client
+        self.cluster_radius_km = cluster_radius_km
+        self.max_clusters = max_clusters
+        self.ttl = ttl
+        self.max_weight = max_weight
+
+    @staticmethod
+    def _keys(user_id: str):
+        return f"user:{user_id}:geo", f"user:{user_id}:geo:weights"
+
+    def _clamp_latitude(self, latitude: float) -> float:
+        return max(-self._MAX_LATITUDE, min(self._MAX_LATITUDE, latitude))
+
+    async def _nearest(self, user_id: str, latitude: float, longitude: float, radius_km: float):
+        """(cluster más cercano o None, pesos) en un round trip"""
+        geo_key, weights_key = self._keys(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.geosearch(
+            geo_key,
+            longitude=longitude,
+            latitude=self._clamp_latitude(latitude),
+            radius=radius_km,
+            unit="km",
+            sort="ASC",
+            count=1,
+            withcoord=True,
+        )
+        pipe.hgetall(weights_key)
+        hits, weights = await pipe.execute()
+        return (hits[0] if hits else None), weights
+
+    async def nearest_location(
+        self, user_id: str, latitude: float, longitude: float
+    ) -> Optional[dict]:
+        hit, weights = await self._nearest(user_id, latitude, longitude, self._SEARCH_ALL_KM)
+        if hit is None:
+            return None
+        member, (center_longitude, center_latitude) = hit
+        return {
+            "latitude": center_latitude,
+            "longitude": center_longitude,
+            "weight": int(weights.get(member, 1)),
+        }
+
+    async def record_location(self, user_id: str, latitude: float, longitude: float) -> None:
+        latitude = self._clamp_latitude(latitude)
+        hit, weights = await self._nearest(user_id, latitude, longitude, self.cluster_radius_km)
+        geo_key, weights_key = self._keys(user_id)
+
+        pipe = self.redis.pipeline(transaction=True)
+        if hit is not None:
+            member, (center_longitude, center_latitude) = hit
+            step = 1.0 / (min(int(weights.get(member, 1)), self.max_weight) + 1)
+            # Diferencia de longitud por el camino corto (clusters sobre el antimeridiano)
+            delta_longitude = (longitude - center_longitude + 180.0) % 360.0 - 180.0
+            new_longitude = (center_longitude + delta_longitude * step + 180.0) % 360.0 - 180.0
+            new_latitude = center_latitude + (latitude - center_latitude) * step
+            pipe.geoadd(geo_key, (new_longitude, new_latitude, member))
+        else:
+            if len(weights) >= self.max_clusters:
+                evicted = min(weights, key=lambda name: int(weights[name]))
+                pipe.zrem(geo_key, evicted)
+                pipe.hdel(weights_key, evicted)
+            member = f"{latitude:.4f},{longitude:.4f}"
+            pipe.geoadd(geo_key, (longitude, latitude, member))
+        pipe.hincrby(weights_key, member, 1)
+        pipe.expire(geo_key, self.ttl)
+        pipe.expire(weights_key, self.ttl)
+        await pipe.execute()
+
+
+def guard_repository(repository: TransactionRepository) -> TransactionRepository:
+    """
+    Repositorio detrás del breaker "mongodb"
+
+    Se envuelve el adaptador y no la colección: find() devuelve un cursor
+    perezoso y el error de red aparece al iterarlo, ya fuera del proxy.
+    """
+    return guard_client(repository, breaker_for("mongodb"))
+
+
+def build_fallback_policies() -> Dict[str, str]:
+    """Políticas de fallback por estrategia según Settings"""
+    return parse_fallback_policies(settings.strategy_fallback_policies)
+
+
+def build_location_profile(cache: RedisAdapter) -> Optional[RedisLocationProfile]:
+    """Perfil de ubicaciones según Settings, sobre el cliente async de la caché"""
+    if not settings.location_profile_enabled:
+        return None
+    return RedisLocationProfile(
+        cache.redis,
+        cluster_radius_km=settings.location_cluster_radius_km,
+        max_clusters=settings.location_profile_max_clusters,
+        ttl=settings.location_profile_ttl,
+    )
+
+
+# Contadores del dashboard admin (snapshot + deltas, ver RedisDashboardCounters)
+DASHBOARD_COUNTERS_KEY = "dashboard:counters"
+DASHBOARD_HOURLY_PREFIX = "dashboard:hourly:"
+DASHBOARD_HOURS = 24
+_DASHBOARD_HOURLY_TTL = (DASHBOARD_HOURS + 2) * 3600
+_DASHBOARD_STATUSES = ("APPROVED", "PENDING_REVIEW", "REJECTED")
+
+
+def dashboard_hour(timestamp: datetime) -> str:
+    """Bucket horario de los contadores ("YYYYmmddHH", hora local como las tendencias)"""
+    return timestamp.strftime("%Y%m%d%H")
+
+
+class RedisEvaluationEventPublisher(EvaluationEventPublisher):
+    """
+    Publica evaluaciones y cambios de estado en Redis pub/sub
+
+    - events:user:{user_id}: cambios de estado para el usuario
+    - events:admin: evaluaciones nuevas y cambios de estado para el
+      dashboard, con los deltas de contadores que aplicaron
+
+    Cada réplica del gateway reparte el mensaje a las conexiones SSE del
+    canal (infrastructure/event_stream.py). Sin suscriptores, PUBLISH no
+    cuesta más que un round trip.
+
+    Nota del desarrollador:
+    Los contadores y `seq` se actualizan en un MULTI y el evento lleva el
+    `seq` resultante: el gateway descarta los deltas que el snapshot de un
+    cliente recién conectado ya incluye.
+    """
+
+    def __init__(self, redis_client, async_client=None) -> None:
+        """
+        Args:
+            redis_client: Cliente redis síncrono (p.ej. RedisAdapter.redis_sync)
+                para ReviewTransactionUseCase y la autenticación del usuario
+            async_client: Cliente redis.asyncio para publish_evaluation (el
+                hot path de evaluación); sin él se usa el síncrono
+        """
+        self.redis = redis_client
+        self.async_client = async_client
+
+    @staticmethod
+    def status_event(evaluation: FraudEvaluation) -> Dict[str, Any]:
+        """Payload del evento: lo mínimo para actualizar la fila del historial"""
+        return {
+            "type": "transaction_status",
+            "transaction_id": evaluation.transaction_id,
+            "status": evaluation.status,
+            "risk_level": evaluation.risk_level.name,
+            "amount": evaluation.amount,
+            "reviewed_by": evaluation.reviewed_by,
+            "reviewed_at": evaluation.reviewed_at,
+            "user_authenticated": evaluation.user_authenticated,
+            "timestamp": evaluation.timestamp,
+        }
+
+    @staticmethod
+    def log_row(evaluation: FraudEvaluation) -> EvaluationRow:
+        """La evaluación con los campos del log de transacciones del dashboard"""
+        location = evaluation.location
+        return {
+            "transaction_id": evaluation.transaction_id,
+            "user_id": evaluation.user_id,
+            "risk_level": evaluation.risk_level.name,
+            "reasons": evaluation.reasons,
+            "timestamp": evaluation.timestamp,
+            "status": evaluation.status,
+            "reviewed_by": evaluation.reviewed_by,
+            "reviewed_at": evaluation.reviewed_at,
+            "amount": evaluation.amount,
+            "location": {"latitude": location.latitude, "longitude": location.longitude} if location else None,
+            "user_authenticated": evaluation.user_authenticated,
+        }
+
+    @staticmethod
+    def _hour_for(evaluation: FraudEvaluation) -> Optional[str]:
+        """Bucket horario, o None si la evaluación ya salió de la ventana"""
+        timestamp = evaluation.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
+        if datetime.now() - timestamp > timedelta(hours=DASHBOARD_HOURS):
+            return None
+        return dashboard_hour(timestamp)
+
+    @staticmethod
+    def _queue_counters(pipe, counters: Dict[str, int], hour: Optional[str], hourly: Dict[str, int]) -> None:
+        """Encola los incrementos; el último comando (HINCRBY seq) da el seq del evento"""
+        for field, delta in counters.items():
+            pipe.hincrby(DASHBOARD_COUNTERS_KEY, field, delta)
+        if hour is not None and hourly:
+            hourly_key = DASHBOARD_HOURLY_PREFIX + hour
+            for status, delta in hourly.items():
+                pipe.hincrby(hourly_key, status, delta)
+            pipe.expire(hourly_key, _DASHBOARD_HOURLY_TTL)
+        pipe.hincrby(DASHBOARD_COUNTERS_KEY, "seq", 1)
+
+    def _dashboard_event(
+        self, kind: str, seq: int, evaluation: FraudEvaluation,
+        counters: Dict[str, int], hour: Optional[str], hourly: Dict[str, int],
+    ) -> str:
+        return serialization.dumps_str({
+            "type": kind,
+            "seq": seq,
+            "counters": counters,
+            "hour": hour,
+            "hourly": hourly,
+            "row": self.log_row(evaluation),
+        })
+
+    async def publish_evaluation(self, evaluation: FraudEvaluation) -> None:
+        status = evaluation.status
+        counters = {"total": 1, f"status:{status}": 1, f"risk:{evaluation.risk_level.name}": 1}
+        hour = self._hour_for(evaluation)
+        hourly = {status: 1}
+        try:
+            if self.async_client is None:
+                self._publish_dashboard("evaluation", evaluation, counters, hour, hourly)
+                return
+            pipe = self.async_client.pipeline(transaction=True)
+            self._queue_counters(pipe, counters, hour, hourly)
+            seq = (await pipe.execute())[-1]
+            await self.async_client.publish(
+                ADMIN_CHANNEL, self._dashboard_event("evaluation", seq, evaluation, counters, hour, hourly)
+            )
+        except Exception as e:
+            # Best-effort: el dashboard resincroniza al reconectar
+            logger.warning("Could not publish evaluation %s: %s", evaluation.transaction_id, e)
+
+    def publish_status_change(
+        self, evaluation: FraudEvaluation, previous_status: Optional[str] = None
+    ) -> None:
+        counters: Dict[str, int] = {}
+        hourly: Dict[str, int] = {}
+        if previous_status and previous_status != evaluation.status:
+            hourly = {previous_status: -1, evaluation.status: 1}
+            counters = {f"status:{status}": delta for status, delta in hourly.items()}
+        try:
+            self.redis.publish(
+                user_channel(evaluation.user_id),
+                serialization.dumps_str(self.status_event(evaluation)),
+            )
+            self._publish_dashboard("status_change", evaluation, counters, self._hour_for(evaluation), hourly)
+        except Exception as e:
+            # Best-effort: el cliente resincroniza al reconectar
+            logger.warning("Could not publish status of %s: %s", evaluation.transaction_id, e)
+
+    def publish_status_changes(
+        self, changes: Sequence[Tuple[FraudEvaluation, Optional[str]]]
+    ) -> None:
+        """
+        Cambios de una revisión masiva en un solo MULTI: los PUBLISH a cada
+        usuario, los deltas agregados de contadores y buckets, y un único
+        evento "status_changes" para el dashboard con todas las filas
+        """
+        if not changes:
+            return
+        counters: Dict[str, int] = {}
+        hours: Dict[str, Dict[str, int]] = {}
+        for evaluation, previous_status in changes:
+            if not previous_status or previous_status == evaluation.status:
+                continue
+            hour = self._hour_for(evaluation)
+            for status, delta in ((previous_status, -1), (evaluation.status, 1)):
+                field = f"status:{status}"
+                counters[field] = counters.get(field, 0) + delta
+                if hour is not None:
+                    bucket = hours.setdefault(hour, {})
+                    bucket[status] = bucket.get(status, 0) + delta
+
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            for evaluation, _ in changes:
+                pipe.publish(
+                    user_channel(evaluation.user_id),
+                    serialization.dumps_str(self.status_event(evaluation)),
+                )
+            for field, delta in counters.items():
+                pipe.hincrby(DASHBOARD_COUNTERS_KEY, field, delta)
+            for hour, bucket in hours.items():
+                hourly_key = DASHBOARD_HOURLY_PREFIX + hour
+                for status, delta in bucket.items():
+                    pipe.hincrby(hourly_key, status, delta)
+                pipe.expire(hourly_key, _DASHBOARD_HOURLY_TTL)
+            pipe.hincrby(DASHBOARD_COUNTERS_KEY, "seq", 1)
+            seq = pipe.execute()[-1]
+            self.redis.publish(ADMIN_CHANNEL, serialization.dumps_str({
+                "type": "status_changes",
+                "seq": seq,
+                "counters": counters,
+                "hours": hours,
+                "rows": [self.log_row(evaluation) for evaluation, _ in changes],
+            }))
+        except Exception as e:
+            logger.warning("Could not publish %d status changes: %s", len(changes), e)
+
+    def _publish_dashboard(
+        self, kind: str, evaluation: FraudEvaluation,
+        counters: Dict[str, int], hour: Optional[str], hourly: Dict[str, int],
+    ) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        self._queue_counters(pipe, counters, hour, hourly)
+        seq = pipe.execute()[-1]
+        self.redis.publish(ADMIN_CHANNEL, self._dashboard_event(kind, seq, evaluation, counters, hour, hourly))
+
+
+def build_event_publisher(cache: RedisAdapter) -> RedisEvaluationEventPublisher:
+    """Publicador de eventos sobre los clientes de la caché"""
+    return RedisEvaluationEventPublisher(cache.redis_sync, cache.redis)
+
+
+class RedisDashboardCounters:
+    """
+    Lectura (snapshot) y siembra de los contadores del dashboard admin
+
+    - dashboard:counters             hash total, status:<estado>, risk:<nivel>,
+                                     seq (último evento aplicado), seeded
+    - dashboard:hourly:<YYYYmmddHH>  hash <estado> -> evaluaciones de esa hora
+
+    Los incrementos los hace RedisEvaluationEventPublisher. Mientras el hash
+    no esté sembrado (primer arranque o después de un DEL) el gateway lo
+    siembra una vez desde MongoDB.
+
+    Nota del desarrollador:
+    La siembra sobrescribe los contadores sin tocar `seq`; las evaluaciones
+    guardadas entre el conteo en MongoDB y la escritura pueden quedar
+    contadas dos veces o ninguna. Para corregir una deriva basta con
+    DEL dashboard:counters: el siguiente snapshot vuelve a sembrar.
+    """
+
+    def __init__(self, redis_client) -> None:
+        """
+        Args:
+            redis_client: Cliente redis.asyncio
+        """
+        self.redis = redis_client
+
+    @staticmethod
+    def _hours(now: datetime) -> List[str]:
+        return [dashboard_hour(now - timedelta(hours=h)) for h in range(DASHBOARD_HOURS - 1, -1, -1)]
+
+    async def read(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Contadores y buckets de las últimas 24 horas en una transacción
+
+        Returns:
+            {"seq", "seeded", "counters": {campo: n}, "hourly": {hora: {estado: n}}}
+        """
+        hours = self._hours(now or datetime.now())
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hgetall(DASHBOARD_COUNTERS_KEY)
+        for hour in hours:
+            pipe.hgetall(DASHBOARD_HOURLY_PREFIX + hour)
+        counters, *buckets = await pipe.execute()
+
+        counters = {field: int(value) for field, value in counters.items()}
+        seq = counters.pop("seq", 0)
+        seeded = bool(counters.pop("seeded", 0))
+        return {
+            "seq": seq,
+            "seeded": seeded,
+            "counters": counters,
+            "hourly": {
+                hour: {status: int(value) for status, value in bucket.items()}
+                for hour, bucket in zip(hours, buckets)
+                if bucket
+            },
+        }
+
+    async def seed(
+        self,
+        totals: Iterable[Dict[str, Any]],
+        hourly: Iterable[Dict[str, Any]],
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        Sobrescribe los contadores con conteos de MongoDB
+
+        Args:
+            totals: Filas de MongoDBAdapter.count_evaluations()
+            hourly: Filas de MongoDBAdapter.count_evaluations(since, by_hour=True)
+        """
+        counters = {"total": 0, "seeded": 1}
+        counters.update({f"status:{status}": 0 for status in _DASHBOARD_STATUSES})
+        counters.update({f"risk:{level.name}": 0 for level in RiskLevel})
+        for row in totals:
+            counters["total"] += row["count"]
+            status_field, risk_field = f"status:{row['status']}", f"risk:{row['risk_level']}"
+            counters[status_field] = counters.get(status_field, 0) + row["count"]
+            counters[risk_field] = counters.get(risk_field, 0) + row["count"]
+
+        buckets: Dict[str, Dict[str, int]] = {hour: {} for hour in self._hours(now or datetime.now())}
+        for row in hourly:
+            bucket = buckets.get(row["hour"])
+            if bucket is not None:
+                bucket[row["status"]] = bucket.get(row["status"], 0) + row["count"]
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(DASHBOARD_COUNTERS_KEY, mapping=counters)
+        for hour, bucket in buckets.items():
+            hourly_key = DASHBOARD_HOURLY_PREFIX + hour
+            pipe.delete(hourly_key)
+            if bucket:
+                pipe.hset(hourly_key, mapping=bucket)
+                pipe.expire(hourly_key, _DASHBOARD_HOURLY_TTL)
+        await pipe.execute()
+
+
+class RedisReviewQueue(ReviewQueue):
+    """
+    Cola priorizada de revisión manual sobre Redis
+
+    - review:queue   sorted set transaction_id -> prioridad (ReviewPriorityPolicy)
+    - review:leases  sorted set transaction_id -> vencimiento del lease (epoch)
+    - review:tasks   hash transaction_id -> JSON de la tarea
+    - review:owners  hash transaction_id -> analista asignado
+
+    Encolar y completar son O(log n); asignar un lote de k tareas es
+    O(k log n) y nunca recorre la colección de evaluaciones.
+
+    Nota del desarrollador:
+    Asignar y devolver leases vencidos usan WATCH/MULTI: sacar las tareas de
+    la cola y registrar el lease ocurre todo o nada, y dos analistas nunca
+    reciben la misma tarea (si la cola cambia en medio, se reintenta).
+    """
+
+    QUEUE_KEY = "review:queue"
+    LEASES_KEY = "review:leases"
+    TASKS_KEY = "review:tasks"
+    OWNERS_KEY = "review:owners"
+
+    # Leases vencidos devueltos a la cola por cada claim()
+    _REAP_BATCH = 100
+
+    def __init__(self, redis_client, policy: Optional[ReviewPriorityPolicy] = None, clock=time.time) -> None:
+        """
+        Args:
+            redis_client: Cliente redis.asyncio (p.ej. RedisAdapter.redis)
+            policy: Pesos de la prioridad (por defecto ReviewPriorityPolicy())
+            clock: Reloj en segundos epoch (inyectable para tests)
+        """
+        self.redis = redis_client
+        self.policy = policy or ReviewPriorityPolicy()
+        self.clock = clock
+
+    async def enqueue(self, task: ReviewTask) -> bool:
+        transaction_id = task["transaction_id"]
+        enqueued_at = float(task.get("enqueued_at") or self.clock())
+        priority = self.policy.score(RiskLevel[task["risk_level"]], task.get("amount"), enqueued_at)
+        stored = {**task, "enqueued_at": enqueued_at, "priority": priority}
+
+        if await self.redis.hsetnx(self.TASKS_KEY, transaction_id, serialization.dumps_str(stored)):
+            await self.redis.zadd(self.QUEUE_KEY, {transaction_id: priority})
+            return True
+
+        # Reentrega del mensaje: solo se repara una tarea que quedó guardada
+        # pero fuera de la cola (caída entre HSETNX y ZADD)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zscore(self.QUEUE_KEY, transaction_id)
+        pipe.zscore(self.LEASES_KEY, transaction_id)
+        queued, leased = await pipe.execute()
+        if queued is None and leased is None:
+            existing = serialization.loads(await self.redis.hget(self.TASKS_KEY, transaction_id))
+            await self.redis.zadd(self.QUEUE_KEY, {transaction_id: existing["priority"]})
+        return False
+
+    async def claim(self, analyst_id: str, batch_size: int, lease_seconds: int) -> List[ReviewTask]:
+        now = self.clock()
+        await self._requeue_expired(now)
+        expires_at = now + lease_seconds
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(self.QUEUE_KEY)
+                    transaction_ids = await pipe.zrevrange(self.QUEUE_KEY, 0, batch_size - 1)
+                    if not transaction_ids:
+                        return []
+                    pipe.multi()
+                    pipe.zrem(self.QUEUE_KEY, *transaction_ids)
+                    pipe.zadd(self.LEASES_KEY, dict.fromkeys(transaction_ids, expires_at))
+                    pipe.hset(self.OWNERS_KEY, mapping=dict.fromkeys(transaction_ids, analyst_id))
+                    pipe.hmget(self.TASKS_KEY, transaction_ids)
+                    stored = (await pipe.execute())[-1]
+                    break
+                except redis.WatchError:
+                    continue
+
+        tasks = []
+        for data in stored:
+            if data is not None:
+                task = serialization.loads(data)
+                task["lease_expires_at"] = expires_at
+                tasks.append(task)
+        return tasks
+
+    async def _requeue_expired(self, now: float) -> None:
+        """Devuelve a la cola, con su prioridad original, las tareas con lease vencido"""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(self.LEASES_KEY)
+                    expired = await pipe.zrangebyscore(self.LEASES_KEY, "-inf", now, start=0, num=self._REAP_BATCH)
+                    if not expired:
+                        return
+                    stored = await pipe.hmget(self.TASKS_KEY, expired)
+                    priorities = {
+                        transaction_id: serialization.loads(data)["priority"]
+                        for transaction_id, data in zip(expired, stored)
+                        if data is not None
+                    }
+                    pipe.multi()
+                    pipe.zrem(self.LEASES_KEY, *expired)
+                    pipe.hdel(self.OWNERS_KEY, *expired)
+                    if priorities:
+                        pipe.zadd(self.QUEUE_KEY, priorities)
+                    await pipe.execute()
+                    return
+                except redis.WatchError:
+                    continue
+
+    async def complete(self, transaction_id: str, analyst_id: Optional[str] = None) -> bool:
+        if analyst_id is not None:
+            owner = await self.redis.hget(self.OWNERS_KEY, transaction_id)
+            if owner is not None and owner != analyst_id:
+                raise LeaseConflictError(f"Transaction {transaction_id} is assigned to {owner}")
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.QUEUE_KEY, transaction_id)
+        pipe.zrem(self.LEASES_KEY, transaction_id)
+        pipe.hdel(self.OWNERS_KEY, transaction_id)
+        pipe.hdel(self.TASKS_KEY, transaction_id)
+        return bool((await pipe.execute())[-1])
+
+    async def complete_many(self, transaction_ids: Sequence[str]) -> int:
+        if not transaction_ids:
+            return 0
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.QUEUE_KEY, *transaction_ids)
+        pipe.zrem(self.LEASES_KEY, *transaction_ids)
+        pipe.hdel(self.OWNERS_KEY, *transaction_ids)
+        pipe.hdel(self.TASKS_KEY, *transaction_ids)
+        return (await pipe.execute())[-1]
+
+    async def pending(self) -> int:
+        return await self.redis.zcard(self.QUEUE_KEY)
+
+
+def build_review_queue(cache: RedisAdapter) -> RedisReviewQueue:
+    """Cola de revisión según Settings, sobre el cliente async de la caché"""
+    return RedisReviewQueue(
+        cache.redis,
+        ReviewPriorityPolicy(
+            risk_weight=settings.review_risk_weight,
+            amount_weight=settings.review_amount_weight,
+            aging_seconds=settings.review_aging_seconds,
+        ),
+    )
+
+
+class RedisSubmissionRegistry(SubmissionRegistry):
+    """
+    Transacciones aceptadas por POST /transaction y aún no evaluadas
+
+    Una clave submission:<id> con TTL por envío. No hace falta borrarla al
+    evaluar: la consulta de estado busca primero la evaluación en MongoDB.
+    Si el worker descarta la transacción, la misma clave pasa a guardar
+    "failed:<motivo>" (un reenvío con el mismo id sigue siendo duplicado).
+    """
+
+    KEY_PREFIX = "submission:"
+    FAILED_PREFIX = "failed:"
+
+    def __init__(self, redis_client, ttl: int) -> None:
+        """
+        Args:
+            redis_client: Cliente redis.asyncio
+            ttl: Segundos que un envío cuenta como "en proceso"
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+
+    async def register(self, transaction_id: str) -> bool:
+        return bool(await self.redis.set(self.KEY_PREFIX + transaction_id, int(time.time()), nx=True, ex=self.ttl))
+
+    async def release(self, transaction_id: str) -> None:
+        await self.redis.delete(self.KEY_PREFIX + transaction_id)
+
+    async def is_pending(self, transaction_id: str) -> bool:
+        value = await self.redis.get(self.KEY_PREFIX + transaction_id)
+        return value is not None and not value.startswith(self.FAILED_PREFIX)
+
+    async def fail(self, transaction_id: str, reason: str) -> None:
+        await self.redis.set(self.KEY_PREFIX + transaction_id, self.FAILED_PREFIX + reason, ex=self.ttl)
+
+    async def failure(self, transaction_id: str) -> Optional[str]:
+        value = await self.redis.get(self.KEY_PREFIX + transaction_id)
+        if value is None or not value.startswith(self.FAILED_PREFIX):
+            return None
+        return value[len(self.FAILED_PREFIX):]
+
+
+def build_submission_registry(cache: RedisAdapter) -> RedisSubmissionRegistry:
+    """Registro de envíos sobre el cliente async de la caché"""
+    return RedisSubmissionRegistry(cache.redis, settings.submission_ttl_seconds)
+
+
 class RabbitMQAdapter(MessagePublisher):
     """
     Adaptador de RabbitMQ que implementa MessagePublisher
@@ -303,9 +1141,10 @@ class RabbitMQAdapter(MessagePublisher):
             self._channel = self._connection.channel()
 
             # Declarar colas (idempotente)
-            self._channel.queue_declare(
-                queue=settings.rabbitmq_transactions_queue, durable=True
-            )
+            for queue in partition_queues(settings.rabbitmq_transactions_queue, settings.rabbitmq_partitions):
+                self._channel.queue_declare(
+                    queue=queue, durable=True, arguments=queue_arguments(settings.rabbitmq_partitions)
+                )
             self._channel.queue_declare(
                 queue=settings.rabbitmq_manual_review_queue, durable=True
             )
@@ -321,33 +1160,64 @@ class RabbitMQAdapter(MessagePublisher):
         Lo cambié a delivery_mode=2 para que los mensajes sobrevivan
         reinicios de RabbitMQ (durability).
         """
-        self._ensure_connection()
-
-        self._channel.basic_publish(
-            exchange="",
-            routing_key=settings.rabbitmq_transactions_queue,
-            body=json.dumps(transaction_data),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # Mensaje persistente
-                content_type="application/json",
-            ),
+        # Cada usuario siempre en la misma partición: se evalúa en orden
+        partitions = settings.rabbitmq_partitions
+        queue = partition_queue(
+            settings.rabbitmq_transactions_queue,
+            partition_for(str(transaction_data.get("user_id", "")), partitions),
+            partitions,
         )
+        with TRACER.start_span("rabbitmq.publish", {"messaging.destination": queue}):
+            self._publish(
+                queue,
+                serialization.dumps(transaction_data),
+                pika.BasicProperties(
+                    delivery_mode=2,  # Mensaje persistente
+                    content_type="application/json",
+                    # x-published-at: tiempo en cola (metrics.py); traceparent: tracing.py
+                    headers=inject({"x-published-at": time.time()}),
+                ),
+            )
 
     async def publish_for_manual_review(self, evaluation_data: dict) -> None:
         """
         Publica una evaluación en la cola de revisión manual (HU-010)
         """
-        self._ensure_connection()
+        with TRACER.start_span(
+            "rabbitmq.publish", {"messaging.destination": settings.rabbitmq_manual_review_queue}
+        ):
+            self._publish(
+                settings.rabbitmq_manual_review_queue,
+                serialization.dumps(evaluation_data),
+                pika.BasicProperties(
+                    delivery_mode=2,
+                    content_type="application/json",
+                    headers=inject({"x-published-at": time.time()}),
+                ),
+            )
 
-        self._channel.basic_publish(
-            exchange="",
-            routing_key=settings.rabbitmq_manual_review_queue,
-            body=json.dumps(evaluation_data),
-            properties=pika.BasicProperties(
-                delivery_mode=2,
-                content_type="application/json",
-            ),
-        )
+    def _publish(self, routing_key: str, body: bytes, properties: pika.BasicProperties) -> None:
+        """
+        Publica reconectando una vez si la conexión se cayó
+
+        Nota del desarrollador:
+        El gateway comparte un adaptador entre requests. Una
+        BlockingConnection ociosa no procesa heartbeats y el broker la
+        cierra; is_closed no se entera hasta el siguiente uso, así que el
+        primer publish después de un rato sin tráfico falla y se reintenta
+        con una conexión nueva.
+        """
+        for attempt in range(2):
+            self._ensure_connection()
+            try:
+                self._channel.basic_publish(
+                    exchange="", routing_key=routing_key, body=body, properties=properties
+                )
+                return
+            except pika.exceptions.AMQPError:
+                self._connection = None
+                if attempt:
+                    raise
 
     def close(self) -> None:
         """
@@ -13,10 +13,36 @@ Lo refactoricé en interfaces específicas para cumplir con Interface Segregatio
 y evitar que los adaptadores implementen métodos innecesarios.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, ContextManager, Dict, List, Optional, Sequence, Tuple, TypedDict
 from src.domain.models import FraudEvaluation
 
 
+class EvaluationRow(TypedDict, total=False):
+    """
+    Read model liviano para listados (admin, auditoría, historial de usuario)
+
+    Es el documento tal como lo guarda el repositorio, limitado por
+    proyección a los campos que pidió el caller. No pasa por FraudEvaluation:
+    sin validación, sin Location ni conversión de montos por fila.
+    """
+
+    transaction_id: str
+    user_id: str
+    risk_level: str
+    reasons: List[str]
+    status: str
+    timestamp: datetime
+    amount: Optional[float]
+    amount_cents: Optional[int]
+    location: Optional[Dict[str, float]]
+    reviewed_by: Optional[str]
+    reviewed_at: Optional[datetime]
+    user_authenticated: Optional[bool]
+    transaction_type: Optional[str]
+    description: Optional[str]
+
+
 class TransactionRepository(ABC):
     """
     Puerto para persistencia de evaluaciones de fraude
@@ -202,3 +228,326 @@ class CacheService(ABC):
         """
         pass
 
+
+class LocationProfileStore(ABC):
+    """
+    Puerto para el perfil de ubicaciones frecuentes de cada usuario
+
+    En lugar de una sola "última ubicación" que se sobrescribe en cada
+    transacción, el perfil agrupa las ubicaciones del usuario en clusters
+    (casa, trabajo, ciudades a las que viaja) y responde cuál es el más
+    cercano a una coordenada.
+    """
+
+    @abstractmethod
+    async def nearest_location(
+        self, user_id: str, latitude: float, longitude: float
+    ) -> Optional[dict]:
+        """
+        Centro del cluster del usuario más cercano a la coordenada
+
+        Returns:
+            Dict con 'latitude', 'longitude' y 'weight' (transacciones
+            agrupadas), None si el usuario no tiene perfil
+        """
+        pass
+
+    @abstractmethod
+    async def record_location(self, user_id: str, latitude: float, longitude: float) -> None:
+        """
+        Agrega la ubicación al perfil: la suma al cluster cercano o crea uno nuevo
+        """
+        pass
+
+
+class EvaluationEventPublisher(ABC):
+    """
+    Puerto para notificar cambios de una evaluación a clientes conectados
+    (canal push del gateway, ver infrastructure/event_stream.py)
+
+    Es best-effort: una falla al notificar no debe deshacer el cambio; los
+    clientes pueden resincronizar con los endpoints de consulta.
+    """
+
+    @abstractmethod
+    async def publish_evaluation(self, evaluation: FraudEvaluation) -> None:
+        """
+        Notifica al dashboard admin una evaluación recién guardada
+        (la fila del log y los contadores que suma)
+        """
+        pass
+
+    @abstractmethod
+    def publish_status_change(
+        self, evaluation: FraudEvaluation, previous_status: Optional[str] = None
+    ) -> None:
+        """
+        Notifica que cambió el estado de una evaluación (decisión del
+        analista o autenticación del usuario) al usuario dueño de la
+        transacción y al dashboard admin
+
+        Args:
+            evaluation: Evaluación ya actualizada
+            previous_status: Estado anterior, si cambió; con él se mueven
+                los contadores del dashboard de un estado al otro
+        """
+        pass
+
+    def publish_status_changes(
+        self, changes: Sequence[Tuple[FraudEvaluation, Optional[str]]]
+    ) -> None:
+        """
+        Notifica varios cambios de estado (revisión masiva)
+
+        Args:
+            changes: Pares (evaluación actualizada, estado anterior)
+
+        Los adaptadores pueden sobrescribirlo para enviar el lote en un
+        solo round trip; por defecto notifica uno por uno.
+        """
+        for evaluation, previous_status in changes:
+            self.publish_status_change(evaluation, previous_status)
+
+
+class NullEvaluationEventPublisher(EvaluationEventPublisher):
+    """Implementación nula: sin canal push configurado"""
+
+    async def publish_evaluation(self, evaluation: FraudEvaluation) -> None:
+        pass
+
+    def publish_status_change(
+        self, evaluation: FraudEvaluation, previous_status: Optional[str] = None
+    ) -> None:
+        pass
+
+
+class SubmissionRegistry(ABC):
+    """
+    Puerto para las transacciones aceptadas que el worker aún no evaluó
+
+    Da idempotencia al envío asíncrono (un reintento del cliente no
+    publica dos veces) y permite responder "en proceso" en la consulta de
+    estado mientras la evaluación no existe en el repositorio. Si el worker
+    descarta la transacción (DLQ) la marca queda como fallida.
+    """
+
+    @abstractmethod
+    async def register(self, transaction_id: str) -> bool:
+        """
+        Marca la transacción como en proceso
+
+        Returns:
+            False si ya estaba marcada
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, transaction_id: str) -> None:
+        """Quita la marca (la publicación falló)"""
+        pass
+
+    @abstractmethod
+    async def is_pending(self, transaction_id: str) -> bool:
+        """True si la transacción fue aceptada, no falló y la marca no expiró"""
+        pass
+
+    @abstractmethod
+    async def fail(self, transaction_id: str, reason: str) -> None:
+        """Marca la transacción como fallida (el worker la mandó a la DLQ)"""
+        pass
+
+    @abstractmethod
+    async def failure(self, transaction_id: str) -> Optional[str]:
+        """Motivo del fallo (None si la transacción no falló)"""
+        pass
+
+
+class NullSubmissionRegistry(SubmissionRegistry):
+    """Implementación nula: sin idempotencia ni estado de envíos en proceso"""
+
+    async def register(self, transaction_id: str) -> bool:
+        return True
+
+    async def release(self, transaction_id: str) -> None:
+        pass
+
+    async def is_pending(self, transaction_id: str) -> bool:
+        return False
+
+    async def fail(self, transaction_id: str, reason: str) -> None:
+        pass
+
+    async def failure(self, transaction_id: str) -> Optional[str]:
+        return None
+
+
+class ReviewTask(TypedDict, total=False):
+    """
+    Transacción pendiente de revisión manual, tal como la encola el
+    publisher (publish_for_manual_review) más los datos de la cola
+    """
+
+    transaction_id: str
+    user_id: str
+    risk_level: str
+    reasons: List[str]
+    amount: Optional[float]
+    enqueued_at: float  # segundos epoch
+    priority: float
+    lease_expires_at: float  # solo en tareas entregadas por claim()
+
+
+class LeaseConflictError(Exception):
+    """La tarea está asignada a otro analista (o su lease ya venció y se reasignó)"""
+
+
+class ReviewQueue(ABC):
+    """
+    Puerto para la cola priorizada de revisión manual
+
+    Las tareas se entregan en lotes con lease: si el analista no completa
+    una tarea antes de que venza, vuelve a la cola para otro analista.
+    """
+
+    @abstractmethod
+    async def enqueue(self, task: ReviewTask) -> bool:
+        """
+        Agrega una tarea (idempotente por transaction_id)
+
+        Returns:
+            False si la tarea ya estaba en la cola o asignada
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, analyst_id: str, batch_size: int, lease_seconds: int) -> List[ReviewTask]:
+        """
+        Asigna al analista las `batch_size` tareas de mayor prioridad
+
+        Antes de asignar devuelve a la cola las tareas con lease vencido.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, transaction_id: str, analyst_id: Optional[str] = None) -> bool:
+        """
+        Saca la tarea de la cola
+
+        Args:
+            transaction_id: Tarea a completar
+            analyst_id: Si se indica, la tarea debe estar asignada a él
+
+        Returns:
+            False si la tarea no existía
+
+        Raises:
+            LeaseConflictError: Si la tarea está asignada a otro analista
+        """
+        pass
+
+    @abstractmethod
+    async def complete_many(self, transaction_ids: Sequence[str]) -> int:
+        """
+        Saca varias tareas de la cola sin validar el lease (ya decididas)
+
+        Returns:
+            Cantidad de tareas que existían
+        """
+        pass
+
+    @abstractmethod
+    async def pending(self) -> int:
+        """Tareas en espera (sin asignar)"""
+        pass
+
+
+class MetricsRecorder(ABC):
+    """
+    Puerto para instrumentación del hot path de evaluación
+
+    El caso de uso reporta tiempos y resultados sin conocer el backend
+    de métricas (Prometheus, StatsD, etc.)
+    """
+
+    @abstractmethod
+    def observe_strategy(self, strategy: str, seconds: float, outcome: str) -> None:
+        """
+        Registra una ejecución de estrategia
+
+        Args:
+            strategy: Nombre de la estrategia (nombre de la clase)
+            seconds: Duración de evaluate()
+            outcome: 'hit' (reportó violación), 'miss', 'fallback'
+                (dependencia no disponible) o 'error' (lanzó excepción)
+        """
+        pass
+
+    @abstractmethod
+    def observe_evaluation(self, risk_level: str, seconds: float) -> None:
+        """
+        Registra una evaluación completa
+
+        Args:
+            risk_level: Nivel de riesgo resultante
+            seconds: Duración total de la evaluación
+        """
+        pass
+
+
+class NullMetricsRecorder(MetricsRecorder):
+    """Implementación nula: usada cuando no se inyecta instrumentación"""
+
+    def observe_strategy(self, strategy: str, seconds: float, outcome: str) -> None:
+        pass
+
+    def observe_evaluation(self, risk_level: str, seconds: float) -> None:
+        pass
+
+
+class Tracer(ABC):
+    """
+    Puerto para spans de tracing del hot path
+
+    start_span retorna un context manager cuyo valor expone
+    set_attribute(key, value). Los spans anidados heredan el span activo.
+    """
+
+    @abstractmethod
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        """
+        Abre un span hijo del span activo
+
+        Args:
+            name: Nombre de la etapa (p.ej. 'strategy.LocationStrategy')
+            attributes: Atributos iniciales del span
+        """
+        pass
+
+
+class _NullSpan:
+    """Span vacío compartido: entrar/salir y set_attribute no hacen nada"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class NullTracer(Tracer):
+    """Implementación nula: usada cuando el tracing no está habilitado"""
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        return NULL_SPAN
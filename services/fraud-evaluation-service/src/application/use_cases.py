@@ -12,17 +12,78 @@ La IA sugirió un método genérico "process_transaction" que hacía todo.
 Lo refactoricé en dos casos de uso separados (EvaluateTransaction y ReviewTransaction)
 para cumplir con Single Responsibility y Command Query Separation (CQS).
 """
+import logging
+import time
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Dict, Any, Optional
 from src.domain.models import Transaction, FraudEvaluation, Location, RiskLevel
+from src.domain.money import Money
 from src.domain.strategies.base import FraudStrategy
+from src.domain.strategies.result import StrategyResult
 from src.application.interfaces import (
     TransactionRepository,
     MessagePublisher,
     CacheService,
+    LocationProfileStore,
+    EvaluationEventPublisher,
+    NullEvaluationEventPublisher,
+    SubmissionRegistry,
+    NullSubmissionRegistry,
+    MetricsRecorder,
+    NullMetricsRecorder,
+    Tracer,
+    NullTracer,
 )
 
+logger = logging.getLogger(__name__)
+
+# Qué hacer con el resultado de una estrategia cuya dependencia falló
+# (StrategyResult.fallback): "flag" lo cuenta como regla incumplida (el
+# "check_failed" manda la transacción a revisión) e "ignore" lo descarta
+FALLBACK_FLAG = "flag"
+FALLBACK_IGNORE = "ignore"
+FALLBACK_POLICIES = (FALLBACK_FLAG, FALLBACK_IGNORE)
+
+
+def parse_transaction(data: dict) -> Transaction:
+    """
+    Construye una entidad Transaction desde el dict del request o del mensaje
+
+    La usan la evaluación y el envío asíncrono: una transacción que el
+    gateway acepta es una que el worker puede parsear.
+
+    Raises:
+        ValueError: Si falta un campo requerido o su formato es inválido
+    """
+    try:
+        location_data = data["location"]
+        location = Location(
+            latitude=float(location_data["latitude"]),
+            longitude=float(location_data["longitude"]),
+        )
+
+        timestamp_str = data.get("timestamp")
+        if timestamp_str:
+            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        else:
+            timestamp = datetime.now()
+
+        return Transaction(
+            id=data["id"],
+            amount=Money.parse(data["amount"]),  # Única conversión exacta del monto
+            user_id=data["user_id"],
+            location=location,
+            timestamp=timestamp,
+            device_id=data.get("device_id"),
+            transaction_type=data.get("transaction_type"),
+            description=data.get("description"),
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing required field: {e}")
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid data format: {e}")
+
 
 class EvaluateTransactionUseCase:
     """
@@ -45,6 +106,13 @@ class EvaluateTransactionUseCase:
         publisher: MessagePublisher,
         cache: CacheService,
         strategies: List[FraudStrategy],
+        metrics: Optional[MetricsRecorder] = None,
+        tracer: Optional[Tracer] = None,
+        location_profile: Optional[LocationProfileStore] = None,
+        cost_aware: bool = False,
+        risk_ceiling: RiskLevel = RiskLevel.HIGH_RISK,
+        events: Optional[EvaluationEventPublisher] = None,
+        fallback_policies: Optional[Dict[str, str]] = None,
     ) -> None:
         """
         Inicializa el caso de uso con sus dependencias
@@ -54,11 +122,37 @@ class EvaluateTransactionUseCase:
             publisher: Puerto para mensajería
             cache: Puerto para caché
             strategies: Lista de estrategias de detección
+            metrics: Puerto de instrumentación (opcional, no-op por defecto)
+            tracer: Puerto de tracing (opcional, no-op por defecto)
+            location_profile: Perfil de ubicaciones frecuentes (opcional). Sin
+                él se usa la última ubicación guardada en caché
+            cost_aware: Ejecutar primero las estrategias baratas (por `cost`,
+                respetando el orden recibido dentro de cada costo) y dejar
+                de evaluar cuando el riesgo alcanza risk_ceiling
+            risk_ceiling: Nivel de riesgo que detiene la evaluación en modo
+                cost_aware. Con HIGH_RISK (por defecto) el resultado es el
+                mismo que evaluando todo; con MEDIUM_RISK basta una regla
+                incumplida
+            events: Canal push hacia el dashboard admin (opcional, no-op
+                por defecto)
+            fallback_policies: Política por nombre de clase de estrategia
+                para resultados degradados (FALLBACK_FLAG por defecto)
         """
         self.repository = repository
         self.publisher = publisher
         self.cache = cache
-        self.strategies = strategies
+        # sorted() es estable: dentro de un mismo costo se respeta la prioridad
+        self.strategies = sorted(strategies, key=lambda strategy: strategy.cost) if cost_aware else strategies
+        self.cost_aware = cost_aware
+        self.risk_ceiling = risk_ceiling
+        self.metrics = metrics or NullMetricsRecorder()
+        self.tracer = tracer or NullTracer()
+        self.location_profile = location_profile
+        self.events = events or NullEvaluationEventPublisher()
+        self.fallback_policies = fallback_policies or {}
+        unknown = set(self.fallback_policies.values()) - set(FALLBACK_POLICIES)
+        if unknown:
+            raise ValueError(f"Unknown fallback policies: {sorted(unknown)}")
 
     async def execute(self, transaction_data: dict) -> Dict[str, Any]:
         """
@@ -79,34 +173,36 @@ class EvaluateTransactionUseCase:
         Lo cambié a dict para evitar que Infrastructure dependa de Domain
         (cumple Dependency Inversion en sentido opuesto).
         """
+        started = time.perf_counter()
+
         # 1. Convertir datos a entidad Transaction
         transaction = self._build_transaction_from_data(transaction_data)
 
         # 2. Obtener ubicación histórica del usuario (si existe)
-        historical_location = await self._get_historical_location(transaction.user_id)
+        with self.tracer.start_span("cache.get_historical_location"):
+            historical_location = await self._get_historical_location(
+                transaction.user_id, transaction.location
+            )
 
-        # 3. Ejecutar todas las estrategias y combinar resultados
+        # 3. Ejecutar las estrategias y combinar resultados
         all_reasons = []
         rules_violated = 0  # Contador de reglas incumplidas
+        decided = False  # En modo cost_aware: el riesgo ya alcanzó el techo
 
         for strategy in self.strategies:
-            result = strategy.evaluate(transaction, historical_location)
+            # Una vez decidido solo corren las que registran estado (ventana de
+            # transacciones, dispositivos): omitirlas falsearía las siguientes
+            if decided and not strategy.records_state:
+                continue
+            result = self._run_strategy(strategy, transaction, historical_location)
             
             # Si la estrategia detectó violaciones, contar como regla incumplida
-            if result["reasons"]:
+            if result.reasons:
                 rules_violated += 1
-                all_reasons.extend(result["reasons"])
+                all_reasons.extend(result.reasons)
+                decided = self.cost_aware and self._risk_for(rules_violated).value >= self.risk_ceiling.value
         
-        # Nueva lógica de estados basada en reglas incumplidas:
-        # - 0 reglas incumplidas = APPROVED (LOW_RISK)
-        # - 1 regla incumplida = PENDING_REVIEW (MEDIUM_RISK)
-        # - 2+ reglas incumplidas = REJECTED (HIGH_RISK)
-        if rules_violated == 0:
-            risk_level = RiskLevel.LOW_RISK
-        elif rules_violated == 1:
-            risk_level = RiskLevel.MEDIUM_RISK
-        else:  # 2 o más reglas incumplidas
-            risk_level = RiskLevel.HIGH_RISK
+        risk_level = self._risk_for(rules_violated)
 
         # 4. Crear evaluación con el resultado final
         evaluation = FraudEvaluation(
@@ -122,26 +218,29 @@ class EvaluateTransactionUseCase:
         )
 
         # 5. Persistir evaluación
-        await self.repository.save_evaluation(evaluation)
+        with self.tracer.start_span("repository.save_evaluation"):
+            await self.repository.save_evaluation(evaluation)
+        with self.tracer.start_span("events.publish_evaluation"):
+            await self.events.publish_evaluation(evaluation)
 
         # 6. Actualizar ubicación en caché
-        await self.cache.set_user_location(
-            user_id=transaction.user_id,
-            latitude=transaction.location.latitude,
-            longitude=transaction.location.longitude,
-        )
+        with self.tracer.start_span("cache.set_user_location"):
+            await self._remember_location(transaction)
 
         # 7. Si es HIGH_RISK o MEDIUM_RISK, enviar a revisión manual (HU-010)
         if risk_level in (RiskLevel.HIGH_RISK, RiskLevel.MEDIUM_RISK):
-            await self.publisher.publish_for_manual_review(
-                {
-                    "transaction_id": transaction.id,
-                    "risk_level": risk_level.name,
-                    "reasons": all_reasons,
-                    "amount": float(transaction.amount),
-                    "user_id": transaction.user_id,
-                }
-            )
+            with self.tracer.start_span("publisher.publish_for_manual_review"):
+                await self.publisher.publish_for_manual_review(
+                    {
+                        "transaction_id": transaction.id,
+                        "risk_level": risk_level.name,
+                        "reasons": all_reasons,
+                        "amount": float(transaction.amount),
+                        "user_id": transaction.user_id,
+                    }
+                )
+
+        self.metrics.observe_evaluation(risk_level.name, time.perf_counter() - started)
 
         # 8. Retornar resultado
         return {
@@ -151,6 +250,57 @@ class EvaluateTransactionUseCase:
             "status": evaluation.status,
         }
 
+    @staticmethod
+    def _risk_for(rules_violated: int) -> RiskLevel:
+        """
+        Nivel de riesgo según la cantidad de reglas incumplidas:
+        - 0 reglas incumplidas = APPROVED (LOW_RISK)
+        - 1 regla incumplida = PENDING_REVIEW (MEDIUM_RISK)
+        - 2+ reglas incumplidas = REJECTED (HIGH_RISK)
+        """
+        if rules_violated == 0:
+            return RiskLevel.LOW_RISK
+        if rules_violated == 1:
+            return RiskLevel.MEDIUM_RISK
+        return RiskLevel.HIGH_RISK
+
+    def _run_strategy(
+        self,
+        strategy: FraudStrategy,
+        transaction: Transaction,
+        historical_location: Optional[Location],
+    ) -> StrategyResult:
+        """
+        Ejecuta una estrategia registrando su duración y resultado
+
+        Las estrategias que dependen de Redis/MongoDB marcan "fallback" cuando
+        la dependencia falla y devuelven un resultado degradado; con la
+        política FALLBACK_IGNORE sus razones se descartan. Un dict
+        (estrategias que aún no retornan StrategyResult) se adapta aquí.
+        """
+        name = type(strategy).__name__
+        start = time.perf_counter()
+        try:
+            with self.tracer.start_span(f"strategy.{name}") as span:
+                result = strategy.evaluate(transaction, historical_location)
+                if type(result) is not StrategyResult:
+                    result = StrategyResult.from_dict(result)
+                span.set_attribute("fraud.reasons", len(result.reasons))
+        except Exception:
+            self.metrics.observe_strategy(name, time.perf_counter() - start, "error")
+            raise
+
+        if result.fallback:
+            outcome = "fallback"
+            if result.reasons and self.fallback_policies.get(name) == FALLBACK_IGNORE:
+                result = StrategyResult(result.risk_level, (), result.details, fallback=True)
+        elif result.reasons:
+            outcome = "hit"
+        else:
+            outcome = "miss"
+        self.metrics.observe_strategy(name, time.perf_counter() - start, outcome)
+        return result
+
     def _build_transaction_from_data(self, data: dict) -> Transaction:
         """
         Construye una entidad Transaction desde datos dict
@@ -160,42 +310,33 @@ class EvaluateTransactionUseCase:
         y conversiones explícitas para "hacer los estados inválidos irrepresentables"
         y cumplir con "Parse, don't validate".
         """
-        try:
-            location_data = data["location"]
-            location = Location(
-                latitude=float(location_data["latitude"]),
-                longitude=float(location_data["longitude"]),
-            )
+        return parse_transaction(data)
 
-            timestamp_str = data.get("timestamp")
-            if timestamp_str:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            else:
-                timestamp = datetime.now()
-
-            return Transaction(
-                id=data["id"],
-                amount=Decimal(str(data["amount"])),
-                user_id=data["user_id"],
-                location=location,
-                timestamp=timestamp,
-                device_id=data.get("device_id"),
-                transaction_type=data.get("transaction_type"),
-                description=data.get("description"),
-            )
-        except KeyError as e:
-            raise ValueError(f"Missing required field: {e}")
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid data format: {e}")
-
-    async def _get_historical_location(self, user_id: str) -> Optional[Location]:
+    async def _get_historical_location(
+        self, user_id: str, location: Optional[Location] = None
+    ) -> Optional[Location]:
         """
         Obtiene la ubicación histórica del usuario desde caché
+
+        Con perfil de ubicaciones es el centro del cluster más cercano a
+        `location`; si el usuario aún no tiene perfil se usa la última
+        ubicación guardada en caché. Si la caché no responde se evalúa como
+        usuario sin historial en lugar de fallar la evaluación completa.
         
         Returns:
             Location si existe, None si es usuario nuevo
         """
-        location_data = await self.cache.get_user_location(user_id)
+        try:
+            location_data = None
+            if self.location_profile is not None and location is not None:
+                location_data = await self.location_profile.nearest_location(
+                    user_id, location.latitude, location.longitude
+                )
+            if location_data is None:
+                location_data = await self.cache.get_user_location(user_id)
+        except Exception as e:
+            logger.warning("historical location unavailable: %s", e, extra={"user_id": user_id})
+            return None
         if location_data is None:
             return None
 
@@ -208,6 +349,77 @@ class EvaluateTransactionUseCase:
             # Datos corruptos en caché, tratarlo como usuario sin historial
             return None
 
+    async def _remember_location(self, transaction: Transaction) -> None:
+        """Agrega la ubicación al perfil del usuario (o a la caché si no hay perfil)"""
+        location = transaction.location
+        try:
+            if self.location_profile is not None:
+                await self.location_profile.record_location(
+                    transaction.user_id, location.latitude, location.longitude
+                )
+            else:
+                await self.cache.set_user_location(
+                    user_id=transaction.user_id,
+                    latitude=location.latitude,
+                    longitude=location.longitude,
+                )
+        except Exception as e:
+            # La evaluación ya está guardada; perder una ubicación solo afecta
+            # a la próxima comparación de LocationStrategy
+            logger.warning("could not remember location: %s", e, extra={"transaction_id": transaction.id})
+
+
+class SubmitTransactionUseCase:
+    """
+    Caso de uso: Aceptar una transacción y encolarla para el worker (HU-001)
+
+    El gateway solo valida y publica; las estrategias corren en el worker.
+    La latencia del envío no depende del costo de las reglas y la flota de
+    workers absorbe el scoring.
+    """
+
+    def __init__(
+        self,
+        publisher: MessagePublisher,
+        registry: Optional[SubmissionRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        """
+        Args:
+            publisher: Puerto de mensajería (cola transactions)
+            registry: Envíos en proceso, para idempotencia y consulta de
+                estado (opcional, no-op por defecto)
+            tracer: Trazas (opcional)
+        """
+        self.publisher = publisher
+        self.registry = registry or NullSubmissionRegistry()
+        self.tracer = tracer or NullTracer()
+
+    async def execute(self, transaction_data: dict) -> bool:
+        """
+        Valida y encola la transacción
+
+        Returns:
+            True si se encoló; False si el mismo ID ya estaba en proceso
+            (reintento del cliente: no se publica dos veces)
+
+        Raises:
+            ValueError: Si los datos no forman una transacción válida
+            Exception: Si falla la publicación (el envío se libera para
+                que el cliente pueda reintentar)
+        """
+        transaction = parse_transaction(transaction_data)
+
+        if not await self.registry.register(transaction.id):
+            return False
+        try:
+            with self.tracer.start_span("publisher.publish_transaction"):
+                await self.publisher.publish_transaction_for_processing(transaction_data)
+        except Exception:
+            await self.registry.release(transaction.id)
+            raise
+        return True
+
 
 class ReviewTransactionUseCase:
     """
@@ -218,19 +430,26 @@ class ReviewTransactionUseCase:
     Cumple Single Responsibility: Solo maneja revisión manual
     """
 
-    def __init__(self, repository: TransactionRepository) -> None:
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        events: Optional[EvaluationEventPublisher] = None,
+    ) -> None:
         """
         Inicializa el caso de uso con su dependencia
         
         Args:
             repository: Puerto para persistencia
+            events: Canal push hacia el usuario (opcional, no-op por defecto)
         
         Nota del desarrollador:
         La IA sugirió también inyectar MessagePublisher para notificaciones.
-        Lo eliminé para cumplir con YAGNI (You Aren't Gonna Need It) -
-        las notificaciones se pueden agregar después si es necesario.
+        Lo eliminé para cumplir con YAGNI (You Aren't Gonna Need It). Las
+        notificaciones llegaron después con su propio puerto, más chico:
+        el usuario ve la decisión sin consultar su historial cada 10 segundos.
         """
         self.repository = repository
+        self.events = events or NullEvaluationEventPublisher()
 
     def execute(
         self, transaction_id: str, decision: str, analyst_id: str
@@ -257,8 +476,124 @@ class ReviewTransactionUseCase:
             raise ValueError(f"Transaction {transaction_id} not found")
 
         # 2. Aplicar decisión manual (la validación está en la entidad)
+        previous_status = evaluation.status
         evaluation.apply_manual_decision(decision, analyst_id)
 
         # 3. Persistir actualización
         self.repository.update_evaluation(evaluation)
 
+        # 4. Avisar al usuario y al dashboard (best-effort: la decisión ya quedó guardada)
+        self.events.publish_status_change(evaluation, previous_status)
+
+
+class BulkReviewTransactionsUseCase:
+    """
+    Caso de uso: Revisar un lote de transacciones de una vez
+
+    El analista que trabaja la cola de revisión decide decenas de
+    transacciones seguidas; una request por decisión se paga en round trips
+    HTTP, lecturas y escrituras sueltas a MongoDB y un evento por fila.
+
+    Cada ítem recibe su propio resultado (nunca falla el lote entero):
+    - applied:     la decisión quedó guardada
+    - invalid:     decisión distinta de APPROVED/REJECTED
+    - duplicate:   la transacción ya apareció antes en el mismo lote
+    - not_found:   la transacción no existe
+    - not_pending: la transacción ya no estaba en PENDING_REVIEW
+    """
+
+    PENDING_STATUS = "PENDING_REVIEW"
+
+    def __init__(
+        self,
+        repository,
+        events: Optional[EvaluationEventPublisher] = None,
+    ) -> None:
+        """
+        Args:
+            repository: Repositorio con get_evaluations_by_ids y
+                apply_manual_decisions (MongoDBAdapter)
+            events: Canal push hacia usuarios y dashboard (opcional)
+        """
+        self.repository = repository
+        self.events = events or NullEvaluationEventPublisher()
+
+    def execute(self, decisions: List[Dict[str, str]], analyst_id: str) -> List[Dict[str, Any]]:
+        """
+        Aplica las decisiones del lote
+
+        Args:
+            decisions: [{"transaction_id", "decision"}] en el orden del analista
+            analyst_id: ID del analista
+
+        Returns:
+            Un resultado por ítem, en el mismo orden:
+            {"transaction_id", "outcome", "status"}
+
+        Raises:
+            ValueError: Si analyst_id está vacío
+
+        Nota del desarrollador:
+        La escritura es un solo bulk_write de updates condicionales
+        (status == PENDING_REVIEW): si otro analista decidió una fila entre
+        la lectura y la escritura, esa fila queda como not_pending en lugar
+        de pisar su decisión.
+        """
+        if not analyst_id or not analyst_id.strip():
+            raise ValueError("Analyst ID cannot be empty")
+
+        results: List[Dict[str, Any]] = []
+        seen = set()
+        for item in decisions:
+            transaction_id, decision = item["transaction_id"], item["decision"]
+            if decision not in ("APPROVED", "REJECTED"):
+                outcome = "invalid"
+            elif transaction_id in seen:
+                outcome = "duplicate"
+            else:
+                outcome = None
+                seen.add(transaction_id)
+            results.append({"transaction_id": transaction_id, "outcome": outcome, "status": None})
+
+        # 1. Una lectura para todo el lote
+        evaluations = {
+            evaluation.transaction_id: evaluation
+            for evaluation in self.repository.get_evaluations_by_ids(seen)
+        } if seen else {}
+
+        # 2. Validar estado y aplicar la decisión en la entidad
+        candidates: Dict[str, FraudEvaluation] = {}
+        for item, result in zip(decisions, results):
+            if result["outcome"] is not None:
+                continue
+            evaluation = evaluations.get(result["transaction_id"])
+            if evaluation is None:
+                result["outcome"] = "not_found"
+            elif evaluation.status != self.PENDING_STATUS:
+                result["outcome"] = "not_pending"
+                result["status"] = evaluation.status
+            else:
+                evaluation.apply_manual_decision(item["decision"], analyst_id)
+                candidates[evaluation.transaction_id] = evaluation
+
+        # 3. Una escritura condicional para todo el lote
+        applied = self.repository.apply_manual_decisions(
+            list(candidates.values()), expected_status=self.PENDING_STATUS
+        )
+        for result in results:
+            evaluation = candidates.get(result["transaction_id"])
+            if evaluation is None or result["outcome"] is not None:
+                continue
+            if evaluation.transaction_id in applied:
+                result["outcome"] = "applied"
+                result["status"] = evaluation.status
+            else:
+                result["outcome"] = "not_pending"
+
+        # 4. Un solo lote de eventos (best-effort)
+        self.events.publish_status_changes([
+            (evaluation, self.PENDING_STATUS)
+            for transaction_id, evaluation in candidates.items()
+            if transaction_id in applied
+        ])
+        return results
@@ -0,0 +1,73 @@
+"""
+Geo - Distancias sobre la esfera terrestre para las reglas de ubicación
+
+- GeoPoint: coordenada con radianes y coseno de la latitud precalculados
+- prepare_point: GeoPoint memoizado por coordenada; la ubicación histórica
+  de un usuario se repite en ráfagas de transacciones y su trigonometría
+  se calcula una sola vez
+- within_radius_bound: pre-filtro sin trigonometría por el punto nuevo
+- haversine_km: distancia exacta
+
+Nota del desarrollador:
+No hay kernel en lote (NumPy): cada evaluación compara contra una sola
+ubicación y el cluster más cercano del perfil lo resuelve Redis (GEOSEARCH).
+"""
+from functools import lru_cache
+from math import asin, cos, pi, radians, sin, sqrt
+
+EARTH_RADIUS_KM = 6371.0
+_TWO_PI = 2 * pi
+
+
+class GeoPoint:
+    """Coordenada con su trigonometría precalculada (inmutable por convención)"""
+
+    __slots__ = ("latitude", "longitude", "lat_rad", "lon_rad", "cos_lat")
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        self.latitude = latitude
+        self.longitude = longitude
+        self.lat_rad = radians(latitude)
+        self.lon_rad = radians(longitude)
+        self.cos_lat = cos(self.lat_rad)
+
+    def __repr__(self) -> str:
+        return f"GeoPoint({self.latitude}, {self.longitude})"
+
+
+@lru_cache(maxsize=4096)
+def prepare_point(latitude: float, longitude: float) -> GeoPoint:
+    """GeoPoint compartido para coordenadas que se consultan repetidamente"""
+    return GeoPoint(latitude, longitude)
+
+
+def _delta_longitude(lon_rad_a: float, lon_rad_b: float) -> float:
+    """Diferencia de longitud por el camino corto, en [-pi, pi]"""
+    delta = lon_rad_b - lon_rad_a
+    if delta > pi:
+        delta -= _TWO_PI
+    elif delta < -pi:
+        delta += _TWO_PI
+    return delta
+
+
+def within_radius_bound(origin: GeoPoint, latitude: float, longitude: float, radius_km: float) -> bool:
+    """
+    True si el punto está con certeza dentro del radio, sin trigonometría
+
+    Usa como cota superior de la distancia el camino que recorre el paralelo
+    de `origin` y luego el meridiano hasta el punto:
+        d <= R * (cos(lat_origin) * |dlon| + |dlat|)
+    False no significa que esté fuera; hay que calcular la distancia exacta.
+    """
+    dlat = abs(radians(latitude) - origin.lat_rad)
+    dlon = abs(_delta_longitude(origin.lon_rad, radians(longitude)))
+    return EARTH_RADIUS_KM * (origin.cos_lat * dlon + dlat) <= radius_km
+
+
+def haversine_km(a: GeoPoint, b: GeoPoint) -> float:
+    """Distancia de círculo máximo en kilómetros (fórmula de Haversine)"""
+    half_dlat = sin((b.lat_rad - a.lat_rad) * 0.5)
+    half_dlon = sin((b.lon_rad - a.lon_rad) * 0.5)
+    h = half_dlat * half_dlat + a.cos_lat * b.cos_lat * half_dlon * half_dlon
+    return 2.0 * EARTH_RADIUS_KM * asin(sqrt(min(1.0, h)))
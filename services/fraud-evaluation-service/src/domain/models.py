@@ -13,14 +13,56 @@ Nota del desarrollador (María Gutiérrez):
 La IA sugirió usar un dict para Location. Lo refactoricé a un Value Object inmutable
 para cumplir con DDD (Domain-Driven Design) y garantizar validación en construcción.
 Esto previene estados inválidos y cumple el principio "Make Invalid States Unrepresentable".
+
+Las entidades usan __slots__ (dataclass(slots=True)) para reducir memoria al
+cargar historiales grandes. Para filas que vienen de nuestra propia base de
+datos existe from_trusted(), que construye la instancia sin __post_init__:
+esos datos ya se validaron cuando se crearon.
 """
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 import re
 
+from src.domain.money import Money
+
+T = TypeVar("T")
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Por clase: (nombre, default, default_factory) de cada campo, calculado una vez
+_FIELD_DEFAULTS: Dict[type, Tuple[Tuple[str, Any, Any], ...]] = {}
+
+
+def _build_trusted(cls: Type[T], values: Dict[str, Any]) -> T:
+    """
+    Construye una instancia sin ejecutar __init__/__post_init__
+
+    Usa object.__setattr__ para que funcione también con dataclasses
+    frozen. Los campos ausentes toman su default; un campo obligatorio
+    ausente lanza TypeError, igual que el constructor normal.
+    """
+    spec = _FIELD_DEFAULTS.get(cls)
+    if spec is None:
+        spec = tuple((f.name, f.default, f.default_factory) for f in fields(cls))
+        _FIELD_DEFAULTS[cls] = spec
+
+    instance = object.__new__(cls)
+    setter = object.__setattr__
+    for name, default, factory in spec:
+        if name in values:
+            value = values[name]
+        elif default is not MISSING:
+            value = default
+        elif factory is not MISSING:
+            value = factory()
+        else:
+            raise TypeError(f"{cls.__name__}.from_trusted() missing field {name!r}")
+        setter(instance, name, value)
+    return instance
+
 
 class RiskLevel(Enum):
     """
@@ -39,7 +81,7 @@ class RiskLevel(Enum):
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     Value Object que representa una ubicación geográfica
@@ -62,8 +104,13 @@ class Location:
         if not -180 <= self.longitude <= 180:
             raise ValueError("Longitude must be between -180 and 180")
 
+    @classmethod
+    def from_trusted(cls, latitude: float, longitude: float) -> "Location":
+        """Construye sin validar rangos (solo para datos ya persistidos)"""
+        return _build_trusted(cls, {"latitude": latitude, "longitude": longitude})
+
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Entidad que representa una transacción financiera
@@ -75,7 +122,7 @@ class Transaction:
     """
 
     id: str
-    amount: Decimal
+    amount: Union[Money, Decimal]  # Money en el hot path; Decimal se acepta por compatibilidad
     user_id: str
     location: Location
     timestamp: datetime
@@ -108,8 +155,13 @@ class Transaction:
         if self.location is None:
             raise ValueError("Location cannot be None")
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "Transaction":
+        """Construye sin __post_init__ (solo para datos ya persistidos)"""
+        return _build_trusted(cls, values)
 
-@dataclass
+
+@dataclass(slots=True)
 class FraudEvaluation:
     """
     Entidad que representa el resultado de una evaluación de fraude
@@ -130,7 +182,7 @@ class FraudEvaluation:
     risk_level: RiskLevel
     reasons: List[str]
     timestamp: datetime
-    amount: Optional[Decimal] = None
+    amount: Optional[Union[Money, Decimal]] = None
     location: Optional[Location] = None
     status: str = ""  # Se calcula en __post_init__
     reviewed_by: Optional[str] = None
@@ -163,6 +215,16 @@ class FraudEvaluation:
             else:  # HIGH_RISK
                 self.status = "REJECTED"
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "FraudEvaluation":
+        """
+        Construye sin __post_init__ (solo para documentos de MongoDB)
+
+        Los documentos persistidos siempre traen status, por eso no se
+        recalcula a partir del nivel de riesgo.
+        """
+        return _build_trusted(cls, values)
+
     def apply_manual_decision(self, decision: str, analyst_id: str) -> None:
         """
         Aplica una decisión manual de un analista
@@ -204,7 +266,7 @@ class FraudEvaluation:
         self.user_auth_timestamp = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Entidad que representa un usuario del sistema
@@ -231,8 +293,7 @@ class User:
             raise ValueError("User ID must be at least 3 characters")
             
         # Validar formato de email
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.email):
+        if not EMAIL_PATTERN.match(self.email):
             raise ValueError("Invalid email format")
         
         if not self.hashed_password:
@@ -241,3 +302,8 @@ class User:
         if not self.full_name or not self.full_name.strip():
             raise ValueError("Full name cannot be empty")
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "User":
+        """Construye sin __post_init__ (solo para documentos de MongoDB)"""
+        return _build_trusted(cls, values)
+
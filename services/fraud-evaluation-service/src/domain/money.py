@@ -0,0 +1,184 @@
+"""
+Money - Value Object de monto en unidades menores (centavos) enteras
+
+El monto se parsea una sola vez en el borde (API / documento de MongoDB) con
+aritmética Decimal exacta y desde ahí viaja como entero: las estrategias
+comparan enteros, MongoDB guarda `amount_cents` y la lectura no vuelve a
+pasar por str()/Decimal.
+
+Compatible con el código que esperaba Decimal: compara por valor contra
+Decimal, int y float (Money("100.00") == Decimal("100.0")), soporta abs(),
+negación, float() y str().
+
+Nota del desarrollador:
+Dos decimales fijos (MINOR_UNITS = 100): todos los montos del sistema están
+en pesos/dólares con centavos. Un monto con más decimales se redondea
+half-even al parsear, igual que lo haría un quantize() de Decimal.
+"""
+from decimal import Decimal, ROUND_HALF_EVEN, InvalidOperation
+from typing import Union
+
+MINOR_UNITS = 100
+_CENT = Decimal("0.01")
+_FLOAT_EXACT = 2 ** 53  # Hasta aquí cents / 100 en float conserva los dígitos
+_FLOAT_FAST_LIMIT = 1e13  # Montos float que se pueden escalar a centavos sin perder dígitos
+
+Number = Union["Money", Decimal, int, float, str]
+
+
+class Money:
+    """Monto inmutable representado como entero de centavos"""
+
+    __slots__ = ("cents",)
+
+    def __init__(self, cents: int) -> None:
+        """
+        Args:
+            cents: Monto en unidades menores (int). Para convertir desde
+                float/str/Decimal usar Money.parse
+        """
+        if cents.__class__ is not int:
+            raise TypeError("Money expects integer minor units; use Money.parse()")
+        _set_cents(self, cents)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Money is immutable")
+
+    @classmethod
+    def parse(cls, value: Number) -> "Money":
+        """
+        Conversión exacta en el borde del sistema
+
+        Los float se convierten vía su repr (str) para obtener el valor que
+        escribió el cliente (100.1 -> 10010 centavos, no 10009.99...).
+
+        Raises:
+            ValueError: Si el valor no es un número finito
+        """
+        if isinstance(value, Money):
+            return value
+        if value.__class__ is int:
+            return _from_cents(value * MINOR_UNITS)
+        if value.__class__ is float and -_FLOAT_FAST_LIMIT < value < _FLOAT_FAST_LIMIT:
+            # Camino rápido: si value * 100 está lejos de un empate (medio
+            # centavo), redondear el float da el mismo resultado que el
+            # quantize half-even del valor decimal. Los empates van por Decimal.
+            scaled = value * MINOR_UNITS
+            cents = round(scaled)
+            if abs(scaled - cents) < 0.4:
+                return _from_cents(cents)
+        try:
+            decimal_value = value if isinstance(value, Decimal) else Decimal(str(value))
+            quantized = decimal_value.quantize(_CENT, rounding=ROUND_HALF_EVEN)
+        except (InvalidOperation, ValueError, TypeError):
+            raise ValueError(f"Invalid amount: {value!r}")
+        if not quantized.is_finite():
+            raise ValueError(f"Invalid amount: {value!r}")
+        return _from_cents(int(quantized.scaleb(2)))
+
+    def to_decimal(self) -> Decimal:
+        """Valor exacto como Decimal con dos decimales"""
+        return Decimal(self.cents).scaleb(-2)
+
+    # --- conversión -------------------------------------------------------
+
+    def __float__(self) -> float:
+        return self.cents / MINOR_UNITS
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def __str__(self) -> str:
+        cents = self.cents
+        if -_FLOAT_EXACT < cents < _FLOAT_EXACT:
+            # cents / 100 queda a menos de medio centavo del valor exacto,
+            # así que '%.2f' reproduce los dígitos exactos
+            return "%.2f" % (cents / MINOR_UNITS)
+        sign = "-" if cents < 0 else ""
+        units, minor = divmod(abs(cents), MINOR_UNITS)
+        return f"{sign}{units}.{minor:02d}"
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __format__(self, spec: str) -> str:
+        return format(self.to_decimal(), spec) if spec else self.__str__()
+
+    # --- aritmética -------------------------------------------------------
+
+    def __abs__(self) -> "Money":
+        return self if self.cents >= 0 else _from_cents(-self.cents)
+
+    def __neg__(self) -> "Money":
+        return _from_cents(-self.cents)
+
+    def __add__(self, other) -> "Money":
+        if isinstance(other, Money):
+            return _from_cents(self.cents + other.cents)
+        return NotImplemented
+
+    def __sub__(self, other) -> "Money":
+        if isinstance(other, Money):
+            return _from_cents(self.cents - other.cents)
+        return NotImplemented
+
+    # --- comparación ------------------------------------------------------
+
+    def _compare_key(self, other):
+        """
+        Retorna (mine, theirs) comparables o None si el tipo no aplica
+
+        Enteros y Money se comparan en centavos enteros; Decimal de forma
+        exacta; float como float (igual que Decimal vs float).
+        """
+        if isinstance(other, Money):
+            return self.cents, other.cents
+        if isinstance(other, bool):
+            return None
+        if isinstance(other, int):
+            return self.cents, other * MINOR_UNITS
+        if isinstance(other, Decimal):
+            return self.to_decimal(), other
+        if isinstance(other, float):
+            return float(self), other
+        return None
+
+    def __eq__(self, other) -> bool:
+        key = self._compare_key(other)
+        return NotImplemented if key is None else key[0] == key[1]
+
+    def __lt__(self, other) -> bool:
+        key = self._compare_key(other)
+        return NotImplemented if key is None else key[0] < key[1]
+
+    def __le__(self, other) -> bool:
+        key = self._compare_key(other)
+        return NotImplemented if key is None else key[0] <= key[1]
+
+    def __gt__(self, other) -> bool:
+        key = self._compare_key(other)
+        return NotImplemented if key is None else key[0] > key[1]
+
+    def __ge__(self, other) -> bool:
+        key = self._compare_key(other)
+        return NotImplemented if key is None else key[0] >= key[1]
+
+    def __hash__(self) -> int:
+        # Igual al hash de Decimal/int equivalentes, consistente con __eq__
+        if self.cents % MINOR_UNITS == 0:
+            return hash(self.cents // MINOR_UNITS)
+        return hash(self.to_decimal())
+
+    def __reduce__(self):
+        return (Money, (self.cents,))
+
+
+# El setter del slot sin pasar por __setattr__ (que bloquea la mutación)
+_set_cents = Money.cents.__set__
+
+
+def _from_cents(cents: int) -> Money:
+    """Construcción interna sin validar el tipo (cents ya es int)"""
+    instance = object.__new__(Money)
+    _set_cents(instance, cents)
+    return instance
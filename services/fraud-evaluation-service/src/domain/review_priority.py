@@ -0,0 +1,61 @@
+"""
+Prioridad de la cola de revisión manual (HU-010)
+
+Una sola puntuación ordena el trabajo de los analistas:
+
+    riesgo * risk_weight + log10(1 + |monto|) * amount_weight - encolado / aging_seconds
+
+- El nivel de riesgo domina: HIGH_RISK antes que MEDIUM_RISK
+- Dentro de un nivel, montos mayores primero (escala logarítmica: pasar de
+  100 a 1.000 pesa lo mismo que de 1.000 a 10.000)
+- La espera suma un punto cada `aging_seconds`: una transacción vieja
+  termina superando a una nueva de mayor riesgo y nada queda olvidado
+
+Nota del desarrollador:
+Restar el instante de encolado (en vez de sumar la edad) deja la
+puntuación fija: se calcula una vez al encolar y el orden relativo es el
+mismo que si la edad se recalculara en cada consulta. Así la cola puede
+ser un sorted set con inserción y extracción O(log n).
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from math import log10
+from typing import Union
+
+from src.domain.models import RiskLevel
+
+
+@dataclass(frozen=True)
+class ReviewPriorityPolicy:
+    """
+    Pesos de la puntuación de prioridad
+
+    Con los valores por defecto un nivel de riesgo equivale a ~16 horas de
+    espera y un orden de magnitud del monto a ~100 minutos.
+    """
+
+    risk_weight: float = 1000.0
+    amount_weight: float = 100.0
+    aging_seconds: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.aging_seconds <= 0:
+            raise ValueError("aging_seconds must be positive")
+
+    def score(
+        self, risk_level: RiskLevel, amount: Union[Decimal, float, None], enqueued_at: float
+    ) -> float:
+        """
+        Puntuación de una transacción (mayor = se revisa antes)
+
+        Args:
+            risk_level: Nivel de riesgo de la evaluación
+            amount: Monto (puede ser negativo o faltar)
+            enqueued_at: Instante de encolado en segundos epoch
+        """
+        magnitude = log10(1 + abs(float(amount or 0)))
+        return (
+            risk_level.value * self.risk_weight
+            + magnitude * self.amount_weight
+            - enqueued_at / self.aging_seconds
+        )
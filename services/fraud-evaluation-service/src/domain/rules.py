@@ -0,0 +1,250 @@
+"""
+Rules - Compilación de reglas personalizadas (colección custom_rules) a
+predicados de Python
+
+Una regla se define desde el panel de administración con un `type` y
+`parameters`. Los tipos soportados son:
+
+- custom: {"condition": <condición>, "reason": "..."} donde una condición es
+    {"field": "amount", "op": "gt", "value": 1000}
+    {"field": "hour", "op": "between", "value": [0, 5]}
+    {"field": "transaction_type", "op": "in", "value": ["transfer", "payment"]}
+    {"all": [<condición>, ...]}, {"any": [<condición>, ...]}, {"not": <condición>}
+- amount_threshold: {"threshold": 1000} (azúcar de amount > threshold)
+- time_based: {"start_hour": 0, "end_hour": 5} (ventana horaria, puede cruzar
+  la medianoche)
+
+Los tipos que necesitan historial del usuario (frequency, velocity,
+location_check) no se pueden expresar como predicado puro y se rechazan con
+RuleDefinitionError.
+
+Nota del desarrollador:
+El documento se interpreta una sola vez: cada condición se convierte en una
+closure con el accessor del campo y la constante ya convertida (centavos
+para montos, frozenset para pertenencia), y RuleCompiler la reutiliza
+mientras la versión (updated_at) de la regla no cambie. Evaluar una regla
+es llamar funciones, no recorrer el JSON en cada transacción.
+"""
+import operator
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.domain.models import Transaction
+from src.domain.money import Money
+
+Predicate = Callable[[Transaction], bool]
+
+
+class RuleDefinitionError(ValueError):
+    """La definición de la regla no se puede compilar"""
+
+
+def _amount_cents(transaction: Transaction) -> int:
+    # Valor absoluto, igual que AmountThresholdStrategy (transferencias negativas)
+    amount = transaction.amount
+    if isinstance(amount, Money):
+        return abs(amount.cents)
+    return abs(Money.parse(amount).cents)
+
+
+# Campo -> (accessor, conversión de la constante al tipo del accessor)
+_FIELDS: Dict[str, Tuple[Callable[[Transaction], Any], Callable[[Any], Any]]] = {
+    "amount": (_amount_cents, lambda value: Money.parse(value).cents),
+    "user_id": (operator.attrgetter("user_id"), str),
+    "device_id": (operator.attrgetter("device_id"), str),
+    "transaction_type": (operator.attrgetter("transaction_type"), str),
+    "description": (operator.attrgetter("description"), str),
+    "latitude": (operator.attrgetter("location.latitude"), float),
+    "longitude": (operator.attrgetter("location.longitude"), float),
+    "hour": (lambda transaction: transaction.timestamp.hour, int),
+    "weekday": (lambda transaction: transaction.timestamp.weekday(), int),
+}
+
+_COMPARISONS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _convert(field: str, converter: Callable[[Any], Any], value: Any) -> Any:
+    if value is None or isinstance(value, (dict, list)):
+        raise RuleDefinitionError(f"Invalid value for field {field!r}: {value!r}")
+    try:
+        return converter(value)
+    except (TypeError, ValueError, ArithmeticError) as error:
+        raise RuleDefinitionError(f"Invalid value for field {field!r}: {value!r}") from error
+
+
+def _compile_comparison(spec: Dict[str, Any]) -> Predicate:
+    field, op = spec.get("field"), spec.get("op")
+    if field not in _FIELDS:
+        raise RuleDefinitionError(f"Unknown field: {field!r}")
+    getter, converter = _FIELDS[field]
+    value = spec.get("value")
+
+    # Un campo ausente (device_id=None) nunca cumple la condición
+    if op in _COMPARISONS:
+        compare = _COMPARISONS[op]
+        constant = _convert(field, converter, value)
+
+        def comparison(transaction: Transaction) -> bool:
+            actual = getter(transaction)
+            return actual is not None and compare(actual, constant)
+
+        return comparison
+
+    if op == "between":
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            raise RuleDefinitionError("'between' expects [low, high]")
+        low, high = (_convert(field, converter, bound) for bound in value)
+        if low > high:
+            raise RuleDefinitionError(f"Empty range for field {field!r}: {value!r}")
+
+        def in_range(transaction: Transaction) -> bool:
+            actual = getter(transaction)
+            return actual is not None and low <= actual <= high
+
+        return in_range
+
+    if op in ("in", "not_in"):
+        if not isinstance(value, (list, tuple)) or not value:
+            raise RuleDefinitionError(f"{op!r} expects a non-empty list")
+        members = frozenset(_convert(field, converter, item) for item in value)
+        expected = op == "in"
+
+        def membership(transaction: Transaction) -> bool:
+            actual = getter(transaction)
+            return actual is not None and (actual in members) is expected
+
+        return membership
+
+    raise RuleDefinitionError(f"Unknown operator: {op!r}")
+
+
+def compile_condition(spec: Any) -> Predicate:
+    """Convierte una condición (dict) en un predicado sobre Transaction"""
+    if not isinstance(spec, dict):
+        raise RuleDefinitionError(f"Condition must be an object, got {spec!r}")
+
+    if "all" in spec or "any" in spec:
+        key = "all" if "all" in spec else "any"
+        children = spec[key]
+        if not isinstance(children, list) or not children:
+            raise RuleDefinitionError(f"{key!r} expects a non-empty list of conditions")
+        predicates = tuple(compile_condition(child) for child in children)
+        if len(predicates) == 1:
+            return predicates[0]
+        if key == "all":
+            def all_of(transaction: Transaction) -> bool:
+                for predicate in predicates:
+                    if not predicate(transaction):
+                        return False
+                return True
+
+            return all_of
+
+        def any_of(transaction: Transaction) -> bool:
+            for predicate in predicates:
+                if predicate(transaction):
+                    return True
+            return False
+
+        return any_of
+
+    if "not" in spec:
+        inner = compile_condition(spec["not"])
+        return lambda transaction: not inner(transaction)
+
+    return _compile_comparison(spec)
+
+
+def _hour_window(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    start, end = parameters.get("start_hour"), parameters.get("end_hour")
+    if not all(isinstance(hour, int) and 0 <= hour <= 23 for hour in (start, end)):
+        raise RuleDefinitionError("time_based expects start_hour and end_hour between 0 and 23")
+    if start <= end:
+        return {"field": "hour", "op": "between", "value": [start, end]}
+    # Ventana que cruza la medianoche (22 -> 5)
+    return {"any": [
+        {"field": "hour", "op": "gte", "value": start},
+        {"field": "hour", "op": "lte", "value": end},
+    ]}
+
+
+def rule_condition(rule_type: str, parameters: Any) -> Dict[str, Any]:
+    """Condición equivalente a un tipo de regla con sus parámetros"""
+    if not isinstance(parameters, dict):
+        raise RuleDefinitionError("parameters must be an object")
+    if rule_type == "custom":
+        if "condition" not in parameters:
+            raise RuleDefinitionError("custom rules need a 'condition'")
+        return parameters["condition"]
+    if rule_type == "amount_threshold":
+        threshold = parameters.get("threshold")
+        if not isinstance(threshold, (int, float)) or isinstance(threshold, bool) or threshold <= 0:
+            raise RuleDefinitionError("amount_threshold expects a positive 'threshold'")
+        return {"field": "amount", "op": "gt", "value": threshold}
+    if rule_type == "time_based":
+        return _hour_window(parameters)
+    raise RuleDefinitionError(f"Unsupported rule type for custom rules: {rule_type!r}")
+
+
+class CompiledRule:
+    """Regla lista para evaluar: identidad, versión, razón y predicado"""
+
+    __slots__ = ("rule_id", "name", "version", "reason", "predicate")
+
+    def __init__(self, rule_id: str, name: str, version: Hashable, reason: str, predicate: Predicate) -> None:
+        self.rule_id = rule_id
+        self.name = name
+        self.version = version
+        self.reason = reason
+        self.predicate = predicate
+
+    def __repr__(self) -> str:
+        return f"CompiledRule({self.rule_id!r}, version={self.version!r})"
+
+
+def compile_rule(rule_doc: Dict[str, Any]) -> CompiledRule:
+    """
+    Compila un documento de custom_rules
+
+    Raises:
+        RuleDefinitionError: Si el tipo no es soportado o la condición es inválida
+    """
+    parameters = rule_doc.get("parameters")
+    predicate = compile_condition(rule_condition(rule_doc.get("type"), parameters))
+    name = rule_doc.get("name") or rule_doc.get("id", "")
+    reason = parameters.get("reason") or f"custom_rule:{name}"
+    return CompiledRule(rule_doc.get("id", ""), name, rule_doc.get("updated_at"), str(reason), predicate)
+
+
+class RuleCompiler:
+    """
+    Cache de reglas compiladas por id
+
+    Una regla se recompila solo cuando cambia su versión (updated_at); las
+    versiones viejas se reemplazan, así que el cache no crece más que la
+    colección de reglas.
+    """
+
+    def __init__(self) -> None:
+        self._compiled: Dict[str, CompiledRule] = {}
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def get(self, rule_doc: Dict[str, Any]) -> CompiledRule:
+        rule_id = rule_doc.get("id", "")
+        cached: Optional[CompiledRule] = self._compiled.get(rule_id)
+        if cached is not None and cached.version == rule_doc.get("updated_at"):
+            return cached
+        compiled = compile_rule(rule_doc)
+        self._compiled[rule_id] = compiled
+        return compiled
+
+    def forget(self, rule_id: str) -> None:
+        self._compiled.pop(rule_id, None)
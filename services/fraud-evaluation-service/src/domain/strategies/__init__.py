@@ -4,18 +4,23 @@ Implementa el patrón Strategy para diferentes reglas de detección.
 """
 
 from .base import FraudStrategy
+from .result import StrategyResult, NO_RISK
 from .amount_threshold import AmountThresholdStrategy
 from .location_check import LocationStrategy
 from .device_validation import DeviceValidationStrategy
 from .rapid_transaction import RapidTransactionStrategy
 from .unusual_time import UnusualTimeStrategy
+from .custom_rule import CustomRuleStrategy
 
 __all__ = [
     'FraudStrategy',
+    'StrategyResult',
+    'NO_RISK',
     'AmountThresholdStrategy',
     'LocationStrategy',
     'DeviceValidationStrategy',
     'RapidTransactionStrategy',
     'UnusualTimeStrategy',
+    'CustomRuleStrategy',
 ]
 
@@ -15,9 +15,13 @@ porque el requerimiento de negocio dice "que exceda $1,500", no "igual o mayor".
 Esto previene falsos positivos en transacciones exactamente en el límite.
 """
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Optional
 from src.domain.strategies.base import FraudStrategy
+from src.domain.strategies.result import NO_RISK, StrategyResult
 from src.domain.models import Transaction, RiskLevel, Location
+from src.domain.money import Money
+
+_EXCEEDED = ("amount_threshold_exceeded",)
 
 
 class AmountThresholdStrategy(FraudStrategy):
@@ -44,10 +48,12 @@ class AmountThresholdStrategy(FraudStrategy):
         if threshold <= 0:
             raise ValueError("Threshold must be positive")
         self.threshold = threshold
+        # Umbral precalculado en centavos: con montos Money la comparación es entera
+        self._threshold_cents = Money.parse(threshold).cents
 
     def evaluate(
         self, transaction: Transaction, historical_location: Optional[Location] = None
-    ) -> Dict[str, Any]:
+    ) -> StrategyResult:
         """
         Evalúa si el monto de la transacción excede el umbral
         
@@ -56,7 +62,7 @@ class AmountThresholdStrategy(FraudStrategy):
             historical_location: No usado en esta estrategia (solo para cumplir interface)
         
         Returns:
-            Dict con risk_level, reasons y details
+            StrategyResult con risk_level, reasons y details
         
         Raises:
             ValueError: Si transaction es None
@@ -68,14 +74,16 @@ class AmountThresholdStrategy(FraudStrategy):
         # La IA sugirió if/else anidado. Lo simplifiqué usando retornos tempranos
         # (guard clauses) para mejorar legibilidad y cumplir con "Flat is better than nested".
         # Usar valor absoluto para validar transferencias (negativas) y depósitos (positivos)
-        amount_abs = abs(transaction.amount)
-        
-        if amount_abs > self.threshold:
-            return {
-                "risk_level": RiskLevel.HIGH_RISK,
-                "reasons": ["amount_threshold_exceeded"],
-                "details": f"amount: {amount_abs} exceeds threshold: {self.threshold}",
-            }
+        amount = transaction.amount
+        if isinstance(amount, Money):
+            exceeded = abs(amount.cents) > self._threshold_cents
+        else:
+            exceeded = abs(amount) > self.threshold
+
+        if exceeded:
+            return StrategyResult(
+                RiskLevel.HIGH_RISK, _EXCEEDED, "amount: {} exceeds threshold: {}", abs(amount), self.threshold
+            )
 
-        return {"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}
+        return NO_RISK
 
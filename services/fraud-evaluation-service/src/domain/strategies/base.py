@@ -14,8 +14,15 @@ un diccionario estructurado con risk_level, reasons y details. Esto cumple mejor
 el principio "Tell, don't ask" y proporciona información rica para auditoría.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from src.domain.models import Transaction, RiskLevel, Location
+from src.domain.strategies.result import StrategyResult
+
+# Costo relativo de evaluar una estrategia (ver EvaluateTransactionUseCase,
+# modo cost_aware): las baratas se ejecutan primero
+COST_IN_MEMORY = 0  # Solo mira la transacción y la ubicación histórica
+COST_CACHE = 1  # Consulta Redis
+COST_DATABASE = 2  # Consulta MongoDB
 
 
 class FraudStrategy(ABC):
@@ -23,12 +30,19 @@ class FraudStrategy(ABC):
     Interface base para estrategias de detección de fraude (Strategy Pattern)
     
     Todas las estrategias concretas deben implementar el método evaluate()
+    y declarar su `cost` si consultan Redis o MongoDB. Las que registran
+    estado al evaluar (dispositivos conocidos, ventana de transacciones)
+    marcan `records_state`: nunca se omiten aunque el resultado ya esté
+    decidido.
     """
 
+    cost: int = COST_IN_MEMORY
+    records_state: bool = False
+
     @abstractmethod
     def evaluate(
         self, transaction: Transaction, historical_location: Optional[Location] = None
-    ) -> Dict[str, Any]:
+    ) -> Union[StrategyResult, Dict[str, Any]]:
         """
         Evalúa una transacción y retorna el resultado del análisis
         
@@ -37,10 +51,12 @@ class FraudStrategy(ABC):
             historical_location: Ubicación histórica del usuario (opcional, solo para LocationStrategy)
         
         Returns:
-            Dict con:
+            StrategyResult (o un dict con las mismas claves) con:
                 - risk_level: RiskLevel (LOW_RISK, MEDIUM_RISK, HIGH_RISK)
-                - reasons: List[str] con razones de la evaluación
+                - reasons: razones de la evaluación
                 - details: str con información adicional
+                - fallback: bool opcional, True si una dependencia (Redis/MongoDB)
+                  falló y el resultado es degradado
         
         Nota del desarrollador:
         El parámetro historical_location es opcional porque solo LocationStrategy lo usa.
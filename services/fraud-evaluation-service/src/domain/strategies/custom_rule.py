@@ -0,0 +1,57 @@
+"""
+Estrategia que ejecuta una regla personalizada compilada (domain/rules.py)
+
+Cada regla habilitada en custom_rules se agrega como una estrategia más, así
+el caso de uso la cuenta como una regla incumplida independiente.
+"""
+import logging
+from typing import Dict, Any, Iterable, List, Optional
+from src.domain.models import Transaction, RiskLevel, Location
+from src.domain.rules import CompiledRule, RuleCompiler, RuleDefinitionError
+from src.domain.strategies.base import FraudStrategy
+from src.domain.strategies.result import NO_RISK, StrategyResult
+
+logger = logging.getLogger(__name__)
+
+
+class CustomRuleStrategy(FraudStrategy):
+    """Evalúa el predicado de una regla definida por los analistas"""
+
+    def __init__(self, rule: CompiledRule, order: int = 999) -> None:
+        self.rule = rule
+        self.order = order  # Prioridad de la regla (campo `order` de custom_rules)
+        self._predicate = rule.predicate
+        self._hit = StrategyResult(RiskLevel.HIGH_RISK, (rule.reason,), f"custom rule {rule.name!r} matched")
+
+    def evaluate(
+        self, transaction: Transaction, historical_location: Optional[Location] = None
+    ) -> StrategyResult:
+        """
+        Evalúa la regla sobre la transacción
+
+        Raises:
+            ValueError: Si transaction es None
+        """
+        if transaction is None:
+            raise ValueError("Transaction cannot be None")
+
+        if self._predicate(transaction):
+            return self._hit
+
+        return NO_RISK
+
+
+def build_custom_strategies(rule_docs: Iterable[Dict[str, Any]], compiler: RuleCompiler) -> List[CustomRuleStrategy]:
+    """
+    Estrategias para los documentos de custom_rules, en su `order`
+
+    Una regla que no compila se omite con un warning: una definición rota
+    no debe tumbar la evaluación del resto.
+    """
+    strategies = []
+    for rule_doc in sorted(rule_docs, key=lambda doc: (doc.get("order", 999), doc.get("id", ""))):
+        try:
+            strategies.append(CustomRuleStrategy(compiler.get(rule_doc), rule_doc.get("order", 999)))
+        except RuleDefinitionError as error:
+            logger.warning("Skipping custom rule %s: %s", rule_doc.get("id"), error)
+    return strategies
@@ -3,10 +3,22 @@ DeviceValidationStrategy - Valida si el dispositivo ha sido usado previamente.
 HU-004: Como sistema, quiero validar si el device_id del usuario ha sido usado
 previamente para detectar actividad sospechosa.
 """
-from typing import Dict, Any, Optional
-from .base import FraudStrategy
+import logging
+from typing import Optional
+from .base import FraudStrategy, COST_CACHE
+from .result import StrategyResult
 from src.domain.models import Transaction, RiskLevel, Location
 
+logger = logging.getLogger(__name__)
+
+_NO_DEVICE = StrategyResult(
+    RiskLevel.MEDIUM_RISK, ("No se proporcionó device_id",), "Transacción sin identificador de dispositivo"
+)
+_NEW_DEVICE = ("Dispositivo nuevo o no reconocido",)
+_CHECK_FAILED = StrategyResult(
+    RiskLevel.LOW_RISK, ("Error en validación de dispositivo",), "No se pudo validar el dispositivo", fallback=True
+)
+
 
 class DeviceValidationStrategy(FraudStrategy):
     """
@@ -15,7 +27,10 @@ class DeviceValidationStrategy(FraudStrategy):
     Utiliza Redis para cachear información de dispositivos y detecta el uso
     de dispositivos nuevos o no reconocidos que puedan indicar fraude.
     """
-    
+
+    cost = COST_CACHE
+    records_state = True  # Registra el dispositivo como conocido en Redis
+
     def __init__(self, redis_client):
         """
         Inicializa la estrategia con el cliente Redis.
@@ -27,7 +42,7 @@ class DeviceValidationStrategy(FraudStrategy):
     
     def evaluate(
         self, transaction: Transaction, historical_location: Optional[Location] = None
-    ) -> Dict[str, Any]:
+    ) -> StrategyResult:
         """
         Evalúa si el dispositivo usado en la transacción ha sido usado antes.
         
@@ -36,21 +51,19 @@ class DeviceValidationStrategy(FraudStrategy):
             historical_location: No usado en esta estrategia
             
         Returns:
-            Dict con risk_level, reasons y details
+            StrategyResult con risk_level, reasons y details
         """
         try:
             user_id = transaction.user_id
             device_id = transaction.device_id
             
-            # DEBUG: Imprimir lo que recibimos
-            print(f"[DeviceValidation] user_id={user_id}, device_id={device_id}, type={type(device_id)}")
+            logger.debug(
+                "device validation input",
+                extra={"transaction_id": transaction.id, "user_id": user_id, "device_id": device_id},
+            )
             
             if not device_id:
-                return {
-                    "risk_level": RiskLevel.MEDIUM_RISK,
-                    "reasons": ["No se proporcionó device_id"],
-                    "details": "Transacción sin identificador de dispositivo"
-                }
+                return _NO_DEVICE
             
             # Clave de Redis para dispositivos del usuario
             redis_key = f"user_devices:{user_id}"
@@ -60,29 +73,24 @@ class DeviceValidationStrategy(FraudStrategy):
             
             if is_known_device:
                 # Dispositivo conocido - no agregar a violaciones
-                return {
-                    "risk_level": RiskLevel.LOW_RISK,
-                    "reasons": [],  # Sin violaciones
-                    "details": f"Dispositivo {device_id} registrado previamente para usuario {user_id}"
-                }
+                return StrategyResult(
+                    RiskLevel.LOW_RISK, (), "Dispositivo {} registrado previamente para usuario {}", device_id, user_id
+                )
             else:
                 # Registrar el nuevo dispositivo
                 self.redis_client.sadd(redis_key, device_id)
                 # Establecer expiración de 90 días
                 self.redis_client.expire(redis_key, 90 * 24 * 60 * 60)
                 
-                return {
-                    "risk_level": RiskLevel.HIGH_RISK,
-                    "reasons": ["Dispositivo nuevo o no reconocido"],
-                    "details": f"Primera transacción desde dispositivo {device_id} para usuario {user_id}"
-                }
+                return StrategyResult(
+                    RiskLevel.HIGH_RISK, _NEW_DEVICE, "Primera transacción desde dispositivo {} para usuario {}",
+                    device_id, user_id,
+                )
                 
         except Exception as e:
             # En caso de error con Redis, retornar riesgo bajo para no bloquear
-            print(f"Error en DeviceValidationStrategy: {e}")
-            return {
-                "risk_level": RiskLevel.LOW_RISK,
-                "reasons": ["Error en validación de dispositivo"],
-                "details": "No se pudo validar el dispositivo"
-            }
+            logger.warning(
+                "device validation fallback: %s", e, extra={"transaction_id": transaction.id}
+            )
+            return _CHECK_FAILED
 
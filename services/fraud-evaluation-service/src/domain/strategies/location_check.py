@@ -13,11 +13,26 @@ Nota del desarrollador (María Gutiérrez):
 La IA sugirió usar una librería externa (geopy) directamente. Lo refactoricé para
 implementar la fórmula de Haversine manualmente, eliminando la dependencia externa
 en el Domain Layer (cumple Clean Architecture: Domain sin dependencias externas).
+
+La trigonometría vive en src/domain/geo.py: la ubicación histórica se prepara
+una vez por coordenada y las transacciones claramente dentro del radio se
+resuelven con una cota sin senos ni cosenos.
 """
-from math import radians, cos, sin, asin, sqrt
-from typing import Dict, Any, Optional
+from math import asin, cos, pi, sin, sqrt
+from typing import Optional
 from src.domain.strategies.base import FraudStrategy
+from src.domain.strategies.result import NO_RISK, StrategyResult
 from src.domain.models import Transaction, RiskLevel, Location
+from src.domain.geo import EARTH_RADIUS_KM, GeoPoint, haversine_km, prepare_point
+
+_DEGREES_TO_RADIANS = pi / 180.0
+_TWO_PI = 2.0 * pi
+
+_NO_HISTORY = StrategyResult(
+    RiskLevel.LOW_RISK, ("no_historical_location",), "First transaction for user, no historical location"
+)
+_UNUSUAL = ("unusual_location",)
+_UNUSUAL_DETAILS = "distance: {:.2f} km exceeds radius: {} km. Previous: ({}, {}), Current: ({}, {})"
 
 
 class LocationStrategy(FraudStrategy):
@@ -40,10 +55,12 @@ class LocationStrategy(FraudStrategy):
         if radius_km <= 0:
             raise ValueError("Radius must be positive")
         self.radius_km = radius_km
+        # Radio como ángulo central: la cota del pre-filtro se compara en radianes
+        self._radius_rad = radius_km / EARTH_RADIUS_KM
 
     def evaluate(
         self, transaction: Transaction, historical_location: Optional[Location] = None
-    ) -> Dict[str, Any]:
+    ) -> StrategyResult:
         """
         Evalúa si la ubicación de la transacción está fuera del radio habitual
         
@@ -52,7 +69,7 @@ class LocationStrategy(FraudStrategy):
             historical_location: Ubicación histórica del usuario
         
         Returns:
-            Dict con risk_level, reasons y details
+            StrategyResult con risk_level, reasons y details
         
         Raises:
             ValueError: Si transaction es None
@@ -67,32 +84,43 @@ class LocationStrategy(FraudStrategy):
 
         # Usuario sin historial de ubicación (primera transacción)
         if historical_location is None:
-            return {
-                "risk_level": RiskLevel.LOW_RISK,
-                "reasons": ["no_historical_location"],
-                "details": "First transaction for user, no historical location",
-            }
-
-        # Calcular distancia usando fórmula de Haversine
-        distance_km = self._calculate_distance(
-            historical_location, transaction.location
-        )
+            return _NO_HISTORY
+
+        current = transaction.location
+        origin = prepare_point(historical_location.latitude, historical_location.longitude)
+
+        # Pre-filtro sin trigonometría (misma cota que geo.within_radius_bound,
+        # en línea porque es el camino más frecuente): recorrer el paralelo del
+        # origen y luego el meridiano nunca es más corto que el círculo máximo
+        dlon = current.longitude * _DEGREES_TO_RADIANS - origin.lon_rad
+        if dlon > pi:
+            dlon -= _TWO_PI
+        elif dlon < -pi:
+            dlon += _TWO_PI
+        latitude = current.latitude * _DEGREES_TO_RADIANS
+        dlat = latitude - origin.lat_rad
+        if origin.cos_lat * abs(dlon) + abs(dlat) <= self._radius_rad:
+            return NO_RISK
+
+        # Calcular distancia usando fórmula de Haversine (geo.haversine_km con
+        # las diferencias ya calculadas; el coseno del origen viene cacheado)
+        half_dlat = sin(dlat * 0.5)
+        half_dlon = sin(dlon * 0.5)
+        h = half_dlat * half_dlat + origin.cos_lat * cos(latitude) * half_dlon * half_dlon
+        distance_km = 2.0 * EARTH_RADIUS_KM * asin(sqrt(min(1.0, h)))
 
         # Nota del desarrollador:
         # La IA sugirió >= para la comparación. Lo cambié a > para que
         # transacciones exactamente en el límite no disparen alerta.
         if distance_km > self.radius_km:
-            return {
-                "risk_level": RiskLevel.HIGH_RISK,
-                "reasons": ["unusual_location"],
-                "details": (
-                    f"distance: {distance_km:.2f} km exceeds radius: {self.radius_km} km. "
-                    f"Previous: ({historical_location.latitude}, {historical_location.longitude}), "
-                    f"Current: ({transaction.location.latitude}, {transaction.location.longitude})"
-                ),
-            }
-
-        return {"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}
+            return StrategyResult(
+                RiskLevel.HIGH_RISK, _UNUSUAL, _UNUSUAL_DETAILS,
+                distance_km, self.radius_km,
+                historical_location.latitude, historical_location.longitude,
+                current.latitude, current.longitude,
+            )
+
+        return NO_RISK
 
     def _calculate_distance(self, loc1: Location, loc2: Location) -> float:
         """
@@ -115,25 +143,7 @@ class LocationStrategy(FraudStrategy):
                  d = R * c
         donde R = 6371 km (radio de la Tierra)
         """
-        # Radio de la Tierra en kilómetros
-        earth_radius_km = 6371.0
-
-        # Convertir grados a radianes
-        lat1 = radians(loc1.latitude)
-        lon1 = radians(loc1.longitude)
-        lat2 = radians(loc2.latitude)
-        lon2 = radians(loc2.longitude)
-
-        # Diferencias
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        # Fórmula de Haversine
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-
-        # Distancia en kilómetros
-        distance = earth_radius_km * c
-
-        return distance
-
+        return haversine_km(
+            prepare_point(loc1.latitude, loc1.longitude),
+            GeoPoint(loc2.latitude, loc2.longitude),
+        )
@@ -3,12 +3,20 @@ RapidTransactionStrategy - Detecta múltiples transacciones rápidas.
 HU-006: Como sistema, quiero detectar si un usuario realiza más de 3 transacciones
 en 5 minutos para marcar como sospechoso.
 """
+import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any
 
-from .base import FraudStrategy
+from .base import FraudStrategy, COST_CACHE
+from .result import StrategyResult
 from src.domain.models import Transaction, RiskLevel
 
+logger = logging.getLogger(__name__)
+
+_DETECTED = ("rapid_transactions_detected",)
+_CHECK_FAILED = StrategyResult(
+    RiskLevel.LOW_RISK, ("rapid_transaction_check_failed",), "Could not check rapid transactions", fallback=True
+)
+
 
 class RapidTransactionStrategy(FraudStrategy):
     """
@@ -17,7 +25,10 @@ class RapidTransactionStrategy(FraudStrategy):
     Utiliza Redis para rastrear transacciones recientes por usuario y detecta
     patrones de transacciones rápidas que puedan indicar fraude.
     """
-    
+
+    cost = COST_CACHE
+    records_state = True  # Agrega la transacción a la ventana en Redis
+
     def __init__(self, redis_client, max_transactions: int = 3, window_minutes: int = 5):
         """
         Inicializa la estrategia con el cliente Redis y parámetros de detección.
@@ -36,7 +47,7 @@ class RapidTransactionStrategy(FraudStrategy):
         """Retorna el nombre de la estrategia."""
         return "rapid_transaction"
     
-    def evaluate(self, transaction: Transaction, historical_location=None) -> Dict[str, Any]:
+    def evaluate(self, transaction: Transaction, historical_location=None) -> StrategyResult:
         """
         Evalúa si la transacción es parte de un patrón de transacciones rápidas.
         
@@ -45,7 +56,7 @@ class RapidTransactionStrategy(FraudStrategy):
             historical_location: No usado en esta estrategia
             
         Returns:
-            Dict con risk_level, reasons y details
+            StrategyResult con risk_level, reasons y details
         """
         try:
             user_id = transaction.user_id
@@ -80,27 +91,22 @@ class RapidTransactionStrategy(FraudStrategy):
             # Evaluar riesgo según el número de transacciones
             # Solo mostrar violación cuando se SUPERA el límite
             if transaction_count > self.max_transactions:
-                return {
-                    "risk_level": RiskLevel.HIGH_RISK,
-                    "reasons": ["rapid_transactions_detected"],
-                    "details": f"{transaction_count} transactions in {self.window_minutes} minutes (limit: {self.max_transactions})"
-                }
+                return StrategyResult(
+                    RiskLevel.HIGH_RISK, _DETECTED, "{} transactions in {} minutes (limit: {})",
+                    transaction_count, self.window_minutes, self.max_transactions,
+                )
             else:
                 # 3 o menos transacciones = OK (sin violación)
-                return {
-                    "risk_level": RiskLevel.LOW_RISK,
-                    "reasons": [],
-                    "details": f"{transaction_count} transactions in {self.window_minutes} minutes"
-                }
+                return StrategyResult(
+                    RiskLevel.LOW_RISK, (), "{} transactions in {} minutes", transaction_count, self.window_minutes
+                )
                 
         except Exception as e:
             # En caso de error con Redis, retornar riesgo bajo para no bloquear
-            print(f"Error en RapidTransactionStrategy: {e}")
-            return {
-                "risk_level": RiskLevel.LOW_RISK,
-                "reasons": ["rapid_transaction_check_failed"],
-                "details": "Could not check rapid transactions"
-            }
+            logger.warning(
+                "rapid transaction fallback: %s", e, extra={"transaction_id": transaction.id}
+            )
+            return _CHECK_FAILED
     
     def get_reason(self, risk_level: RiskLevel) -> str:
         """
@@ -0,0 +1,116 @@
+"""
+StrategyResult - Resultado compacto de FraudStrategy.evaluate()
+
+- __slots__ y razones en tupla: un resultado sin violaciones puede ser una
+  instancia constante compartida (NO_RISK) en lugar de un dict nuevo por
+  llamada
+- details se formatea recién cuando alguien lo lee (plantilla + argumentos);
+  el caso de uso nunca lo lee, así que en el hot path no se formatea
+- API compatible con el dict que retornaban las estrategias
+  (result["reasons"], result.get("fallback"), == {...}) para el código y
+  los tests existentes
+
+Nota del desarrollador:
+Por la API de dict, result["reasons"] retorna una lista nueva (el código
+viejo podía mutarla); el caso de uso usa el atributo `reasons` (tupla) y no
+copia nada.
+"""
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+from src.domain.models import RiskLevel
+
+_KEYS = ("risk_level", "reasons", "details")
+
+
+class StrategyResult:
+    """Resultado inmutable (por convención) de una estrategia"""
+
+    __slots__ = ("risk_level", "reasons", "fallback", "_details", "_args")
+
+    def __init__(
+        self,
+        risk_level: RiskLevel,
+        reasons: Sequence[str] = (),
+        details: str = "",
+        *args: Any,
+        fallback: bool = False,
+    ) -> None:
+        """
+        Args:
+            risk_level: Nivel de riesgo de la estrategia
+            reasons: Razones de la violación (vacío = sin violación)
+            details: Texto o plantilla str.format; con `args` se formatea
+                al leer `details`
+            fallback: True si una dependencia falló y el resultado es degradado
+        """
+        self.risk_level = risk_level
+        self.reasons: Tuple[str, ...] = tuple(reasons)
+        self.fallback = fallback
+        self._details = details
+        self._args = args
+
+    @property
+    def details(self) -> str:
+        if self._args:
+            # Se formatea una sola vez; instancias constantes nunca tienen args
+            self._details = self._details.format(*self._args)
+            self._args = ()
+        return self._details
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "StrategyResult":
+        """Adapta el dict de una estrategia que aún no usa StrategyResult"""
+        return cls(
+            result["risk_level"],
+            result["reasons"],
+            result.get("details", ""),
+            fallback=bool(result.get("fallback")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {"risk_level": self.risk_level, "reasons": list(self.reasons), "details": self.details}
+        if self.fallback:
+            result["fallback"] = True
+        return result
+
+    # --- API compatible con dict -------------------------------------------
+
+    def keys(self) -> Tuple[str, ...]:
+        return _KEYS + ("fallback",) if self.fallback else _KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "reasons":
+            return list(self.reasons)
+        if key in _KEYS or (key == "fallback" and self.fallback):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StrategyResult):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # Compara como dict: no es hashable
+
+    def __repr__(self) -> str:
+        return f"StrategyResult({self.risk_level.name}, reasons={self.reasons!r}, fallback={self.fallback})"
+
+
+# Resultado constante para el caso más común: sin violaciones ni detalle
+NO_RISK = StrategyResult(RiskLevel.LOW_RISK)
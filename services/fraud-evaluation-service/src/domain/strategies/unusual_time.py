@@ -3,13 +3,27 @@ UnusualTimeStrategy - Detecta transacciones en horarios inusuales.
 HU-007: Como sistema, quiero detectar si una transacción se realiza en un horario
 inusual para el usuario basándome en sus patrones históricos.
 """
+import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict
 from collections import defaultdict
 
-from .base import FraudStrategy
+from .base import FraudStrategy, COST_DATABASE
+from .result import StrategyResult
 from src.domain.models import Transaction, RiskLevel
 
+logger = logging.getLogger(__name__)
+
+_INSUFFICIENT_HISTORY = StrategyResult(
+    RiskLevel.LOW_RISK, (), "Insufficient transaction history to establish pattern"
+)
+_UNUSUAL = ("unusual_transaction_time",)
+_MODERATELY_UNUSUAL = ("moderately_unusual_time",)
+_DEVIATION_DETAILS = "Transaction at {}:00 is {} hours from normal pattern"
+_CHECK_FAILED = StrategyResult(
+    RiskLevel.LOW_RISK, ("unusual_time_check_failed",), "Could not check unusual time pattern", fallback=True
+)
+
 
 class UnusualTimeStrategy(FraudStrategy):
     """
@@ -19,7 +33,9 @@ class UnusualTimeStrategy(FraudStrategy):
     Analiza el historial de transacciones del usuario en MongoDB para determinar
     sus horarios habituales de transacción y detecta desviaciones significativas.
     """
-    
+
+    cost = COST_DATABASE
+
     def __init__(
         self,
         audit_repository,
@@ -42,7 +58,7 @@ class UnusualTimeStrategy(FraudStrategy):
         """Retorna el nombre de la estrategia."""
         return "unusual_time"
     
-    def evaluate(self, transaction: Transaction, historical_location=None) -> Dict[str, Any]:
+    def evaluate(self, transaction: Transaction, historical_location=None) -> StrategyResult:
         """
         Evalúa si la transacción ocurre en un horario inusual para el usuario.
         
@@ -51,7 +67,7 @@ class UnusualTimeStrategy(FraudStrategy):
             historical_location: No usado en esta estrategia
             
         Returns:
-            Dict con risk_level, reasons y details
+            StrategyResult con risk_level, reasons y details
         """
         try:
             user_id = transaction.user_id
@@ -62,11 +78,7 @@ class UnusualTimeStrategy(FraudStrategy):
             
             # Si no hay suficientes transacciones históricas, no se puede establecer un patrón
             if len(historical_transactions) < self.min_transactions_for_pattern:
-                return {
-                    "risk_level": RiskLevel.LOW_RISK,
-                    "reasons": [],
-                    "details": "Insufficient transaction history to establish pattern"
-                }
+                return _INSUFFICIENT_HISTORY
             
             # Analizar patrón de horarios
             hourly_pattern = self._analyze_hourly_pattern(historical_transactions)
@@ -80,32 +92,20 @@ class UnusualTimeStrategy(FraudStrategy):
             # Evaluar riesgo según la desviación
             if is_unusual:
                 if deviation_hours >= self.unusual_threshold_hours * 2:
-                    return {
-                        "risk_level": RiskLevel.HIGH_RISK,
-                        "reasons": ["unusual_transaction_time"],
-                        "details": f"Transaction at {current_hour}:00 is {deviation_hours} hours from normal pattern"
-                    }
+                    return StrategyResult(RiskLevel.HIGH_RISK, _UNUSUAL, _DEVIATION_DETAILS, current_hour, deviation_hours)
                 elif deviation_hours >= self.unusual_threshold_hours:
-                    return {
-                        "risk_level": RiskLevel.MEDIUM_RISK,
-                        "reasons": ["moderately_unusual_time"],
-                        "details": f"Transaction at {current_hour}:00 is {deviation_hours} hours from normal pattern"
-                    }
-            
-            return {
-                "risk_level": RiskLevel.LOW_RISK,
-                "reasons": [],
-                "details": f"Transaction at {current_hour}:00 is within normal pattern"
-            }
+                    return StrategyResult(
+                        RiskLevel.MEDIUM_RISK, _MODERATELY_UNUSUAL, _DEVIATION_DETAILS, current_hour, deviation_hours
+                    )
+            
+            return StrategyResult(RiskLevel.LOW_RISK, (), "Transaction at {}:00 is within normal pattern", current_hour)
             
         except Exception as e:
             # En caso de error, retornar riesgo bajo para no bloquear
-            print(f"Error en UnusualTimeStrategy: {e}")
-            return {
-                "risk_level": RiskLevel.LOW_RISK,
-                "reasons": ["unusual_time_check_failed"],
-                "details": "Could not check unusual time pattern"
-            }
+            logger.warning(
+                "unusual time fallback: %s", e, extra={"transaction_id": transaction.id}
+            )
+            return _CHECK_FAILED
     
     def get_reason(self, transaction: Transaction, risk_level: RiskLevel) -> str:
         """
@@ -157,7 +157,7 @@ class UnusualTimeStrategy(FraudStrategy):
             return filtered_data
             
         except Exception as exc:
-            print(f"Error obteniendo historial: {exc}")
+            logger.warning("could not load user history: %s", exc)
             return []
     
     def _analyze_hourly_pattern(self, transactions: list) -> Dict[int, int]:
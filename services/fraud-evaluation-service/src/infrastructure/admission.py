@@ -0,0 +1,290 @@
+"""
+Control de admisión del gateway (backpressure por clase de endpoint)
+
+Sin límite, una ráfaga sobre /api/v1/transaction/validate abría tantas
+evaluaciones concurrentes como requests llegaran: cada una sumaba consultas
+a MongoDB/Redis, la latencia crecía para todas y el gateway terminaba sin
+completar ninguna a tiempo. Con admisión:
+
+- Cada clase (scoring, auth, user, admin) tiene su límite de requests en
+  curso y todas comparten un límite total del proceso
+- Lo que no entra espera en una cola acotada, a lo sumo el deadline de su
+  clase; si la cola está llena se responde 429 al instante y si vence el
+  deadline, 503. Ambos con Retry-After
+- Al liberarse un lugar se atiende primero la clase de mayor prioridad:
+  scoring antes que el tráfico de usuarios (auth y su historial, user) y
+  éste antes que los reportes/scans de admin
+
+Nota del desarrollador:
+Los límites son por proceso (por worker de uvicorn) y el estado vive en el
+event loop: no hay locks porque acquire/release nunca corren en otro hilo.
+Los streams SSE y /health, /metrics no pasan por aquí: ocuparían un lugar
+durante toda la conexión.
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Sequence
+
+from src.infrastructure import serialization
+from src.infrastructure.metrics import REGISTRY
+
+SCORING = "scoring"
+AUTH = "auth"
+USER = "user"
+ADMIN = "admin"
+
+# (método o None, ruta, clase): gana la primera coincidencia. Una ruta que
+# termina en "/" es un prefijo; si no, tiene que coincidir exacta.
+ENDPOINT_CLASSES = (
+    ("GET", "/api/v1/admin/stream", None),
+    ("GET", "/api/v1/user/events/", None),
+    ("POST", "/api/v1/transaction/validate", SCORING),
+    ("POST", "/transaction", SCORING),
+    ("GET", "/transaction/", SCORING),
+    ("POST", "/api/v1/user/transaction/", SCORING),
+    (None, "/api/v1/auth/", AUTH),
+    ("GET", "/api/v1/user/transactions/", USER),
+    (None, "/api/v1/admin/", ADMIN),
+    (None, "/api/v1/transaction/review/", ADMIN),
+    (None, "/audit/", ADMIN),
+    (None, "/config/", ADMIN),
+)
+
+ADMISSION_DECISIONS = REGISTRY.counter(
+    "fraud_admission_total",
+    "Requests por clase de endpoint: admitted, rejected (cola llena) o expired (deadline)",
+    ("endpoint_class", "outcome"),
+)
+ADMISSION_QUEUE_TIME = REGISTRY.histogram(
+    "fraud_admission_queue_seconds",
+    "Espera en la cola de admisión de los requests admitidos",
+    ("endpoint_class",),
+)
+
+
+def endpoint_class(method: str, path: str) -> Optional[str]:
+    """Clase de un request (None = sin control de admisión)"""
+    for rule_method, route, name in ENDPOINT_CLASSES:
+        if rule_method is not None and rule_method != method:
+            continue
+        if path == route or (route.endswith("/") and path.startswith(route)):
+            return name
+    return None
+
+
+@dataclass(frozen=True)
+class EndpointClass:
+    """Límites de una clase de endpoint"""
+
+    name: str
+    concurrency: int
+    deadline: float  # segundos máximos en cola
+    priority: int  # menor = se atiende antes
+
+
+class AdmissionRejected(Exception):
+    """El request no se admitió; status_code es 429 o 503"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Semáforos por clase + total, con colas por prioridad y deadline
+
+    Un request se admite directo solo si hay lugar en su clase y en el
+    total y no hay nadie esperando con igual o mayor prioridad (no se
+    adelanta a la cola).
+    """
+
+    def __init__(
+        self,
+        classes: Sequence[EndpointClass],
+        total_concurrency: int,
+        queue_size: int,
+        retry_after: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            classes: Límites por clase de endpoint
+            total_concurrency: Requests en curso entre todas las clases
+            queue_size: Requests esperando por clase antes de responder 429
+            retry_after: Segundos sugeridos en el header Retry-After
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        self.classes = {endpoint.name: endpoint for endpoint in classes}
+        self.total_concurrency = total_concurrency
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._clock = clock
+        self._by_priority = sorted(classes, key=lambda endpoint: endpoint.priority)
+        self._in_flight: Dict[str, int] = {name: 0 for name in self.classes}
+        self._total = 0
+        self._waiting: Dict[str, Deque[asyncio.Future]] = {name: deque() for name in self.classes}
+
+    def in_flight(self, name: str) -> int:
+        return self._in_flight[name]
+
+    def waiting(self, name: str) -> int:
+        return sum(1 for waiter in self._waiting[name] if not waiter.done())
+
+    async def acquire(self, name: str) -> float:
+        """
+        Espera un lugar para un request de la clase `name`
+
+        Returns:
+            Segundos que esperó en cola
+
+        Raises:
+            AdmissionRejected: 429 si la cola de la clase está llena, 503 si
+                venció el deadline esperando
+        """
+        endpoint = self.classes[name]
+        if self._has_room(endpoint) and not self._waiting_ahead(endpoint):
+            self._take(name)
+            ADMISSION_DECISIONS.labels(name, "admitted").inc()
+            ADMISSION_QUEUE_TIME.labels(name).observe(0.0)
+            return 0.0
+
+        queue = self._waiting[name]
+        if self.waiting(name) >= self.queue_size:
+            ADMISSION_DECISIONS.labels(name, "rejected").inc()
+            raise AdmissionRejected(429, f"Too many {name} requests queued", self.retry_after)
+
+        started = self._clock()
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, endpoint.deadline)
+        except asyncio.TimeoutError:
+            self._abandon(name, waiter)
+            ADMISSION_DECISIONS.labels(name, "expired").inc()
+            raise AdmissionRejected(503, f"{name} requests are overloaded", self.retry_after) from None
+        except asyncio.CancelledError:
+            self._abandon(name, waiter)
+            raise
+
+        waited = self._clock() - started
+        ADMISSION_DECISIONS.labels(name, "admitted").inc()
+        ADMISSION_QUEUE_TIME.labels(name).observe(waited)
+        return waited
+
+    def release(self, name: str) -> None:
+        """Libera el lugar de un request terminado y despierta a los que esperan"""
+        self._in_flight[name] -= 1
+        self._total -= 1
+        self._wake()
+
+    def _has_room(self, endpoint: EndpointClass) -> bool:
+        return self._total < self.total_concurrency and self._in_flight[endpoint.name] < endpoint.concurrency
+
+    def _waiting_ahead(self, endpoint: EndpointClass) -> bool:
+        """Hay requests en cola con igual o mayor prioridad que podrían usar el lugar"""
+        return any(
+            self.waiting(other.name) and self._in_flight[other.name] < other.concurrency
+            for other in self._by_priority
+            if other.priority <= endpoint.priority
+        )
+
+    def _take(self, name: str) -> None:
+        self._in_flight[name] += 1
+        self._total += 1
+
+    def _wake(self) -> None:
+        """Entrega los lugares libres por prioridad y en orden de llegada"""
+        for endpoint in self._by_priority:
+            queue = self._waiting[endpoint.name]
+            while queue and self._has_room(endpoint):
+                waiter = queue.popleft()
+                if waiter.done():  # venció o se canceló antes de recibir el lugar
+                    continue
+                self._take(endpoint.name)
+                waiter.set_result(None)
+            if self._total >= self.total_concurrency:
+                return
+
+    def _abandon(self, name: str, waiter: asyncio.Future) -> None:
+        """Un request que deja de esperar devuelve el lugar si ya se le había dado"""
+        if waiter.done() and not waiter.cancelled():
+            self.release(name)
+            return
+        try:
+            self._waiting[name].remove(waiter)
+        except ValueError:
+            pass
+
+
+class AdmissionMiddleware:
+    """
+    Middleware ASGI que pasa cada request por el AdmissionController
+
+    Los rechazos se responden sin tocar la app: JSON {"detail": ...} como
+    HTTPException, con Retry-After.
+    """
+
+    def __init__(self, app, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = endpoint_class(scope["method"], scope["path"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(name)
+        except AdmissionRejected as rejected:
+            await send_rejection(send, rejected.status_code, rejected.detail, rejected.retry_after)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(name)
+
+
+async def send_rejection(send, status_code: int, detail: str, retry_after: int, headers=()) -> None:
+    """Responde desde un middleware ASGI con {"detail": ...} y Retry-After"""
+    body = serialization.dumps({"detail": detail})
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(retry_after).encode("latin-1")),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def build_admission_controller(settings) -> Optional[AdmissionController]:
+    """AdmissionController según Settings (None si admission_enabled es False)"""
+    if not settings.admission_enabled:
+        return None
+    return AdmissionController(
+        [
+            EndpointClass(SCORING, settings.admission_scoring_concurrency,
+                          settings.admission_scoring_deadline_seconds, priority=0),
+            EndpointClass(AUTH, settings.admission_auth_concurrency,
+                          settings.admission_auth_deadline_seconds, priority=1),
+            EndpointClass(USER, settings.admission_user_concurrency,
+                          settings.admission_user_deadline_seconds, priority=1),
+            EndpointClass(ADMIN, settings.admission_admin_concurrency,
+                          settings.admission_admin_deadline_seconds, priority=2),
+        ],
+        total_concurrency=settings.admission_total_concurrency,
+        queue_size=settings.admission_queue_size,
+        retry_after=settings.admission_retry_after_seconds,
+    )
@@ -0,0 +1,305 @@
+"""
+Circuit breakers por dependencia (Redis, MongoDB)
+
+Con Redis o MongoDB lentos cada llamada esperaba el timeout del cliente (sin
+configurar: indefinido en redis-py, 30 s de server selection en pymongo) y
+recién ahí la estrategia devolvía su resultado "check_failed". Ahora:
+
+- Los clientes tienen timeouts cortos (redis_timeout_seconds, mongodb_timeout_ms)
+- Tras circuit_failure_threshold fallos de conexión seguidos el circuito se
+  abre y las llamadas fallan de inmediato con CircuitOpenError, sin tocar la
+  red: una dependencia caída cuesta microsegundos por transacción
+- Pasados circuit_reset_seconds el circuito queda semiabierto y deja pasar
+  una sola llamada de prueba: si responde se cierra, si falla se vuelve a abrir
+
+Un breaker por dependencia y por proceso (breaker_for): todos los clientes
+de Redis del gateway o del worker comparten el estado.
+
+Nota del desarrollador:
+Solo los errores de conexión/timeout abren el circuito. Un ResponseError de
+Redis o un DuplicateKeyError de MongoDB significan que la dependencia
+respondió, y cuentan como éxito. Los pipelines de Redis pasan por el breaker
+al crearse (pipeline()), no en execute().
+
+Los comandos de redis.asyncio no son `async def`: son funciones que
+devuelven una corrutina, y el error de conexión aparece recién al
+esperarla. Por eso call() mira el resultado y, si es una corrutina, la
+espera dentro del breaker (con isawaitable también se envolvería el
+Pipeline async, que define __await__).
+"""
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Callable, Dict, Tuple, Type
+
+import redis
+from pymongo.errors import ConnectionFailure
+
+from src.application.use_cases import FALLBACK_POLICIES
+from src.config import settings
+from src.infrastructure.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "fraud_circuit_transitions_total",
+    "Cambios de estado de los circuit breakers",
+    ("dependency", "state"),
+)
+CIRCUIT_REJECTIONS = REGISTRY.counter(
+    "fraud_circuit_rejected_total",
+    "Llamadas rechazadas sin tocar la red porque el circuito está abierto",
+    ("dependency",),
+)
+
+# Excepciones que indican que la dependencia no respondió
+_FAILURES: Dict[str, Tuple[Type[BaseException], ...]] = {
+    "redis": (redis.ConnectionError, redis.TimeoutError, OSError),
+    "mongodb": (ConnectionFailure, OSError),
+}
+_DEFAULT_FAILURES: Tuple[Type[BaseException], ...] = (OSError,)
+
+
+class CircuitOpenError(ConnectionError):
+    """La dependencia está marcada como caída; la llamada no se intentó"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe (cerrado -> abierto -> semiabierto)
+
+    Se usa desde hilos del threadpool de FastAPI y desde el event loop, por
+    eso el estado se protege con un Lock; la llamada en sí corre sin él.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+        failures: Tuple[Type[BaseException], ...] = _DEFAULT_FAILURES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            name: Dependencia protegida (label de las métricas)
+            failure_threshold: Fallos seguidos que abren el circuito
+            reset_timeout: Segundos abierto antes de permitir una llamada de prueba
+            failures: Excepciones que cuentan como fallo de la dependencia
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = failures
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejections = CIRCUIT_REJECTIONS.labels(name)
+
+    @property
+    def state(self) -> str:
+        """Estado actual; un circuito abierto vencido se informa semiabierto"""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Reserva el paso de una llamada
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto, o semiabierto con
+                la llamada de prueba ya en curso
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+        self._rejections.inc()
+        raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probing = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                if self._state != OPEN:
+                    self._transition(OPEN)
+
+    def call(self, function: Callable, *args, **kwargs):
+        """
+        Ejecuta `function` a través del breaker
+
+        Si `function` devuelve una corrutina (comandos de redis.asyncio) se
+        devuelve otra que la espera y registra el resultado al terminar.
+        """
+        self.before_call()
+        try:
+            result = function(*args, **kwargs)
+        except self.failures:
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        if inspect.iscoroutine(result):
+            return self._settle(result)
+        self.record_success()
+        return result
+
+    async def call_async(self, function: Callable, *args, **kwargs):
+        """Versión para corrutinas (redis.asyncio, puertos async)"""
+        result = self.call(function, *args, **kwargs)
+        return await result if inspect.iscoroutine(result) else result
+
+    async def _settle(self, coroutine):
+        """Espera una llamada ya admitida por before_call() y registra el resultado"""
+        try:
+            result = await coroutine
+        except self.failures:
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        except BaseException:
+            # CancelledError: quien llama desistió, no dice nada de la dependencia
+            self._release_probe()
+            raise
+        self.record_success()
+        return result
+
+    def _release_probe(self) -> None:
+        with self._lock:
+            self._probing = False
+
+    def _transition(self, state: str) -> None:
+        """Cambia de estado (con el lock tomado)"""
+        self._state = state
+        CIRCUIT_TRANSITIONS.labels(self.name, state).inc()
+        log = logger.warning if state == OPEN else logger.info
+        log("circuit %s -> %s", self.name, state, extra={"dependency": self.name})
+
+
+class GuardedClient:
+    """
+    Proxy que pasa cada método de un cliente por un CircuitBreaker
+
+    Mismo esquema que InstrumentedClient: wrappers sync/async cacheados por
+    nombre y atributos no invocables devueltos tal cual. Los métodos que
+    devuelven una corrutina (redis.asyncio) se registran al esperarla.
+    """
+
+    __slots__ = ("_target", "_breaker", "_wrappers")
+
+    def __init__(self, target, breaker: CircuitBreaker) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_breaker", breaker)
+        object.__setattr__(self, "_wrappers", {})
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def __getattr__(self, name: str):
+        wrapper = self._wrappers.get(name)
+        if wrapper is not None:
+            return wrapper
+
+        attribute = getattr(self._target, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        breaker = self._breaker
+        if asyncio.iscoroutinefunction(attribute):
+            async def wrapper(*args, **kwargs):
+                return await breaker.call_async(attribute, *args, **kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                return breaker.call(attribute, *args, **kwargs)
+
+        self._wrappers[name] = wrapper
+        return wrapper
+
+
+def guard_client(client, breaker: CircuitBreaker):
+    """Envuelve un cliente en GuardedClient (idempotente)"""
+    if isinstance(client, GuardedClient):
+        return client
+    return GuardedClient(client, breaker)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(dependency: str) -> CircuitBreaker:
+    """Breaker compartido del proceso para una dependencia ("redis", "mongodb")"""
+    breaker = _breakers.get(dependency)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(dependency)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    dependency,
+                    failure_threshold=settings.circuit_failure_threshold,
+                    reset_timeout=settings.circuit_reset_seconds,
+                    failures=_FAILURES.get(dependency, _DEFAULT_FAILURES),
+                )
+                _breakers[dependency] = breaker
+    return breaker
+
+
+def reset_breakers() -> None:
+    """Descarta el estado de todos los breakers (tests)"""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def parse_fallback_policies(value: str) -> Dict[str, str]:
+    """
+    Políticas de fallback por estrategia desde Settings.strategy_fallback_policies
+
+    "UnusualTimeStrategy=ignore,DeviceValidationStrategy=flag" ->
+    {"UnusualTimeStrategy": "ignore", "DeviceValidationStrategy": "flag"}
+
+    Raises:
+        ValueError: Si una entrada no tiene la forma Estrategia=política o
+            la política no existe
+    """
+    policies = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        strategy, sep, policy = entry.partition("=")
+        policy = policy.strip().lower()
+        if not sep or not strategy.strip() or policy not in FALLBACK_POLICIES:
+            raise ValueError(f"Invalid fallback policy {entry.strip()!r}")
+        policies[strategy.strip()] = policy
+    return policies
@@ -0,0 +1,150 @@
+"""
+Canal push del gateway: eventos publicados en Redis pub/sub y repartidos a
+las conexiones SSE abiertas en cada réplica
+
+- Los productores (casos de uso de evaluación y revisión, autenticación
+  del usuario) publican JSON en un canal por destinatario:
+  events:user:<user_id> y events:admin
+- Cada réplica del gateway mantiene UNA suscripción por patrón (events:*)
+  y reparte cada mensaje a las colas locales de las conexiones de ese canal
+- Cada conexión tiene una cola acotada; si el cliente no consume, se
+  descartan los eventos más viejos en lugar de crecer sin límite
+
+Nota del desarrollador:
+Una suscripción por réplica (y no una por conexión) mantiene constante la
+cantidad de conexiones a Redis sin importar cuántos usuarios estén
+conectados. El volumen de eventos es bajo (cambios de estado), así que
+recibir también los de usuarios conectados a otras réplicas es barato.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "events:"
+# Evaluaciones nuevas y cambios de estado para el dashboard admin
+ADMIN_CHANNEL = CHANNEL_PREFIX + "admin"
+
+# Comentario SSE periódico: mantiene viva la conexión a través de proxies
+HEARTBEAT_SECONDS = 15.0
+
+_MAX_BACKOFF_SECONDS = 30.0
+
+
+def user_channel(user_id: str) -> str:
+    """Canal de eventos de un usuario"""
+    return f"{CHANNEL_PREFIX}user:{user_id}"
+
+
+def format_sse(data: Union[str, bytes], event: Optional[str] = None) -> str:
+    """
+    Un evento Server-Sent Events; `data` es JSON compacto (sin saltos de línea)
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    if event:
+        return f"event: {event}\ndata: {data}\n\n"
+    return f"data: {data}\n\n"
+
+
+class EventSubscription:
+    """Cola de eventos de una conexión; se libera con close()"""
+
+    def __init__(self, hub: "EventHub", channel: str, queue: asyncio.Queue) -> None:
+        self._hub = hub
+        self.channel = channel
+        self.queue = queue
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Siguiente evento (JSON crudo), o None si vence el timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._hub._remove(self.channel, self.queue)
+
+
+class EventHub:
+    """
+    Fan-out de Redis pub/sub a conexiones locales
+
+    La tarea que escucha Redis arranca con la primera suscripción y se
+    reconecta con backoff exponencial si Redis se cae.
+    """
+
+    def __init__(self, redis_client, pattern: str = CHANNEL_PREFIX + "*", queue_size: int = 100) -> None:
+        self.redis = redis_client
+        self.pattern = pattern
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def connections(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def subscribe(self, channel: str) -> EventSubscription:
+        """Registra una conexión local en el canal (requiere un event loop activo)"""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(channel, set()).add(queue)
+        return EventSubscription(self, channel, queue)
+
+    def _remove(self, channel: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(channel)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[channel]
+
+    def dispatch(self, channel: str, data: str) -> int:
+        """Entrega el evento a las conexiones locales del canal; retorna cuántas"""
+        queues = self._subscribers.get(channel)
+        if not queues:
+            return 0
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()  # Cliente lento: se pierde el evento más viejo
+            queue.put_nowait(data)
+        return len(queues)
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.psubscribe(self.pattern)
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    self.dispatch(channel, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("event stream subscription lost: %s", e)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        """Detiene la escucha de Redis (shutdown del gateway)"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
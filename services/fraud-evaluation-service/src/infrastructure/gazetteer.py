@@ -0,0 +1,192 @@
+"""
+Resolución de ubicaciones escritas a mano ("Bogotá", "Cartagena, España",
+"4.71,-74.07") a coordenadas con un gazetteer offline
+
+- Los datos vienen en data/gazetteer.tsv (ciudades y países) y se cargan una
+  sola vez por proceso en arrays compactos (array('d') para coordenadas)
+- Los nombres se normalizan (sin tildes, minúsculas, sin puntuación) y se
+  buscan por coincidencia exacta o por prefijo sobre una lista ordenada
+- Las resoluciones frecuentes quedan en un LRU
+- Un nombre desconocido es un miss explícito (None), nunca una ubicación
+  inventada
+
+Nota del desarrollador:
+El gateway antes armaba un dict de ocho ciudades por request y cualquier
+ciudad desconocida terminaba en Nueva York, lo que disparaba falsos
+positivos de ubicación. Un país se resuelve a su capital.
+"""
+import unicodedata
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_DATA_PATH = Path(__file__).parent / "data" / "gazetteer.tsv"
+
+# Prefijos más cortos son demasiado ambiguos ("sa" -> San..., Santa..., Santiago...)
+MIN_PREFIX_LENGTH = 3
+
+
+class ResolvedLocation(NamedTuple):
+    """Resultado de una resolución: coordenadas y lo que se reconoció"""
+
+    latitude: float
+    longitude: float
+    name: str
+    country: str
+    kind: str  # 'coordinates', 'city' o 'country'
+
+    def as_dict(self) -> Dict[str, float]:
+        return {"latitude": self.latitude, "longitude": self.longitude}
+
+
+# Puntuación ASCII: '.' y "'" se eliminan ("D.C." -> "dc"), el resto separa palabras
+_ASCII_PUNCTUATION = str.maketrans(
+    {chr(code): ("" if chr(code) in ".'" else " ") for code in range(128) if not chr(code).isalnum()}
+)
+
+
+def normalize(text: str) -> str:
+    """'Bogotá D.C.' -> 'bogota dc'"""
+    if not text.isascii():
+        decomposed = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in decomposed if not unicodedata.combining(char))
+    cleaned = text.casefold().translate(_ASCII_PUNCTUATION)
+    if not cleaned.isascii():
+        # Puntuación no ASCII ("¿", "–"): mismo tratamiento carácter por carácter
+        cleaned = "".join(char if char.isalnum() or char == " " else " " for char in cleaned)
+    return " ".join(cleaned.split())
+
+
+_NUMBER_START = frozenset("+-.0123456789")
+
+
+def parse_coordinates(text: str) -> Optional[Tuple[float, float]]:
+    """'lat,lon' dentro de rango, o None si el texto no son coordenadas"""
+    parts = text.split(",")
+    if len(parts) != 2 or parts[0].strip()[:1] not in _NUMBER_START:
+        return None
+    try:
+        latitude, longitude = float(parts[0]), float(parts[1])
+    except ValueError:
+        return None
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return None
+    return latitude, longitude
+
+
+class Gazetteer:
+    """
+    Índice en memoria de lugares con búsqueda exacta y por prefijo
+
+    Cada lugar ocupa una posición en los arrays paralelos (coordenadas,
+    población, país, tipo). `_keys` es la lista ordenada de nombres
+    normalizados (incluye alias) y `_key_places` la posición del lugar de
+    cada clave.
+    """
+
+    def __init__(self, rows: List[Tuple[str, str, float, float, int, List[str]]], cache_size: int = 4096) -> None:
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        self._populations = array("l")
+        self._countries: List[str] = []
+        self._kinds: List[str] = []
+        self._names: List[str] = []
+        self._country_codes: Dict[str, str] = {}
+
+        pairs = []
+        for kind, country, latitude, longitude, population, names in rows:
+            place = len(self._names)
+            self._latitudes.append(latitude)
+            self._longitudes.append(longitude)
+            self._populations.append(population)
+            self._countries.append(country)
+            self._kinds.append(kind)
+            self._names.append(names[0])
+            for name in names:
+                key = normalize(name)
+                pairs.append((key, place))
+                if kind == "country":
+                    self._country_codes[key] = country
+            self._country_codes[country.casefold()] = country
+
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._key_places = array("l", (place for _, place in pairs))
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_DATA_PATH, cache_size: int = 4096) -> "Gazetteer":
+        """Carga el TSV: kind, country, latitude, longitude, population_k, names"""
+        rows = []
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                kind, country, latitude, longitude, population, names = line.rstrip("\n").split("\t")
+                rows.append(
+                    (kind, country, float(latitude), float(longitude), int(population), names.split("|"))
+                )
+        return cls(rows, cache_size)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _place(self, place: int) -> ResolvedLocation:
+        return ResolvedLocation(
+            self._latitudes[place],
+            self._longitudes[place],
+            self._names[place],
+            self._countries[place],
+            self._kinds[place],
+        )
+
+    def _candidates(self, key: str, prefix: bool) -> List[int]:
+        """Lugares cuya clave es `key` (o empieza por `key` si prefix)"""
+        places = []
+        index = bisect_left(self._keys, key)
+        keys = self._keys
+        while index < len(keys) and (keys[index] == key or (prefix and keys[index].startswith(key))):
+            places.append(self._key_places[index])
+            index += 1
+        return places
+
+    def _best(self, places: List[int], country: Optional[str]) -> Optional[int]:
+        """El lugar más poblado, restringido al país si se indicó uno"""
+        if country is not None:
+            places = [place for place in places if self._countries[place] == country]
+        if not places:
+            return None
+        return max(places, key=lambda place: (self._kinds[place] == "city", self._populations[place]))
+
+    def _resolve(self, text: str) -> Optional[ResolvedLocation]:
+        coordinates = parse_coordinates(text)
+        if coordinates is not None:
+            return ResolvedLocation(coordinates[0], coordinates[1], text.strip(), "", "coordinates")
+
+        parts = [normalize(part) for part in text.split(",")]
+        parts = [part for part in parts if part]
+        if not parts:
+            return None
+
+        # "Ciudad, País": el país desambigua; si la última parte no es un país
+        # (departamento, estado) se ignora
+        country = self._country_codes.get(parts[-1]) if len(parts) > 1 else None
+
+        name = parts[0]
+        place = self._best(self._candidates(name, prefix=False), country)
+        if place is None and len(name) >= MIN_PREFIX_LENGTH:
+            place = self._best(self._candidates(name, prefix=True), country)
+        return None if place is None else self._place(place)
+
+
+@lru_cache(maxsize=1)
+def default_gazetteer() -> Gazetteer:
+    """Gazetteer empaquetado, cargado una vez por proceso"""
+    return Gazetteer.load()
+
+
+def resolve_location(text: str) -> Optional[ResolvedLocation]:
+    """Atajo sobre el gazetteer por defecto; None si no se reconoce"""
+    return default_gazetteer().resolve(text)
@@ -0,0 +1,226 @@
+"""
+Logging estructurado y no bloqueante para el gateway y el worker
+
+- Los loggers solo encolan el registro (QueueHandler); un hilo aparte
+  (QueueListener) hace el formateo JSON y la escritura a stdout
+- Niveles por módulo configurables ("src.domain=DEBUG,api_gateway=WARNING")
+- Muestreo 1 de N para las líneas DEBUG de alto volumen
+- Salida JSON con los campos extra del registro (transaction_id, duration_ms, ...)
+- El access log de uvicorn no registra credenciales de la query string
+  (?token= del stream SSE, ver QueryRedactionFilter)
+
+Nota del desarrollador:
+Reemplaza los print() del hot path. Con log drivers de contenedor la
+escritura a stdout puede bloquear, y en el gateway eso bloquea el event loop
+completo; con la cola el costo en el hilo que loguea es un put().
+"""
+import atexit
+import copy
+import itertools
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Mapping, Optional, Union
+
+
+# Atributos estándar de LogRecord: todo lo demás viene de `extra=` y va al JSON
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Parámetros de query que llevan credenciales (EventSource no puede mandar
+# el header Authorization, así que el stream SSE acepta ?token=)
+REDACTED_QUERY_PARAMS = ("token", "access_token")
+REDACTED = "[REDACTED]"
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro con timestamp UTC, nivel, logger y campos extra"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Deja pasar 1 de cada `rate` registros con nivel <= `max_level`
+
+    Los niveles superiores (INFO, WARNING, ...) nunca se muestrean.
+    El contador es global al filtro; itertools.count es atómico bajo el GIL.
+    """
+
+    def __init__(self, rate: int, max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+        self.rate = max(1, int(rate))
+        self.max_level = max_level
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.rate == 1:
+            return True
+        return next(self._counter) % self.rate == 0
+
+
+class QueryRedactionFilter(logging.Filter):
+    """
+    Oculta el valor de los parámetros sensibles en paths con query string
+
+    uvicorn.access registra el path completo ('"GET /api/v1/...?token=..."'
+    en los args del registro): sin el filtro cada conexión y reconexión del
+    stream SSE dejaba un JWT vigente en los logs del gateway.
+    """
+
+    def __init__(self, params=REDACTED_QUERY_PARAMS) -> None:
+        super().__init__()
+        names = "|".join(re.escape(param) for param in params)
+        self._pattern = re.compile(rf"([?&](?:{names})=)[^&#\s\"]*")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(self.redact(arg) if isinstance(arg, str) else arg for arg in record.args)
+        elif isinstance(record.msg, str):
+            record.msg = self.redact(record.msg)
+        return True
+
+    def redact(self, text: str) -> str:
+        if "?" not in text:
+            return text
+        return self._pattern.sub(rf"\g<1>{REDACTED}", text)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que solo resuelve el mensaje antes de encolar
+
+    El QueueHandler estándar formatea el registro completo en el hilo que
+    loguea; aquí dejamos el JSON para el hilo del listener y solo fijamos
+    msg/args y el traceback (que no se puede serializar entre hilos).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_module_levels(spec: Union[str, Mapping[str, str], None]) -> Dict[str, int]:
+    """
+    Convierte "src.domain=DEBUG,api_gateway.routes=WARNING" en {logger: nivel}
+
+    Raises:
+        ValueError: Si una entrada no tiene el formato modulo=NIVEL o el nivel no existe
+    """
+    if not spec:
+        return {}
+    items = spec.items() if isinstance(spec, Mapping) else (
+        entry.split("=", 1) for entry in spec.split(",") if entry.strip()
+    )
+    levels: Dict[str, int] = {}
+    for item in items:
+        if len(item) != 2:
+            raise ValueError(f"Invalid module level entry: {item!r}")
+        module, level = item[0].strip(), str(item[1]).strip().upper()
+        numeric = logging.getLevelName(level)
+        if not isinstance(numeric, int):
+            raise ValueError(f"Unknown log level {level!r} for {module!r}")
+        levels[module] = numeric
+    return levels
+
+
+def configure_logging(
+    level: str = "INFO",
+    module_levels: Union[str, Mapping[str, str], None] = None,
+    json_output: bool = True,
+    debug_sample_rate: int = 1,
+    stream=None,
+) -> logging.handlers.QueueListener:
+    """
+    Configura el logger raíz con un QueueHandler y arranca el listener
+
+    Es idempotente: si ya estaba configurado, detiene el listener anterior
+    y reemplaza los handlers.
+
+    Args:
+        level: Nivel del logger raíz
+        module_levels: Niveles por módulo (ver parse_module_levels)
+        json_output: JSON por línea (True) o texto legible para desarrollo
+        debug_sample_rate: Registrar 1 de cada N líneas DEBUG
+        stream: Destino de la salida (stdout por defecto)
+    """
+    global _listener
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(
+        JsonFormatter() if json_output
+        else logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    # El muestreo va antes de encolar: lo descartado no cuesta ni el put()
+    queue_handler.addFilter(SamplingFilter(debug_sample_rate))
+
+    root = logging.getLogger()
+    if _listener is not None:
+        _listener.stop()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    for module, module_level in parse_module_levels(module_levels).items():
+        logging.getLogger(module).setLevel(module_level)
+
+    # Filtro del logger (no del handler): uvicorn le pone handlers propios y
+    # no propaga a la raíz
+    access_logger = logging.getLogger("uvicorn.access")
+    if not any(isinstance(f, QueryRedactionFilter) for f in access_logger.filters):
+        access_logger.addFilter(QueryRedactionFilter())
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Vacía la cola y detiene el listener (se registra con atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_from_settings(settings) -> logging.handlers.QueueListener:
+    """Atajo para los entrypoints: usa los campos log_* de Settings"""
+    return configure_logging(
+        level=settings.log_level,
+        module_levels=settings.log_levels,
+        json_output=settings.log_json,
+        debug_sample_rate=settings.log_debug_sample_rate,
+    )
+
+
+atexit.register(shutdown_logging)
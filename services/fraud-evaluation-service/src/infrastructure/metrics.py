@@ -0,0 +1,364 @@
+"""
+Métricas en proceso con exposición en formato Prometheus
+
+Registro minimalista (contadores e histogramas con labels) para el hot path:
+- Tiempo y resultado por estrategia (hit / miss / fallback / error)
+- Llamadas, errores y latencia hacia Redis y MongoDB
+- Tiempo en cola vs tiempo de procesamiento en el worker
+
+Nota del desarrollador:
+No agregamos prometheus_client como dependencia: solo necesitamos counters,
+histogramas y el formato de texto 0.0.4, y así el costo por observación
+queda en un lookup de dict + un bisect.
+"""
+import asyncio
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.application.interfaces import MetricsRecorder
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base común: nombre, ayuda, labels y lock para los hijos"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """Retorna (creando si hace falta) la serie para esos valores de label"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values, child) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _render_child(self, values, child) -> Iterable[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, values)} {child.value:g}"
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _render_child(self, values, child) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets, child.counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, values, f'le="{bound:g}"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, values, 'le="+Inf"')
+        yield f"{self.name}_bucket{labels} {child.count}"
+        plain = _format_labels(self.labelnames, values)
+        yield f"{self.name}_sum{plain} {child.sum:g}"
+        yield f"{self.name}_count{plain} {child.count}"
+
+
+class MetricsRegistry:
+    """Colección de métricas con render en formato de texto Prometheus"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# Registro global del proceso (gateway o worker)
+REGISTRY = MetricsRegistry()
+
+STRATEGY_DURATION = REGISTRY.histogram(
+    "fraud_strategy_duration_seconds",
+    "Tiempo de evaluate() por estrategia",
+    ("strategy",),
+)
+STRATEGY_RESULTS = REGISTRY.counter(
+    "fraud_strategy_results_total",
+    "Resultados por estrategia: hit (violación), miss, fallback (dependencia caída) o error",
+    ("strategy", "outcome"),
+)
+EVALUATION_DURATION = REGISTRY.histogram(
+    "fraud_evaluation_duration_seconds",
+    "Tiempo total de EvaluateTransactionUseCase.execute",
+)
+EVALUATIONS = REGISTRY.counter(
+    "fraud_evaluations_total",
+    "Evaluaciones completadas por nivel de riesgo",
+    ("risk_level",),
+)
+DEPENDENCY_CALLS = REGISTRY.counter(
+    "fraud_dependency_calls_total",
+    "Llamadas a Redis/MongoDB por operación",
+    ("dependency", "operation"),
+)
+DEPENDENCY_ERRORS = REGISTRY.counter(
+    "fraud_dependency_errors_total",
+    "Llamadas a Redis/MongoDB que lanzaron excepción",
+    ("dependency", "operation"),
+)
+DEPENDENCY_DURATION = REGISTRY.histogram(
+    "fraud_dependency_call_duration_seconds",
+    "Latencia de llamadas a Redis/MongoDB",
+    ("dependency",),
+)
+WORKER_QUEUE_TIME = REGISTRY.histogram(
+    "fraud_worker_queue_time_seconds",
+    "Tiempo entre la publicación del mensaje y el inicio de su procesamiento",
+    buckets=DEFAULT_BUCKETS + (30.0, 60.0, 300.0),
+)
+WORKER_PROCESSING_TIME = REGISTRY.histogram(
+    "fraud_worker_processing_time_seconds",
+    "Tiempo de procesamiento de un mensaje en el worker",
+)
+WORKER_MESSAGES = REGISTRY.counter(
+    "fraud_worker_messages_total",
+    "Mensajes consumidos por el worker según resultado",
+    ("outcome",),
+)
+
+
+class PrometheusMetricsRecorder(MetricsRecorder):
+    """Implementación del puerto MetricsRecorder sobre el registro global"""
+
+    def observe_strategy(self, strategy: str, seconds: float, outcome: str) -> None:
+        STRATEGY_DURATION.labels(strategy).observe(seconds)
+        STRATEGY_RESULTS.labels(strategy, outcome).inc()
+
+    def observe_evaluation(self, risk_level: str, seconds: float) -> None:
+        EVALUATION_DURATION.observe(seconds)
+        EVALUATIONS.labels(risk_level).inc()
+
+
+class InstrumentedClient:
+    """
+    Proxy que cuenta y cronometra cada llamada a un cliente Redis/Mongo
+
+    Funciona con clientes síncronos y asíncronos: los métodos `async def` se
+    envuelven con un wrapper async, y si un método síncrono devuelve una
+    corrutina (los comandos de redis.asyncio) se cronometra y se cuentan sus
+    errores al esperarla, no al crearla. Los atributos no invocables se
+    devuelven tal cual.
+    """
+
+    __slots__ = ("_target", "_dependency", "_wrappers")
+
+    def __init__(self, target, dependency: str) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_dependency", dependency)
+        object.__setattr__(self, "_wrappers", {})
+
+    @property
+    def wrapped(self):
+        """Cliente original sin instrumentar"""
+        return self._target
+
+    def __getattr__(self, name: str):
+        wrapper = self._wrappers.get(name)
+        if wrapper is not None:
+            return wrapper
+
+        attribute = getattr(self._target, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        dependency = self._dependency
+        calls = DEPENDENCY_CALLS.labels(dependency, name)
+        errors = DEPENDENCY_ERRORS.labels(dependency, name)
+        duration = DEPENDENCY_DURATION.labels(dependency)
+
+        if asyncio.iscoroutinefunction(attribute):
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                calls.inc()
+                try:
+                    return await attribute(*args, **kwargs)
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    duration.observe(time.perf_counter() - start)
+        else:
+            async def observe(coroutine, start):
+                try:
+                    return await coroutine
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    duration.observe(time.perf_counter() - start)
+
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                calls.inc()
+                try:
+                    result = attribute(*args, **kwargs)
+                except Exception:
+                    errors.inc()
+                    duration.observe(time.perf_counter() - start)
+                    raise
+                if inspect.iscoroutine(result):
+                    return observe(result, start)
+                duration.observe(time.perf_counter() - start)
+                return result
+
+        self._wrappers[name] = wrapper
+        return wrapper
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._target, name, value)
+
+
+def instrument_client(client, dependency: str):
+    """Envuelve un cliente en InstrumentedClient (idempotente)"""
+    if isinstance(client, InstrumentedClient):
+        return client
+    return InstrumentedClient(client, dependency)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - nombre impuesto por BaseHTTPRequestHandler
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        """Silencia el log por request de http.server (el scrape es periódico)"""
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> Optional[ThreadingHTTPServer]:
+    """
+    Expone GET /metrics en un hilo daemon (para procesos sin servidor HTTP,
+    como el worker). Retorna None si el puerto es 0 (deshabilitado).
+    """
+    if not port:
+        return None
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,86 @@
+"""
+Particionado de la cola de transacciones por usuario
+
+Con rabbitmq_partitions = N > 1 la cola "transactions" se reparte en
+transactions.p0 ... transactions.p<N-1> y cada transacción va a la
+partición crc32(user_id) % N. Cada partición tiene un solo consumidor
+activo (x-single-active-consumer), así que las transacciones de un usuario
+se evalúan en orden y nunca en paralelo: las estrategias con estado
+(RapidTransactionStrategy, DeviceValidationStrategy, la ubicación en caché)
+no compiten consigo mismas. El throughput escala con las particiones solo
+si cada réplica del worker es dueña de un grupo distinto (WORKER_PARTITIONS
+"K/M" o listas disjuntas): réplicas que consumen todas las particiones
+quedan a la espera detrás del primer consumidor registrado en cada una.
+
+Con N = 1 (por defecto) todo sigue en la cola "transactions" original.
+
+Nota del desarrollador:
+crc32 y no hash(): hash() de str cambia entre procesos (PYTHONHASHSEED) y
+el gateway y el worker tienen que coincidir. Cambiar N reasigna usuarios;
+hacerlo con las colas vacías (o aceptando que los mensajes en vuelo de un
+usuario se evalúen fuera de orden una vez). El orden tampoco sobrevive a un
+reintento: el mensaje que espera en transactions.pK.retry.* deja pasar a
+los siguientes del mismo usuario (sí se mantiene que nunca corren en
+paralelo).
+"""
+import zlib
+from typing import List, Sequence
+
+# Argumento de las colas de partición: los workers de respaldo esperan
+# conectados y toman la partición si el activo se cae
+PARTITION_QUEUE_ARGUMENTS = {"x-single-active-consumer": True}
+
+
+def partition_for(user_id: str, partitions: int) -> int:
+    """Partición de un usuario (estable entre procesos y reinicios)"""
+    if partitions <= 1:
+        return 0
+    return zlib.crc32(user_id.encode("utf-8")) % partitions
+
+
+def partition_queue(base_queue: str, partition: int, partitions: int) -> str:
+    """Nombre de la cola de una partición (la cola base si no hay particiones)"""
+    if partitions <= 1:
+        return base_queue
+    return f"{base_queue}.p{partition}"
+
+
+def partition_queues(base_queue: str, partitions: int) -> List[str]:
+    """Todas las colas de partición"""
+    return [partition_queue(base_queue, p, partitions) for p in range(max(partitions, 1))]
+
+
+def queue_arguments(partitions: int):
+    """Argumentos de declaración: ninguno para la cola base (ya existe sin ellos)"""
+    return PARTITION_QUEUE_ARGUMENTS if partitions > 1 else None
+
+
+def parse_owned_partitions(value: str, partitions: int) -> Sequence[int]:
+    """
+    Particiones que consume un worker desde Settings.worker_partitions
+
+    "" = todas (un solo worker o pruebas locales); "0,3" = solo esas;
+    "K/M" = réplica K de M, dueña de las particiones p con p % M == K. Si
+    hay menos particiones que réplicas, la réplica sin partición propia
+    queda de respaldo en la K % N.
+
+    Raises:
+        ValueError: Si alguna partición o réplica está fuera de rango
+    """
+    if not value.strip():
+        return list(range(max(partitions, 1)))
+    if "/" in value:
+        return _replica_partitions(value, partitions)
+    owned = sorted({int(part) for part in value.split(",") if part.strip()})
+    if any(p < 0 or p >= max(partitions, 1) for p in owned):
+        raise ValueError(f"Partitions {value!r} out of range for {partitions} partitions")
+    return owned
+
+
+def _replica_partitions(value: str, partitions: int) -> Sequence[int]:
+    """Particiones de la réplica "K/M" (ver parse_owned_partitions)"""
+    replica, replicas = (int(part) for part in value.split("/"))
+    if replicas < 1 or not 0 <= replica < replicas:
+        raise ValueError(f"Replica {value!r} out of range")
+    total = max(partitions, 1)
+    return [p for p in range(total) if p % replicas == replica] or [replica % total]
@@ -0,0 +1,260 @@
+"""
+Rate limiting del gateway con token bucket en Redis
+
+Cada grupo de rutas (las mismas clases que el control de admisión:
+scoring, auth, user, admin) tiene un bucket por identidad: el usuario del token
+JWT, el header X-Analyst-ID o la IP del cliente. Una integración que se
+porta mal agota su bucket y recibe 429 con Retry-After sin ocupar lugares
+de admisión ni llegar a bcrypt (/auth/login) o a las estrategias.
+
+- Redis: un script Lua hace la recarga y el consumo en una sola llamada
+  atómica (EVALSHA, un round-trip por request). El reloj es el TIME de
+  Redis, así que todas las réplicas del gateway comparten el mismo bucket
+  sin depender de sus relojes
+- Sin Redis (error, timeout o circuito abierto) se usa un bucket local en
+  memoria: es una aproximación, cada réplica aplica el límite por su cuenta
+
+Nota del desarrollador:
+Las demás operaciones de Redis del proyecto evitan Lua (WATCH/MULTI), pero
+un WATCH necesita al menos dos round-trips por chequeo y se reintenta con
+contención justo sobre los buckets más calientes. El script es corto y
+se carga solo (NOSCRIPT -> EVAL) la primera vez en cada servidor.
+"""
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from redis.exceptions import NoScriptError
+
+from src.infrastructure.admission import endpoint_class, send_rejection
+from src.infrastructure.metrics import REGISTRY
+
+KEY_USER = "user"
+KEY_ANALYST = "analyst"
+KEY_IP = "ip"
+_KEY_KINDS = (KEY_USER, KEY_ANALYST, KEY_IP)
+_PERIODS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+RATE_LIMIT_DECISIONS = REGISTRY.counter(
+    "fraud_rate_limit_total",
+    "Chequeos de rate limit por grupo, resultado (allowed/limited) y backend (redis/local)",
+    ("group", "outcome", "backend"),
+)
+
+# KEYS[1] = bucket; ARGV = tokens por segundo, capacidad, costo.
+# Retorna {permitido, ms hasta tener el costo, tokens restantes}
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = burst
+  ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait_ms = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  wait_ms = math.ceil((cost - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, wait_ms, math.floor(tokens)}
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_SCRIPT.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Límite de un grupo de rutas: `rate` tokens/s, hasta `burst`, por `key`"""
+
+    group: str
+    rate: float
+    burst: int
+    key: str
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float  # segundos hasta que haya un token (0 si allowed)
+    remaining: int
+
+
+def parse_rate_limits(value: str) -> Dict[str, RateLimitRule]:
+    """
+    Reglas por grupo desde Settings.rate_limits
+
+    "scoring=20/s:40:user,auth=10/m:5:ip" -> scoring: 20 por segundo con
+    ráfagas de 40 por usuario; auth: 10 por minuto, ráfagas de 5, por IP.
+
+    Raises:
+        ValueError: Si una entrada no tiene la forma grupo=N/periodo:ráfaga:clave
+    """
+    rules = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        try:
+            group, spec = entry.split("=")
+            rate, burst, key = spec.split(":")
+            count, period = rate.split("/")
+            rule = RateLimitRule(
+                group.strip(), float(count) / _PERIODS[period.strip()], int(burst), key.strip()
+            )
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid rate limit {entry.strip()!r}") from None
+        if rule.rate <= 0 or rule.burst < 1 or rule.key not in _KEY_KINDS:
+            raise ValueError(f"Invalid rate limit {entry.strip()!r}")
+        rules[rule.group] = rule
+    return rules
+
+
+class LocalTokenBucket:
+    """
+    Token buckets en memoria para cuando Redis no responde
+
+    Acotado a `max_keys` buckets (se descarta el menos usado): una ráfaga de
+    IPs distintas no puede hacer crecer la memoria del gateway.
+    """
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitDecision:
+        now = self._clock()
+        tokens, last = self._buckets.pop(key, (float(rule.burst), now))
+        tokens = min(float(rule.burst), tokens + max(0.0, now - last) * rule.rate)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        retry_after = 0.0 if allowed else (cost - tokens) / rule.rate
+        return RateLimitDecision(allowed, retry_after, int(tokens))
+
+
+class RateLimiter:
+    """Token bucket en Redis con el bucket local como respaldo"""
+
+    def __init__(self, redis_client, local: Optional[LocalTokenBucket] = None) -> None:
+        """
+        Args:
+            redis_client: Cliente redis.asyncio (idealmente detrás del
+                breaker "redis", así con Redis caído no se espera el timeout)
+            local: Buckets en memoria para el respaldo
+        """
+        self.redis = redis_client
+        self.local = local or LocalTokenBucket()
+
+    async def take(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitDecision:
+        """Consume `cost` tokens del bucket `key` si hay suficientes"""
+        try:
+            allowed, wait_ms, remaining = await self._eval(key, rule, cost)
+        except Exception:
+            decision = self.local.take(key, rule, cost)
+            backend = "local"
+        else:
+            decision = RateLimitDecision(bool(int(allowed)), int(wait_ms) / 1000, int(remaining))
+            backend = "redis"
+        RATE_LIMIT_DECISIONS.labels(rule.group, "allowed" if decision.allowed else "limited", backend).inc()
+        return decision
+
+    async def _eval(self, key: str, rule: RateLimitRule, cost: int):
+        args = (rule.rate, rule.burst, cost)
+        try:
+            return await self.redis.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+        except NoScriptError:
+            # Primera llamada en este servidor (o tras SCRIPT FLUSH): EVAL lo deja cargado
+            return await self.redis.eval(TOKEN_BUCKET_SCRIPT, 1, key, *args)
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que aplica las reglas por grupo de rutas
+
+    Las rutas sin grupo (health, metrics, streams SSE) o sin regla pasan
+    sin chequeo.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: RateLimiter,
+        rules: Dict[str, RateLimitRule],
+        user_resolver: Optional[Callable[[str], Optional[str]]] = None,
+        trust_forwarded_for: bool = False,
+    ) -> None:
+        """
+        Args:
+            limiter: Buckets (Redis + respaldo local)
+            rules: Regla por grupo (ver parse_rate_limits)
+            user_resolver: Token Bearer -> user id (None si no es válido).
+                Sin él las reglas por usuario usan la IP
+            trust_forwarded_for: Tomar la IP de X-Forwarded-For (solo detrás
+                de un proxy que lo reescriba)
+        """
+        self.app = app
+        self.limiter = limiter
+        self.rules = rules
+        self.user_resolver = user_resolver
+        self.trust_forwarded_for = trust_forwarded_for
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rule = self.rules.get(endpoint_class(scope["method"], scope["path"]))
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self.limiter.take(f"ratelimit:{rule.group}:{self._identity(scope, rule)}", rule)
+        if not decision.allowed:
+            await send_rejection(
+                send, 429, f"Rate limit exceeded for {rule.group} requests",
+                max(1, math.ceil(decision.retry_after)),
+                headers=[(b"x-ratelimit-remaining", b"0")],
+            )
+            return
+        await self.app(scope, receive, send)
+
+    def _identity(self, scope, rule: RateLimitRule) -> str:
+        """Identidad del bucket según la clave de la regla (IP si falta)"""
+        headers = _headers(scope)
+        if rule.key == KEY_USER and self.user_resolver is not None:
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            user_id = self.user_resolver(token) if scheme.lower() == "bearer" and token else None
+            if user_id:
+                return f"user:{user_id}"
+        elif rule.key == KEY_ANALYST and headers.get("x-analyst-id"):
+            return f"analyst:{headers['x-analyst-id']}"
+
+        forwarded = headers.get("x-forwarded-for") if self.trust_forwarded_for else None
+        if forwarded:
+            return f"ip:{forwarded.split(',')[0].strip()}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+def _headers(scope) -> Dict[str, str]:
+    wanted = (b"authorization", b"x-analyst-id", b"x-forwarded-for")
+    return {
+        key.decode("latin-1"): value.decode("latin-1")
+        for key, value in scope.get("headers", ())
+        if key in wanted
+    }
@@ -0,0 +1,177 @@
+"""
+Caché por proceso de las reglas personalizadas habilitadas y del orden de
+las reglas
+
+Antes cada /transaction/validate y cada mensaje del worker consultaba
+custom_rules en MongoDB y el hash rule_order en Redis, aunque ambos cambian
+solo cuando un analista edita o reordena las reglas. Ahora:
+
+- El gateway y el worker guardan el snapshot de las reglas en memoria
+- Vencido rule_cache_ttl_seconds se lee la clave rules:version de Redis (un
+  GET): si no cambió, el snapshot sigue valiendo otro período sin tocar
+  MongoDB; si cambió, se recargan las reglas y el orden
+- Los endpoints que crean, editan, borran o reordenan reglas incrementan la
+  versión (bump_rules_version) e invalidan el snapshot local
+
+La compilación sigue a cargo de RuleCompiler (por updated_at); aquí solo se
+cachea la consulta.
+
+Nota del desarrollador:
+Si Redis no responde no se puede comparar la versión y se recarga de MongoDB
+una vez por período. Aunque la versión no cambie, el snapshot se recarga
+cada _MAX_AGE_SECONDS: un incremento perdido (Redis caído justo al editar)
+no deja reglas viejas para siempre.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+RULES_VERSION_KEY = "rules:version"
+
+# Hash de Redis rule_id -> order con el orden persistido de las reglas predeterminadas
+RULE_ORDER_KEY = "rule_order"
+
+# Prioridad de las reglas predeterminadas si nunca se reordenaron
+DEFAULT_RULE_ORDER = {
+    "rule_amount_threshold": 1,
+    "rule_location_check": 2,
+    "rule_device_validation": 3,
+    "rule_rapid_transaction": 4,
+    "rule_unusual_time": 5,
+}
+
+_MAX_AGE_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Snapshot de la configuración de reglas"""
+
+    custom_rules: Tuple[Dict[str, Any], ...] = ()  # documentos de list_enabled_custom_rules
+    rule_order: Dict[str, int] = field(default_factory=dict)  # hash rule_order
+
+    def order_of(self, rule_id: str) -> int:
+        """Prioridad de una regla predeterminada"""
+        return self.rule_order.get(rule_id, DEFAULT_RULE_ORDER[rule_id])
+
+    def sort_strategies(self, defaults: Iterable[Tuple[str, Any]], custom: Iterable[Any]) -> List[Any]:
+        """
+        Estrategias en el orden de /admin/rules/reorder
+
+        Args:
+            defaults: (rule_id, estrategia) de las reglas predeterminadas
+            custom: Estrategias de reglas personalizadas (con `order`)
+        """
+        prioritized = [(self.order_of(rule_id), strategy) for rule_id, strategy in defaults]
+        prioritized += [(strategy.order, strategy) for strategy in custom]
+        # sort estable por prioridad: a igual orden se mantiene el de entrada
+        prioritized.sort(key=lambda pair: pair[0])
+        return [strategy for _, strategy in prioritized]
+
+
+class RuleSetCache:
+    """
+    Snapshot de reglas compartido entre requests (o mensajes) de un proceso
+
+    Mientras se refresca, los requests concurrentes siguen usando el
+    snapshot anterior. El snapshot pertenece al repositorio del que se
+    cargó: con otro repositorio se recarga.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            ttl_seconds: Segundos entre chequeos de versión (por defecto
+                Settings.rule_cache_ttl_seconds)
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        self.ttl_seconds = settings.rule_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._clock = clock
+        self._rules: Optional[RuleSet] = None
+        self._source = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        """Descarta el snapshot (el próximo get() recarga)"""
+        self._rules = None
+
+    async def get(self, cache, repository) -> RuleSet:
+        """
+        Reglas vigentes
+
+        Args:
+            cache: Adaptador con cliente redis.asyncio en `.redis` (versión)
+            repository: Repositorio con list_enabled_custom_rules()
+        """
+        now = self._clock()
+        rules = self._rules
+        current = rules is not None and repository is self._source
+        if current and now - self._checked_at < self.ttl_seconds:
+            return rules
+
+        self._checked_at = now
+        version = await _read_version(cache)
+        if current and version is not None and version == self._version and now - self._loaded_at < _MAX_AGE_SECONDS:
+            return rules
+
+        custom_rules = await _load_custom_rules(repository)
+        rule_order = await read_rule_order(cache)
+        previous = rules if current else RuleSet()
+        if custom_rules is None or rule_order is None:
+            # MongoDB o Redis fallaron: se conserva esa parte del snapshot
+            # anterior y se reintenta en el próximo chequeo (sin versión no
+            # se da por vigente)
+            version = None
+        rules = RuleSet(
+            previous.custom_rules if custom_rules is None else custom_rules,
+            previous.rule_order if rule_order is None else rule_order,
+        )
+        self._rules, self._source, self._version, self._loaded_at = rules, repository, version, now
+        return rules
+
+
+async def _load_custom_rules(repository) -> Optional[Tuple[Dict[str, Any], ...]]:
+    """Reglas habilitadas desde MongoDB, en un hilo (None si falla)"""
+    try:
+        return tuple(await asyncio.get_running_loop().run_in_executor(None, repository.list_enabled_custom_rules))
+    except Exception as e:
+        logger.warning("Error loading custom rules: %s", e)
+        return None
+
+
+async def read_rule_order(cache) -> Optional[Dict[str, int]]:
+    """Orden persistido de las reglas predeterminadas (None si Redis falla)"""
+    try:
+        stored = await cache.redis.hgetall(RULE_ORDER_KEY)
+        return {
+            (rule_id.decode("utf-8") if isinstance(rule_id, bytes) else rule_id): int(order)
+            for rule_id, order in stored.items()
+        }
+    except Exception as e:
+        logger.warning("Error loading rule order: %s", e)
+        return None
+
+
+async def _read_version(cache) -> Optional[str]:
+    """Versión de las reglas en Redis (None si Redis falla)"""
+    try:
+        return await cache.redis.get(RULES_VERSION_KEY) or "0"
+    except Exception as e:
+        logger.warning("Error reading rules version: %s", e)
+        return None
+
+
+async def bump_rules_version(cache) -> None:
+    """Avisa a los demás procesos que las reglas cambiaron"""
+    try:
+        await cache.redis.incr(RULES_VERSION_KEY)
+    except Exception as e:
+        logger.warning("Error bumping rules version: %s", e)
@@ -0,0 +1,149 @@
+"""
+Serialización JSON rápida para respuestas HTTP, mensajes AMQP y valores de Redis
+
+Backend intercambiable:
+- orjson si está instalado (serializa datetime, dataclasses y Enum en C)
+- json de la librería estándar como respaldo, con el mismo formato de salida
+
+Ambos backends producen bytes compactos y manejan:
+- datetime: ISO 8601 en UTC con sufijo 'Z'; las fechas naive son hora
+  local (las evaluaciones se guardan con datetime.now()) y se convierten
+  a UTC como hacía routes._iso_utc
+- Decimal y Money: número JSON
+- Enum: su value; set/tuple: lista
+
+Nota del desarrollador:
+Las respuestas grandes del admin pasaban dos veces por el árbol de objetos
+(jsonable_encoder + json.dumps) y hacían astimezone/isoformat/replace por
+cada fecha. Con FastJSONResponse el endpoint entrega datetimes crudos y la
+serialización es una sola pasada. orjson solo convierte las fechas naive en
+C si la hora local del proceso es UTC (el caso de los contenedores); si no,
+le pasa cada datetime a _iso_datetime para no correr la hora.
+"""
+import json
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Union
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+from src.domain.money import Money
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _iso_datetime(value: datetime) -> str:
+    """Mismo formato que orjson con OPT_NAIVE_UTC | OPT_UTC_Z, naive = hora local"""
+    if value.tzinfo is None:
+        value = value.astimezone(timezone.utc)
+    if value.utcoffset() == timezone.utc.utcoffset(None):
+        return value.replace(tzinfo=None).isoformat() + "Z"
+    return value.isoformat()
+
+
+def _local_time_is_utc() -> bool:
+    """La zona horaria del proceso es UTC sin horario de verano"""
+    return time.timezone == 0 and not time.daylight
+
+
+def _default(value: Any) -> Any:
+    """Tipos que ningún backend serializa de forma nativa"""
+    if isinstance(value, (Money, Decimal)):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return _iso_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return _default(value)
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, default=_stdlib_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _stdlib_loads(data: Union[bytes, bytearray, str]) -> Any:
+    return json.loads(data)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def _orjson_dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+    def _orjson_default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return _iso_datetime(value)
+        return _default(value)
+
+    def _orjson_local_dumps(value: Any) -> bytes:
+        """orjson con hora local distinta de UTC: las fechas pasan por _iso_datetime"""
+        return orjson.dumps(value, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+    _orjson_loads = orjson.loads
+
+
+_BACKENDS = {"json": (_stdlib_dumps, _stdlib_loads)}
+if orjson is not None:
+    _BACKENDS["orjson"] = (_orjson_dumps, _orjson_loads)
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[Union[bytes, bytearray, str]], Any]
+backend: str = ""
+
+
+def use_backend(name: str = "auto") -> str:
+    """
+    Selecciona el backend ('orjson', 'json' o 'auto') y retorna el elegido
+
+    Raises:
+        ValueError: Si el backend pedido no está disponible
+    """
+    global dumps, loads, backend
+    if name == "auto":
+        name = "orjson" if "orjson" in _BACKENDS else "json"
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available")
+    dumps, loads = _BACKENDS[name]
+    if name == "orjson" and not _local_time_is_utc():
+        dumps = _orjson_local_dumps
+    backend = name
+    return name
+
+
+def dumps_str(value: Any) -> str:
+    """dumps() como str (para APIs que no aceptan bytes)"""
+    return dumps(value).decode("utf-8")
+
+
+use_backend("auto")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse que serializa con el backend rápido
+
+    Usada como default_response_class de la app. Los endpoints con listas
+    grandes la retornan directamente para saltarse jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
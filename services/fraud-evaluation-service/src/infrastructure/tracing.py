@@ -0,0 +1,359 @@
+"""
+Tracing opcional por request (gateway -> caso de uso -> estrategias -> adaptadores -> worker)
+
+- Spans con ids compatibles con OpenTelemetry/W3C (trace_id de 16 bytes,
+  span_id de 8 bytes) y propagación por el header `traceparent`
+- Exportación en lotes desde un hilo aparte, en formato OTLP/JSON:
+  a un archivo local (una línea por lote) o a un collector (POST /v1/traces)
+- Deshabilitado por defecto: start_span retorna un span nulo compartido,
+  sin asignaciones ni acceso a contextvars
+
+Nota del desarrollador:
+No agregamos el SDK de OpenTelemetry como dependencia del runtime. El formato
+de salida es OTLP/JSON, así que cualquier collector o backend compatible
+(Jaeger, Tempo, otel-collector) puede ingerir los spans.
+"""
+import atexit
+import json
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from src.application.interfaces import NULL_SPAN, Tracer
+
+
+class SpanContext(NamedTuple):
+    """Identidad de un span remoto o local (trace_id/span_id en hex)"""
+
+    trace_id: str
+    span_id: str
+
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Span:
+    """Span activo; se registra como span actual mientras dura el `with`"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "error", "_processor", "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional[SpanContext],
+        attributes: Optional[Dict[str, Any]],
+        processor: "BatchSpanProcessor",
+    ) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_trace_id()
+        self.span_id = _new_span_id()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self._processor = processor
+        self._token = None
+
+    @property
+    def context(self) -> SpanContext:
+        return SpanContext(self.trace_id, self.span_id)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self._processor.on_end(self)
+        return None
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def to_otlp(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """Convierte un lote de spans al payload ExportTraceServiceRequest (OTLP/JSON)"""
+    encoded = []
+    for span in spans:
+        item = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _otlp_attributes(span.attributes),
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            item["parentSpanId"] = span.parent_id
+        encoded.append(item)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "fraud-detection"}, "spans": encoded}],
+        }]
+    }
+
+
+class FileSpanExporter:
+    """Agrega cada lote como una línea OTLP/JSON al archivo indicado"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+
+class OTLPHttpExporter:
+    """POST del lote a un collector OTLP/HTTP (p.ej. http://otel-collector:4318)"""
+
+    def __init__(self, endpoint: str, timeout: float = 2.0) -> None:
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class BatchSpanProcessor:
+    """
+    Encola spans terminados y los exporta por lotes desde un hilo daemon
+
+    El hilo del request solo hace un put(); si la cola supera `max_queue`
+    los spans se descartan (nunca bloqueamos el hot path por el tracing).
+    """
+
+    def __init__(
+        self,
+        exporter,
+        service_name: str,
+        max_batch: int = 256,
+        interval: float = 2.0,
+        max_queue: int = 10000,
+    ) -> None:
+        self.exporter = exporter
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.interval = interval
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        if self._queue.qsize() >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.put(span)
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                span = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                span = False
+            if span is None:
+                self._export(batch)
+                return
+            if span:
+                batch.append(span)
+            if len(batch) >= self.max_batch or time.monotonic() >= deadline:
+                self._export(batch)
+                batch = []
+                deadline = time.monotonic() + self.interval
+
+    def _export(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        try:
+            self.exporter.export(to_otlp(batch, self.service_name))
+        except Exception:
+            # El collector caído no debe afectar al servicio
+            self.dropped += len(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Exporta lo pendiente y detiene el hilo"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+class SpanTracer(Tracer):
+    """
+    Implementación del puerto Tracer
+
+    Mientras `processor` sea None el tracer está deshabilitado y todos los
+    spans son NULL_SPAN.
+    """
+
+    def __init__(self) -> None:
+        self.processor: Optional[BatchSpanProcessor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ):
+        processor = self.processor
+        if processor is None:
+            return NULL_SPAN
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        return Span(name, parent, attributes, processor)
+
+
+def current_span() -> Optional[Span]:
+    """Span activo en el contexto actual (None si no hay o si está deshabilitado)"""
+    return _current_span.get()
+
+
+def inject(headers: Dict[str, Any]) -> Dict[str, Any]:
+    """Agrega `traceparent` (W3C) al dict de headers si hay un span activo"""
+    span = _current_span.get()
+    if span is not None:
+        headers["traceparent"] = f"00-{span.trace_id}-{span.span_id}-01"
+    return headers
+
+
+def extract(headers: Optional[Dict[str, Any]]) -> Optional[SpanContext]:
+    """Lee `traceparent` de los headers (AMQP/HTTP); None si falta o es inválido"""
+    if not headers:
+        return None
+    value = headers.get("traceparent")
+    if isinstance(value, bytes):
+        value = value.decode("ascii", "ignore")
+    if not isinstance(value, str):
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return SpanContext(parts[1], parts[2])
+
+
+# Tracer del proceso (gateway o worker); se habilita con configure_tracing
+TRACER = SpanTracer()
+
+
+def get_tracer() -> SpanTracer:
+    return TRACER
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI que abre el span raíz de cada request HTTP
+
+    Continúa la traza si el request trae `traceparent`. Solo se registra en
+    la app cuando el tracing está habilitado, así que deshabilitado no
+    agrega ni una capa al stack ASGI.
+    """
+
+    def __init__(self, app, tracer: Optional[SpanTracer] = None) -> None:
+        self.app = app
+        self.tracer = tracer or TRACER
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers", ())
+            if key == b"traceparent"
+        }
+        attributes = {"http.method": scope["method"], "http.target": scope["path"]}
+        with self.tracer.start_span(
+            f"{scope['method']} {scope['path']}", attributes, parent=extract(headers)
+        ) as span:
+            async def send_with_status(message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_status)
+
+
+def configure_tracing(settings, service_name: Optional[str] = None) -> SpanTracer:
+    """
+    Habilita el tracer global según Settings
+
+    tracing_exporter: 'file' (tracing_file_path) u 'otlp' (tracing_otlp_endpoint).
+    Si tracing_enabled es False no hace nada.
+    """
+    if not settings.tracing_enabled or TRACER.enabled:
+        return TRACER
+    if settings.tracing_exporter == "otlp":
+        exporter = OTLPHttpExporter(settings.tracing_otlp_endpoint)
+    elif settings.tracing_exporter == "file":
+        exporter = FileSpanExporter(settings.tracing_file_path)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {settings.tracing_exporter!r}")
+    TRACER.processor = BatchSpanProcessor(
+        exporter, service_name or settings.tracing_service_name
+    )
+    return TRACER
+
+
+def shutdown_tracing() -> None:
+    """Exporta los spans pendientes y deshabilita el tracer"""
+    processor, TRACER.processor = TRACER.processor, None
+    if processor is not None:
+        processor.shutdown()
+
+
+atexit.register(shutdown_tracing)
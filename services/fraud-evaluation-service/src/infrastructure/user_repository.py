@@ -65,17 +65,7 @@ class UserRepository:
         if not document:
             return None
         
-        return User(
-            user_id=document["user_id"],
-            email=document["email"],
-            hashed_password=document["hashed_password"],
-            full_name=document["full_name"],
-            created_at=document["created_at"],
-            is_active=document.get("is_active", True),
-            is_verified=document.get("is_verified", False),
-            verification_token=document.get("verification_token"),
-            verification_token_expires=document.get("verification_token_expires"),
-        )
+        return self._document_to_user(document)
     
     async def find_by_email(self, email: str) -> Optional[User]:
         """
@@ -91,17 +81,7 @@ class UserRepository:
         if not document:
             return None
         
-        return User(
-            user_id=document["user_id"],
-            email=document["email"],
-            hashed_password=document["hashed_password"],
-            full_name=document["full_name"],
-            created_at=document["created_at"],
-            is_active=document.get("is_active", True),
-            is_verified=document.get("is_verified", False),
-            verification_token=document.get("verification_token"),
-            verification_token_expires=document.get("verification_token_expires"),
-        )
+        return self._document_to_user(document)
     
     async def find_by_verification_token(self, token: str) -> Optional[User]:
         """
@@ -117,17 +97,7 @@ class UserRepository:
         if not document:
             return None
         
-        return User(
-            user_id=document["user_id"],
-            email=document["email"],
-            hashed_password=document["hashed_password"],
-            full_name=document["full_name"],
-            created_at=document["created_at"],
-            is_active=document.get("is_active", True),
-            is_verified=document.get("is_verified", False),
-            verification_token=document.get("verification_token"),
-            verification_token_expires=document.get("verification_token_expires"),
-        )
+        return self._document_to_user(document)
     
     async def update_user(self, user: User) -> None:
         """
@@ -172,3 +142,22 @@ class UserRepository:
             True si existe, False en caso contrario
         """
         return self.users.count_documents({"email": email}) > 0
+
+    def _document_to_user(self, document: dict) -> User:
+        """
+        Convierte un documento de MongoDB a entidad User
+
+        Usa User.from_trusted: el documento se guardó desde un User ya
+        validado (incluido el regex de email), no se revalida en cada lectura.
+        """
+        return User.from_trusted(
+            user_id=document["user_id"],
+            email=document["email"],
+            hashed_password=document["hashed_password"],
+            full_name=document["full_name"],
+            created_at=document["created_at"],
+            is_active=document.get("is_active", True),
+            is_verified=document.get("is_verified", False),
+            verification_token=document.get("verification_token"),
+            verification_token_expires=document.get("verification_token_expires"),
+        )
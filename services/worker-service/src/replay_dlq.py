@@ -0,0 +1,60 @@
+"""
+Replay DLQ - Devuelve a la cola de transacciones los mensajes de la DLQ
+
+Para usar una vez corregida la causa (un bug desplegado, MongoDB caído más
+tiempo que todos los reintentos). Los mensajes vuelven con los intentos en
+cero y el header x-replays incrementado.
+
+    docker compose run --rm worker python -m worker.replay_dlq --limit 100
+
+Sin --limit vacía la DLQ; los mensajes que vuelvan a fallar terminan otra
+vez en ella después de sus reintentos, no en un ciclo.
+"""
+import argparse
+import logging
+
+import pika
+
+from src.config import settings
+from src.infrastructure.logging_config import configure_from_settings
+from src.infrastructure.partitioning import partition_queue, queue_arguments
+from src.infrastructure.retry_topology import RetryTopology, parse_delays
+
+logger = logging.getLogger(__name__)
+
+
+def replay(limit=None) -> int:
+    """Mueve hasta `limit` mensajes de las DLQ (una por partición) a su cola de trabajo"""
+    partitions = settings.rabbitmq_partitions
+    connection = pika.BlockingConnection(pika.URLParameters(settings.rabbitmq_url))
+    try:
+        channel = connection.channel()
+        channel.confirm_delivery()
+        moved = 0
+        for partition in range(max(partitions, 1)):
+            topology = RetryTopology(
+                partition_queue(settings.rabbitmq_transactions_queue, partition, partitions),
+                parse_delays(settings.worker_retry_delays),
+                queue_arguments(partitions),
+            )
+            topology.declare(channel)
+            moved += topology.replay(channel, None if limit is None else limit - moved)
+            if limit is not None and moved >= limit:
+                break
+        return moved
+    finally:
+        connection.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=None, help="Máximo de mensajes a devolver")
+    args = parser.parse_args(argv)
+
+    configure_from_settings(settings)
+    moved = replay(args.limit)
+    logger.info("Replayed %d messages from the %s DLQs", moved, settings.rabbitmq_transactions_queue)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Review Consumer - Consume la cola manual_review hacia la cola priorizada
+
+Cada evaluación MEDIUM/HIGH que publica publish_for_manual_review se guarda
+en RedisReviewQueue, de donde los analistas reciben lotes con lease
+(/api/v1/admin/review-queue/claim) en lugar de buscar trabajo recorriendo
+el log de transacciones.
+
+Corre en su propio contenedor con la imagen del worker:
+    python -m worker.review_consumer
+
+Nota del desarrollador:
+El callback de pika es síncrono; la cola usa redis.asyncio. En lugar de
+asyncio.run() por mensaje (un event loop y un pool de conexiones nuevos cada
+vez) el consumidor mantiene un loop y una cola para todo el proceso.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+import pika
+
+from src.adapters import RedisAdapter, RedisReviewQueue, build_review_queue
+from src.config import settings
+from src.domain.models import RiskLevel
+from src.infrastructure.logging_config import configure_from_settings
+from src.infrastructure import serialization
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_queue: Optional[RedisReviewQueue] = None
+
+
+def _review_queue() -> RedisReviewQueue:
+    """Cola y event loop compartidos por todos los mensajes"""
+    global _loop, _queue
+    if _queue is None:
+        _loop = asyncio.new_event_loop()
+        _queue = build_review_queue(RedisAdapter(settings.redis_url, settings.redis_ttl))
+    return _queue
+
+
+def _parse_task(body: bytes, properties) -> dict:
+    """
+    Tarea a encolar desde el mensaje del publisher
+
+    Raises:
+        ValueError: Si falta transaction_id o el nivel de riesgo es inválido
+    """
+    task = serialization.loads(body)
+    if not task.get("transaction_id"):
+        raise ValueError("Missing transaction_id")
+    if task.get("risk_level") not in RiskLevel.__members__:
+        raise ValueError(f"Invalid risk_level: {task.get('risk_level')!r}")
+
+    # La antigüedad cuenta desde que se publicó, no desde que se consumió
+    headers = getattr(properties, "headers", None) or {}
+    published_at = headers.get("x-published-at")
+    task["enqueued_at"] = published_at if isinstance(published_at, (int, float)) else time.time()
+    return task
+
+
+def callback(ch, method, properties, body):
+    """
+    Guarda la evaluación en la cola priorizada y confirma el mensaje
+
+    Un reenvío del mismo mensaje no duplica la tarea (enqueue es idempotente).
+    """
+    try:
+        task = _parse_task(body, properties)
+        queue = _review_queue()
+        created = _loop.run_until_complete(queue.enqueue(task))
+        logger.info(
+            "review task queued",
+            extra={"transaction_id": task["transaction_id"], "risk_level": task["risk_level"], "new_task": created},
+        )
+        ch.basic_ack(delivery_tag=method.delivery_tag)
+
+    except (json.JSONDecodeError, ValueError) as e:
+        logger.error("Invalid review message: %s", e)
+        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+
+    except Exception as e:
+        logger.exception("Error queueing review task, requeuing: %s", e)
+        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+
+
+def start_consumer(max_retries: int = 10, retry_delay: float = 2) -> None:
+    """
+    Consume settings.rabbitmq_manual_review_queue (reintenta la conexión
+    con backoff exponencial mientras RabbitMQ arranca)
+    """
+    configure_from_settings(settings)
+    serialization.use_backend(settings.json_backend)
+
+    for attempt in range(max_retries):
+        try:
+            connection = pika.BlockingConnection(pika.URLParameters(settings.rabbitmq_url))
+            channel = connection.channel()
+            channel.queue_declare(queue=settings.rabbitmq_manual_review_queue, durable=True)
+            # Encolar es barato: un prefetch mayor que el del worker evita
+            # un round trip a RabbitMQ por mensaje
+            channel.basic_qos(prefetch_count=50)
+            channel.basic_consume(queue=settings.rabbitmq_manual_review_queue, on_message_callback=callback)
+
+            logger.info("Review consumer started, waiting for messages from %s", settings.rabbitmq_manual_review_queue)
+            try:
+                channel.start_consuming()
+            except KeyboardInterrupt:
+                channel.stop_consuming()
+                connection.close()
+            break
+
+        except pika.exceptions.AMQPConnectionError as e:
+            if attempt == max_retries - 1:
+                logger.error("Failed to connect after %d attempts", max_retries)
+                raise
+            logger.warning("Connection failed: %s. Retrying in %s seconds", e, retry_delay)
+            time.sleep(retry_delay)
+            retry_delay *= 2
+
+
+if __name__ == "__main__":
+    start_consumer()
@@ -11,19 +11,159 @@ de errores y dead letter queue para mayor resiliencia.
 import pika
 import json
 import asyncio
+import functools
+import logging
+import time
 from decimal import Decimal
+from typing import Optional
+from pymongo.errors import DuplicateKeyError
 from src.adapters import (
     MongoDBAdapter,
     RedisAdapter,
     RabbitMQAdapter,
+    build_event_publisher,
+    build_fallback_policies,
+    build_location_profile,
+    build_submission_registry,
+    guard_repository,
 )
 from src.config import settings
+from src.domain.models import RiskLevel
 from src.domain.strategies.amount_threshold import AmountThresholdStrategy
 from src.domain.strategies.location_check import LocationStrategy
 from src.domain.strategies.device_validation import DeviceValidationStrategy
 from src.domain.strategies.rapid_transaction import RapidTransactionStrategy
 from src.domain.strategies.unusual_time import UnusualTimeStrategy
+from src.domain.strategies.custom_rule import build_custom_strategies
+from src.domain.rules import RuleCompiler
 from src.application.use_cases import EvaluateTransactionUseCase
+from src.infrastructure.metrics import (
+    PrometheusMetricsRecorder,
+    WORKER_MESSAGES,
+    WORKER_PROCESSING_TIME,
+    WORKER_QUEUE_TIME,
+    start_metrics_server,
+)
+from src.infrastructure.logging_config import configure_from_settings
+from src.infrastructure.partitioning import (
+    parse_owned_partitions,
+    partition_queue,
+    queue_arguments,
+)
+from src.infrastructure.retry_topology import RetryTopology, parse_delays
+from src.infrastructure.rule_cache import RuleSetCache
+from src.infrastructure.tracing import TRACER, configure_tracing, extract
+from src.infrastructure import serialization
+
+logger = logging.getLogger(__name__)
+
+# Reglas personalizadas y orden: el snapshot se relee solo cuando cambia la
+# versión en Redis y se recompilan solo las reglas que cambiaron su updated_at
+_RULE_SET_CACHE = RuleSetCache()
+_RULE_COMPILER = RuleCompiler()
+
+
+def _retry_topology(partition: int = 0) -> RetryTopology:
+    """Cola de una partición con sus colas de espera y DLQ"""
+    partitions = settings.rabbitmq_partitions
+    return RetryTopology(
+        partition_queue(settings.rabbitmq_transactions_queue, partition, partitions),
+        parse_delays(settings.worker_retry_delays),
+        queue_arguments(partitions),
+    )
+
+
+# Colas de espera y DLQ de la cola de transacciones (sin particiones)
+_RETRY_TOPOLOGY = _retry_topology()
+
+
+# Adaptadores por proceso: un MongoClient, un pool de Redis y una conexión
+# a RabbitMQ para todos los mensajes. Se crean en el primer uso; si la
+# construcción falla no se guarda nada y el próximo mensaje reintenta.
+_shared = {}
+
+
+def _shared_instance(name: str, build):
+    if name not in _shared:
+        _shared[name] = build()
+    return _shared[name]
+
+
+def _repository():
+    """
+    Repositorio detrás del breaker "mongodb"
+
+    Se construye sin índices (MongoClient no se conecta hasta la primera
+    operación): los crea start_worker al arrancar, también detrás del breaker.
+    """
+    return _shared_instance("repository", lambda: guard_repository(
+        MongoDBAdapter(settings.mongodb_url, settings.mongodb_database, create_indexes=False)
+    ))
+
+
+def _cache() -> RedisAdapter:
+    return _shared_instance("cache", lambda: RedisAdapter(settings.redis_url, settings.redis_ttl))
+
+
+def _publisher() -> RabbitMQAdapter:
+    return _shared_instance("publisher", lambda: RabbitMQAdapter(settings.rabbitmq_url))
+
+
+def _submissions():
+    return _shared_instance("submissions", lambda: build_submission_registry(_cache()))
+
+
+def _collaborators() -> dict:
+    """
+    Estrategias base y demás colaboradores del caso de uso
+
+    Ninguno guarda estado por transacción: se crean una vez y los comparten
+    todos los mensajes. Solo las reglas personalizadas cambian entre mensajes.
+    """
+    def build():
+        repository, cache = _repository(), _cache()
+        return {
+            "strategies": [  # (rule_id, estrategia)
+                ("rule_amount_threshold", AmountThresholdStrategy(threshold=Decimal(str(settings.amount_threshold)))),
+                ("rule_location_check", LocationStrategy(radius_km=settings.location_radius_km)),
+                ("rule_device_validation", DeviceValidationStrategy(redis_client=cache.redis_sync)),
+                ("rule_rapid_transaction", RapidTransactionStrategy(redis_client=cache.redis_sync)),
+                ("rule_unusual_time", UnusualTimeStrategy(audit_repository=repository)),
+            ],
+            "metrics": PrometheusMetricsRecorder(),
+            "location_profile": build_location_profile(cache),
+            "events": build_event_publisher(cache),
+            "fallback_policies": build_fallback_policies(),
+        }
+    return _shared_instance("collaborators", build)
+
+
+def _ensure_indexes() -> None:
+    """
+    Índices de evaluations, una vez por proceso
+
+    Se llama al arrancar; si MongoDB no responde se reintenta con el próximo
+    mensaje (con el circuito abierto el intento falla sin tocar la red).
+    """
+    if _shared.get("indexes"):
+        return
+    try:
+        _repository().ensure_indexes()
+    except Exception as e:
+        logger.warning("Could not create MongoDB indexes: %s", e)
+        return
+    _shared["indexes"] = True
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop del proceso
+
+    Los clientes redis.asyncio compartidos quedan atados al loop en el que
+    abren sus conexiones: asyncio.run() por mensaje creaba un loop nuevo
+    cada vez y habría roto el pool.
+    """
+    return _shared_instance("loop", asyncio.new_event_loop)
 
 
 def create_use_case() -> EvaluateTransactionUseCase:
@@ -34,22 +174,40 @@ def create_use_case() -> EvaluateTransactionUseCase:
     La IA sugirió crear esto en cada callback. Lo extraje a una función
     para cumplir con DRY y facilitar testing.
     """
-    repository = MongoDBAdapter(settings.mongodb_url, settings.mongodb_database)
-    publisher = RabbitMQAdapter(settings.rabbitmq_url)
-    cache = RedisAdapter(settings.redis_url, settings.redis_ttl)
+    # Detrás del breaker "mongodb": con MongoDB caído los mensajes van a las
+    # colas de espera sin esperar un timeout por operación
+    repository = _repository()
+    _ensure_indexes()
+    shared = _collaborators()
+
+    # En el orden de /admin/rules/reorder, igual que el gateway
+    rules = _event_loop().run_until_complete(_RULE_SET_CACHE.get(_cache(), repository))
+    strategies = rules.sort_strategies(
+        shared["strategies"], build_custom_strategies(rules.custom_rules, _RULE_COMPILER)
+    )
 
-    strategies = [
-        AmountThresholdStrategy(threshold=Decimal(str(settings.amount_threshold))),
-        LocationStrategy(radius_km=settings.location_radius_km),
-        DeviceValidationStrategy(redis_client=cache.redis_sync),
-        RapidTransactionStrategy(redis_client=cache.redis_sync),
-        UnusualTimeStrategy(audit_repository=repository),
-    ]
+    return EvaluateTransactionUseCase(
+        repository, _publisher(), _cache(), strategies,
+        metrics=shared["metrics"], tracer=TRACER,
+        location_profile=shared["location_profile"],
+        cost_aware=settings.rule_cost_aware,
+        risk_ceiling=RiskLevel[settings.rule_risk_ceiling],
+        events=shared["events"],
+        fallback_policies=shared["fallback_policies"],
+    )
 
-    return EvaluateTransactionUseCase(repository, publisher, cache, strategies)
 
+def _observe_queue_time(properties) -> None:
+    """Tiempo en cola a partir del header x-published-at que agrega el publisher"""
+    headers = getattr(properties, "headers", None) or {}
+    published_at = headers.get("x-published-at")
+    if published_at is None and getattr(properties, "timestamp", None):
+        published_at = properties.timestamp
+    if isinstance(published_at, (int, float)):
+        WORKER_QUEUE_TIME.observe(max(0.0, time.time() - published_at))
 
-def callback(ch, method, properties, body):
+
+def callback(ch, method, properties, body, topology: RetryTopology = None):
     """
     Callback para procesar mensajes de la cola
     
@@ -58,40 +216,113 @@ def callback(ch, method, properties, body):
         method: Método de entrega
         properties: Propiedades del mensaje
         body: Cuerpo del mensaje (JSON)
+        topology: Colas de espera y DLQ de la partición que entregó el mensaje
     
     Nota del desarrollador:
     La IA olvidó agregar manejo de errores. Agregué try/except para
     evitar que un mensaje corrupto detenga el worker (resilience pattern).
     """
+    _observe_queue_time(properties)
+    topology = topology or _RETRY_TOPOLOGY
+    started = time.perf_counter()
+    outcome = "processed"
+    transaction_id = None
     try:
-        transaction_data = json.loads(body)
-        print(f"Processing transaction: {transaction_data['id']}")
+        transaction_data = serialization.loads(body)
+        transaction_id = transaction_data["id"]
 
-        # Ejecutar caso de uso
-        use_case = create_use_case()
-        result = asyncio.run(use_case.execute(transaction_data))
+        # Ejecutar caso de uso (continuando la traza del publisher si viene traceparent)
+        parent = extract(getattr(properties, "headers", None))
+        with TRACER.start_span(
+            "worker.process_transaction",
+            {"transaction_id": transaction_id},
+            parent=parent,
+        ):
+            use_case = create_use_case()
+            result = _event_loop().run_until_complete(use_case.execute(transaction_data))
 
-        print(
-            f"Transaction {transaction_data['id']} evaluated as {result['risk_level']}"
+        logger.info(
+            "transaction evaluated",
+            extra={
+                "transaction_id": transaction_id,
+                "risk_level": result["risk_level"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
         )
 
         # Acknowledge el mensaje
         ch.basic_ack(delivery_tag=method.delivery_tag)
 
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in message: {e}")
-        # Rechazar mensaje y no reencolar (está corrupto)
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError también es subclase
+        logger.error("Invalid JSON in message: %s", e)
+        # Está corrupto: directo a la DLQ, reintentar no lo arregla
+        outcome = _settle(topology, ch, method, properties, body, f"invalid_json: {e}", permanent=True)
+
+    except (ValueError, DuplicateKeyError) as e:
+        logger.error("Invalid transaction data: %s", e)
+        # Datos inválidos o evaluación ya guardada: tampoco se reintenta
+        outcome = _settle(
+            topology, ch, method, properties, body, f"{type(e).__name__}: {e}", permanent=True,
+            transaction_id=transaction_id,
+        )
+
+    except Exception as e:
+        logger.exception("Error processing transaction, scheduling retry: %s", e)
+        # Error temporal: vuelve después de la espera del intento
+        outcome = _settle(
+            topology, ch, method, properties, body, f"{type(e).__name__}: {e}", transaction_id=transaction_id
+        )
+
+    finally:
+        WORKER_PROCESSING_TIME.observe(time.perf_counter() - started)
+        WORKER_MESSAGES.labels(outcome).inc()
+
 
-    except ValueError as e:
-        print(f"Error: Invalid transaction data: {e}")
-        # Rechazar mensaje y no reencolar (datos inválidos)
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+def _settle(
+    topology: RetryTopology, ch, method, properties, body, reason: str, permanent: bool = False,
+    transaction_id: Optional[str] = None,
+) -> str:
+    """
+    Saca de la cola un mensaje fallido: a la cola de espera de su intento
+    o a la DLQ, y después lo confirma. Si va a la DLQ, la consulta de estado
+    de `transaction_id` pasa a responder FAILED
+
+    Returns:
+        Resultado para WORKER_MESSAGES
 
+    Nota del desarrollador:
+    Antes era basic_nack(requeue=True): un mensaje que siempre falla volvía
+    al instante a la cabeza de la cola y el worker giraba sobre él. Si la
+    republicación falla (RabbitMQ caído) se cae en ese mismo nack como
+    último recurso, para no perder el mensaje.
+    """
+    try:
+        if permanent:
+            outcome = topology.dead_letter(ch, properties, body, reason)
+        else:
+            outcome = topology.retry(ch, properties, body, reason)
+        ch.basic_ack(delivery_tag=method.delivery_tag)
     except Exception as e:
-        print(f"Error processing transaction: {e}")
-        # Rechazar mensaje y reencolar (error temporal, puede recuperarse)
+        logger.error("Could not reroute failed message, requeuing: %s", e)
         ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+        return "requeued"
+    if outcome == "dead_lettered" and transaction_id:
+        _mark_failed(transaction_id, reason)
+    return outcome
+
+
+def _mark_failed(transaction_id: str, reason: str) -> None:
+    """
+    Registra el fallo para GET /transaction/{id}/status
+
+    Solo se guarda el tipo de error ("ValueError", "invalid_json"...): el
+    mensaje completo queda en la DLQ. Si Redis falla, la consulta sigue
+    diciendo PROCESSING hasta que vence la marca del envío.
+    """
+    try:
+        _event_loop().run_until_complete(_submissions().fail(transaction_id, reason.partition(":")[0]))
+    except Exception as e:
+        logger.warning("Could not mark transaction %s as failed: %s", transaction_id, e)
 
 
 def start_worker():
@@ -110,47 +341,61 @@ def start_worker():
     
     max_retries = 10
     retry_delay = 2
+
+    configure_from_settings(settings)
+    configure_tracing(settings, service_name="fraud-worker")
+    serialization.use_backend(settings.json_backend)
+
+    # /metrics en un hilo aparte: el consumo de pika bloquea el hilo principal
+    start_metrics_server(settings.metrics_port)
+    _ensure_indexes()
     
     for attempt in range(max_retries):
         try:
-            print(f"Connecting to RabbitMQ: {settings.rabbitmq_url} (attempt {attempt + 1}/{max_retries})")
+            logger.info("Connecting to RabbitMQ (attempt %d/%d)", attempt + 1, max_retries)
             connection = pika.BlockingConnection(
                 pika.URLParameters(settings.rabbitmq_url)
             )
             channel = connection.channel()
 
-            # Declarar cola (idempotente)
-            channel.queue_declare(queue=settings.rabbitmq_transactions_queue, durable=True)
+            # Confirmaciones del broker: el original se confirma solo cuando
+            # su copia (reintento o DLQ) ya quedó encolada
+            channel.confirm_delivery()
 
-            # Prefetch count = 1: procesar un mensaje a la vez
+            # Prefetch count = 1: procesar un mensaje a la vez (por partición)
             channel.basic_qos(prefetch_count=1)
 
-            # Consumir mensajes
-            channel.basic_consume(
-                queue=settings.rabbitmq_transactions_queue, on_message_callback=callback
-            )
+            # Consumir las particiones asignadas, cada una con sus colas de
+            # espera y DLQ (declaración idempotente)
+            queues = []
+            for partition in parse_owned_partitions(settings.worker_partitions, settings.rabbitmq_partitions):
+                topology = _retry_topology(partition)
+                topology.declare(channel)
+                channel.basic_consume(
+                    queue=topology.queue,
+                    on_message_callback=functools.partial(callback, topology=topology),
+                )
+                queues.append(topology.queue)
 
-            print(f"✅ Worker started successfully. Waiting for messages from {settings.rabbitmq_transactions_queue}")
-            print("To exit press CTRL+C")
+            logger.info("Worker started, waiting for messages from %s", ", ".join(queues))
 
             try:
                 channel.start_consuming()
             except KeyboardInterrupt:
-                print("\nStopping worker...")
+                logger.info("Stopping worker...")
                 channel.stop_consuming()
                 connection.close()
-                print("Worker stopped")
+                logger.info("Worker stopped")
             
             break  # Salir del loop de retry si se conectó exitosamente
             
         except pika.exceptions.AMQPConnectionError as e:
             if attempt < max_retries - 1:
-                print(f"❌ Connection failed: {e}")
-                print(f"⏳ Retrying in {retry_delay} seconds...")
+                logger.warning("Connection failed: %s. Retrying in %s seconds", e, retry_delay)
                 time.sleep(retry_delay)
                 retry_delay *= 2  # Backoff exponencial
             else:
-                print(f"❌ Failed to connect after {max_retries} attempts")
+                logger.error("Failed to connect after %d attempts", max_retries)
                 raise
 
 
@@ -8,6 +8,7 @@ Incluye datos de ejemplo y configuración de la base de datos de prueba.
 import pytest
 from datetime import datetime
 from typing import Dict, Any
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -69,6 +70,67 @@ def mock_redis():
     return mock_redis
 
 
+def pytest_addoption(parser):
+    """Opciones para la suite de benchmarks (tests/performance)."""
+    group = parser.getgroup("benchmarks", "Benchmarks del hot path de evaluación")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Ejecuta los tests marcados con @pytest.mark.benchmark",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Degradación máxima de p50 frente al baseline (0.2 = 20%%)",
+    )
+    group.addoption(
+        "--benchmark-tail-tolerance",
+        action="store",
+        type=float,
+        default=1.0,
+        help="Degradación máxima del tiempo medio (p99: el doble) frente al baseline",
+    )
+    group.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        default=False,
+        help="Sobrescribe tests/performance/baseline.json con los resultados medidos",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Los benchmarks solo corren con --run-benchmarks para no ralentizar la suite."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="usar --run-benchmarks para ejecutar")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+def _register_api_gateway_package(repo_root: Path) -> None:
+    """
+    Registra services/api-gateway/src como el paquete `api_gateway`.
+
+    En Docker el gateway se copia a /app/api_gateway (ver Dockerfile), por eso
+    sus módulos importan `api_gateway.routes`. Replicamos ese layout en tests.
+    """
+    if "api_gateway" in sys.modules:
+        return
+    package_dir = repo_root / "services" / "api-gateway" / "src"
+    spec = importlib.util.spec_from_file_location(
+        "api_gateway",
+        package_dir / "__init__.py",
+        submodule_search_locations=[str(package_dir)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["api_gateway"] = module
+    spec.loader.exec_module(module)
+
+
 def pytest_sessionstart(session):
     """Ensure service src folders are on sys.path so imports like `src.*` work."""
     repo_root = Path(__file__).resolve().parents[1]
@@ -84,3 +146,7 @@ def pytest_sessionstart(session):
                 p = str(src_folder)
                 if p not in sys.path:
                     sys.path.insert(0, p)
+    fraud_service_root = str(services_dir / "fraud-evaluation-service")
+    if fraud_service_root not in sys.path:
+        sys.path.insert(0, fraud_service_root)
+    _register_api_gateway_package(repo_root)
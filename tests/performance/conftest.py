@@ -0,0 +1,181 @@
+"""
+Fixtures para los benchmarks del hot path de evaluación.
+
+Usa dobles en proceso en lugar de servicios reales:
+- fakeredis para RedisAdapter (cliente async y sync comparten servidor)
+- mongomock para MongoDBAdapter
+- un publisher stub que solo cuenta mensajes
+
+Ejecutar con:
+    pytest tests/performance --run-benchmarks
+    pytest tests/performance --run-benchmarks --benchmark-save-baseline
+
+Política del baseline:
+- La suite tiene que pasar en cada commit. Un cambio que toca un camino
+  medido se queda dentro de la tolerancia; si no, se optimiza en el mismo
+  cambio
+- Re-baselinar solo cuando el costo extra es intencional (una regla nueva,
+  más trabajo por request a propósito), en el mismo commit y con el motivo y
+  los números viejos/nuevos en el mensaje. Solo las entradas afectadas:
+  --benchmark-save-baseline -k <benchmark> (save() conserva las demás)
+- Un benchmark nuevo agrega su entrada en el mismo commit; sin entrada solo
+  se reporta y no protege nada
+- Los tiempos están normalizados a la velocidad de la CPU (ver harness.py):
+  p50 tolera --benchmark-tolerance (20%), throughput y p99 la tolerancia de
+  cola, más laxa. Si cambia harness.py o la máquina de referencia, se
+  re-baselinan todas las entradas (mediana de varias corridas)
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from tests.performance.harness import BaselineStore, BenchmarkResult
+
+
+class StubPublisher:
+    """Publisher en memoria: cuenta mensajes sin abrir conexión AMQP"""
+
+    def __init__(self) -> None:
+        self.processing = 0
+        self.manual_review = 0
+
+    async def publish_transaction_for_processing(self, transaction_data: dict) -> None:
+        self.processing += 1
+
+    async def publish_for_manual_review(self, evaluation_data: dict) -> None:
+        self.manual_review += 1
+
+
+# Un único store por sesión: lo usan los tests y los hooks de reporte
+_BASELINE_STORE = BaselineStore()
+
+
+@pytest.fixture(scope="session")
+def baseline_store():
+    return _BASELINE_STORE
+
+
+@pytest.fixture
+def check_baseline(request, baseline_store):
+    """Registra el resultado y falla si hay regresión frente al baseline"""
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    tail_tolerance = request.config.getoption("--benchmark-tail-tolerance")
+    save_mode = request.config.getoption("--benchmark-save-baseline")
+
+    def _check(result: BenchmarkResult) -> BenchmarkResult:
+        baseline_store.record(result)
+        if save_mode:
+            return result
+        problems = baseline_store.regressions(result, tolerance, tail_tolerance)
+        if problems:
+            pytest.fail(f"Regresión en {result.name}: " + "; ".join(problems))
+        return result
+
+    return _check
+
+
+@pytest.fixture
+def redis_adapter():
+    """RedisAdapter real sobre fakeredis (async y sync ven los mismos datos)"""
+    fakeredis = pytest.importorskip("fakeredis")
+    from fakeredis import aioredis as fake_aioredis
+
+    server = fakeredis.FakeServer()
+    with patch(
+        "src.adapters.redis_async.from_url",
+        side_effect=lambda *a, **kw: fake_aioredis.FakeRedis(server=server, decode_responses=True),
+    ), patch(
+        "src.adapters.redis.from_url",
+        side_effect=lambda *a, **kw: fakeredis.FakeRedis(server=server, decode_responses=True),
+    ):
+        from src.adapters import RedisAdapter
+
+        yield RedisAdapter("redis://benchmark", ttl=3600)
+
+
+@pytest.fixture
+def mongo_adapter():
+    """MongoDBAdapter real sobre mongomock (incluye índices)"""
+    mongomock = pytest.importorskip("mongomock")
+    with patch("src.adapters.MongoClient", mongomock.MongoClient):
+        from src.adapters import MongoDBAdapter
+
+        yield MongoDBAdapter("mongodb://benchmark", "fraud_benchmark")
+
+
+@pytest.fixture
+def stub_publisher():
+    return StubPublisher()
+
+
+@pytest.fixture
+def seeded_history(mongo_adapter):
+    """50 evaluaciones históricas para bench_user (patrón horario 9-17h)"""
+    from src.domain.models import FraudEvaluation, Location, RiskLevel
+
+    now = datetime.now()
+    documents = []
+    for i in range(50):
+        timestamp = (now - timedelta(days=i % 60)).replace(hour=9 + (i % 9), minute=0)
+        evaluation = FraudEvaluation(
+            transaction_id=f"hist_{i}",
+            user_id="bench_user",
+            risk_level=RiskLevel.LOW_RISK,
+            reasons=[],
+            timestamp=timestamp,
+            amount=Decimal("120.50"),
+            location=Location(latitude=4.7110, longitude=-74.0721),
+        )
+        documents.append(evaluation)
+
+    async def _seed():
+        for evaluation in documents:
+            await mongo_adapter.save_evaluation(evaluation)
+
+    asyncio.run(_seed())
+    return mongo_adapter
+
+
+@pytest.fixture
+def transaction_payload():
+    """Construye payloads únicos por iteración para EvaluateTransactionUseCase"""
+
+    def _build(i: int) -> dict:
+        return {
+            "id": f"bench_txn_{i}",
+            "amount": 250.75,
+            "user_id": "bench_user",
+            "location": {"latitude": 4.7110, "longitude": -74.0721},
+            "timestamp": datetime.now().replace(hour=11).isoformat(),
+            "device_id": "device_known",
+            "transaction_type": "payment",
+        }
+
+    return _build
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if session.config.getoption("--benchmark-save-baseline") and _BASELINE_STORE.results:
+        _BASELINE_STORE.save()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Imprime la tabla de resultados al final de la sesión"""
+    if not _BASELINE_STORE.results:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<40} {'iter':>6} {'p50 us':>10} {'p99 us':>10} {'ops/s':>10} {'calib us':>9}"
+    )
+    for name, result in sorted(_BASELINE_STORE.results.items()):
+        terminalreporter.write_line(
+            f"{name:<40} {result.iterations:>6} {result.p50_us:>10.1f} "
+            f"{result.p99_us:>10.1f} {result.throughput_ops:>10.0f} {result.calibration_us:>9.1f}"
+        )
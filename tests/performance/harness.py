@@ -0,0 +1,258 @@
+"""
+Harness mínimo para medir el hot path de evaluación.
+
+Mide cada operación individualmente (time.perf_counter_ns) para poder
+reportar p50/p99 además del throughput, y compara contra un baseline
+guardado en JSON. No depende de pytest-benchmark para que la suite corra
+con las dependencias de requirements-test.txt.
+
+Nota del desarrollador:
+En máquinas compartidas la CPU pasa por fases (de 100 ms a segundos) en las
+que rinde la mitad. Medido de corrido, el mismo código daba p50 hasta 2x
+distintos entre corridas: solo una tolerancia del 50% evitaba falsos
+positivos, y con ella una regresión real del 30% pasaba. Ahora:
+
+- Las muestras se toman en tramos de ~20 ms y cada tramo se escala por la
+  velocidad de la CPU medida justo antes y después con una carga fija
+  (_reference_workload): los tiempos quedan en µs "a velocidad de
+  referencia" (REFERENCE_CALIBRATION_US) y una fase lenta se compensa
+- Cada benchmark corre ROUNDS rondas y se reporta el mejor valor de cada
+  métrica entre ellas: un cambio de fase en medio de un tramo solo empeora
+  una ronda, una regresión real las empeora todas
+
+El baseline guarda además calibration_us, la mejor calibración vista:
+compararla con la de una corrida dice si la máquina es otra.
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Tiempo de _reference_workload() al que se normalizan las muestras
+REFERENCE_CALIBRATION_US = 500.0
+# Rondas por benchmark; se reporta el mejor valor de cada métrica
+ROUNDS = 5
+# Duración de cada tramo entre calibraciones
+_CHUNK_NS = 20_000_000
+# Diferencia (p50 o tiempo medio por operación) por debajo de la cual no se
+# reporta regresión: las operaciones de ~1us varían hasta 2x entre procesos y
+# la calibración no lo corrige (no comparten caché ni fases con
+# _reference_workload)
+NOISE_FLOOR_US = 1.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Resultado agregado de un benchmark (tiempos a velocidad de referencia)"""
+
+    name: str
+    iterations: int
+    p50_us: float
+    p99_us: float
+    throughput_ops: float
+    calibration_us: float = 0.0  # mejor _reference_workload() medido
+
+    def to_dict(self) -> dict:
+        return {
+            "iterations": self.iterations,
+            "p50_us": round(self.p50_us, 2),
+            "p99_us": round(self.p99_us, 2),
+            "throughput_ops": round(self.throughput_ops, 1),
+            "calibration_us": round(self.calibration_us, 1),
+        }
+
+
+def _percentile(sorted_samples: List[int], percentile: float) -> float:
+    """Percentil por rango más cercano sobre muestras ya ordenadas"""
+    index = min(len(sorted_samples) - 1, int(round(percentile * (len(sorted_samples) - 1))))
+    return float(sorted_samples[index])
+
+
+def _summarize(name: str, samples_ns: List[int], calibration_us: float = 0.0) -> BenchmarkResult:
+    samples_ns.sort()
+    total_s = sum(samples_ns) / 1e9
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples_ns),
+        p50_us=_percentile(samples_ns, 0.50) / 1000,
+        p99_us=_percentile(samples_ns, 0.99) / 1000,
+        throughput_ops=len(samples_ns) / total_s if total_s > 0 else float("inf"),
+        calibration_us=calibration_us,
+    )
+
+
+def _reference_workload() -> None:
+    """Trabajo fijo en Python puro (dict, str, int) que sirve de vara de medir"""
+    table: Dict[str, int] = {}
+    for i in range(2000):
+        key = f"k{i % 97}"
+        table[key] = table.get(key, 0) + i * 3
+    sorted(table.items())
+
+
+def _calibration_us(repeats: int = 3) -> float:
+    """Mejor tiempo de _reference_workload() en este momento"""
+    clock = time.perf_counter_ns
+    best = None
+    for _ in range(repeats):
+        start = clock()
+        _reference_workload()
+        elapsed = clock() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1000
+
+
+class _Round:
+    """Muestras de una ronda, escaladas tramo a tramo a la velocidad de referencia"""
+
+    def __init__(self) -> None:
+        self.samples: List[int] = []
+        self._chunk: List[int] = []
+        self._calibrations = [_calibration_us()]
+        self._deadline = time.perf_counter_ns() + _CHUNK_NS
+
+    def add(self, start_ns: int, end_ns: int) -> None:
+        self._chunk.append(end_ns - start_ns)
+        if end_ns >= self._deadline:
+            self._close_chunk()
+
+    def _close_chunk(self) -> None:
+        before, after = self._calibrations[-1], _calibration_us()
+        factor = REFERENCE_CALIBRATION_US / ((before + after) / 2)
+        self.samples += [round(sample * factor) for sample in self._chunk]
+        self._calibrations.append(after)
+        self._chunk = []
+        self._deadline = time.perf_counter_ns() + _CHUNK_NS
+
+    def result(self, name: str) -> BenchmarkResult:
+        if self._chunk:
+            self._close_chunk()
+        return _summarize(name, self.samples, min(self._calibrations))
+
+
+def _best(results: List[BenchmarkResult]) -> BenchmarkResult:
+    """Mejor valor de cada métrica entre rondas (una regresión real las mueve todas)"""
+    return BenchmarkResult(
+        name=results[0].name,
+        iterations=results[0].iterations,
+        p50_us=min(result.p50_us for result in results),
+        p99_us=min(result.p99_us for result in results),
+        throughput_ops=max(result.throughput_ops for result in results),
+        calibration_us=min(result.calibration_us for result in results),
+    )
+
+
+def run_benchmark(
+    name: str, fn: Callable[[int], object], iterations: int = 1000, warmup: int = 50
+) -> BenchmarkResult:
+    """
+    Ejecuta fn(i) `iterations` veces por ronda y retorna la mejor ronda
+
+    El índice de iteración permite generar ids únicos (p.ej. transaction_id,
+    que tiene índice unique en MongoDB); no se repite entre rondas.
+    """
+    for i in range(warmup):
+        fn(-i - 1)
+
+    results = []
+    clock = time.perf_counter_ns
+    for round_index in range(ROUNDS):
+        current = _Round()
+        for i in range(round_index * iterations, (round_index + 1) * iterations):
+            start = clock()
+            fn(i)
+            current.add(start, clock())
+        results.append(current.result(name))
+    return _best(results)
+
+
+def run_async_benchmark(
+    name: str,
+    fn: Callable[[int], Awaitable[object]],
+    iterations: int = 1000,
+    warmup: int = 50,
+) -> BenchmarkResult:
+    """Igual que run_benchmark pero para corrutinas (un único event loop)"""
+
+    async def _run() -> List[BenchmarkResult]:
+        for i in range(warmup):
+            await fn(-i - 1)
+        results = []
+        clock = time.perf_counter_ns
+        for round_index in range(ROUNDS):
+            current = _Round()
+            for i in range(round_index * iterations, (round_index + 1) * iterations):
+                start = clock()
+                await fn(i)
+                current.add(start, clock())
+            results.append(current.result(name))
+        return results
+
+    return _best(asyncio.run(_run()))
+
+
+class BaselineStore:
+    """
+    Baseline persistido en tests/performance/baseline.json
+
+    Se considera regresión si p50 empeora más que `tolerance` respecto al
+    baseline, si el tiempo medio por operación (1/throughput) empeora más que
+    `tail_tolerance` o si p99 empeora más del doble de `tail_tolerance`: la
+    cola (y la media, que la arrastran los outliers) es mucho más ruidosa que
+    p50. p50 y media ignoran diferencias menores que NOISE_FLOOR_US.
+    """
+
+    def __init__(self, path: Path = BASELINE_PATH) -> None:
+        self.path = path
+        self.baseline: Dict[str, dict] = {}
+        if path.exists():
+            self.baseline = json.loads(path.read_text(encoding="utf-8"))
+        self.results: Dict[str, BenchmarkResult] = {}
+
+    def record(self, result: BenchmarkResult) -> None:
+        self.results[result.name] = result
+
+    def regressions(
+        self, result: BenchmarkResult, tolerance: float, tail_tolerance: Optional[float] = None
+    ) -> List[str]:
+        """Lista de métricas que empeoraron más allá de la tolerancia"""
+        reference: Optional[dict] = self.baseline.get(result.name)
+        if reference is None:
+            return []
+        if tail_tolerance is None:
+            tail_tolerance = tolerance
+
+        def _exceeds(value_us: float, reference_us: float, limit: float) -> bool:
+            return value_us > max(reference_us * (1 + limit), reference_us + NOISE_FLOOR_US)
+
+        problems = []
+        if _exceeds(result.p50_us, reference["p50_us"], tolerance):
+            problems.append(f"p50 {result.p50_us:.1f}us > baseline {reference['p50_us']}us")
+        if result.p99_us > reference["p99_us"] * (1 + 2 * tail_tolerance):
+            problems.append(f"p99 {result.p99_us:.1f}us > baseline {reference['p99_us']}us")
+        if _exceeds(1e6 / result.throughput_ops, 1e6 / reference["throughput_ops"], tail_tolerance):
+            problems.append(
+                f"throughput {result.throughput_ops:.0f} ops/s < baseline "
+                f"{reference['throughput_ops']} ops/s"
+            )
+        return problems
+
+    def save(self) -> None:
+        merged = dict(self.baseline)
+        merged.update({name: r.to_dict() for name, r in self.results.items()})
+        self.path.write_text(
+            json.dumps(dict(sorted(merged.items())), indent=2) + "\n", encoding="utf-8"
+        )
+
+
+__all__ = [
+    "BenchmarkResult",
+    "BaselineStore",
+    "run_benchmark",
+    "run_async_benchmark",
+]
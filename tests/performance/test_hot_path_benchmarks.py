@@ -0,0 +1,200 @@
+"""
+Benchmarks del hot path de evaluación de fraude.
+
+Cubre EvaluateTransactionUseCase.execute, cada estrategia de
+domain/strategies, _build_strategies del gateway y los round-trips de
+MongoDBAdapter/RedisAdapter, todos contra dobles en proceso.
+
+Los resultados se comparan con tests/performance/baseline.json; un
+benchmark sin entrada en el baseline solo se reporta.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.domain.models import Transaction, Location, RiskLevel, FraudEvaluation
+from src.domain.money import Money
+from src.domain.strategies.amount_threshold import AmountThresholdStrategy
+from src.domain.strategies.location_check import LocationStrategy
+from src.domain.strategies.device_validation import DeviceValidationStrategy
+from src.domain.strategies.rapid_transaction import RapidTransactionStrategy
+from src.domain.strategies.unusual_time import UnusualTimeStrategy
+from src.application.use_cases import EvaluateTransactionUseCase
+from tests.performance.harness import run_benchmark, run_async_benchmark
+
+pytestmark = pytest.mark.benchmark
+
+
+BOGOTA = Location(latitude=4.7110, longitude=-74.0721)
+MEDELLIN = Location(latitude=6.2442, longitude=-75.5812)
+
+
+def _transaction(i: int, amount: str = "250.75", device_id: str = "device_known") -> Transaction:
+    return Transaction(
+        id=f"bench_txn_{i}",
+        amount=Money.parse(amount),
+        user_id="bench_user",
+        location=BOGOTA,
+        timestamp=datetime.now().replace(hour=11),
+        device_id=device_id,
+    )
+
+
+class TestStrategyBenchmarks:
+    """Cada estrategia aislada, con sus dependencias en memoria"""
+
+    def test_amount_threshold(self, check_baseline):
+        strategy = AmountThresholdStrategy(Decimal("1500"))
+        transaction = _transaction(0, amount="2000.00")
+        result = run_benchmark(
+            "strategy.amount_threshold", lambda i: strategy.evaluate(transaction), 5000
+        )
+        check_baseline(result)
+
+    def test_location_check(self, check_baseline):
+        strategy = LocationStrategy(radius_km=100)
+        transaction = _transaction(0)
+        result = run_benchmark(
+            "strategy.location_check",
+            lambda i: strategy.evaluate(transaction, MEDELLIN),
+            5000,
+        )
+        check_baseline(result)
+
+    def test_device_validation(self, check_baseline, redis_adapter):
+        strategy = DeviceValidationStrategy(redis_client=redis_adapter.redis_sync)
+        redis_adapter.redis_sync.sadd("user_devices:bench_user", "device_known")
+        transaction = _transaction(0)
+        result = run_benchmark(
+            "strategy.device_validation", lambda i: strategy.evaluate(transaction), 1000
+        )
+        check_baseline(result)
+
+    def test_rapid_transaction(self, check_baseline, redis_adapter):
+        strategy = RapidTransactionStrategy(redis_client=redis_adapter.redis_sync)
+        result = run_benchmark(
+            "strategy.rapid_transaction",
+            lambda i: strategy.evaluate(_transaction(i)),
+            1000,
+        )
+        check_baseline(result)
+
+    def test_unusual_time(self, check_baseline, seeded_history):
+        strategy = UnusualTimeStrategy(audit_repository=seeded_history)
+        transaction = _transaction(0)
+        outcome = strategy.evaluate(transaction)
+        assert outcome["risk_level"] == RiskLevel.LOW_RISK
+        result = run_benchmark(
+            "strategy.unusual_time", lambda i: strategy.evaluate(transaction), 200, warmup=10
+        )
+        check_baseline(result)
+
+
+class TestUseCaseBenchmarks:
+    """Caso de uso completo con las cinco estrategias del gateway"""
+
+    def test_evaluate_transaction_execute(
+        self, check_baseline, redis_adapter, seeded_history, stub_publisher, transaction_payload
+    ):
+        redis_adapter.redis_sync.sadd("user_devices:bench_user", "device_known")
+        strategies = [
+            AmountThresholdStrategy(Decimal("1500")),
+            LocationStrategy(100.0),
+            DeviceValidationStrategy(redis_client=redis_adapter.redis_sync),
+            RapidTransactionStrategy(redis_client=redis_adapter.redis_sync, max_transactions=10**9),
+            UnusualTimeStrategy(audit_repository=seeded_history),
+        ]
+        use_case = EvaluateTransactionUseCase(
+            seeded_history, stub_publisher, redis_adapter, strategies
+        )
+
+        result = run_async_benchmark(
+            "use_case.evaluate_transaction",
+            lambda i: use_case.execute(transaction_payload(i)),
+            200,
+            warmup=10,
+        )
+        check_baseline(result)
+
+    def test_build_strategies(self, check_baseline, redis_adapter, mongo_adapter):
+        from api_gateway.routes import _build_strategies
+
+        result = run_async_benchmark(
+            "gateway.build_strategies",
+            lambda i: _build_strategies(set(), redis_adapter, mongo_adapter),
+            500,
+        )
+        check_baseline(result)
+
+
+class TestAdapterBenchmarks:
+    """Round-trips de los adaptadores sobre fakeredis/mongomock"""
+
+    def test_mongodb_save_and_get(self, check_baseline, mongo_adapter):
+        async def _round_trip(i: int) -> None:
+            evaluation = FraudEvaluation(
+                transaction_id=f"bench_rt_{i}",
+                user_id="bench_user",
+                risk_level=RiskLevel.MEDIUM_RISK,
+                reasons=["amount_threshold_exceeded"],
+                timestamp=datetime.now(),
+                amount=Money.parse("1999.99"),
+                location=BOGOTA,
+            )
+            await mongo_adapter.save_evaluation(evaluation)
+            assert mongo_adapter.get_evaluation_by_id(evaluation.transaction_id) is not None
+
+        result = run_async_benchmark("adapter.mongodb.save_get", _round_trip, 500)
+        check_baseline(result)
+
+    def test_mongodb_user_history(self, check_baseline, seeded_history):
+        result = run_benchmark(
+            "adapter.mongodb.evaluations_by_user",
+            lambda i: seeded_history.get_evaluations_by_user("bench_user"),
+            200,
+            warmup=10,
+        )
+        check_baseline(result)
+
+    def test_redis_location_round_trip(self, check_baseline, redis_adapter):
+        async def _round_trip(i: int) -> None:
+            await redis_adapter.set_user_location("bench_user", 4.7110, -74.0721)
+            assert await redis_adapter.get_user_location("bench_user") is not None
+
+        result = run_async_benchmark("adapter.redis.location_round_trip", _round_trip, 1000)
+        check_baseline(result)
+
+    def test_redis_threshold_config(self, check_baseline, redis_adapter):
+        async def _round_trip(i: int) -> None:
+            await redis_adapter.set_threshold_config(1500.0, 100.0)
+            assert await redis_adapter.get_threshold_config() is not None
+
+        result = run_async_benchmark("adapter.redis.threshold_config", _round_trip, 1000)
+        check_baseline(result)
+
+
+class TestSerializationBenchmarks:
+    """Serialización de un listado grande del admin (1000 filas)"""
+
+    def test_admin_log_serialization(self, check_baseline):
+        from src.infrastructure import serialization
+
+        now = datetime.now()
+        rows = [
+            {
+                "id": f"bench_txn_{i}",
+                "amount": Money(123456),
+                "userId": "bench_user",
+                "date": now,
+                "status": "APPROVED",
+                "violations": ["amount_threshold_exceeded"],
+                "riskLevel": "LOW_RISK",
+                "reviewedAt": None,
+            }
+            for i in range(1000)
+        ]
+        result = run_benchmark(
+            "serialization.admin_log_1000", lambda i: serialization.dumps(rows), 100, warmup=5
+        )
+        check_baseline(result)
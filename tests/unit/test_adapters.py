@@ -149,6 +149,32 @@ class TestMongoDBAdapter:
         
         mock_collection.find.assert_called_with({"user_id": "user_001"})
 
+    def test_list_evaluations_projects_filters_and_limits(self, sample_evaluation):
+        """Test: Listado liviano con proyección, filtros y límite en MongoDB."""
+        import asyncio
+        import mongomock
+        from src.adapters import MongoDBAdapter
+
+        with patch('src.adapters.MongoClient', mongomock.MongoClient):
+            adapter = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+        for index, status in enumerate(["PENDING_REVIEW", "APPROVED", "PENDING_REVIEW"]):
+            sample_evaluation.transaction_id = f"txn_{index}"
+            sample_evaluation.status = status
+            sample_evaluation.timestamp = datetime(2026, 1, 12, 10, index)
+            asyncio.run(adapter.save_evaluation(sample_evaluation))
+
+        rows = adapter.list_evaluations(
+            ("transaction_id", "amount", "location"),
+            user_id="user_001", status="PENDING_REVIEW", limit=1,
+        )
+
+        assert rows == [{
+            "transaction_id": "txn_2",
+            "amount": 2000.0,
+            "location": {"latitude": 4.7110, "longitude": -74.0721},
+        }]
+        assert adapter.list_evaluations(("transaction_id",), user_id="otro") == []
+
 
 class TestRedisAdapter:
     """Tests para el adaptador de Redis."""
@@ -0,0 +1,156 @@
+"""
+Tests unitarios para el control de admisión del gateway
+(infrastructure/admission.py).
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.infrastructure.admission import (
+    ADMIN,
+    AUTH,
+    USER,
+    SCORING,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    EndpointClass,
+    endpoint_class,
+)
+
+
+def _controller(scoring=1, admin=1, total=1, queue_size=10, deadline=1.0):
+    return AdmissionController(
+        [
+            EndpointClass(SCORING, scoring, deadline, priority=0),
+            EndpointClass(AUTH, 1, deadline, priority=1),
+            EndpointClass(ADMIN, admin, deadline, priority=2),
+        ],
+        total_concurrency=total,
+        queue_size=queue_size,
+    )
+
+
+class TestEndpointClass:
+    def test_routes_by_class(self):
+        assert endpoint_class("POST", "/api/v1/transaction/validate") == SCORING
+        assert endpoint_class("POST", "/transaction") == SCORING
+        assert endpoint_class("GET", "/transaction/txn_1/status") == SCORING
+        assert endpoint_class("POST", "/api/v1/auth/login") == AUTH
+        assert endpoint_class("GET", "/api/v1/admin/transactions/log") == ADMIN
+        assert endpoint_class("POST", "/api/v1/transaction/review/bulk") == ADMIN
+        assert endpoint_class("GET", "/api/v1/user/transactions/user_1") == USER
+
+    def test_streams_and_probes_are_not_limited(self):
+        assert endpoint_class("GET", "/api/v1/admin/stream") is None
+        assert endpoint_class("GET", "/api/v1/user/events/user_1") is None
+        assert endpoint_class("GET", "/health") is None
+        assert endpoint_class("GET", "/transactions") is None
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected_with_429(self):
+        controller = _controller(queue_size=1)
+        await controller.acquire(SCORING)
+        waiter = asyncio.ensure_future(controller.acquire(SCORING))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire(SCORING)
+
+        assert rejected.value.status_code == 429
+        controller.release(SCORING)
+        assert await waiter >= 0.0
+        assert controller.in_flight(SCORING) == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline_returns_503(self):
+        controller = _controller(deadline=0.01)
+        await controller.acquire(ADMIN)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire(ADMIN)
+
+        assert rejected.value.status_code == 503
+        assert controller.waiting(ADMIN) == 0
+        controller.release(ADMIN)
+        assert controller.in_flight(ADMIN) == 0
+
+    @pytest.mark.asyncio
+    async def test_scoring_is_served_before_admin(self):
+        controller = _controller(total=1)
+        await controller.acquire(SCORING)
+        admitted = []
+
+        async def request(name):
+            await controller.acquire(name)
+            admitted.append(name)
+
+        admin = asyncio.ensure_future(request(ADMIN))
+        await asyncio.sleep(0)
+        scoring = asyncio.ensure_future(request(SCORING))
+        await asyncio.sleep(0)
+
+        controller.release(SCORING)
+        await scoring
+        controller.release(SCORING)
+        await admin
+
+        assert admitted == [SCORING, ADMIN]
+
+    @pytest.mark.asyncio
+    async def test_blocked_class_does_not_hold_back_others(self):
+        controller = _controller(scoring=1, total=3)
+        await controller.acquire(SCORING)
+        waiter = asyncio.ensure_future(controller.acquire(SCORING))
+        await asyncio.sleep(0)
+
+        assert await controller.acquire(ADMIN) == 0.0
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert controller.waiting(SCORING) == 0
+
+
+class TestAdmissionMiddleware:
+    def test_rejection_carries_retry_after(self):
+        app = FastAPI()
+
+        @app.post("/api/v1/transaction/validate")
+        async def validate():
+            return {"status": "APPROVED"}
+
+        @app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+
+        controller = _controller(scoring=0, queue_size=0)
+        app.add_middleware(AdmissionMiddleware, controller=controller)
+        client = TestClient(app)
+
+        response = client.post("/api/v1/transaction/validate")
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert response.json() == {"detail": "Too many scoring requests queued"}
+        assert client.get("/health").status_code == 200
+
+    def test_slot_is_released_after_the_response(self):
+        app = FastAPI()
+
+        @app.post("/api/v1/transaction/validate")
+        async def validate():
+            return {"status": "APPROVED"}
+
+        controller = _controller()
+        app.add_middleware(AdmissionMiddleware, controller=controller)
+        client = TestClient(app)
+
+        assert [client.post("/api/v1/transaction/validate").status_code for _ in range(3)] == [200, 200, 200]
+        assert controller.in_flight(SCORING) == 0
@@ -0,0 +1,160 @@
+"""
+Tests unitarios para el envío asíncrono: SubmitTransactionUseCase,
+RedisSubmissionRegistry, la reconexión de RabbitMQAdapter y los endpoints
+POST /transaction y GET /transaction/{id}/status.
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import pika
+from fakeredis import FakeServer, aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import RabbitMQAdapter, RedisSubmissionRegistry
+from src.application.use_cases import SubmitTransactionUseCase
+from src.domain.models import FraudEvaluation, Location, RiskLevel
+
+TRANSACTION = {
+    "id": "txn_001",
+    "amount": -250.0,
+    "user_id": "user_001",
+    "location": {"latitude": 4.711, "longitude": -74.0721},
+}
+
+
+@pytest.fixture
+def registry():
+    return RedisSubmissionRegistry(aioredis.FakeRedis(server=FakeServer(), decode_responses=True), ttl=60)
+
+
+class TestSubmitTransactionUseCase:
+    @pytest.mark.asyncio
+    async def test_publishes_once_per_transaction(self, registry):
+        publisher = Mock(publish_transaction_for_processing=AsyncMock())
+        use_case = SubmitTransactionUseCase(publisher, registry)
+
+        assert await use_case.execute(TRANSACTION)
+        assert not await use_case.execute(TRANSACTION)
+
+        publisher.publish_transaction_for_processing.assert_awaited_once_with(TRANSACTION)
+        assert await registry.is_pending("txn_001")
+
+    @pytest.mark.asyncio
+    async def test_invalid_transaction_is_not_published(self, registry):
+        publisher = Mock(publish_transaction_for_processing=AsyncMock())
+
+        with pytest.raises(ValueError):
+            await SubmitTransactionUseCase(publisher, registry).execute({**TRANSACTION, "location": {}})
+
+        publisher.publish_transaction_for_processing.assert_not_awaited()
+        assert not await registry.is_pending("txn_001")
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_releases_submission(self, registry):
+        publisher = Mock(publish_transaction_for_processing=AsyncMock(side_effect=ConnectionError("down")))
+
+        with pytest.raises(ConnectionError):
+            await SubmitTransactionUseCase(publisher, registry).execute(TRANSACTION)
+
+        assert not await registry.is_pending("txn_001")
+
+
+class TestRedisSubmissionRegistry:
+    @pytest.mark.asyncio
+    async def test_failed_submission_is_no_longer_pending(self, registry):
+        await registry.register("txn_001")
+        assert await registry.failure("txn_001") is None
+
+        await registry.fail("txn_001", "ValueError")
+
+        assert await registry.failure("txn_001") == "ValueError"
+        assert not await registry.is_pending("txn_001")
+        assert not await registry.register("txn_001")
+
+
+class TestRabbitMQReconnect:
+    @pytest.mark.asyncio
+    async def test_stale_connection_is_replaced(self):
+        stale, fresh = Mock(), Mock()
+        stale.basic_publish.side_effect = pika.exceptions.StreamLostError("lost")
+        connections = [Mock(is_closed=False, channel=Mock(return_value=channel)) for channel in (stale, fresh)]
+
+        with patch("src.adapters.pika.BlockingConnection", side_effect=connections):
+            adapter = RabbitMQAdapter("amqp://localhost:5672")
+            await adapter.publish_transaction_for_processing(TRANSACTION)
+
+        fresh.basic_publish.assert_called_once()
+        assert fresh.basic_publish.call_args.kwargs["routing_key"] == "transactions"
+
+
+class TestSubmissionEndpoints:
+    @pytest.fixture
+    def gateway(self):
+        from api_gateway import routes
+
+        server = self.server = FakeServer()
+        cache = Mock()
+        type(cache).redis = property(lambda _: aioredis.FakeRedis(server=server, decode_responses=True))
+        self.publisher = Mock(publish_transaction_for_processing=AsyncMock())
+        self.repository = Mock(get_evaluation_by_id=Mock(return_value=None))
+        routes.configure_dependencies(lambda: self.repository, lambda: cache, Mock(), Mock(), lambda: self.publisher)
+        app = FastAPI()
+        app.include_router(routes.router)
+        return TestClient(app)
+
+    def test_submit_queues_and_reports_processing(self, gateway):
+        response = gateway.post("/transaction", json={**TRANSACTION, "amount": 250.0, "transaction_type": "payment"})
+
+        assert response.status_code == 202
+        assert response.headers["location"] == "/transaction/txn_001/status"
+        assert response.json()["duplicate"] is False
+        published = self.publisher.publish_transaction_for_processing.await_args.args[0]
+        assert published["amount"] == -250.0
+
+        status = gateway.get("/transaction/txn_001/status")
+        assert status.json() == {"transaction_id": "txn_001", "state": "PROCESSING"}
+        assert status.headers["retry-after"] == "1"
+
+        assert gateway.post("/transaction", json={**TRANSACTION, "amount": 250.0}).json()["duplicate"] is True
+        self.publisher.publish_transaction_for_processing.assert_awaited_once()
+
+    def test_status_of_evaluated_transaction(self, gateway):
+        self.repository.get_evaluation_by_id.return_value = FraudEvaluation(
+            transaction_id="txn_001", user_id="user_001", risk_level=RiskLevel.HIGH_RISK,
+            reasons=["amount_threshold_exceeded", "location_change"], timestamp=datetime(2026, 1, 1, 12),
+            amount=Decimal("-2500"), location=Location(latitude=4.711, longitude=-74.0721),
+        )
+
+        body = gateway.get("/transaction/txn_001/status").json()
+
+        assert body["state"] == "EVALUATED"
+        assert (body["risk_level"], body["status"]) == ("HIGH_RISK", "REJECTED")
+
+    def test_status_of_dead_lettered_transaction(self, gateway):
+        gateway.post("/transaction", json={**TRANSACTION, "amount": 250.0})
+        registry = RedisSubmissionRegistry(aioredis.FakeRedis(server=self.server, decode_responses=True), ttl=60)
+
+        asyncio.run(registry.fail("txn_001", "ValueError"))
+
+        response = gateway.get("/transaction/txn_001/status")
+        assert response.json() == {"transaction_id": "txn_001", "state": "FAILED", "reason": "ValueError"}
+        assert "retry-after" not in response.headers
+
+    def test_unknown_transaction(self, gateway):
+        assert gateway.get("/transaction/txn_404/status").status_code == 404
+
+    def test_queue_down_returns_503(self, gateway):
+        self.publisher.publish_transaction_for_processing.side_effect = pika.exceptions.AMQPConnectionError()
+
+        response = gateway.post("/transaction", json={**TRANSACTION, "amount": 250.0})
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
@@ -0,0 +1,199 @@
+"""
+Tests unitarios para la revisión masiva: bulk_write condicional en
+MongoDBAdapter, BulkReviewTransactionsUseCase, el lote de eventos de
+RedisEvaluationEventPublisher y POST /api/v1/transaction/review/bulk.
+"""
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import mongomock
+from fakeredis import FakeServer, FakeStrictRedis, aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import (
+    MongoDBAdapter,
+    RedisDashboardCounters,
+    RedisEvaluationEventPublisher,
+    RedisReviewQueue,
+    dashboard_hour,
+)
+from src.application.use_cases import BulkReviewTransactionsUseCase
+from src.domain.models import FraudEvaluation, Location, RiskLevel
+from src.infrastructure.event_stream import ADMIN_CHANNEL, user_channel
+
+
+def _evaluation(transaction_id, user_id="user_001"):
+    return FraudEvaluation(
+        transaction_id=transaction_id,
+        user_id=user_id,
+        risk_level=RiskLevel.MEDIUM_RISK,
+        reasons=["amount_threshold_exceeded"],
+        timestamp=datetime.now(),
+        amount=Decimal("1500.00"),
+        location=Location(latitude=4.711, longitude=-74.0721),
+    )
+
+
+@pytest.fixture
+def repository():
+    with patch("src.adapters.MongoClient", mongomock.MongoClient):
+        repository = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+
+    async def seed():
+        for transaction_id in ("txn_001", "txn_002", "txn_003"):
+            await repository.save_evaluation(_evaluation(transaction_id))
+
+    asyncio.run(seed())
+    approved = repository.get_evaluation_by_id("txn_003")
+    approved.apply_manual_decision("APPROVED", "analyst_b")
+    repository.update_evaluation(approved)
+    return repository
+
+
+class TestApplyManualDecisions:
+    def test_only_pending_rows_move(self, repository):
+        evaluations = repository.get_evaluations_by_ids(["txn_001", "txn_003", "txn_404"])
+        for evaluation in evaluations:
+            evaluation.apply_manual_decision("REJECTED", "analyst_a")
+
+        applied = repository.apply_manual_decisions(evaluations)
+
+        assert applied == {"txn_001"}
+        assert repository.get_evaluation_by_id("txn_001").status == "REJECTED"
+        untouched = repository.get_evaluation_by_id("txn_003")
+        assert (untouched.status, untouched.reviewed_by) == ("APPROVED", "analyst_b")
+
+    def test_empty_batch_skips_database(self, repository):
+        assert repository.apply_manual_decisions([]) == set()
+
+
+class TestBulkReviewUseCase:
+    def test_outcomes_in_input_order(self, repository):
+        events = Mock()
+        use_case = BulkReviewTransactionsUseCase(repository, events=events)
+
+        results = use_case.execute([
+            {"transaction_id": "txn_001", "decision": "APPROVED"},
+            {"transaction_id": "txn_002", "decision": "MAYBE"},
+            {"transaction_id": "txn_001", "decision": "REJECTED"},
+            {"transaction_id": "txn_003", "decision": "REJECTED"},
+            {"transaction_id": "txn_404", "decision": "REJECTED"},
+        ], "analyst_a")
+
+        assert [(r["transaction_id"], r["outcome"], r["status"]) for r in results] == [
+            ("txn_001", "applied", "APPROVED"),
+            ("txn_002", "invalid", None),
+            ("txn_001", "duplicate", None),
+            ("txn_003", "not_pending", "APPROVED"),
+            ("txn_404", "not_found", None),
+        ]
+        assert repository.get_evaluation_by_id("txn_002").status == "PENDING_REVIEW"
+        (changes,), _ = events.publish_status_changes.call_args
+        assert [(e.transaction_id, previous) for e, previous in changes] == [("txn_001", "PENDING_REVIEW")]
+
+    def test_row_decided_concurrently_is_not_overwritten(self, repository):
+        stale = repository.get_evaluations_by_ids(["txn_001"])
+        racer = repository.get_evaluation_by_id("txn_001")
+        racer.apply_manual_decision("APPROVED", "analyst_b")
+        repository.update_evaluation(racer)
+        repository.get_evaluations_by_ids = Mock(return_value=stale)
+
+        results = BulkReviewTransactionsUseCase(repository).execute(
+            [{"transaction_id": "txn_001", "decision": "REJECTED"}], "analyst_a"
+        )
+
+        assert results[0]["outcome"] == "not_pending"
+        assert repository.get_evaluation_by_id("txn_001").reviewed_by == "analyst_b"
+
+    def test_empty_analyst_rejected(self, repository):
+        with pytest.raises(ValueError):
+            BulkReviewTransactionsUseCase(repository).execute([], " ")
+
+
+class TestBatchEvents:
+    @pytest.mark.asyncio
+    async def test_one_admin_event_with_aggregated_deltas(self):
+        server = FakeServer()
+        publisher = RedisEvaluationEventPublisher(FakeStrictRedis(server=server, decode_responses=True))
+        pubsub = FakeStrictRedis(server=server, decode_responses=True).pubsub()
+        pubsub.subscribe(ADMIN_CHANNEL, user_channel("user_001"))
+        pubsub.get_message(timeout=1)
+        pubsub.get_message(timeout=1)
+        changes = []
+        for transaction_id, decision in (("txn_001", "APPROVED"), ("txn_002", "REJECTED"), ("txn_003", "REJECTED")):
+            evaluation = _evaluation(transaction_id)
+            evaluation.apply_manual_decision(decision, "analyst_a")
+            changes.append((evaluation, "PENDING_REVIEW"))
+
+        publisher.publish_status_changes(changes)
+
+        messages = [pubsub.get_message(timeout=1) for _ in range(4)]
+        assert [m["channel"] for m in messages] == [user_channel("user_001")] * 3 + [ADMIN_CHANNEL]
+        event = json.loads(messages[-1]["data"])
+        hour = dashboard_hour(changes[0][0].timestamp)
+        assert event["type"] == "status_changes" and event["seq"] == 1
+        assert event["counters"] == {"status:PENDING_REVIEW": -3, "status:APPROVED": 1, "status:REJECTED": 2}
+        assert event["hours"] == {hour: {"PENDING_REVIEW": -3, "APPROVED": 1, "REJECTED": 2}}
+        assert [row["transaction_id"] for row in event["rows"]] == ["txn_001", "txn_002", "txn_003"]
+        snapshot = await RedisDashboardCounters(aioredis.FakeRedis(server=server, decode_responses=True)).read()
+        assert snapshot["hourly"][hour]["REJECTED"] == 2
+
+
+class TestBulkReviewEndpoint:
+    def test_applies_and_releases_queue_tasks(self, repository):
+        from api_gateway import routes
+
+        server = FakeServer()
+        cache = Mock()
+        type(cache).redis = property(lambda _: aioredis.FakeRedis(server=server, decode_responses=True))
+        routes.configure_dependencies(lambda: repository, lambda: cache, Mock(), Mock())
+        routes.configure_event_stream(routes.NullEvaluationEventPublisher, None)
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+
+        async def seed():
+            queue = RedisReviewQueue(cache.redis)
+            for transaction_id in ("txn_001", "txn_002"):
+                await queue.enqueue({"transaction_id": transaction_id, "risk_level": "MEDIUM_RISK", "amount": 1500.0})
+
+        asyncio.run(seed())
+        client = TestClient(app)
+
+        response = client.post(
+            "/api/v1/transaction/review/bulk",
+            json={"decisions": [
+                {"transactionId": "txn_001", "decision": "APPROVED"},
+                {"transactionId": "txn_003", "decision": "REJECTED"},
+            ]},
+            headers={"X-Analyst-ID": "analyst_a"},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["reviewed"] == 1
+        assert [r["outcome"] for r in body["results"]] == ["applied", "not_pending"]
+        assert client.get("/api/v1/admin/review-queue").json() == {"pending": 1}
+
+    def test_batch_size_is_bounded(self):
+        from api_gateway import routes
+
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+        decisions = [
+            {"transactionId": f"txn_{n}", "decision": "APPROVED"} for n in range(routes.BULK_REVIEW_MAX_ITEMS + 1)
+        ]
+
+        response = TestClient(app).post(
+            "/api/v1/transaction/review/bulk", json={"decisions": decisions}, headers={"X-Analyst-ID": "analyst_a"}
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,213 @@
+"""
+Tests unitarios para los circuit breakers (infrastructure/circuit_breaker.py)
+y la evaluación degradada: políticas de fallback por estrategia y caché caída.
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import redis
+from fakeredis import FakeServer, aioredis
+
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.models import Location, Transaction
+from src.domain.strategies.device_validation import DeviceValidationStrategy
+from src.infrastructure.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    guard_client,
+    parse_fallback_policies,
+)
+
+TRANSACTION = {
+    "id": "txn_001",
+    "amount": 100.0,
+    "user_id": "user_001",
+    "location": {"latitude": 4.711, "longitude": -74.0721},
+    "device_id": "device_001",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "redis", failure_threshold=2, reset_timeout=5.0,
+        failures=(redis.ConnectionError, redis.TimeoutError), clock=clock,
+    )
+
+
+def _down():
+    raise redis.ConnectionError("connection refused")
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            with pytest.raises(redis.ConnectionError):
+                breaker.call(_down)
+
+        assert breaker.state == OPEN
+        dependency = Mock()
+        with pytest.raises(CircuitOpenError):
+            breaker.call(dependency)
+        dependency.assert_not_called()
+
+    def test_other_errors_mean_the_dependency_answered(self, breaker):
+        for _ in range(3):
+            with pytest.raises(redis.ResponseError):
+                breaker.call(Mock(side_effect=redis.ResponseError("WRONGTYPE")))
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_lets_a_single_probe_through(self, breaker, clock):
+        for _ in range(2):
+            with pytest.raises(redis.ConnectionError):
+                breaker.call(_down)
+        clock.now = 5.0
+        assert breaker.state == HALF_OPEN
+
+        breaker.before_call()  # la prueba en curso
+        with pytest.raises(CircuitOpenError):
+            breaker.call(Mock())
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.call(Mock(return_value="PONG")) == "PONG"
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        for _ in range(2):
+            with pytest.raises(redis.ConnectionError):
+                breaker.call(_down)
+        clock.now = 5.0
+
+        with pytest.raises(redis.ConnectionError):
+            breaker.call(_down)
+
+        assert breaker.state == OPEN
+        clock.now = 9.0
+        assert breaker.state == OPEN
+
+    @pytest.mark.asyncio
+    async def test_guarded_redis_asyncio_client(self, breaker):
+        # Los comandos de redis.asyncio no son async def: devuelven la corrutina
+        # y el ConnectionError aparece recién al esperarla
+        server = FakeServer()
+        server.connected = False
+        client = guard_client(aioredis.FakeRedis(server=server), breaker)
+        for _ in range(2):
+            with pytest.raises(redis.ConnectionError):
+                await client.get("key")
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            await client.hgetall("key")
+
+    @pytest.mark.asyncio
+    async def test_guarded_redis_asyncio_pipeline(self, breaker):
+        server = FakeServer()
+        client = guard_client(aioredis.FakeRedis(server=server, decode_responses=True), breaker)
+        breaker.record_failure()
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set("key", "1")
+            pipe.incr("key")
+            assert await pipe.execute() == [True, 2]
+        assert await client.get("key") == "2"
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_guarded_async_port(self, breaker):
+        class Port:
+            async def save(self):
+                raise redis.TimeoutError("timeout")
+
+        client = guard_client(Port(), breaker)
+        for _ in range(2):
+            with pytest.raises(redis.TimeoutError):
+                await client.save()
+
+        with pytest.raises(CircuitOpenError):
+            await client.save()
+
+    def test_parse_fallback_policies(self):
+        assert parse_fallback_policies("") == {}
+        assert parse_fallback_policies("UnusualTimeStrategy=ignore, DeviceValidationStrategy=FLAG") == {
+            "UnusualTimeStrategy": "ignore", "DeviceValidationStrategy": "flag",
+        }
+        with pytest.raises(ValueError):
+            parse_fallback_policies("DeviceValidationStrategy=skip")
+
+
+class TestDegradedEvaluation:
+    @pytest.fixture
+    def dependencies(self):
+        repository = Mock(save_evaluation=AsyncMock())
+        publisher = Mock(publish_for_manual_review=AsyncMock())
+        cache = Mock(
+            get_user_location=AsyncMock(side_effect=CircuitOpenError("redis circuit is open")),
+            set_user_location=AsyncMock(side_effect=CircuitOpenError("redis circuit is open")),
+        )
+        return repository, publisher, cache
+
+    def _device_strategy(self, breaker):
+        client = Mock(sismember=Mock(side_effect=redis.ConnectionError("down")))
+        return DeviceValidationStrategy(redis_client=guard_client(client, breaker)), client
+
+    def test_open_circuit_skips_the_network(self, breaker):
+        strategy, client = self._device_strategy(breaker)
+        transaction = Transaction(
+            id="txn_001", amount=Decimal("100"), user_id="user_001",
+            location=Location(latitude=4.711, longitude=-74.0721), timestamp=datetime.now(),
+            device_id="device_001",
+        )
+
+        results = [strategy.evaluate(transaction) for _ in range(5)]
+
+        assert all(result.fallback for result in results)
+        assert client.sismember.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_flag_policy_counts_fallback_as_violation(self, dependencies, breaker):
+        strategy, _ = self._device_strategy(breaker)
+
+        result = await EvaluateTransactionUseCase(*dependencies, [strategy]).execute(TRANSACTION)
+
+        assert result["risk_level"] == "MEDIUM_RISK"
+        assert result["reasons"] == ["Error en validación de dispositivo"]
+
+    @pytest.mark.asyncio
+    async def test_ignore_policy_drops_fallback_reasons(self, dependencies, breaker):
+        strategy, _ = self._device_strategy(breaker)
+        use_case = EvaluateTransactionUseCase(
+            *dependencies, [strategy], fallback_policies={"DeviceValidationStrategy": "ignore"},
+        )
+
+        result = await use_case.execute(TRANSACTION)
+
+        assert (result["risk_level"], result["reasons"]) == ("LOW_RISK", [])
+        dependencies[0].save_evaluation.assert_awaited_once()
+
+    def test_unknown_policy_is_rejected(self, dependencies):
+        with pytest.raises(ValueError):
+            EvaluateTransactionUseCase(*dependencies, [], fallback_policies={"DeviceValidationStrategy": "skip"})
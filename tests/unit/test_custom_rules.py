@@ -0,0 +1,213 @@
+"""
+Tests unitarios para el motor de reglas personalizadas (domain/rules.py,
+CustomRuleStrategy) y su carga en el gateway.
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import mongomock
+from fakeredis import aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import MongoDBAdapter
+from src.domain.models import Location, RiskLevel, Transaction
+from src.domain.money import Money
+from src.domain.rules import RuleCompiler, RuleDefinitionError, compile_condition, compile_rule
+from src.domain.strategies.custom_rule import CustomRuleStrategy, build_custom_strategies
+
+
+def _transaction(amount="1500.00", hour=14, **overrides):
+    fields = {
+        "id": "txn_001",
+        "amount": Money.parse(amount),
+        "user_id": "user_001",
+        "location": Location(latitude=4.7110, longitude=-74.0721),
+        "timestamp": datetime(2026, 3, 10, hour, 30),
+        "device_id": "device_a",
+        "transaction_type": "transfer",
+    }
+    fields.update(overrides)
+    return Transaction(**fields)
+
+
+def _rule(rule_id="rule_big_transfer", updated_at=datetime(2026, 1, 1), **parameters):
+    parameters.setdefault("condition", {"field": "amount", "op": "gt", "value": 1000})
+    return {
+        "id": rule_id,
+        "name": "Big transfer",
+        "type": "custom",
+        "parameters": parameters,
+        "order": 10,
+        "updated_at": updated_at,
+    }
+
+
+class TestCompileCondition:
+    @pytest.mark.parametrize("condition, expected", [
+        ({"field": "amount", "op": "gt", "value": 1000}, True),
+        ({"field": "amount", "op": "lte", "value": "1500.00"}, True),
+        ({"field": "amount", "op": "eq", "value": 1500.001}, True),
+        ({"field": "hour", "op": "between", "value": [9, 17]}, True),
+        ({"field": "transaction_type", "op": "in", "value": ["payment", "recharge"]}, False),
+        ({"field": "user_id", "op": "not_in", "value": ["user_999"]}, True),
+        ({"all": [{"field": "amount", "op": "gt", "value": 1000},
+                  {"field": "transaction_type", "op": "eq", "value": "deposit"}]}, False),
+        ({"any": [{"field": "amount", "op": "gt", "value": 1000},
+                  {"field": "transaction_type", "op": "eq", "value": "deposit"}]}, True),
+        ({"not": {"field": "device_id", "op": "eq", "value": "device_a"}}, False),
+    ])
+    def test_condition(self, condition, expected):
+        assert compile_condition(condition)(_transaction()) is expected
+
+    def test_amount_uses_absolute_value(self):
+        predicate = compile_condition({"field": "amount", "op": "gt", "value": 1000})
+        assert predicate(_transaction(amount="-1500.00"))
+
+    def test_missing_field_never_matches(self):
+        predicate = compile_condition({"field": "device_id", "op": "ne", "value": "device_a"})
+        assert not predicate(_transaction(device_id=None))
+
+    @pytest.mark.parametrize("condition", [
+        {"field": "ip_address", "op": "eq", "value": "1.1.1.1"},
+        {"field": "amount", "op": "matches", "value": 1},
+        {"field": "amount", "op": "gt", "value": "mucho"},
+        {"field": "hour", "op": "between", "value": [17, 9]},
+        {"field": "user_id", "op": "in", "value": []},
+        {"all": []},
+        "amount > 1000",
+    ])
+    def test_invalid_condition(self, condition):
+        with pytest.raises(RuleDefinitionError):
+            compile_condition(condition)
+
+
+class TestCompileRule:
+    def test_amount_threshold_type(self):
+        rule = compile_rule({"id": "r1", "name": "Umbral", "type": "amount_threshold", "parameters": {"threshold": 1000}})
+        assert rule.predicate(_transaction())
+        assert rule.reason == "custom_rule:Umbral"
+
+    def test_time_based_window_crosses_midnight(self):
+        rule = compile_rule({"id": "r2", "type": "time_based", "parameters": {"start_hour": 22, "end_hour": 5}})
+        assert rule.predicate(_transaction(hour=23))
+        assert rule.predicate(_transaction(hour=3))
+        assert not rule.predicate(_transaction(hour=14))
+
+    def test_stateful_types_are_rejected(self):
+        with pytest.raises(RuleDefinitionError):
+            compile_rule({"id": "r3", "type": "velocity", "parameters": {"max": 3}})
+
+    def test_custom_reason(self):
+        assert compile_rule(_rule(reason="big_transfer")).reason == "big_transfer"
+
+
+class TestRuleCompiler:
+    def test_rule_is_compiled_once_per_version(self):
+        compiler = RuleCompiler()
+        first = compiler.get(_rule())
+
+        assert compiler.get(_rule()) is first
+        updated = compiler.get(_rule(updated_at=datetime(2026, 2, 1), condition={"field": "amount", "op": "gt", "value": 5000}))
+        assert updated is not first
+        assert not updated.predicate(_transaction())
+        assert len(compiler) == 1
+
+    def test_broken_rules_are_skipped(self):
+        broken = _rule("rule_broken", condition={"field": "nope", "op": "eq", "value": 1})
+        second = {**_rule("rule_second"), "order": 1}
+
+        strategies = build_custom_strategies([_rule(), broken, second], RuleCompiler())
+
+        assert [strategy.rule.rule_id for strategy in strategies] == ["rule_second", "rule_big_transfer"]
+
+
+class TestCustomRuleStrategy:
+    def test_hit_and_miss(self):
+        strategy = CustomRuleStrategy(compile_rule(_rule(reason="big_transfer")))
+
+        hit = strategy.evaluate(_transaction())
+        miss = strategy.evaluate(_transaction(amount="10.00"))
+
+        assert hit["risk_level"] == RiskLevel.HIGH_RISK
+        assert hit["reasons"] == ["big_transfer"]
+        assert miss["reasons"] == []
+
+    def test_reasons_are_not_shared_between_results(self):
+        strategy = CustomRuleStrategy(compile_rule(_rule()))
+        strategy.evaluate(_transaction())["reasons"].append("mutated")
+        assert strategy.evaluate(_transaction())["reasons"] == ["custom_rule:Big transfer"]
+
+    def test_none_transaction(self):
+        with pytest.raises(ValueError):
+            CustomRuleStrategy(compile_rule(_rule())).evaluate(None)
+
+
+class TestGatewayCustomRules:
+    """Las reglas creadas desde el panel se ejecutan en /transaction/validate"""
+
+    @pytest.fixture
+    def client(self):
+        from api_gateway import routes
+
+        with patch("src.adapters.MongoClient", mongomock.MongoClient):
+            repository = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+        repository.save_evaluation = AsyncMock()
+        cache = Mock(
+            redis=aioredis.FakeRedis(decode_responses=True),
+            redis_sync=Mock(),
+            get_threshold_config=AsyncMock(return_value=None),
+            get_user_location=AsyncMock(return_value=None),
+            set_user_location=AsyncMock(),
+        )
+        publisher = Mock(publish_for_manual_review=AsyncMock())
+        routes.configure_dependencies(lambda: repository, lambda: cache, Mock(), Mock(), lambda: publisher)
+
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+        return TestClient(app)
+
+    def test_invalid_rule_is_rejected(self, client):
+        response = client.post(
+            "/api/v1/admin/rules",
+            json={"name": "Rota", "type": "custom", "parameters": {"condition": {"field": "nope"}}},
+            headers={"X-Analyst-ID": "analyst_001"},
+        )
+        assert response.status_code == 422
+
+    def test_created_rule_is_evaluated(self, client):
+        created = client.post(
+            "/api/v1/admin/rules",
+            json={
+                "name": "Depósitos grandes",
+                "type": "custom",
+                "parameters": {
+                    "condition": {"all": [
+                        {"field": "transaction_type", "op": "eq", "value": "deposit"},
+                        {"field": "amount", "op": "gte", "value": 900},
+                    ]},
+                    "reason": "large_deposit",
+                },
+            },
+            headers={"X-Analyst-ID": "analyst_001"},
+        )
+        assert created.status_code == 200
+
+        with patch("src.domain.strategies.unusual_time.UnusualTimeStrategy.evaluate",
+                   return_value={"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}), \
+             patch("src.domain.strategies.device_validation.DeviceValidationStrategy.evaluate",
+                   return_value={"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}), \
+             patch("src.domain.strategies.rapid_transaction.RapidTransactionStrategy.evaluate",
+                   return_value={"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}):
+            response = client.post(
+                "/api/v1/transaction/validate",
+                json={"amount": 950, "userId": "user_001", "location": "Bogota", "transactionType": "deposit"},
+            )
+
+        assert response.status_code == 200, response.text
+        assert "large_deposit" in str(response.json())
@@ -0,0 +1,197 @@
+"""
+Tests unitarios para el feed en vivo del dashboard admin: contadores en
+Redis (RedisEvaluationEventPublisher, RedisDashboardCounters), conteos en
+MongoDB y el protocolo snapshot + deltas de /api/v1/admin/stream.
+"""
+import json
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import mongomock
+from fakeredis import FakeServer, FakeStrictRedis, aioredis
+
+from src.adapters import (
+    MongoDBAdapter,
+    RedisDashboardCounters,
+    RedisEvaluationEventPublisher,
+    dashboard_hour,
+)
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.models import FraudEvaluation, Location, RiskLevel
+from src.infrastructure.event_stream import ADMIN_CHANNEL, EventHub
+
+
+def _evaluation(transaction_id="txn_001", risk_level=RiskLevel.MEDIUM_RISK, timestamp=None):
+    return FraudEvaluation(
+        transaction_id=transaction_id,
+        user_id="user_001",
+        risk_level=risk_level,
+        reasons=["amount_threshold_exceeded"] if risk_level != RiskLevel.LOW_RISK else [],
+        timestamp=timestamp or datetime.now(),
+        amount=Decimal("1500.00"),
+        location=Location(latitude=4.711, longitude=-74.0721),
+    )
+
+
+@pytest.fixture
+def redis_server():
+    return FakeServer()
+
+
+def _publisher(server):
+    return RedisEvaluationEventPublisher(
+        FakeStrictRedis(server=server, decode_responses=True),
+        aioredis.FakeRedis(server=server, decode_responses=True),
+    )
+
+
+class TestDashboardCounters:
+    @pytest.mark.asyncio
+    async def test_evaluations_and_reviews_move_counters(self, redis_server):
+        publisher = _publisher(redis_server)
+        counters = RedisDashboardCounters(aioredis.FakeRedis(server=redis_server, decode_responses=True))
+        pending = _evaluation()
+
+        await publisher.publish_evaluation(pending)
+        await publisher.publish_evaluation(_evaluation("txn_002", RiskLevel.LOW_RISK))
+        pending.apply_manual_decision("REJECTED", "analyst_001")
+        publisher.publish_status_change(pending, "PENDING_REVIEW")
+
+        snapshot = await counters.read()
+        assert snapshot["seq"] == 3
+        assert not snapshot["seeded"]
+        assert snapshot["counters"] == {
+            "total": 2, "status:PENDING_REVIEW": 0, "status:REJECTED": 1, "status:APPROVED": 1,
+            "risk:MEDIUM_RISK": 1, "risk:LOW_RISK": 1,
+        }
+        assert snapshot["hourly"] == {dashboard_hour(pending.timestamp): {"PENDING_REVIEW": 0, "APPROVED": 1, "REJECTED": 1}}
+
+    @pytest.mark.asyncio
+    async def test_admin_event_carries_seq_and_deltas(self, redis_server):
+        publisher = _publisher(redis_server)
+        pubsub = FakeStrictRedis(server=redis_server, decode_responses=True).pubsub()
+        pubsub.subscribe(ADMIN_CHANNEL)
+        pubsub.get_message(timeout=1)  # Confirmación de la suscripción
+
+        await publisher.publish_evaluation(_evaluation())
+        event = json.loads(pubsub.get_message(timeout=1)["data"])
+
+        assert event["type"] == "evaluation"
+        assert event["seq"] == 1
+        assert event["counters"] == {"total": 1, "status:PENDING_REVIEW": 1, "risk:MEDIUM_RISK": 1}
+        assert event["hourly"] == {"PENDING_REVIEW": 1}
+        assert event["row"]["transaction_id"] == "txn_001"
+        assert event["row"]["location"] == {"latitude": 4.711, "longitude": -74.0721}
+
+    @pytest.mark.asyncio
+    async def test_old_evaluations_do_not_touch_hourly_buckets(self, redis_server):
+        publisher = _publisher(redis_server)
+        old = _evaluation(timestamp=datetime.now() - timedelta(days=3))
+        old.apply_manual_decision("APPROVED", "analyst_001")
+
+        publisher.publish_status_change(old, "PENDING_REVIEW")
+
+        snapshot = await RedisDashboardCounters(aioredis.FakeRedis(server=redis_server, decode_responses=True)).read()
+        assert snapshot["hourly"] == {}
+        assert snapshot["counters"] == {"status:PENDING_REVIEW": -1, "status:APPROVED": 1}
+
+    @pytest.mark.asyncio
+    async def test_seed_from_mongodb_keeps_seq(self, redis_server):
+        with patch("src.adapters.MongoClient", mongomock.MongoClient):
+            repository = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+        now = datetime.now().replace(minute=30)
+        for n, (risk_level, timestamp) in enumerate([
+            (RiskLevel.LOW_RISK, now), (RiskLevel.HIGH_RISK, now), (RiskLevel.MEDIUM_RISK, now - timedelta(days=2)),
+        ]):
+            await repository.save_evaluation(_evaluation(f"txn_{n}", risk_level, timestamp))
+        await _publisher(redis_server).publish_evaluation(_evaluation("txn_new"))
+        counters = RedisDashboardCounters(aioredis.FakeRedis(server=redis_server, decode_responses=True))
+
+        since = now.replace(minute=0) - timedelta(hours=23)
+        await counters.seed(repository.count_evaluations(), repository.count_evaluations(since, by_hour=True), now=now)
+        snapshot = await counters.read(now=now)
+
+        assert snapshot["seeded"] and snapshot["seq"] == 1
+        assert snapshot["counters"]["total"] == 3
+        assert snapshot["counters"]["status:PENDING_REVIEW"] == 1
+        assert snapshot["counters"]["risk:HIGH_RISK"] == 1
+        assert snapshot["hourly"] == {dashboard_hour(now): {"APPROVED": 1, "REJECTED": 1}}
+
+
+class TestEvaluatePublishes:
+    @pytest.mark.asyncio
+    async def test_saved_evaluation_is_published(self):
+        events = Mock(publish_evaluation=AsyncMock())
+        use_case = EvaluateTransactionUseCase(
+            Mock(save_evaluation=AsyncMock()),
+            Mock(publish_for_manual_review=AsyncMock()),
+            Mock(get_user_location=AsyncMock(return_value=None), set_user_location=AsyncMock()),
+            [],
+            events=events,
+        )
+
+        await use_case.execute({"id": "txn_001", "amount": 10, "user_id": "user_001",
+                                "location": {"latitude": 4.711, "longitude": -74.0721}})
+
+        evaluation = events.publish_evaluation.await_args.args[0]
+        assert evaluation.transaction_id == "txn_001"
+
+
+class TestAdminStream:
+    @pytest.mark.asyncio
+    async def test_snapshot_then_newer_deltas_only(self):
+        from api_gateway import routes
+
+        hub = EventHub(Mock())
+        hub._listener = Mock(done=Mock(return_value=False))
+        subscription = hub.subscribe(ADMIN_CHANNEL)
+        snapshot = {"type": "snapshot", "seq": 5, "counters": {"total": 5}, "hourly": {}, "recent": []}
+        row = RedisEvaluationEventPublisher.log_row(_evaluation())
+        for seq in (5, 6):
+            hub.dispatch(ADMIN_CHANNEL, json.dumps({
+                "type": "evaluation", "seq": seq, "counters": {"total": 1}, "hour": None, "hourly": {},
+                "row": {**row, "timestamp": row["timestamp"].isoformat(), "amount": 1500.0},
+            }))
+        request = Mock(is_disconnected=AsyncMock(side_effect=[False, False, False, True]))
+
+        chunks = [chunk async for chunk in routes._admin_event_stream(request, subscription, snapshot, heartbeat=0.01)]
+
+        assert chunks[0] == "retry: 5000\n\n"
+        assert chunks[1].startswith("event: snapshot\n")
+        assert chunks[2].startswith("event: evaluation\n")
+        delta = json.loads(chunks[2].split("data: ", 1)[1])
+        assert delta["seq"] == 6
+        assert delta["row"]["status"] == "SUSPICIOUS"
+        assert delta["row"]["location"] == "4.711, -74.0721"
+        assert chunks[3:] == [": keepalive\n\n"]
+        assert hub.connections == 0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_seeds_once(self):
+        from api_gateway import routes
+
+        counters = Mock(
+            read=AsyncMock(side_effect=[
+                {"seq": 0, "seeded": False, "counters": {}, "hourly": {}},
+                {"seq": 0, "seeded": True, "counters": {"total": 1}, "hourly": {}},
+            ]),
+            seed=AsyncMock(),
+        )
+        repository = Mock(
+            count_evaluations=Mock(return_value=[]),
+            list_evaluations=Mock(return_value=[RedisEvaluationEventPublisher.log_row(_evaluation())]),
+        )
+        routes.configure_event_stream(routes.NullEvaluationEventPublisher, None, counters)
+
+        snapshot = await routes._dashboard_snapshot(repository)
+
+        counters.seed.assert_awaited_once()
+        assert repository.count_evaluations.call_count == 2
+        assert snapshot["counters"] == {"total": 1}
+        assert [row["id"] for row in snapshot["recent"]] == ["txn_001"]
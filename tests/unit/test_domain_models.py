@@ -284,3 +284,59 @@ class TestRiskLevel:
         assert RiskLevel.LOW_RISK.value < RiskLevel.MEDIUM_RISK.value
         assert RiskLevel.MEDIUM_RISK.value < RiskLevel.HIGH_RISK.value
         assert RiskLevel.LOW_RISK.value < RiskLevel.HIGH_RISK.value
+
+
+class TestTrustedConstruction:
+    """Tests para from_trusted (lectura de filas ya validadas) y __slots__."""
+
+    def test_models_are_slotted(self):
+        """Test: Las entidades no tienen __dict__ por instancia."""
+        location = Location(latitude=4.7110, longitude=-74.0721)
+        evaluation = FraudEvaluation(
+            transaction_id="txn_001",
+            user_id="user_001",
+            risk_level=RiskLevel.LOW_RISK,
+            reasons=[],
+            timestamp=datetime.now(),
+        )
+        assert not hasattr(location, "__dict__")
+        assert not hasattr(evaluation, "__dict__")
+
+    def test_from_trusted_equals_validated_construction(self):
+        """Test: from_trusted produce la misma entidad que el constructor."""
+        timestamp = datetime.now()
+        kwargs = dict(
+            transaction_id="txn_001",
+            user_id="user_001",
+            risk_level=RiskLevel.MEDIUM_RISK,
+            reasons=["amount_threshold_exceeded"],
+            timestamp=timestamp,
+            amount=Decimal("2000.00"),
+            status="PENDING_REVIEW",
+        )
+        assert FraudEvaluation.from_trusted(**kwargs) == FraudEvaluation(**kwargs)
+
+    def test_from_trusted_skips_validation(self):
+        """Test: from_trusted no re-ejecuta __post_init__."""
+        evaluation = FraudEvaluation.from_trusted(
+            transaction_id="txn_001",
+            user_id="user_001",
+            risk_level=RiskLevel.HIGH_RISK,
+            reasons=[],
+            timestamp=datetime.now(),
+            status="APPROVED",
+        )
+        assert evaluation.status == "APPROVED"
+        assert evaluation.location is None
+        assert Location.from_trusted(latitude=4.7, longitude=-74.0) == Location(4.7, -74.0)
+
+    def test_from_trusted_missing_required_field_raises(self):
+        """Test: Un campo obligatorio ausente falla igual que el constructor."""
+        with pytest.raises(TypeError):
+            FraudEvaluation.from_trusted(transaction_id="txn_001")
+
+    def test_frozen_location_stays_immutable(self):
+        """Test: Location.from_trusted conserva la inmutabilidad."""
+        location = Location.from_trusted(latitude=4.7, longitude=-74.0)
+        with pytest.raises(Exception):
+            location.latitude = 0.0
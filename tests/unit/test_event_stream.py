@@ -0,0 +1,174 @@
+"""
+Tests unitarios para el canal push de estados (infrastructure/event_stream.py,
+RedisEvaluationEventPublisher y /api/v1/user/events/{user_id}).
+"""
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fakeredis import FakeServer, FakeStrictRedis, aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import RedisEvaluationEventPublisher
+from src.application.use_cases import ReviewTransactionUseCase
+from src.domain.models import FraudEvaluation, RiskLevel
+from src.infrastructure.event_stream import EventHub, format_sse, user_channel
+
+
+def _evaluation(**overrides):
+    fields = {
+        "transaction_id": "txn_001",
+        "user_id": "user_001",
+        "risk_level": RiskLevel.HIGH_RISK,
+        "reasons": ["amount_threshold_exceeded"],
+        "timestamp": datetime(2026, 1, 1, 12),
+        "amount": Decimal("2500.00"),
+    }
+    fields.update(overrides)
+    return FraudEvaluation(**fields)
+
+
+class TestEventHub:
+    @pytest.mark.asyncio
+    async def test_dispatch_only_reaches_channel_subscribers(self):
+        hub = EventHub(Mock())
+        hub._listener = Mock(done=Mock(return_value=False))  # Sin Redis
+        mine, other = hub.subscribe(user_channel("user_001")), hub.subscribe(user_channel("user_002"))
+
+        assert hub.dispatch(user_channel("user_001"), '{"a":1}') == 1
+        assert await mine.get(timeout=0.1) == '{"a":1}'
+        assert await other.get(timeout=0.01) is None
+
+        mine.close()
+        other.close()
+        assert hub.connections == 0
+        assert hub.dispatch(user_channel("user_001"), "{}") == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest_events(self):
+        hub = EventHub(Mock(), queue_size=2)
+        hub._listener = Mock(done=Mock(return_value=False))
+        subscription = hub.subscribe("events:user:u")
+
+        for n in range(3):
+            hub.dispatch("events:user:u", str(n))
+
+        assert [await subscription.get(0.1), await subscription.get(0.1)] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_redis_round_trip(self):
+        server = FakeServer()
+        hub = EventHub(aioredis.FakeRedis(server=server, decode_responses=True))
+        subscription = hub.subscribe(user_channel("user_001"))
+        publisher = RedisEvaluationEventPublisher(FakeStrictRedis(server=server, decode_responses=True))
+
+        try:
+            await asyncio.sleep(0.05)  # Deja que la tarea de escucha se suscriba
+            evaluation = _evaluation()
+            evaluation.apply_manual_decision("REJECTED", "analyst_001")
+            publisher.publish_status_change(evaluation)
+
+            event = json.loads(await subscription.get(timeout=1))
+        finally:
+            subscription.close()
+            await hub.close()
+
+        assert event["type"] == "transaction_status"
+        assert event["transaction_id"] == "txn_001"
+        assert event["status"] == "REJECTED"
+        assert event["risk_level"] == "HIGH_RISK"
+        assert event["amount"] == 2500.0
+        assert event["reviewed_by"] == "analyst_001"
+
+
+class TestPublisher:
+    def test_redis_errors_are_swallowed(self):
+        redis_client = Mock(publish=Mock(side_effect=ConnectionError("down")))
+        RedisEvaluationEventPublisher(redis_client).publish_status_change(_evaluation())
+        redis_client.publish.assert_called_once()
+
+    def test_review_notifies_user(self):
+        evaluation = _evaluation()
+        repository = Mock(get_evaluation_by_id=Mock(return_value=evaluation))
+        events = Mock()
+
+        ReviewTransactionUseCase(repository, events=events).execute("txn_001", "APPROVED", "analyst_001")
+
+        repository.update_evaluation.assert_called_once_with(evaluation)
+        events.publish_status_change.assert_called_once_with(evaluation, "REJECTED")
+
+
+class TestUserEventsEndpoint:
+    def test_format_sse(self):
+        assert format_sse(b'{"a":1}', event="transaction_status") == 'event: transaction_status\ndata: {"a":1}\n\n'
+        assert format_sse("{}") == "data: {}\n\n"
+
+    def test_unavailable_without_hub(self):
+        from api_gateway import routes
+
+        routes.configure_event_stream(routes.NullEvaluationEventPublisher, None)
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+
+        assert TestClient(app).get("/api/v1/user/events/user_001").status_code == 503
+
+    @pytest.fixture
+    def stream_client(self, monkeypatch):
+        from api_gateway import routes
+        from src.infrastructure.auth_service import JWTService
+
+        async def _one_event(request, subscription):
+            yield "retry: 5000\n\n"
+
+        jwt_service = JWTService("test-secret")
+        monkeypatch.setattr(routes, "_event_stream", _one_event)
+        routes.configure_event_stream(routes.NullEvaluationEventPublisher, Mock(), jwt_service_factory=lambda: jwt_service)
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+        yield TestClient(app), jwt_service.create_access_token({"sub": "user_001"})
+        routes.configure_event_stream(routes.NullEvaluationEventPublisher, None)
+
+    def test_stream_requires_token_of_the_same_user(self, stream_client):
+        client, token = stream_client
+
+        assert client.get("/api/v1/user/events/user_001").status_code == 401
+        assert client.get("/api/v1/user/events/user_001", params={"token": "forged"}).status_code == 401
+        assert client.get("/api/v1/user/events/user_002", params={"token": token}).status_code == 403
+
+    def test_stream_accepts_query_token_or_cookie(self, stream_client):
+        client, token = stream_client
+
+        response = client.get("/api/v1/user/events/user_001", params={"token": token})
+        assert response.status_code == 200
+        assert response.text == "retry: 5000\n\n"
+
+        client.cookies.set("access_token", token)
+        assert client.get("/api/v1/user/events/user_001").status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_events_and_heartbeats(self):
+        from api_gateway import routes
+
+        hub = EventHub(Mock())
+        hub._listener = Mock(done=Mock(return_value=False))
+        subscription = hub.subscribe(user_channel("user_001"))
+        request = Mock(is_disconnected=AsyncMock(side_effect=[False, False, True]))
+
+        stream = routes._event_stream(request, subscription, heartbeat=0.01)
+        hub.dispatch(user_channel("user_001"), '{"status":"APPROVED"}')
+        chunks = [chunk async for chunk in stream]
+
+        assert chunks == [
+            "retry: 5000\n\n",
+            'event: transaction_status\ndata: {"status":"APPROVED"}\n\n',
+            ": keepalive\n\n",
+        ]
+        assert hub.connections == 0
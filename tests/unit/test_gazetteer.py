@@ -0,0 +1,95 @@
+"""
+Tests unitarios para la resolución de ubicaciones (infrastructure/gazetteer.py)
+y su uso en /api/v1/transaction/validate.
+"""
+import pytest
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.infrastructure.gazetteer import (
+    Gazetteer,
+    default_gazetteer,
+    normalize,
+    resolve_location,
+)
+
+
+class TestNormalize:
+    @pytest.mark.parametrize("text, expected", [
+        ("Bogotá D.C.", "bogota dc"),
+        ("  SÃO   paulo ", "sao paulo"),
+        ("¿Medellín–Antioquia?", "medellin antioquia"),
+    ])
+    def test_normalize(self, text, expected):
+        assert normalize(text) == expected
+
+
+class TestResolveLocation:
+    def test_coordinates(self):
+        resolved = resolve_location("4.7110, -74.0721")
+        assert resolved.kind == "coordinates"
+        assert resolved.as_dict() == {"latitude": 4.7110, "longitude": -74.0721}
+
+    def test_out_of_range_coordinates_are_a_miss(self):
+        assert resolve_location("120,200") is None
+
+    def test_city_with_accents_and_case(self):
+        resolved = resolve_location("  medellín ")
+        assert (resolved.latitude, resolved.longitude) == (6.2442, -75.5812)
+
+    def test_country_disambiguates_city(self):
+        assert resolve_location("Cartagena").country == "CO"
+        assert resolve_location("Cartagena, España").country == "ES"
+        assert resolve_location("Valencia, ES").country == "ES"
+
+    def test_non_country_qualifier_is_ignored(self):
+        assert resolve_location("Medellín, Antioquia").name == "Medellin"
+
+    def test_prefix_lookup(self):
+        assert resolve_location("San Fran").name == "San Francisco"
+        assert resolve_location("Sa") is None
+
+    def test_country_resolves_to_capital(self):
+        resolved = resolve_location("Colombia")
+        assert resolved.kind == "country"
+        assert resolved.as_dict() == resolve_location("Bogota").as_dict()
+
+    def test_unknown_location_is_an_explicit_miss(self):
+        assert resolve_location("Atlantis") is None
+        assert resolve_location("Paris, Colombia") is None
+        assert resolve_location(" ") is None
+
+    def test_resolutions_are_cached(self):
+        gazetteer = Gazetteer([("city", "CO", 4.6, -74.0, 1, ["Bogota"])], cache_size=8)
+        gazetteer.resolve("Bogota")
+        gazetteer.resolve("Bogota")
+        assert gazetteer.resolve.cache_info().hits == 1
+
+    def test_default_gazetteer_is_loaded_once(self):
+        assert default_gazetteer() is default_gazetteer()
+        assert len(default_gazetteer()) > 100
+
+
+class TestValidateEndpointLocation:
+    """Una ubicación desconocida ya no se resuelve silenciosamente a Nueva York"""
+
+    def test_unknown_location_returns_422(self):
+        from api_gateway import routes
+
+        routes.configure_dependencies(Mock(), Mock(), Mock(), Mock(), Mock())
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+
+        response = TestClient(app).post(
+            "/api/v1/transaction/validate",
+            json={"amount": 100, "userId": "user_001", "location": "Atlantis"},
+        )
+
+        assert response.status_code == 422
+        assert "Unknown location" in response.json()["detail"]
@@ -0,0 +1,63 @@
+"""
+Tests unitarios para el motor de distancias (domain/geo.py)
+"""
+import random
+from math import asin, cos, radians, sin, sqrt
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.domain.geo import GeoPoint, haversine_km, prepare_point, within_radius_bound
+
+
+def _reference_km(lat1, lon1, lat2, lon2):
+    """Haversine de referencia (la implementación original de LocationStrategy)"""
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 6371.0 * 2 * asin(sqrt(a))
+
+
+def _random_pairs(count, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        origin = (rng.uniform(-89, 89), rng.uniform(-180, 180))
+        # Mitad cerca del origen (hasta ~3 grados), mitad en cualquier parte
+        if rng.random() < 0.5:
+            point = (
+                max(-90.0, min(90.0, origin[0] + rng.uniform(-3, 3))),
+                (origin[1] + rng.uniform(-3, 3) + 180) % 360 - 180,
+            )
+        else:
+            point = (rng.uniform(-90, 90), rng.uniform(-180, 180))
+        yield origin, point
+
+
+class TestHaversine:
+    def test_matches_reference_formula(self):
+        for (lat1, lon1), (lat2, lon2) in _random_pairs(2000):
+            expected = _reference_km(lat1, lon1, lat2, lon2)
+            assert haversine_km(GeoPoint(lat1, lon1), GeoPoint(lat2, lon2)) == pytest.approx(expected, abs=1e-6)
+
+    def test_prepared_points_are_cached(self):
+        assert prepare_point(4.711, -74.0721) is prepare_point(4.711, -74.0721)
+
+
+class TestRadiusBound:
+    def test_bound_never_underestimates_distance(self):
+        for (lat1, lon1), (lat2, lon2) in _random_pairs(5000):
+            origin = GeoPoint(lat1, lon1)
+            distance = _reference_km(lat1, lon1, lat2, lon2)
+            for radius in (10.0, 100.0, 500.0):
+                if within_radius_bound(origin, lat2, lon2, radius):
+                    assert distance <= radius + 1e-9
+
+    def test_nearby_point_is_accepted(self):
+        bogota = GeoPoint(4.7110, -74.0721)
+        assert within_radius_bound(bogota, 4.7600, -74.0400, 100.0)
+        assert not within_radius_bound(bogota, 6.2442, -75.5812, 100.0)
+
+    def test_antimeridian(self):
+        assert within_radius_bound(GeoPoint(0.0, 179.9), 0.0, -179.9, 50.0)
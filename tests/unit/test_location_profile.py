@@ -0,0 +1,123 @@
+"""
+Tests unitarios para el perfil de ubicaciones frecuentes (RedisLocationProfile)
+y su uso en EvaluateTransactionUseCase.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fakeredis import aioredis
+
+from src.adapters import RedisLocationProfile
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.strategies.location_check import LocationStrategy
+
+BOGOTA = (4.7110, -74.0721)
+BOGOTA_NORTE = (4.7600, -74.0400)
+MEDELLIN = (6.2442, -75.5812)
+CALI = (3.4516, -76.5320)
+
+
+@pytest.fixture
+def profile():
+    return RedisLocationProfile(aioredis.FakeRedis(decode_responses=True), max_clusters=2)
+
+
+class TestRedisLocationProfile:
+    """Clustering incremental y búsqueda del cluster más cercano"""
+
+    @pytest.mark.asyncio
+    async def test_user_without_profile(self, profile):
+        assert await profile.nearest_location("user_001", *BOGOTA) is None
+
+    @pytest.mark.asyncio
+    async def test_nearby_points_share_a_cluster(self, profile):
+        await profile.record_location("user_001", *BOGOTA)
+        await profile.record_location("user_001", *BOGOTA_NORTE)
+
+        nearest = await profile.nearest_location("user_001", *BOGOTA)
+
+        assert nearest["weight"] == 2
+        # El centro se movió a mitad de camino entre los dos puntos
+        assert nearest["latitude"] == pytest.approx(4.7355, abs=1e-4)
+        assert nearest["longitude"] == pytest.approx(-74.0561, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_nearest_cluster_is_returned(self, profile):
+        await profile.record_location("user_001", *BOGOTA)
+        await profile.record_location("user_001", *MEDELLIN)
+
+        nearest = await profile.nearest_location("user_001", 6.25, -75.56)
+
+        assert nearest["latitude"] == pytest.approx(MEDELLIN[0], abs=1e-4)
+        assert nearest["weight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_profile_evicts_least_used_cluster(self, profile):
+        await profile.record_location("user_001", *BOGOTA)
+        await profile.record_location("user_001", *BOGOTA)
+        await profile.record_location("user_001", *MEDELLIN)
+        await profile.record_location("user_001", *CALI)
+
+        weights = await profile.redis.hgetall("user:user_001:geo:weights")
+
+        assert sorted(weights.values()) == ["1", "2"]
+        nearest = await profile.nearest_location("user_001", *MEDELLIN)
+        assert nearest["latitude"] != pytest.approx(MEDELLIN[0], abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_antimeridian_cluster_does_not_jump(self, profile):
+        await profile.record_location("user_001", 0.0, 179.95)
+        await profile.record_location("user_001", 0.0, -179.95)
+
+        nearest = await profile.nearest_location("user_001", 0.0, 180.0)
+
+        assert abs(nearest["longitude"]) == pytest.approx(180.0, abs=1e-3)
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            RedisLocationProfile(Mock(), cluster_radius_km=0)
+
+
+class TestUseCaseWithLocationProfile:
+    """Un usuario que viaja no alterna entre HIGH y LOW riesgo"""
+
+    @pytest.fixture
+    def use_case(self, profile):
+        repository = Mock(save_evaluation=AsyncMock())
+        publisher = Mock(publish_for_manual_review=AsyncMock())
+        cache = Mock(get_user_location=AsyncMock(return_value=None), set_user_location=AsyncMock())
+        return EvaluateTransactionUseCase(
+            repository, publisher, cache, [LocationStrategy(100)], location_profile=profile
+        )
+
+    @staticmethod
+    def _transaction(number, location):
+        return {
+            "id": f"txn_{number}",
+            "amount": 100,
+            "user_id": "user_001",
+            "location": {"latitude": location[0], "longitude": location[1]},
+        }
+
+    @pytest.mark.asyncio
+    async def test_returning_home_is_low_risk(self, use_case):
+        await use_case.execute(self._transaction(1, BOGOTA))
+        trip = await use_case.execute(self._transaction(2, MEDELLIN))
+        back_home = await use_case.execute(self._transaction(3, BOGOTA_NORTE))
+
+        assert trip["reasons"] == ["unusual_location"]
+        assert back_home["risk_level"] == "LOW_RISK"
+        use_case.cache.set_user_location.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_cached_location_without_profile(self, use_case):
+        use_case.cache.get_user_location.return_value = {"latitude": MEDELLIN[0], "longitude": MEDELLIN[1]}
+
+        result = await use_case.execute(self._transaction(1, BOGOTA))
+
+        assert result["reasons"] == ["unusual_location"]
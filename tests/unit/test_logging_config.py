@@ -0,0 +1,139 @@
+"""
+Tests unitarios para el logging estructurado (infrastructure/logging_config.py).
+"""
+import io
+import json
+import logging
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.infrastructure.logging_config import (
+    REDACTED,
+    JsonFormatter,
+    QueryRedactionFilter,
+    SamplingFilter,
+    configure_logging,
+    parse_module_levels,
+    shutdown_logging,
+)
+
+
+def _record(level=logging.INFO, msg="hola %s", args=("mundo",), **extra):
+    record = logging.LogRecord("test.logger", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    """Una línea JSON por registro"""
+
+    def test_includes_message_and_extra_fields(self):
+        line = JsonFormatter().format(_record(transaction_id="txn_1", duration_ms=1.5))
+        payload = json.loads(line)
+
+        assert payload["message"] == "hola mundo"
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "test.logger"
+        assert payload["transaction_id"] == "txn_1"
+        assert payload["duration_ms"] == 1.5
+
+    def test_non_serializable_extra_is_stringified(self):
+        payload = json.loads(JsonFormatter().format(_record(risk=object())))
+        assert isinstance(payload["risk"], str)
+
+
+class TestSamplingFilter:
+    """Muestreo 1 de N solo para DEBUG"""
+
+    def test_samples_debug_records(self):
+        sampler = SamplingFilter(rate=10)
+        passed = sum(sampler.filter(_record(level=logging.DEBUG)) for _ in range(100))
+        assert passed == 10
+
+    def test_never_samples_info_or_higher(self):
+        sampler = SamplingFilter(rate=10)
+        assert all(sampler.filter(_record(level=logging.WARNING)) for _ in range(20))
+
+
+class TestQueryRedactionFilter:
+    """Credenciales en la query string del access log de uvicorn"""
+
+    def test_redacts_token_in_access_log_args(self):
+        record = _record(
+            msg='%s - "%s %s HTTP/%s" %d',
+            args=("10.0.0.1:5000", "GET", "/api/v1/user/u1/events?token=eyJ.abc.def&x=1", "1.1", 200),
+        )
+
+        QueryRedactionFilter().filter(record)
+
+        assert record.getMessage() == (
+            f'10.0.0.1:5000 - "GET /api/v1/user/u1/events?token={REDACTED}&x=1 HTTP/1.1" 200'
+        )
+
+    def test_keeps_other_params(self):
+        redaction = QueryRedactionFilter()
+
+        assert redaction.redact("/a?page=2&access_token=t&mytoken=v") == f"/a?page=2&access_token={REDACTED}&mytoken=v"
+        assert redaction.redact("/health") == "/health"
+
+
+class TestParseModuleLevels:
+    """Formato "modulo=NIVEL,modulo=NIVEL" """
+
+    def test_parses_string_spec(self):
+        levels = parse_module_levels("src.domain=debug, api_gateway.routes=WARNING")
+        assert levels == {"src.domain": logging.DEBUG, "api_gateway.routes": logging.WARNING}
+
+    def test_empty_spec(self):
+        assert parse_module_levels("") == {}
+
+    def test_invalid_level_raises(self):
+        with pytest.raises(ValueError):
+            parse_module_levels("src.domain=LOUD")
+
+
+class TestConfigureLogging:
+    """Pipeline completo: logger -> cola -> listener -> stream"""
+
+    @pytest.fixture
+    def restore_root(self):
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+        yield
+        shutdown_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        logging.getLogger("test.quiet").setLevel(logging.NOTSET)
+
+    def test_records_reach_stream_as_json(self, restore_root):
+        stream = io.StringIO()
+        configure_logging(level="INFO", module_levels="test.quiet=ERROR", stream=stream)
+
+        logging.getLogger("test.loud").info("evaluated", extra={"transaction_id": "txn_9"})
+        logging.getLogger("test.quiet").warning("filtered out")
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["message"] for line in lines] == ["evaluated"]
+        assert lines[0]["transaction_id"] == "txn_9"
+
+    def test_uvicorn_access_log_is_redacted(self, restore_root):
+        # uvicorn le pone su propio handler a uvicorn.access y no propaga
+        access_logger = logging.getLogger("uvicorn.access")
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        access_logger.addHandler(handler)
+        access_logger.propagate = False
+        try:
+            configure_logging(stream=io.StringIO())
+            configure_logging(stream=io.StringIO())
+            access_logger.info('%s - "%s %s HTTP/%s" %d', "10.0.0.1:5000", "GET", "/events?token=eyJ.abc", "1.1", 200)
+        finally:
+            access_logger.removeHandler(handler)
+            access_logger.propagate = True
+
+        assert "eyJ" not in stream.getvalue()
+        assert sum(isinstance(f, QueryRedactionFilter) for f in access_logger.filters) == 1
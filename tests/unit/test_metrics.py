@@ -0,0 +1,194 @@
+"""
+Tests unitarios para las métricas del hot path (infrastructure/metrics.py)
+y la instrumentación de EvaluateTransactionUseCase.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import redis
+from fakeredis import FakeServer, aioredis
+
+from src.application.interfaces import MetricsRecorder
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.models import RiskLevel
+from src.domain.strategies.amount_threshold import AmountThresholdStrategy
+from src.infrastructure.metrics import (
+    MetricsRegistry,
+    DEPENDENCY_CALLS,
+    DEPENDENCY_DURATION,
+    DEPENDENCY_ERRORS,
+    instrument_client,
+)
+
+
+class RecordingMetrics(MetricsRecorder):
+    """Recorder en memoria para verificar lo que reporta el caso de uso"""
+
+    def __init__(self):
+        self.strategies = []
+        self.evaluations = []
+
+    def observe_strategy(self, strategy, seconds, outcome):
+        self.strategies.append((strategy, outcome))
+
+    def observe_evaluation(self, risk_level, seconds):
+        self.evaluations.append(risk_level)
+
+
+class TestMetricsRegistry:
+    """Formato de texto Prometheus"""
+
+    def test_counter_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo", ("outcome",))
+        counter.labels("hit").inc()
+        counter.labels("hit").inc(2)
+
+        output = registry.render()
+
+        assert "# TYPE demo_total counter" in output
+        assert 'demo_total{outcome="hit"} 3' in output
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("demo_seconds", "Demo", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+
+        output = registry.render()
+
+        assert 'demo_seconds_bucket{le="0.1"} 1' in output
+        assert 'demo_seconds_bucket{le="1"} 2' in output
+        assert 'demo_seconds_bucket{le="+Inf"} 3' in output
+        assert "demo_seconds_count 3" in output
+
+    def test_labels_cardinality_is_validated(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("solo_uno")
+
+    def test_register_is_idempotent(self):
+        registry = MetricsRegistry()
+        first = registry.counter("demo_total", "Demo")
+        assert registry.counter("demo_total", "Demo") is first
+
+
+class TestInstrumentedClient:
+    """Conteo de llamadas y errores hacia dependencias"""
+
+    def test_sync_calls_and_errors(self):
+        client = Mock()
+        client.find_one.return_value = {"_id": 1}
+        client.insert_one.side_effect = RuntimeError("down")
+        wrapped = instrument_client(client, "test_sync")
+
+        calls = DEPENDENCY_CALLS.labels("test_sync", "find_one")
+        errors = DEPENDENCY_ERRORS.labels("test_sync", "insert_one")
+        before_calls, before_errors = calls.value, errors.value
+
+        assert wrapped.find_one({"_id": 1}) == {"_id": 1}
+        with pytest.raises(RuntimeError):
+            wrapped.insert_one({})
+
+        assert calls.value == before_calls + 1
+        assert errors.value == before_errors + 1
+        assert instrument_client(wrapped, "test_sync") is wrapped
+
+    @pytest.mark.asyncio
+    async def test_redis_asyncio_calls_are_timed_when_awaited(self):
+        # Los comandos de redis.asyncio no son async def: devuelven la corrutina
+        server = FakeServer()
+        wrapped = instrument_client(aioredis.FakeRedis(server=server, decode_responses=True), "test_async")
+        calls = DEPENDENCY_CALLS.labels("test_async", "get")
+        errors = DEPENDENCY_ERRORS.labels("test_async", "get")
+        duration = DEPENDENCY_DURATION.labels("test_async")
+        before_calls, before_errors, before_count = calls.value, errors.value, duration.count
+
+        pending = wrapped.get("k")
+        assert duration.count == before_count
+        assert await pending is None
+
+        server.connected = False
+        with pytest.raises(redis.ConnectionError):
+            await wrapped.get("k")
+
+        assert calls.value == before_calls + 2
+        assert errors.value == before_errors + 1
+        assert duration.count == before_count + 2
+
+    @pytest.mark.asyncio
+    async def test_async_methods_stay_awaitable(self):
+        class AsyncClient:
+            async def get(self, key):
+                return f"value:{key}"
+
+        wrapped = instrument_client(AsyncClient(), "test_async_port")
+        calls = DEPENDENCY_CALLS.labels("test_async_port", "get")
+        before = calls.value
+
+        assert await wrapped.get("k") == "value:k"
+        assert calls.value == before + 1
+
+
+class TestUseCaseInstrumentation:
+    """Clasificación hit / miss / fallback / error por estrategia"""
+
+    @pytest.fixture
+    def dependencies(self):
+        repository = Mock()
+        repository.save_evaluation = AsyncMock(return_value=True)
+        publisher = Mock()
+        publisher.publish_for_manual_review = AsyncMock(return_value=True)
+        cache = Mock()
+        cache.get_user_location = AsyncMock(return_value=None)
+        cache.set_user_location = AsyncMock(return_value=True)
+        return repository, publisher, cache
+
+    @staticmethod
+    def _strategy(result=None, error=None):
+        strategy = Mock()
+        if error is not None:
+            strategy.evaluate.side_effect = error
+        else:
+            strategy.evaluate.return_value = result
+        return strategy
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_reported(self, dependencies, sample_transaction_data):
+        metrics = RecordingMetrics()
+        fallback = self._strategy(
+            {"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": "", "fallback": True}
+        )
+        use_case = EvaluateTransactionUseCase(
+            *dependencies,
+            [AmountThresholdStrategy(Decimal("50")), AmountThresholdStrategy(Decimal("5000")), fallback],
+            metrics=metrics,
+        )
+
+        result = await use_case.execute(sample_transaction_data)
+
+        outcomes = [outcome for _, outcome in metrics.strategies]
+        assert outcomes == ["hit", "miss", "fallback"]
+        assert metrics.evaluations == [result["risk_level"]]
+
+    @pytest.mark.asyncio
+    async def test_strategy_error_is_reported_and_reraised(
+        self, dependencies, sample_transaction_data
+    ):
+        metrics = RecordingMetrics()
+        use_case = EvaluateTransactionUseCase(
+            *dependencies, [self._strategy(error=RuntimeError("boom"))], metrics=metrics
+        )
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute(sample_transaction_data)
+
+        assert [outcome for _, outcome in metrics.strategies] == ["error"]
+        assert metrics.evaluations == []
@@ -0,0 +1,94 @@
+"""
+Tests unitarios para el Value Object Money (montos en centavos enteros).
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_EVEN
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.domain.money import Money
+from src.domain.models import Transaction, Location
+from src.domain.strategies.amount_threshold import AmountThresholdStrategy
+from src.adapters import MongoDBAdapter
+
+
+class TestMoneyParse:
+    """Conversión exacta en el borde"""
+
+    @pytest.mark.parametrize("value, cents", [
+        (100, 10000),
+        (100.1, 10010),
+        (0.29, 29),
+        ("1500.00", 150000),
+        (Decimal("-250.75"), -25075),
+        (1.005, 100),  # half-even sobre el valor decimal escrito
+    ])
+    def test_parse(self, value, cents):
+        assert Money.parse(value).cents == cents
+
+    @pytest.mark.parametrize("value", [1.15, 0.285, 0.295, 19999.995, -2.675, 1e12 + 0.07])
+    def test_float_fast_path_matches_decimal_quantize(self, value):
+        expected = Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_EVEN)
+        assert Money.parse(value).to_decimal() == expected
+
+    @pytest.mark.parametrize("value", ["abc", float("nan"), float("inf"), None])
+    def test_parse_invalid(self, value):
+        with pytest.raises(ValueError):
+            Money.parse(value)
+
+    def test_constructor_requires_int(self):
+        with pytest.raises(TypeError):
+            Money(1.5)
+
+
+class TestMoneyCompatibility:
+    """Money se comporta como el Decimal que reemplaza"""
+
+    def test_equality_with_decimal_int_and_float(self):
+        amount = Money.parse("100.00")
+        assert amount == Decimal("100.0")
+        assert amount == 100
+        assert amount == 100.0
+        assert hash(amount) == hash(Decimal("100.0"))
+
+    def test_ordering_and_abs(self):
+        assert abs(Money.parse(-2000)) > Decimal("1500")
+        assert Decimal("1500") < Money.parse("1500.01")
+        assert -Money.parse(5) == Money(-500)
+
+    def test_str_and_float(self):
+        assert str(Money(-25075)) == "-250.75"
+        assert float(Money(25075)) == 250.75
+        assert not Money(0)
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            Money(1).cents = 2
+
+
+class TestMoneyOnHotPath:
+    """Uso en estrategia y persistencia"""
+
+    def _transaction(self, amount):
+        return Transaction(
+            id="txn_001",
+            amount=amount,
+            user_id="user_001",
+            location=Location(latitude=4.7110, longitude=-74.0721),
+            timestamp=datetime.now(),
+        )
+
+    def test_threshold_is_strict_in_cents(self):
+        strategy = AmountThresholdStrategy(Decimal("1500"))
+        assert strategy.evaluate(self._transaction(Money.parse("1500.00")))["reasons"] == []
+        assert strategy.evaluate(self._transaction(Money.parse("-1500.01")))["reasons"] == [
+            "amount_threshold_exceeded"
+        ]
+
+    def test_document_amount_prefers_cents(self):
+        assert MongoDBAdapter._document_amount({"amount_cents": 199999, "amount": 1.0}) == Money(199999)
+        assert MongoDBAdapter._document_amount({"amount": 1999.99}) == Money(199999)
+        assert MongoDBAdapter._document_amount({"amount": None}) is None
@@ -0,0 +1,92 @@
+"""
+Tests unitarios para el particionado por usuario de la cola de
+transacciones (infrastructure/partitioning.py, RabbitMQAdapter y worker).
+"""
+import pytest
+from collections import Counter
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.adapters import RabbitMQAdapter
+from src.infrastructure.partitioning import (
+    parse_owned_partitions,
+    partition_for,
+    partition_queue,
+    partition_queues,
+    queue_arguments,
+)
+
+
+class TestPartitioning:
+    def test_same_user_same_partition(self):
+        assert partition_for("user_001", 8) == partition_for("user_001", 8)
+        assert partition_for("user_001", 1) == 0
+
+    def test_users_spread_across_partitions(self):
+        counts = Counter(partition_for(f"user_{n}", 4) for n in range(4000))
+        assert set(counts) == {0, 1, 2, 3}
+        assert min(counts.values()) > 800
+
+    def test_single_partition_keeps_original_queue(self):
+        assert partition_queues("transactions", 1) == ["transactions"]
+        assert queue_arguments(1) is None
+        assert partition_queues("transactions", 3) == ["transactions.p0", "transactions.p1", "transactions.p2"]
+        assert queue_arguments(3) == {"x-single-active-consumer": True}
+
+    def test_owned_partitions(self):
+        assert parse_owned_partitions("", 3) == [0, 1, 2]
+        assert parse_owned_partitions("2, 0", 3) == [0, 2]
+        with pytest.raises(ValueError):
+            parse_owned_partitions("3", 3)
+
+    def test_replicas_own_disjoint_partitions(self):
+        owned = [parse_owned_partitions(f"{replica}/2", 4) for replica in range(2)]
+
+        assert owned == [[0, 2], [1, 3]]
+        # Más réplicas que particiones: la que sobra queda de respaldo
+        assert parse_owned_partitions("2/3", 2) == [0]
+        assert parse_owned_partitions("1/2", 1) == [0]
+        for value in ("2/2", "0/0", "a/2"):
+            with pytest.raises(ValueError):
+                parse_owned_partitions(value, 4)
+
+
+class TestPartitionedPublishing:
+    @pytest.mark.asyncio
+    async def test_publisher_routes_by_user(self):
+        channel = Mock()
+        with patch("src.adapters.pika.BlockingConnection", return_value=Mock(is_closed=False, channel=Mock(return_value=channel))), \
+             patch("src.adapters.settings.rabbitmq_partitions", 4):
+            adapter = RabbitMQAdapter("amqp://localhost:5672")
+            for user_id in ("user_001", "user_002", "user_001"):
+                await adapter.publish_transaction_for_processing({"id": "txn", "user_id": user_id})
+
+        declared = [call.kwargs["queue"] for call in channel.queue_declare.call_args_list]
+        assert declared[:4] == partition_queues("transactions", 4)
+        routed = [call.kwargs["routing_key"] for call in channel.basic_publish.call_args_list]
+        assert routed[0] == routed[2] == partition_queue("transactions", partition_for("user_001", 4), 4)
+
+
+class TestPartitionedWorker:
+    def test_worker_consumes_only_owned_partitions(self):
+        import worker
+
+        channel = Mock(start_consuming=Mock(side_effect=KeyboardInterrupt))
+        with patch.object(worker.pika, "BlockingConnection", return_value=Mock(channel=Mock(return_value=channel))), \
+             patch.object(worker, "start_metrics_server"), \
+             patch.object(worker, "configure_from_settings"), \
+             patch.object(worker, "configure_tracing"), \
+             patch.object(worker.settings, "rabbitmq_partitions", 4), \
+             patch.object(worker.settings, "worker_partitions", "1,3"):
+            worker.start_worker()
+
+        consumed = [call.kwargs["queue"] for call in channel.basic_consume.call_args_list]
+        assert consumed == ["transactions.p1", "transactions.p3"]
+        retry = {call.kwargs["queue"]: call.kwargs.get("arguments") for call in channel.queue_declare.call_args_list}
+        assert retry["transactions.p3"] == {"x-single-active-consumer": True}
+        assert retry["transactions.p3.retry.5s"]["x-dead-letter-routing-key"] == "transactions.p3"
+        topology = channel.basic_consume.call_args.kwargs["on_message_callback"].keywords["topology"]
+        assert topology.dead_letter_queue == "transactions.p3.dlq"
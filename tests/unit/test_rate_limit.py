@@ -0,0 +1,209 @@
+"""
+Tests unitarios para el rate limiting del gateway
+(infrastructure/rate_limit.py).
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import redis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.infrastructure.circuit_breaker import CircuitOpenError
+from src.infrastructure.rate_limit import (
+    TOKEN_BUCKET_SCRIPT,
+    TOKEN_BUCKET_SHA,
+    LocalTokenBucket,
+    RateLimiter,
+    RateLimitMiddleware,
+    RateLimitRule,
+    parse_rate_limits,
+)
+
+AUTH_RULE = RateLimitRule("auth", rate=1.0, burst=2, key="ip")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _redis_down():
+    return Mock(evalsha=AsyncMock(side_effect=CircuitOpenError("redis circuit is open")))
+
+
+class TestParseRateLimits:
+    def test_rules_per_group(self):
+        rules = parse_rate_limits("scoring=20/s:40:user, auth=10/m:5:ip")
+
+        assert rules["scoring"] == RateLimitRule("scoring", 20.0, 40, "user")
+        assert rules["auth"].rate == pytest.approx(10 / 60)
+        assert parse_rate_limits("") == {}
+
+    @pytest.mark.parametrize("value", ["auth=10/d:5:ip", "auth=10/m:5:token", "auth=10/m", "auth=0/s:5:ip"])
+    def test_invalid_rules(self, value):
+        with pytest.raises(ValueError):
+            parse_rate_limits(value)
+
+
+class TestLocalTokenBucket:
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        bucket = LocalTokenBucket(clock=clock)
+
+        assert [bucket.take("k", AUTH_RULE).allowed for _ in range(3)] == [True, True, False]
+        assert bucket.take("k", AUTH_RULE).retry_after == pytest.approx(1.0)
+
+        clock.now = 1.0
+        assert bucket.take("k", AUTH_RULE).allowed
+
+    def test_bounded_number_of_buckets(self):
+        bucket = LocalTokenBucket(max_keys=2, clock=FakeClock())
+        for key in ("a", "a", "b", "c"):
+            bucket.take(key, AUTH_RULE)
+
+        # "a" se descartó: vuelve con el bucket lleno
+        assert bucket.take("a", AUTH_RULE).remaining == 1
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_single_evalsha_per_check(self):
+        client = Mock(evalsha=AsyncMock(return_value=[0, 250, 0]))
+
+        decision = await RateLimiter(client).take("ratelimit:auth:ip:1.2.3.4", AUTH_RULE)
+
+        assert (decision.allowed, decision.retry_after) == (False, 0.25)
+        client.evalsha.assert_awaited_once_with(TOKEN_BUCKET_SHA, 1, "ratelimit:auth:ip:1.2.3.4", 1.0, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_loads_script_on_noscript(self):
+        client = Mock(
+            evalsha=AsyncMock(side_effect=redis.exceptions.NoScriptError("NOSCRIPT")),
+            eval=AsyncMock(return_value=[1, 0, 1]),
+        )
+
+        decision = await RateLimiter(client).take("key", AUTH_RULE)
+
+        assert decision.allowed and decision.remaining == 1
+        assert client.eval.await_args.args[0] == TOKEN_BUCKET_SCRIPT
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_bucket(self):
+        limiter = RateLimiter(_redis_down(), LocalTokenBucket(clock=FakeClock()))
+
+        decisions = [await limiter.take("key", AUTH_RULE) for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+
+
+class TestTokenBucketScript:
+    """El script Lua sobre fakeredis (requiere lupa, ver fakeredis[lua])"""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("lupa")
+        from fakeredis import FakeServer, aioredis
+
+        return aioredis.FakeRedis(server=FakeServer(), decode_responses=True)
+
+    @pytest.fixture
+    def limiter(self, client):
+        # Sin respaldo local: un error del script no pasa desapercibido
+        return RateLimiter(client, Mock(take=Mock(side_effect=AssertionError("fell back to local bucket"))))
+
+    @staticmethod
+    async def _rewind(client, key, seconds):
+        """Simula el paso del tiempo atrasando la última recarga del bucket"""
+        await client.hincrbyfloat(key, "ts", -seconds)
+
+    @pytest.mark.asyncio
+    async def test_burst(self, limiter, client):
+        decisions = [await limiter.take("key", AUTH_RULE) for _ in range(3)]
+
+        assert [(d.allowed, d.remaining) for d in decisions] == [(True, 1), (True, 0), (False, 0)]
+        assert 0 < float(await client.hget("key", "tokens")) < 1
+        assert 0 < await client.pttl("key") <= 3000
+
+    @pytest.mark.asyncio
+    async def test_retry_after(self, limiter, client):
+        slow = RateLimitRule("auth", rate=0.5, burst=1, key="ip")
+        await limiter.take("key", slow)
+
+        limited = await limiter.take("key", slow)
+
+        assert not limited.allowed
+        assert limited.retry_after == pytest.approx(2.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_refill(self, limiter, client):
+        for _ in range(2):
+            await limiter.take("key", AUTH_RULE)
+
+        await self._rewind(client, "key", 1.0)
+        assert (await limiter.take("key", AUTH_RULE)).allowed
+        assert not (await limiter.take("key", AUTH_RULE)).allowed
+
+        # La recarga no pasa de la capacidad del bucket
+        await self._rewind(client, "key", 100.0)
+        assert (await limiter.take("key", AUTH_RULE)).remaining == AUTH_RULE.burst - 1
+
+    @pytest.mark.asyncio
+    async def test_evalsha_falls_back_to_eval(self, limiter, client):
+        assert await client.script_exists(TOKEN_BUCKET_SHA) == [False]
+
+        assert (await limiter.take("key", AUTH_RULE)).allowed
+        assert await client.script_exists(TOKEN_BUCKET_SHA) == [True]
+
+        # Tras SCRIPT FLUSH (o un Redis reiniciado) se vuelve a cargar
+        await client.script_flush()
+        assert (await limiter.take("key", AUTH_RULE)).remaining == 0
+        assert await client.script_exists(TOKEN_BUCKET_SHA) == [True]
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.post("/api/v1/auth/login")
+        async def login():
+            return {"access_token": "token"}
+
+        @app.put("/api/v1/admin/rules/{rule_id}")
+        async def update_rule(rule_id: str):
+            return {"rule_id": rule_id}
+
+        @app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=RateLimiter(_redis_down(), LocalTokenBucket(clock=FakeClock())),
+            rules={"auth": AUTH_RULE, "admin": RateLimitRule("admin", 1.0, 1, "analyst")},
+        )
+        return TestClient(app)
+
+    def test_login_is_limited_per_ip(self, client):
+        statuses = [client.post("/api/v1/auth/login").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        limited = client.post("/api/v1/auth/login")
+        assert limited.headers["retry-after"] == "1"
+        assert limited.json() == {"detail": "Rate limit exceeded for auth requests"}
+        assert client.get("/health").status_code == 200
+
+    def test_admin_is_limited_per_analyst(self, client):
+        ana = {"X-Analyst-ID": "ana"}
+
+        assert client.put("/api/v1/admin/rules/r1", headers=ana).status_code == 200
+        assert client.put("/api/v1/admin/rules/r1", headers=ana).status_code == 429
+        assert client.put("/api/v1/admin/rules/r1", headers={"X-Analyst-ID": "luis"}).status_code == 200
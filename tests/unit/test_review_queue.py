@@ -0,0 +1,180 @@
+"""
+Tests unitarios para la cola priorizada de revisión manual
+(domain/review_priority.py, RedisReviewQueue, review_consumer y los
+endpoints /api/v1/admin/review-queue).
+"""
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fakeredis import FakeServer, aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import RedisReviewQueue
+from src.application.interfaces import LeaseConflictError
+from src.domain.models import RiskLevel
+from src.domain.review_priority import ReviewPriorityPolicy
+
+T0 = 1_800_000_000.0
+
+
+def _task(transaction_id, risk_level="MEDIUM_RISK", amount=100.0, enqueued_at=T0):
+    return {"transaction_id": transaction_id, "user_id": "user_001", "risk_level": risk_level,
+            "reasons": ["amount_threshold_exceeded"], "amount": amount, "enqueued_at": enqueued_at}
+
+
+class _Clock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def queue(clock):
+    return RedisReviewQueue(aioredis.FakeRedis(server=FakeServer(), decode_responses=True), clock=clock)
+
+
+class TestReviewPriorityPolicy:
+    def test_risk_then_amount_then_age(self):
+        policy = ReviewPriorityPolicy()
+        high = policy.score(RiskLevel.HIGH_RISK, Decimal("10"), T0)
+        medium_big = policy.score(RiskLevel.MEDIUM_RISK, Decimal("90000"), T0)
+        medium_small = policy.score(RiskLevel.MEDIUM_RISK, Decimal("-10"), T0)
+        medium_small_older = policy.score(RiskLevel.MEDIUM_RISK, Decimal("10"), T0 - 60)
+
+        assert high > medium_big > medium_small_older > medium_small
+
+    def test_aging_eventually_beats_risk(self):
+        policy = ReviewPriorityPolicy(aging_seconds=60)
+        day_old_medium = policy.score(RiskLevel.MEDIUM_RISK, None, T0 - 24 * 3600)
+        assert day_old_medium > policy.score(RiskLevel.HIGH_RISK, None, T0)
+
+    def test_invalid_aging(self):
+        with pytest.raises(ValueError):
+            ReviewPriorityPolicy(aging_seconds=0)
+
+
+class TestRedisReviewQueue:
+    @pytest.mark.asyncio
+    async def test_claim_in_priority_order(self, queue):
+        await queue.enqueue(_task("txn_small"))
+        await queue.enqueue(_task("txn_high", "HIGH_RISK"))
+        await queue.enqueue(_task("txn_big", amount=50000))
+
+        first = await queue.claim("analyst_a", 2, 300)
+        second = await queue.claim("analyst_b", 5, 300)
+
+        assert [task["transaction_id"] for task in first] == ["txn_high", "txn_big"]
+        assert first[0]["lease_expires_at"] == T0 + 300
+        assert [task["transaction_id"] for task in second] == ["txn_small"]
+        assert await queue.claim("analyst_c", 5, 300) == []
+
+    @pytest.mark.asyncio
+    async def test_enqueue_is_idempotent(self, queue):
+        assert await queue.enqueue(_task("txn_001"))
+        await queue.claim("analyst_a", 1, 300)
+
+        assert not await queue.enqueue(_task("txn_001"))
+        assert await queue.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_redelivery_repairs_task_missing_from_queue(self, queue):
+        await queue.enqueue(_task("txn_001"))
+        await queue.redis.zrem(RedisReviewQueue.QUEUE_KEY, "txn_001")
+
+        assert not await queue.enqueue(_task("txn_001"))
+        assert await queue.pending() == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_returns_task_to_queue(self, queue, clock):
+        await queue.enqueue(_task("txn_001"))
+        await queue.claim("analyst_a", 1, 300)
+
+        clock.now += 301
+        reclaimed = await queue.claim("analyst_b", 1, 300)
+
+        assert [task["transaction_id"] for task in reclaimed] == ["txn_001"]
+        with pytest.raises(LeaseConflictError):
+            await queue.complete("txn_001", "analyst_a")
+        assert await queue.complete("txn_001", "analyst_b")
+        assert not await queue.complete("txn_001")
+
+    @pytest.mark.asyncio
+    async def test_complete_without_owner_removes_queued_task(self, queue):
+        await queue.enqueue(_task("txn_001"))
+
+        assert await queue.complete("txn_001", "analyst_a")
+        assert await queue.pending() == 0
+
+
+class TestReviewConsumer:
+    def test_valid_message_is_queued_and_acked(self):
+        import review_consumer
+
+        queue = Mock(enqueue=AsyncMock(return_value=True))
+        channel, method = Mock(), Mock(delivery_tag=7)
+        body = b'{"transaction_id":"txn_001","risk_level":"HIGH_RISK","amount":2500.0,"user_id":"user_001"}'
+
+        with patch.object(review_consumer, "_queue", queue), \
+             patch.object(review_consumer, "_loop", asyncio.new_event_loop()):
+            review_consumer.callback(channel, method, Mock(headers={"x-published-at": T0}), body)
+
+        task = queue.enqueue.await_args.args[0]
+        assert task["enqueued_at"] == T0
+        channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    @pytest.mark.parametrize("body", [b"not json", b'{"transaction_id":"txn_001","risk_level":"NOPE"}', b"{}"])
+    def test_invalid_message_is_dropped(self, body):
+        import review_consumer
+
+        channel = Mock()
+        review_consumer.callback(channel, Mock(delivery_tag=1), Mock(headers=None), body)
+
+        channel.basic_nack.assert_called_once_with(delivery_tag=1, requeue=False)
+
+
+class TestReviewQueueEndpoints:
+    @pytest.fixture
+    def gateway(self):
+        from api_gateway import routes
+
+        server = FakeServer()
+        cache = Mock()
+        type(cache).redis = property(lambda _: aioredis.FakeRedis(server=server, decode_responses=True))
+        routes.configure_dependencies(Mock(), lambda: cache, Mock(), Mock(), Mock())
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+
+        async def seed():
+            queue = RedisReviewQueue(cache.redis)
+            await queue.enqueue(_task("txn_001", "HIGH_RISK", enqueued_at=None))
+            await queue.enqueue(_task("txn_002", enqueued_at=None))
+
+        asyncio.run(seed())
+        return TestClient(app)
+
+    def test_claim_and_complete(self, gateway):
+        headers = {"X-Analyst-ID": "analyst_a"}
+        assert gateway.get("/api/v1/admin/review-queue").json() == {"pending": 2}
+
+        claimed = gateway.post("/api/v1/admin/review-queue/claim", json={"batchSize": 1}, headers=headers).json()
+
+        assert [task["transactionId"] for task in claimed["tasks"]] == ["txn_001"]
+        assert claimed["leaseExpiresAt"].endswith("Z")
+        conflict = gateway.post("/api/v1/admin/review-queue/txn_001/complete", headers={"X-Analyst-ID": "analyst_b"})
+        assert conflict.status_code == 409
+        assert gateway.post("/api/v1/admin/review-queue/txn_001/complete", headers=headers).status_code == 200
+        assert gateway.post("/api/v1/admin/review-queue/txn_001/complete", headers=headers).status_code == 404
@@ -0,0 +1,154 @@
+"""
+Tests unitarios para la caché por proceso de las reglas
+(infrastructure/rule_cache.py).
+"""
+import pytest
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fakeredis import FakeServer, aioredis
+
+from src.infrastructure.rule_cache import (
+    RULE_ORDER_KEY,
+    RULES_VERSION_KEY,
+    RuleSet,
+    RuleSetCache,
+    bump_rules_version,
+)
+
+RULE = {"_id": "r1", "name": "big", "condition": "amount > 100", "updated_at": 1}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def rule_cache(clock):
+    return RuleSetCache(ttl_seconds=5, clock=clock)
+
+
+@pytest.fixture
+def cache():
+    return Mock(redis=aioredis.FakeRedis(server=FakeServer(), decode_responses=True))
+
+
+@pytest.fixture
+def repository():
+    return Mock(list_enabled_custom_rules=Mock(return_value=[RULE]))
+
+
+class TestRuleSetCache:
+    @pytest.mark.asyncio
+    async def test_rules_are_read_once_per_ttl(self, rule_cache, cache, repository, clock):
+        assert (await rule_cache.get(cache, repository)).custom_rules == (RULE,)
+
+        clock.now = 4
+        await rule_cache.get(cache, repository)
+        clock.now = 10
+        await rule_cache.get(cache, repository)
+
+        # Vencido el TTL se compara la versión: sin cambios no se va a MongoDB
+        repository.list_enabled_custom_rules.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_version_bump_reloads_after_ttl(self, rule_cache, cache, repository, clock):
+        await rule_cache.get(cache, repository)
+        repository.list_enabled_custom_rules.return_value = []
+
+        await bump_rules_version(cache)
+        assert (await rule_cache.get(cache, repository)).custom_rules == (RULE,)
+
+        clock.now = 5
+        assert (await rule_cache.get(cache, repository)).custom_rules == ()
+        assert await cache.redis.get(RULES_VERSION_KEY) == "1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_immediately(self, rule_cache, cache, repository):
+        await rule_cache.get(cache, repository)
+
+        rule_cache.invalidate()
+        await rule_cache.get(cache, repository)
+
+        assert repository.list_enabled_custom_rules.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_snapshot_expires_even_without_bump(self, rule_cache, cache, repository, clock):
+        await rule_cache.get(cache, repository)
+
+        clock.now = 61
+        await rule_cache.get(cache, repository)
+
+        assert repository.list_enabled_custom_rules.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mongodb_failure_keeps_previous_snapshot(self, rule_cache, cache, repository, clock):
+        await rule_cache.get(cache, repository)
+        await bump_rules_version(cache)
+        repository.list_enabled_custom_rules.side_effect = ConnectionError("mongo down")
+
+        clock.now = 5
+        assert (await rule_cache.get(cache, repository)).custom_rules == (RULE,)
+
+        # Sin versión conocida el próximo chequeo vuelve a intentar
+        repository.list_enabled_custom_rules.side_effect = None
+        repository.list_enabled_custom_rules.return_value = []
+        clock.now = 10
+        assert (await rule_cache.get(cache, repository)).custom_rules == ()
+
+    @pytest.mark.asyncio
+    async def test_other_repository_reloads(self, rule_cache, cache, repository):
+        other = Mock(list_enabled_custom_rules=Mock(return_value=[]))
+        await rule_cache.get(cache, repository)
+
+        assert (await rule_cache.get(cache, other)).custom_rules == ()
+
+    @pytest.mark.asyncio
+    async def test_redis_down_still_serves_rules(self, rule_cache, repository, clock):
+        cache = Mock(redis=Mock(get=Mock(side_effect=ConnectionError("redis down"))))
+
+        assert (await rule_cache.get(cache, repository)).custom_rules == (RULE,)
+        clock.now = 5
+        await rule_cache.get(cache, repository)
+
+        assert repository.list_enabled_custom_rules.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rule_order_is_part_of_the_snapshot(self, rule_cache, cache, repository, clock):
+        await cache.redis.hset(RULE_ORDER_KEY, mapping={"rule_unusual_time": 1})
+        assert (await rule_cache.get(cache, repository)).order_of("rule_unusual_time") == 1
+
+        await cache.redis.hset(RULE_ORDER_KEY, mapping={"rule_unusual_time": 7})
+        clock.now = 5
+        assert (await rule_cache.get(cache, repository)).order_of("rule_unusual_time") == 1
+
+        await bump_rules_version(cache)
+        clock.now = 10
+        rules = await rule_cache.get(cache, repository)
+        assert (rules.order_of("rule_unusual_time"), rules.order_of("rule_amount_threshold")) == (7, 1)
+
+
+class TestRuleSet:
+    def test_sort_strategies(self):
+        rules = RuleSet(rule_order={"rule_unusual_time": 1, "rule_amount_threshold": 3})
+        custom = Mock(order=2)
+
+        ordered = rules.sort_strategies(
+            [("rule_amount_threshold", "amount"), ("rule_location_check", "location"), ("rule_unusual_time", "time")],
+            [custom],
+        )
+
+        # location conserva su prioridad por defecto (2) y queda antes que la personalizada
+        assert ordered == ["time", "location", custom, "amount"]
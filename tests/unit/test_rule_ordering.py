@@ -0,0 +1,202 @@
+"""
+Tests unitarios para el orden persistido de reglas (/admin/rules/reorder) y
+la evaluación cost_aware con corte temprano de EvaluateTransactionUseCase.
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import mongomock
+from fakeredis import FakeServer, aioredis
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import MongoDBAdapter
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.models import RiskLevel
+from src.domain.strategies.base import COST_CACHE, COST_DATABASE, FraudStrategy
+
+
+class _Recording(FraudStrategy):
+    """Estrategia de prueba que anota en `calls` cuándo se ejecutó"""
+
+    def __init__(self, name, calls, hit=False, cost=0, records_state=False):
+        self.name, self.calls, self.hit = name, calls, hit
+        self.cost, self.records_state = cost, records_state
+
+    def evaluate(self, transaction, historical_location=None):
+        self.calls.append(self.name)
+        if self.hit:
+            return {"risk_level": RiskLevel.HIGH_RISK, "reasons": [self.name], "details": ""}
+        return {"risk_level": RiskLevel.LOW_RISK, "reasons": [], "details": ""}
+
+
+TRANSACTION = {"id": "txn_001", "amount": 2000, "user_id": "user_001",
+               "location": {"latitude": 4.711, "longitude": -74.0721}}
+
+
+def _use_case(strategies, **options):
+    return EvaluateTransactionUseCase(
+        Mock(save_evaluation=AsyncMock()),
+        Mock(publish_for_manual_review=AsyncMock()),
+        Mock(get_user_location=AsyncMock(return_value=None), set_user_location=AsyncMock()),
+        strategies,
+        **options,
+    )
+
+
+class TestCostAwareEvaluation:
+    @pytest.mark.asyncio
+    async def test_exhaustive_mode_runs_everything_in_given_order(self):
+        calls = []
+        strategies = [_Recording("mongo", calls, hit=True, cost=COST_DATABASE),
+                      _Recording("amount", calls, hit=True), _Recording("location", calls, hit=True)]
+
+        result = await _use_case(strategies).execute(TRANSACTION)
+
+        assert calls == ["mongo", "amount", "location"]
+        assert result["reasons"] == ["mongo", "amount", "location"]
+
+    @pytest.mark.asyncio
+    async def test_cheap_rules_first_and_stop_when_decided(self):
+        calls = []
+        strategies = [_Recording("mongo", calls, hit=True, cost=COST_DATABASE),
+                      _Recording("amount", calls, hit=True), _Recording("location", calls, hit=True)]
+
+        result = await _use_case(strategies, cost_aware=True).execute(TRANSACTION)
+
+        assert calls == ["amount", "location"]
+        assert result["risk_level"] == "HIGH_RISK"
+
+    @pytest.mark.asyncio
+    async def test_same_outcome_when_not_decided(self):
+        calls = []
+        strategies = [_Recording("mongo", calls, cost=COST_DATABASE), _Recording("amount", calls, hit=True)]
+
+        result = await _use_case(strategies, cost_aware=True).execute(TRANSACTION)
+
+        assert calls == ["amount", "mongo"]
+        assert result["risk_level"] == "MEDIUM_RISK"
+
+    @pytest.mark.asyncio
+    async def test_state_recording_strategies_always_run(self):
+        calls = []
+        strategies = [_Recording("amount", calls, hit=True), _Recording("location", calls, hit=True),
+                      _Recording("rapid", calls, cost=COST_CACHE, records_state=True),
+                      _Recording("mongo", calls, cost=COST_DATABASE)]
+
+        await _use_case(strategies, cost_aware=True).execute(TRANSACTION)
+
+        assert calls == ["amount", "location", "rapid"]
+
+    @pytest.mark.asyncio
+    async def test_risk_ceiling(self):
+        calls = []
+        strategies = [_Recording("amount", calls, hit=True), _Recording("location", calls, hit=True)]
+
+        result = await _use_case(strategies, cost_aware=True, risk_ceiling=RiskLevel.MEDIUM_RISK).execute(TRANSACTION)
+
+        assert calls == ["amount"]
+        assert result["risk_level"] == "MEDIUM_RISK"
+
+
+class _FakeCache:
+    """Un cliente fakeredis por acceso: TestClient y asyncio.run usan loops distintos"""
+
+    def __init__(self):
+        self.server = FakeServer()
+        self.redis_sync = Mock()
+        self.get_threshold_config = AsyncMock(return_value=None)
+
+    @property
+    def redis(self):
+        return aioredis.FakeRedis(server=self.server, decode_responses=True)
+
+
+class TestPersistedRuleOrder:
+    @pytest.fixture
+    def gateway(self):
+        from api_gateway import routes
+
+        with patch("src.adapters.MongoClient", mongomock.MongoClient):
+            repository = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+        repository.db.custom_rules.insert_one({
+            "id": "rule_custom", "name": "Grandes", "type": "amount_threshold",
+            "parameters": {"threshold": 5000}, "enabled": True, "order": 999,
+        })
+        cache = _FakeCache()
+        routes.configure_dependencies(lambda: repository, lambda: cache, Mock(), Mock(), Mock())
+
+        app = FastAPI()
+        app.include_router(routes.api_v1_router)
+        return routes, TestClient(app), cache, repository
+
+    def _reorder(self, client, rule_ids):
+        return client.post("/api/v1/admin/rules/reorder", json={"ruleIds": rule_ids},
+                           headers={"X-Analyst-ID": "analyst_001"})
+
+    def test_reorder_is_persisted(self, gateway):
+        routes, client, cache, repository = gateway
+
+        response = self._reorder(client, ["rule_custom", "rule_unusual_time"])
+
+        assert response.status_code == 200
+        assert response.json()["newOrder"][:3] == [
+            {"id": "rule_custom", "order": 1},
+            {"id": "rule_unusual_time", "order": 2},
+            {"id": "rule_amount_threshold", "order": 3},
+        ]
+        assert asyncio.run(cache.redis.hget("rule_order", "rule_unusual_time")) == "2"
+        assert repository.db.custom_rules.find_one({"id": "rule_custom"})["order"] == 1
+        rules = client.get("/api/v1/admin/rules").json()
+        assert [rule["id"] for rule in rules] == [
+            "rule_custom", "rule_unusual_time", "rule_amount_threshold",
+            "rule_location_check", "rule_device_validation", "rule_rapid_transaction",
+        ]
+
+    def test_strategies_follow_persisted_order(self, gateway):
+        routes, client, cache, repository = gateway
+        self._reorder(client, ["rule_unusual_time", "rule_custom"])
+
+        strategies = asyncio.run(routes._build_strategies(set(), cache, repository))
+
+        assert [type(strategy).__name__ for strategy in strategies] == [
+            "UnusualTimeStrategy", "CustomRuleStrategy", "AmountThresholdStrategy",
+            "LocationStrategy", "DeviceValidationStrategy", "RapidTransactionStrategy",
+        ]
+
+    def test_reordering_only_default_rules_refreshes_the_snapshot(self, gateway):
+        routes, client, cache, repository = gateway
+        asyncio.run(routes._build_strategies(set(), cache, repository))
+
+        self._reorder(client, ["rule_rapid_transaction"])
+        strategies = asyncio.run(routes._build_strategies(set(), cache, repository))
+
+        assert type(strategies[0]).__name__ == "RapidTransactionStrategy"
+
+    def test_worker_follows_persisted_order(self, gateway):
+        import worker
+
+        _, client, cache, repository = gateway
+        self._reorder(client, ["rule_unusual_time", "rule_custom"])
+        worker._shared.clear()
+        with patch.object(worker, "_repository", return_value=repository), \
+             patch.object(worker, "_cache", return_value=cache), \
+             patch.object(worker, "_publisher", return_value=Mock()), \
+             patch.object(worker, "_ensure_indexes"):
+            strategies = worker.create_use_case().strategies
+        worker._shared.clear()
+
+        assert [type(strategy).__name__ for strategy in strategies] == [
+            "UnusualTimeStrategy", "CustomRuleStrategy", "AmountThresholdStrategy",
+            "LocationStrategy", "DeviceValidationStrategy", "RapidTransactionStrategy",
+        ]
+
+    def test_unknown_or_duplicated_ids_are_rejected(self, gateway):
+        _, client, _, _ = gateway
+        assert self._reorder(client, ["rule_nope"]).status_code == 422
+        assert self._reorder(client, ["rule_custom", "rule_custom"]).status_code == 422
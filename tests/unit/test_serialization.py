@@ -0,0 +1,140 @@
+"""
+Tests unitarios para la capa de serialización JSON (infrastructure/serialization.py)
+y los endpoints de listado que la usan.
+"""
+import asyncio
+import json
+import mongomock
+import pytest
+import time
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from src.adapters import MongoDBAdapter
+from src.domain.models import FraudEvaluation, Location, RiskLevel
+from src.domain.money import Money
+from src.infrastructure import serialization
+
+BACKENDS = ["json"] + (["orjson"] if serialization.orjson is not None else [])
+
+# Las fechas naive son hora local: en un host UTC salen tal cual
+EVALUATED_AT = datetime(2026, 1, 15, 10, 30).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = serialization.backend
+    serialization.use_backend(request.param)
+    yield request.param
+    serialization.use_backend(previous)
+
+
+class TestSerialization:
+    """Mismo formato de salida con cualquier backend"""
+
+    def test_native_types(self, backend):
+        payload = {
+            "naive": datetime(2026, 1, 15, 10, 30, 0, 123456),
+            "utc": datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc),
+            "offset": datetime(2026, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=-5))),
+            "money": Money.parse("1999.99"),
+            "decimal": Decimal("10.5"),
+            "risk": RiskLevel.HIGH_RISK,
+            "tags": {"a"},
+        }
+
+        decoded = json.loads(serialization.dumps(payload))
+
+        assert decoded == {
+            "naive": EVALUATED_AT.replace("Z", ".123456Z"),
+            "utc": "2026-01-15T10:30:00Z",
+            "offset": "2026-01-15T10:30:00-05:00",
+            "money": 1999.99,
+            "decimal": 10.5,
+            "risk": 3,
+            "tags": ["a"],
+        }
+
+    def test_naive_datetimes_are_local_time(self, backend, monkeypatch):
+        monkeypatch.setenv("TZ", "America/Bogota")
+        time.tzset()
+        try:
+            serialization.use_backend(backend)
+            encoded = serialization.dumps({"naive": datetime(2026, 1, 15, 10, 30)})
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+            serialization.use_backend(backend)
+
+        assert json.loads(encoded) == {"naive": "2026-01-15T15:30:00Z"}
+
+    def test_round_trip_and_compact_output(self, backend):
+        data = {"latitude": 4.711, "longitude": -74.0721}
+        encoded = serialization.dumps(data)
+        assert b" " not in encoded
+        assert serialization.loads(encoded) == data
+        assert serialization.loads(encoded.decode()) == data
+
+    def test_invalid_input_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            serialization.loads("not valid json")
+
+    def test_unsupported_type_raises(self, backend):
+        with pytest.raises(TypeError):
+            serialization.dumps({"x": object()})
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            serialization.use_backend("simplejson")
+
+
+class TestListEndpoints:
+    """Los listados entregan fechas en ISO UTC con 'Z' vía FastJSONResponse"""
+
+    @pytest.fixture
+    def client(self):
+        from api_gateway import routes
+
+        evaluation = FraudEvaluation(
+            transaction_id="txn_001",
+            user_id="user_001",
+            risk_level=RiskLevel.MEDIUM_RISK,
+            reasons=["amount_threshold_exceeded"],
+            timestamp=datetime(2026, 1, 15, 10, 30),
+            amount=Money.parse("2000"),
+            location=Location(4.711, -74.0721),
+        )
+        # Repositorio real sobre mongomock: los listados leen filas proyectadas
+        with patch("src.adapters.MongoClient", mongomock.MongoClient):
+            repository = MongoDBAdapter("mongodb://localhost:27017", "test_db")
+        asyncio.run(repository.save_evaluation(evaluation))
+        routes.configure_dependencies(lambda: repository, Mock(), Mock(), Mock(), Mock())
+
+        app = FastAPI()
+        app.include_router(routes.router)
+        app.include_router(routes.api_v1_router)
+        return TestClient(app)
+
+    def test_transactions_log(self, client):
+        body = client.get("/api/v1/admin/transactions/log").json()
+        assert body[0]["date"] == EVALUATED_AT
+        assert body[0]["amount"] == 2000.0
+        assert body[0]["status"] == "SUSPICIOUS"
+        assert body[0]["reviewedAt"] is None
+
+    def test_user_transactions(self, client):
+        body = client.get("/api/v1/user/transactions/user_001").json()
+        assert body[0]["timestamp"] == EVALUATED_AT
+        assert body[0]["needsAuthentication"] is True
+
+    def test_audit_endpoints(self, client):
+        assert client.get("/audit/all").json()[0]["timestamp"] == EVALUATED_AT
+        assert client.get("/audit/user/user_001").json()[0]["evaluated_at"] == EVALUATED_AT
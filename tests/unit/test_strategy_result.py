@@ -0,0 +1,62 @@
+"""
+Tests unitarios para StrategyResult (domain/strategies/result.py)
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.domain.models import Location, RiskLevel, Transaction
+from src.domain.strategies import AmountThresholdStrategy, LocationStrategy, NO_RISK, StrategyResult
+
+
+class TestStrategyResult:
+    def test_dict_compatible_api(self):
+        result = StrategyResult(RiskLevel.HIGH_RISK, ("a",), "x={}", 1)
+
+        assert result["risk_level"] == RiskLevel.HIGH_RISK
+        assert result["reasons"] == ["a"]
+        assert result.get("fallback") is None
+        assert "fallback" not in result
+        assert result == {"risk_level": RiskLevel.HIGH_RISK, "reasons": ["a"], "details": "x=1"}
+        assert dict(**result) == result.to_dict()
+
+    def test_details_are_formatted_lazily_and_once(self):
+        calls = []
+
+        class Spy:
+            def __format__(self, spec):
+                calls.append(spec)
+                return "spy"
+
+        result = StrategyResult(RiskLevel.LOW_RISK, (), "{:.2f}", Spy())
+        assert calls == []
+        assert result.details == "spy"
+        assert result.details == "spy"
+        assert calls == [".2f"]
+
+    def test_reasons_copy_does_not_touch_shared_instance(self):
+        NO_RISK["reasons"].append("mutated")
+        assert NO_RISK.reasons == ()
+
+    def test_fallback(self):
+        result = StrategyResult.from_dict(
+            {"risk_level": RiskLevel.LOW_RISK, "reasons": ["x"], "details": "", "fallback": True}
+        )
+        assert result.fallback and result["fallback"] is True
+        with pytest.raises(KeyError):
+            NO_RISK["fallback"]
+
+
+class TestSharedInstances:
+    TRANSACTION = Transaction(
+        id="txn_001", amount=Decimal("100"), user_id="user_001",
+        location=Location(latitude=4.7110, longitude=-74.0721), timestamp=datetime(2026, 1, 1, 12),
+    )
+
+    def test_common_case_allocates_no_result(self):
+        assert AmountThresholdStrategy(Decimal("1500")).evaluate(self.TRANSACTION) is NO_RISK
+        assert LocationStrategy(100).evaluate(self.TRANSACTION, Location(4.76, -74.04)) is NO_RISK
@@ -0,0 +1,184 @@
+"""
+Tests unitarios para el tracing opcional (infrastructure/tracing.py).
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+from src.application.interfaces import NULL_SPAN
+from src.application.use_cases import EvaluateTransactionUseCase
+from src.domain.strategies.amount_threshold import AmountThresholdStrategy
+from src.infrastructure.tracing import (
+    BatchSpanProcessor,
+    SpanTracer,
+    TracingMiddleware,
+    extract,
+    inject,
+    to_otlp,
+)
+
+
+class MemoryExporter:
+    """Exporter en memoria: guarda los payloads OTLP recibidos"""
+
+    def __init__(self):
+        self.payloads = []
+
+    def export(self, payload):
+        self.payloads.append(payload)
+
+    @property
+    def spans(self):
+        return [
+            span
+            for payload in self.payloads
+            for resource in payload["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        ]
+
+
+@pytest.fixture
+def exporter():
+    return MemoryExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    tracer = SpanTracer()
+    tracer.processor = BatchSpanProcessor(exporter, "test-service", interval=60)
+    yield tracer
+    if tracer.processor is not None:
+        tracer.processor.shutdown()
+
+
+def _flush(tracer):
+    processor, tracer.processor = tracer.processor, None
+    processor.shutdown()
+
+
+class TestSpanTracer:
+    """Creación, anidamiento y exportación de spans"""
+
+    def test_disabled_tracer_returns_shared_null_span(self):
+        tracer = SpanTracer()
+        assert tracer.start_span("x") is NULL_SPAN
+        with tracer.start_span("x") as span:
+            span.set_attribute("ignored", True)
+
+    def test_nested_spans_share_trace_and_link_parent(self, tracer, exporter):
+        with tracer.start_span("root") as root:
+            with tracer.start_span("child", {"k": 1}):
+                pass
+        _flush(tracer)
+
+        spans = {span["name"]: span for span in exporter.spans}
+        assert spans["child"]["traceId"] == spans["root"]["traceId"] == root.trace_id
+        assert spans["child"]["parentSpanId"] == spans["root"]["spanId"]
+        assert "parentSpanId" not in spans["root"]
+        assert spans["child"]["attributes"] == [{"key": "k", "value": {"intValue": "1"}}]
+
+    def test_exception_marks_span_as_error(self, tracer, exporter):
+        with pytest.raises(RuntimeError):
+            with tracer.start_span("failing"):
+                raise RuntimeError("boom")
+        _flush(tracer)
+
+        assert exporter.spans[0]["status"] == {"code": 2, "message": "RuntimeError: boom"}
+
+    def test_failing_exporter_drops_batch(self):
+        broken = Mock()
+        broken.export.side_effect = OSError("collector down")
+        tracer = SpanTracer()
+        tracer.processor = processor = BatchSpanProcessor(broken, "svc", interval=60)
+        with tracer.start_span("lost"):
+            pass
+        _flush(tracer)
+        assert processor.dropped == 1
+
+
+class TestPropagation:
+    """traceparent W3C en headers AMQP/HTTP"""
+
+    def test_inject_then_extract_round_trip(self, tracer):
+        with tracer.start_span("publisher") as span:
+            headers = inject({"x-published-at": 1.0})
+        context = extract(headers)
+
+        assert context.trace_id == span.trace_id
+        assert context.span_id == span.span_id
+
+    def test_inject_without_active_span_is_noop(self):
+        assert inject({}) == {}
+
+    @pytest.mark.parametrize("value", [None, "garbage", "00-" + "0" * 32 + "-" + "1" * 16 + "-01"])
+    def test_extract_rejects_invalid_values(self, value):
+        assert extract({"traceparent": value}) is None
+
+    def test_remote_parent_continues_trace(self, tracer, exporter):
+        parent = extract({"traceparent": f"00-{'a' * 32}-{'b' * 16}-01"})
+        with tracer.start_span("worker.process_transaction", parent=parent):
+            pass
+        _flush(tracer)
+
+        assert exporter.spans[0]["traceId"] == "a" * 32
+        assert exporter.spans[0]["parentSpanId"] == "b" * 16
+
+
+class TestInstrumentation:
+    """Spans emitidos por el caso de uso y el middleware ASGI"""
+
+    @pytest.mark.asyncio
+    async def test_use_case_emits_stage_spans(self, tracer, exporter, sample_transaction_data):
+        repository = Mock(save_evaluation=AsyncMock())
+        publisher = Mock(publish_for_manual_review=AsyncMock())
+        cache = Mock(get_user_location=AsyncMock(return_value=None), set_user_location=AsyncMock())
+        use_case = EvaluateTransactionUseCase(
+            repository, publisher, cache, [AmountThresholdStrategy(threshold=1500)], tracer=tracer
+        )
+
+        with tracer.start_span("request"):
+            await use_case.execute(sample_transaction_data)
+        _flush(tracer)
+
+        names = {span["name"] for span in exporter.spans}
+        assert {
+            "request",
+            "cache.get_historical_location",
+            "strategy.AmountThresholdStrategy",
+            "repository.save_evaluation",
+            "cache.set_user_location",
+        } <= names
+        assert len({span["traceId"] for span in exporter.spans}) == 1
+
+    def test_middleware_records_http_status(self, tracer, exporter):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 202, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = TracingMiddleware(app, tracer)
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/transaction/validate",
+            "headers": [(b"traceparent", f"00-{'c' * 32}-{'d' * 16}-01".encode())],
+        }
+        asyncio.run(middleware(scope, AsyncMock(), AsyncMock()))
+        _flush(tracer)
+
+        span = exporter.spans[0]
+        assert span["name"] == "POST /api/v1/transaction/validate"
+        assert span["traceId"] == "c" * 32
+        assert {"key": "http.status_code", "value": {"intValue": "202"}} in span["attributes"]
+
+
+def test_to_otlp_sets_service_name(tracer):
+    with tracer.start_span("s") as span:
+        pass
+    payload = to_otlp([span], "api-gateway")
+    resource = payload["resourceSpans"][0]["resource"]
+    assert resource["attributes"] == [{"key": "service.name", "value": {"stringValue": "api-gateway"}}]
@@ -0,0 +1,186 @@
+"""
+Tests unitarios para la topología de reintentos del worker
+(infrastructure/retry_topology.py), su uso en el callback y los adaptadores
+que el worker comparte entre mensajes.
+"""
+import pytest
+from unittest.mock import ANY, AsyncMock, Mock, patch
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "services" / "fraud-evaluation-service"))
+
+import pika
+import pymongo
+
+from src.infrastructure.retry_topology import (
+    ATTEMPT_HEADER,
+    REASON_HEADER,
+    REPLAYS_HEADER,
+    RetryTopology,
+    parse_delays,
+)
+
+BODY = b'{"id":"txn_001","amount":10,"user_id":"user_001","location":{"latitude":4.7,"longitude":-74.0}}'
+
+
+@pytest.fixture
+def topology():
+    return RetryTopology("transactions", (5, 30))
+
+
+def _published(channel):
+    kwargs = channel.basic_publish.call_args.kwargs
+    return kwargs["routing_key"], kwargs["properties"].headers
+
+
+class TestRetryTopology:
+    def test_parse_delays(self):
+        assert parse_delays("5, 30,120") == (5, 30, 120)
+        with pytest.raises(ValueError):
+            parse_delays("5,0")
+
+    def test_delay_queues_dead_letter_back_to_work_queue(self, topology):
+        channel = Mock()
+
+        topology.declare(channel)
+
+        declared = {call.kwargs["queue"]: call.kwargs.get("arguments") for call in channel.queue_declare.call_args_list}
+        assert declared["transactions"] is None
+        assert declared["transactions.dlq"] is None
+        assert declared["transactions.retry.30s"] == {
+            "x-message-ttl": 30000, "x-dead-letter-exchange": "", "x-dead-letter-routing-key": "transactions",
+        }
+
+    def test_attempts_walk_the_delays_then_dead_letter(self, topology):
+        channel = Mock()
+        properties = pika.BasicProperties(headers={"traceparent": "00-abc"})
+        routes = []
+        for _ in range(3):
+            outcome = topology.retry(channel, properties, BODY, "ConnectionFailure: timeout")
+            routing_key, headers = _published(channel)
+            routes.append((routing_key, outcome))
+            properties = pika.BasicProperties(headers=headers)
+
+        assert routes == [
+            ("transactions.retry.5s", "retried"),
+            ("transactions.retry.30s", "retried"),
+            ("transactions.dlq", "dead_lettered"),
+        ]
+        assert headers["traceparent"] == "00-abc"
+        assert headers[REASON_HEADER] == "ConnectionFailure: timeout"
+
+    def test_replay_resets_attempts(self, topology):
+        channel = Mock()
+        dead = pika.BasicProperties(headers={ATTEMPT_HEADER: 2, REASON_HEADER: "boom", "x-published-at": 1.0})
+        channel.basic_get.side_effect = [(Mock(delivery_tag=1), dead, BODY), (Mock(delivery_tag=2), dead, BODY)]
+
+        assert topology.replay(channel, limit=1) == 1
+
+        routing_key, headers = _published(channel)
+        assert routing_key == "transactions"
+        assert headers == {"x-published-at": 1.0, REPLAYS_HEADER: 1}
+        channel.basic_ack.assert_called_once_with(delivery_tag=1)
+
+    def test_replay_stops_when_empty(self, topology):
+        channel = Mock(basic_get=Mock(return_value=(None, None, None)))
+        assert topology.replay(channel) == 0
+
+
+class TestWorkerCallback:
+    def test_transient_failure_is_delayed_not_requeued(self):
+        import worker
+
+        channel = Mock()
+        with patch.object(worker, "create_use_case", side_effect=ConnectionError("mongo down")):
+            worker.callback(channel, Mock(delivery_tag=7), pika.BasicProperties(headers={}), BODY)
+
+        routing_key, headers = _published(channel)
+        assert routing_key.startswith("transactions.retry.")
+        assert headers[ATTEMPT_HEADER] == 1
+        channel.basic_ack.assert_called_once_with(delivery_tag=7)
+        channel.basic_nack.assert_not_called()
+
+    def test_invalid_json_goes_straight_to_dlq(self):
+        import worker
+
+        channel = Mock()
+        worker.callback(channel, Mock(delivery_tag=3), pika.BasicProperties(), b"not json")
+
+        assert _published(channel)[0] == "transactions.dlq"
+        channel.basic_ack.assert_called_once_with(delivery_tag=3)
+
+    def test_dead_lettered_transaction_is_marked_failed(self):
+        import worker
+
+        submissions = Mock(fail=AsyncMock())
+        with patch.object(worker, "create_use_case", side_effect=ValueError("Amount must be positive")), \
+             patch.object(worker, "_submissions", return_value=submissions):
+            worker.callback(Mock(), Mock(delivery_tag=5), pika.BasicProperties(), BODY)
+            worker.callback(Mock(), Mock(delivery_tag=6), pika.BasicProperties(), b"not json")
+
+        submissions.fail.assert_awaited_once_with("txn_001", "ValueError")
+
+    def test_retried_transaction_is_not_marked_failed(self):
+        import worker
+
+        submissions = Mock(fail=AsyncMock())
+        with patch.object(worker, "create_use_case", side_effect=ConnectionError("mongo down")), \
+             patch.object(worker, "_submissions", return_value=submissions):
+            worker.callback(Mock(), Mock(delivery_tag=8), pika.BasicProperties(headers={}), BODY)
+
+        submissions.fail.assert_not_awaited()
+
+    def test_broker_failure_falls_back_to_requeue(self):
+        import worker
+
+        channel = Mock(basic_publish=Mock(side_effect=pika.exceptions.UnroutableError([])))
+        worker.callback(channel, Mock(delivery_tag=4), pika.BasicProperties(), b"not json")
+
+        channel.basic_nack.assert_called_once_with(delivery_tag=4, requeue=True)
+
+
+class TestWorkerDependencies:
+    @pytest.fixture
+    def worker(self):
+        import worker
+
+        worker._shared.clear()
+        with patch.object(worker, "MongoDBAdapter") as mongo, \
+             patch.object(worker, "RedisAdapter") as redis_adapter, \
+             patch.object(worker, "RabbitMQAdapter") as rabbitmq:
+            yield worker, mongo, redis_adapter, rabbitmq
+        worker._shared.clear()
+
+    def test_adapters_are_built_once_per_process(self, worker):
+        worker, mongo, redis_adapter, rabbitmq = worker
+
+        worker.create_use_case()
+        worker.create_use_case()
+
+        mongo.assert_called_once_with(ANY, ANY, create_indexes=False)
+        mongo.return_value.ensure_indexes.assert_called_once_with()
+        redis_adapter.assert_called_once()
+        rabbitmq.assert_called_once()
+
+    def test_index_creation_goes_through_the_mongodb_breaker(self, worker):
+        worker, mongo, _, _ = worker
+        mongo.return_value.ensure_indexes.side_effect = pymongo.errors.ServerSelectionTimeoutError("down")
+        breaker = worker._repository().breaker
+        for _ in range(breaker.failure_threshold):
+            worker._ensure_indexes()
+
+        worker._ensure_indexes()
+
+        assert mongo.return_value.ensure_indexes.call_count == breaker.failure_threshold
+        assert not worker._shared.get("indexes")
+        breaker.record_success()
+
+    def test_strategies_and_collaborators_are_shared(self, worker):
+        worker, _, _, _ = worker
+
+        first, second = worker.create_use_case(), worker.create_use_case()
+
+        assert first is not second
+        assert [id(s) for s in first.strategies[:5]] == [id(s) for s in second.strategies[:5]]
+        assert first.events is second.events and first.metrics is second.metrics